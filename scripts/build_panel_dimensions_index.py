@@ -0,0 +1,67 @@
+import io
+import os
+import zipfile
+from configparser import ConfigParser
+from pathlib import Path
+
+import typer
+from barks_fantagraphics.comics_utils import get_abbrev_path
+from barks_reader.core.config_info import ConfigInfo  # make sure this is before any kivy imports
+from barks_reader.core.panel_dimensions_index import (
+    get_panel_dimensions_index_file,
+    write_panel_dimensions_index,
+)
+from barks_reader.core.reader_settings import ReaderSettings
+from cli_setup import init_logging
+from comic_utils.common_typer_options import LogLevelArg
+from cryptography.fernet import Fernet
+from dotenv import load_dotenv
+from loguru import logger
+from PIL import Image
+
+load_dotenv(Path(__file__).parent.parent / ".env.runtime")
+
+APP_LOGGING_NAME = "dims"
+
+PANEL_KEY = os.environ["BARKS_ZIPS_KEY"]
+FERNET = Fernet(PANEL_KEY)
+
+
+def read_encrypted_image_size(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> tuple[int, int]:
+    decrypted_data = FERNET.decrypt(archive.read(info))
+    # Only the header is parsed; the size is known without decoding the pixels.
+    with Image.open(io.BytesIO(decrypted_data)) as image:
+        return image.size
+
+
+app = typer.Typer()
+
+
+@app.command(help="Write the image dimensions index alongside the Barks panels zip")
+def build_index(zip_file: Path | None = None, log_level_str: LogLevelArg = "DEBUG") -> None:
+    init_logging(APP_LOGGING_NAME, "build-panel-dimensions-index.log", log_level_str)
+
+    if zip_file is None:
+        config_info = ConfigInfo()
+        config = ConfigParser()
+        logger.info(f'Using config file "{config_info.app_config_path}".')
+        config.read(config_info.app_config_path)
+        reader_settings = ReaderSettings()
+        reader_settings.set_config(config, config_info.app_config_path, config_info.app_data_dir)  # ty: ignore[invalid-argument-type]
+        zip_file = reader_settings.file_paths.get_default_jpg_barks_panels_source()
+
+    if not zip_file.is_file():
+        logger.error(f'File not found: "{zip_file}".')
+        return
+
+    index_file = get_panel_dimensions_index_file(zip_file)
+    logger.info(f'Indexing images in "{get_abbrev_path(zip_file)}"...')
+
+    with zipfile.ZipFile(zip_file, "r") as archive:
+        num_images = write_panel_dimensions_index(index_file, archive, read_encrypted_image_size)
+
+    logger.success(f'Wrote {num_images} image dimensions to "{get_abbrev_path(index_file)}".')
+
+
+if __name__ == "__main__":
+    app()
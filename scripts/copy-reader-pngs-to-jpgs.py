@@ -9,7 +9,12 @@ import typer
 from barks_fantagraphics.comics_consts import PNG_FILE_EXT
 from barks_fantagraphics.comics_utils import get_abbrev_path, get_backup_file
 from barks_reader.core.config_info import ConfigInfo  # make sure this is before any kivy imports
+from barks_reader.core.panel_dimensions_index import (
+    get_panel_dimensions_index_file,
+    write_panel_dimensions_index,
+)
 from barks_reader.core.reader_settings import ReaderSettings
+from build_panel_dimensions_index import read_encrypted_image_size
 from cli_setup import init_logging
 from comic_utils.comic_consts import JPG_FILE_EXT
 from comic_utils.common_typer_options import LogLevelArg
@@ -130,6 +135,14 @@ def copy_to_zip(log_level_str: LogLevelArg = "DEBUG") -> None:
 
         traverse_and_process_dirs(png_dir, zip_file, file_processor_func=convert_and_zip_file)
 
+        # The old dimensions index no longer matches the new zip's members.
+        index_file = get_panel_dimensions_index_file(zip_file)
+        with zipfile.ZipFile(zip_file, "r") as archive:
+            num_images = write_panel_dimensions_index(
+                index_file, archive, read_encrypted_image_size
+            )
+        logger.info(f'Wrote {num_images} image dimensions to "{index_file}".')
+
         if zip_backup:
             logger.success(f'NOTE: Backed up old zip to "{zip_backup}".')
 
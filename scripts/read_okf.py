@@ -50,6 +50,7 @@ from barks_reader.core.wiki_integration import (
     story_page_title,
     title_can_have_wiki_page,
     wiki_page_for_title,
+    wiki_search_index_path,
     wiki_session_path,
     wiki_top_bar_spec,
 )
@@ -59,6 +60,7 @@ from dotenv import load_dotenv
 from loguru import logger
 from okf_reader.core.actions import PageAction
 from okf_reader.core.render import resolve_link
+from okf_reader.core.search import FullTextSearcher
 from okf_reader.core.top_bar import TopBarSpec
 
 load_dotenv(Path(__file__).parent.parent / ".env.runtime")
@@ -275,6 +277,7 @@ def main(
     reader_settings = None
     comics_database = None
     state_path = None
+    search_index_path = None
     if barks_env is not None:
         reader_settings, comics_database, config_info = barks_env
         # Resume where the last session left off; the state lives beside the
@@ -283,6 +286,7 @@ def main(
         # for any other bundle, so reading elsewhere can't clobber the wiki's
         # resume point).
         state_path = wiki_session_path(Path(config_info.app_data_dir), bundle)
+        search_index_path = wiki_search_index_path(Path(config_info.app_data_dir), bundle)
     image_provider = (
         BarksPanelsImageProvider(reader_settings) if reader_settings is not None else None
     )
@@ -301,6 +305,7 @@ def main(
         action_provider=ReadComicActionProvider(comics_database),
         top_bar=_barks_top_bar_spec(reader_settings, win_height),
         state_path=state_path,
+        search_provider=FullTextSearcher(bundle, search_index_path),
     )
 
 
@@ -37,9 +37,9 @@ from barks_fantagraphics.pages import (
 )
 from barks_fantagraphics.panel_geometry import scale_height
 from comic_utils.decryption import DecryptionError
-from comic_utils.pil_image_utils import load_pil_image_from_bytes
+from comic_utils.pil_image_utils import get_decode_reduction, load_pil_image_from_bytes
 from loguru import logger
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw, ImageFont, ImageOps
 from PIL.Image import Image as PilImage
 from PIL.ImageDraw import ImageDraw as PilImageDraw
 from PIL.ImageFont import FreeTypeFont
@@ -65,6 +65,10 @@ SPLASH_BORDER_COLOR = (0, 0, 0)
 SPLASH_BORDER_WIDTH = 10
 SPLASH_MARGIN = DEST_TARGET_X_MARGIN
 
+# A reduced source decode must keep this many source pixels per displayed pixel, so
+# the final LANCZOS resample still has detail to filter rather than upscaling.
+REDUCED_DECODE_MIN_OVERSAMPLE = 1.25
+
 
 class BasePageType(Enum):
     EMPTY_PAGE = auto()
@@ -162,10 +166,15 @@ class BuildSourceProfile:
     The two choices are inherently coupled — alpha-PNG paths need the alpha
     renderer, RGB JPGs need the RGB renderer — so they are bundled here to prevent
     mis-pairing at construction sites.
+
+    ``allow_reduced_decode`` opts a profile in to decoding JPEG sources at 1/2, 1/4
+    or 1/8 scale when a page is built for a display much smaller than the source
+    (see ``ComicBookImageBuilder.get_srce_min_decode_scale``).
     """
 
     page_image_source: PageImageSource
     srce_story_file_resolver: SrceStoryFileResolver
+    allow_reduced_decode: bool = False
 
 
 RGB_PROFILE = BuildSourceProfile(
@@ -178,6 +187,14 @@ SVG_ADAPTIVE_PROFILE = BuildSourceProfile(
     srce_story_file_resolver=SvgPngStoryFileResolver(fallback=FinalStoryFileResolver()),
 )
 
+# Final JPGs built for on-screen reading, where the page is never shown larger than
+# the display.
+RGB_DISPLAY_PROFILE = BuildSourceProfile(
+    page_image_source=RgbPageImageSource(),
+    srce_story_file_resolver=FinalStoryFileResolver(),
+    allow_reduced_decode=True,
+)
+
 
 class ComicBookImageBuilder:
     def __init__(
@@ -186,16 +203,40 @@ class ComicBookImageBuilder:
         empty_page_file: Path,
         page_image_source: PageImageSource | None = None,
         get_inset_decrypted_bytes: Callable[[bytes], bytes] | None = None,
+        allow_reduced_decode: bool = False,
     ) -> None:
         self._comic = comic
+        self._empty_page_token = f"{empty_page_file.name}:{empty_page_file.stat().st_mtime_ns}"
         self._empty_page_image = open_image_for_reading(empty_page_file)
         self._page_image_source = page_image_source or RgbPageImageSource()
         self._get_inset_decrypted_bytes = get_inset_decrypted_bytes
+        self._allow_reduced_decode = allow_reduced_decode
         self._required_dim: RequiredDimensions = RequiredDimensions()
+        # The empty page resized to each display size requested so far.
+        self._display_empty_page_images: dict[tuple[int, int], PilImage] = {}
 
     def set_required_dim(self, required_dim: RequiredDimensions) -> None:
         self._required_dim = required_dim
 
+    def get_dest_page_cache_token(self, srce_page: CleanPage, dest_page: CleanPage) -> str:
+        """Return a token identifying how the builder transforms a page.
+
+        Together with the identity of the source image (and, for
+        ``get_display_page_image``, the display size), the token determines the
+        built page: the page-image source (the renderer half of a
+        ``BuildSourceProfile``), whether reduced decodes are allowed, the required
+        dimensions, the empty page and the srce/dest page geometry. Callers use it
+        to key caches of built pages.
+        """
+        return (
+            f"{type(self._page_image_source).__qualname__}"
+            f"{':reduced' if self._allow_reduced_decode else ''}"
+            f"|{self._required_dim}"
+            f"|{self._empty_page_token}"
+            f"|{srce_page.page_type.name}:{srce_page.panels_bbox.get_box()}"
+            f"|{dest_page.page_type.name}:{dest_page.panels_bbox.get_box()}:{dest_page.page_num}"
+        )
+
     @staticmethod
     def _log_page_info(prefix: str, image: PilImage | None, page: CleanPage) -> None:
         width = image.width if image else 0
@@ -227,6 +268,144 @@ class ComicBookImageBuilder:
 
         return rgb_dest_page_image
 
+    def get_srce_min_decode_scale(
+        self,
+        srce_page: CleanPage,
+        dest_page: CleanPage,
+        max_width: int,
+        max_height: int,
+    ) -> float:
+        """Return the fraction of each source side needed to build a display-size page.
+
+        The source may be decoded at reduced size as long as it keeps this fraction
+        (see ``comic_utils.pil_image_utils.reduce_jpeg_decode``). It is 1.0 — a full
+        decode — unless reduced decodes are allowed and the page goes through the
+        fused ``get_display_page_image`` build, which is the only one that maps
+        the panels box onto a reduced source. The quality guard
+        ``REDUCED_DECODE_MIN_OVERSAMPLE`` keeps the decode above the displayed size.
+        """
+        if (
+            not self._allow_reduced_decode
+            or dest_page.page_type in PAGES_WITHOUT_PANELS
+            or srce_page.panels_bbox.get_width() <= 1
+            or srce_page.panels_bbox.get_height() <= 1
+        ):
+            return 1.0
+
+        display_width, display_height = get_display_page_size(max_width, max_height)
+        display_scale = max(
+            dest_page.panels_bbox.get_width()
+            * display_width
+            / (DEST_TARGET_WIDTH * srce_page.panels_bbox.get_width()),
+            dest_page.panels_bbox.get_height()
+            * display_height
+            / (DEST_TARGET_HEIGHT * srce_page.panels_bbox.get_height()),
+        )
+
+        return min(1.0, REDUCED_DECODE_MIN_OVERSAMPLE * display_scale)
+
+    def get_display_page_image(
+        self,
+        srce_page_image: PilImage,
+        srce_page: CleanPage,
+        dest_page: CleanPage,
+        max_width: int,
+        max_height: int,
+    ) -> PilImage:
+        """Build the dest page directly at the size it is displayed at.
+
+        The result matches ``get_dest_page_image`` shrunk (LANCZOS) to fit within
+        ``(max_width, max_height)``, but for panel pages the source is resampled
+        only once: the crop, paste position and page number are laid out in
+        destination coordinates and scaled to the display size up front. Pages
+        without panels, and sources rendered with a paste mask, take the two-pass
+        route.
+
+        ``srce_page_image`` may have been decoded at reduced size (a JPEG decoded
+        with ``get_srce_min_decode_scale``); the source panels box is scaled to match.
+        """
+        if dest_page.page_type in PAGES_WITHOUT_PANELS:
+            return self._get_contained_dest_page_image(
+                srce_page_image, srce_page, dest_page, max_width, max_height
+            )
+
+        # A masked paste blends the rendered pixels with the mask, which is not linear,
+        # so resampling before the paste would darken thin lines. Only the alpha-PNG
+        # build profile produces a mask.
+        srce_rgb, srce_mask = self._page_image_source.to_renderable(srce_page_image)
+        if srce_mask is not None:
+            return self._get_contained_dest_page_image(
+                srce_page_image, srce_page, dest_page, max_width, max_height
+            )
+
+        display_size = get_display_page_size(max_width, max_height)
+
+        self._log_page_info(f"{srce_page.page_num}-Srce", srce_page_image, srce_page)
+
+        scale = (display_size[0] / DEST_TARGET_WIDTH, display_size[1] / DEST_TARGET_HEIGHT)
+        dest_panels_box, srce_panels_box = _get_display_panels_boxes(srce_page, dest_page, scale)
+        # Scale to a reduced decode, and keep the sub-pixel widening inside the image.
+        x_reduction, y_reduction = get_decode_reduction(srce_page_image)
+        srce_panels_box = (
+            max(0.0, srce_panels_box[0] / x_reduction),
+            max(0.0, srce_panels_box[1] / y_reduction),
+            min(srce_rgb.width, srce_panels_box[2] / x_reduction),
+            min(srce_rgb.height, srce_panels_box[3] / y_reduction),
+        )
+        dest_panels_size = (
+            dest_panels_box[2] - dest_panels_box[0],
+            dest_panels_box[3] - dest_panels_box[1],
+        )
+
+        panels_rgb = srce_rgb.resize(
+            size=dest_panels_size, resample=Image.Resampling.LANCZOS, box=srce_panels_box
+        )
+
+        dest_page_image = self._get_display_empty_page_image(display_size).copy()
+        dest_page_image.paste(panels_rgb, dest_panels_box[:2])
+
+        self._write_page_number(dest_page_image, dest_page, PAGE_NUM_COLOR, scale)
+
+        rgb_dest_page_image = dest_page_image.convert("RGB")
+
+        self._log_page_info("Display", rgb_dest_page_image, dest_page)
+
+        return rgb_dest_page_image
+
+    def _get_contained_dest_page_image(
+        self,
+        srce_page_image: PilImage,
+        srce_page: CleanPage,
+        dest_page: CleanPage,
+        max_width: int,
+        max_height: int,
+    ) -> PilImage:
+        if get_decode_reduction(srce_page_image) != (1.0, 1.0):
+            msg = f"Page {srce_page.page_num} needs a full size source to build in two passes."
+            raise ValueError(msg)
+
+        return ImageOps.contain(
+            self.get_dest_page_image(srce_page_image, srce_page, dest_page),
+            (max_width, max_height),
+            Image.Resampling.LANCZOS,
+        )
+
+    def _get_display_empty_page_image(self, display_size: tuple[int, int]) -> PilImage:
+        empty_page_image = self._display_empty_page_images.get(display_size)
+        if empty_page_image is None:
+            if self._empty_page_image.size != (DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT):
+                msg = (
+                    f"Empty page size mismatch: {self._empty_page_image.size}"
+                    f" != {(DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT)}"
+                )
+                raise RuntimeError(msg)
+            empty_page_image = self._empty_page_image.resize(
+                size=display_size, resample=Image.Resampling.LANCZOS
+            )
+            self._display_empty_page_images[display_size] = empty_page_image
+
+        return empty_page_image
+
     def _get_no_panels_dest_image(
         self,
         srce_page_image: PilImage,
@@ -446,39 +625,45 @@ class ComicBookImageBuilder:
         dest_page_image: PilImage,
         dest_page: CleanPage,
         color: tuple[int, int, int],
+        scale: tuple[float, float] = (1.0, 1.0),
     ) -> None:
+        # The layout is in full-size dest page coordinates; 'scale' maps them onto
+        # 'dest_page_image' when the page is built directly at its display size.
+        scale_x, scale_y = scale
         draw = ImageDraw.Draw(dest_page_image)
 
-        dest_page_centre = int(dest_page_image.width / 2)
+        dest_page_width = round(dest_page_image.width / scale_x)
+        dest_page_height = round(dest_page_image.height / scale_y)
+
+        dest_page_centre = int(dest_page_width / 2)
         page_num_x_start = dest_page_centre - PAGE_NUM_X_OFFSET_FROM_CENTRE
         page_num_x_end = dest_page_centre + PAGE_NUM_X_OFFSET_FROM_CENTRE
         page_num_y_start = (
-            dest_page_image.height - self._required_dim.page_num_y_bottom
+            dest_page_height - self._required_dim.page_num_y_bottom
         ) - PAGE_NUM_HEIGHT
         page_num_y_end = page_num_y_start + PAGE_NUM_HEIGHT
 
         # Get the color of a blank part of the page
         page_blank_color = dest_page_image.getpixel(
             (
-                page_num_x_start + PAGE_NUM_X_BLANK_PIXEL_OFFSET,
-                page_num_y_end,
+                round((page_num_x_start + PAGE_NUM_X_BLANK_PIXEL_OFFSET) * scale_x),
+                min(round(page_num_y_end * scale_y), dest_page_image.height - 1),
             ),
         )
 
         # Remove the existing page number
-        shape = (
+        shape = _scale_box(
             (
                 page_num_x_start - 1,
                 page_num_y_start - 1,
-            ),
-            (
                 page_num_x_end + 1,
                 page_num_y_end + 1,
             ),
+            scale,
         )
         draw.rectangle(shape, fill=page_blank_color)
 
-        font = ImageFont.truetype(PAGE_NUM_FONT_FILE, PAGE_NUM_FONT_SIZE)
+        font = ImageFont.truetype(PAGE_NUM_FONT_FILE, PAGE_NUM_FONT_SIZE * scale_y)
         text = get_page_num_str(dest_page)
         self._draw_centered_text(
             text,
@@ -486,7 +671,7 @@ class ComicBookImageBuilder:
             draw,
             font,
             color,
-            page_num_y_start,
+            round(page_num_y_start * scale_y),
         )
 
     @staticmethod
@@ -809,6 +994,66 @@ class ComicBookImageBuilder:
         )
 
 
+def get_display_page_size(max_width: int, max_height: int) -> tuple[int, int]:
+    """Return the size a dest page is shrunk to so it fits within ``(max_width, max_height)``.
+
+    Same arithmetic as ``PIL.ImageOps.contain``, so fused and two-pass builds agree.
+    """
+    dest_ratio = DEST_TARGET_WIDTH / DEST_TARGET_HEIGHT
+    max_ratio = max_width / max_height
+    if dest_ratio > max_ratio:
+        return max_width, round(DEST_TARGET_HEIGHT / DEST_TARGET_WIDTH * max_width)
+    if dest_ratio < max_ratio:
+        return round(DEST_TARGET_WIDTH / DEST_TARGET_HEIGHT * max_height), max_height
+    return max_width, max_height
+
+
+def _get_display_panels_boxes(
+    srce_page: CleanPage, dest_page: CleanPage, scale: tuple[float, float]
+) -> tuple[tuple[int, int, int, int], tuple[float, float, float, float]]:
+    """Return the display-size paste box for the panels and the source box that fills it.
+
+    Scaled down, the dest panels box falls on fractional pixel positions. Rounding
+    it to whole pixels and widening the source box to match keeps every source
+    pixel where the two-pass build (full-size paste, then shrink) would put it.
+    """
+    scale_x, scale_y = scale
+    dest_x_min = dest_page.panels_bbox.x_min * scale_x
+    dest_y_min = dest_page.panels_bbox.y_min * scale_y
+    dest_width = dest_page.panels_bbox.get_width() * scale_x
+    dest_height = dest_page.panels_bbox.get_height() * scale_y
+    dest_box = (
+        round(dest_x_min),
+        round(dest_y_min),
+        round(dest_x_min + dest_width),
+        round(dest_y_min + dest_height),
+    )
+
+    srce_x_min, srce_y_min, srce_x_max, srce_y_max = srce_page.panels_bbox.get_box()
+    srce_per_dest_x = (srce_x_max - srce_x_min) / dest_width
+    srce_per_dest_y = (srce_y_max - srce_y_min) / dest_height
+    srce_box = (
+        srce_x_min + (dest_box[0] - dest_x_min) * srce_per_dest_x,
+        srce_y_min + (dest_box[1] - dest_y_min) * srce_per_dest_y,
+        srce_x_min + (dest_box[2] - dest_x_min) * srce_per_dest_x,
+        srce_y_min + (dest_box[3] - dest_y_min) * srce_per_dest_y,
+    )
+
+    return dest_box, srce_box
+
+
+def _scale_box(
+    box: tuple[int, int, int, int], scale: tuple[float, float]
+) -> tuple[int, int, int, int]:
+    scale_x, scale_y = scale
+    return (
+        round(box[0] * scale_x),
+        round(box[1] * scale_y),
+        round(box[2] * scale_x),
+        round(box[3] * scale_y),
+    )
+
+
 def build_double_page_image(left: PilImage, right: PilImage) -> PilImage:
     """Composite two pages side-by-side into a single landscape image.
 
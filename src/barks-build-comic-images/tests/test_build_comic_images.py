@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
+import io
+import math
+import random
 from dataclasses import FrozenInstanceError
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
 import pytest
 from barks_build_comic_images.build_comic_images import (
+    REDUCED_DECODE_MIN_OVERSAMPLE,
+    RGB_DISPLAY_PROFILE,
     RGB_PROFILE,
     SVG_ADAPTIVE_PROFILE,
     AdaptivePageImageSource,
     AlphaPageImageSource,
     BuildSourceProfile,
+    ComicBookImageBuilder,
     PageImageSource,
     RgbPageImageSource,
+    get_display_page_size,
 )
+from barks_fantagraphics.comics_consts import DEST_TARGET_HEIGHT, DEST_TARGET_WIDTH, PageType
+from barks_fantagraphics.page_classes import CleanPage, RequiredDimensions
 from barks_fantagraphics.pages import (
     FinalStoryFileResolver,
     SvgPngStoryFileResolver,
 )
-from PIL import Image
+from barks_fantagraphics.panel_geometry import BoundingBox
+from comic_utils.pil_image_utils import get_decode_reduction, load_pil_image_from_bytes
+from PIL import Image, ImageChops, ImageDraw, ImageOps, ImageStat
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 class TestPageImageSource:
@@ -108,6 +124,12 @@ class TestBuildSourceProfile:
         assert isinstance(RGB_PROFILE.page_image_source, RgbPageImageSource)
         assert isinstance(RGB_PROFILE.srce_story_file_resolver, FinalStoryFileResolver)
 
+    def test_only_the_display_profile_allows_reduced_decode(self) -> None:
+        assert isinstance(RGB_DISPLAY_PROFILE.page_image_source, RgbPageImageSource)
+        assert RGB_DISPLAY_PROFILE.allow_reduced_decode
+        assert not RGB_PROFILE.allow_reduced_decode
+        assert not SVG_ADAPTIVE_PROFILE.allow_reduced_decode
+
     def test_svg_adaptive_profile_pairs_adaptive_source_with_svg_resolver(self) -> None:
         assert isinstance(SVG_ADAPTIVE_PROFILE.page_image_source, AdaptivePageImageSource)
         assert isinstance(SVG_ADAPTIVE_PROFILE.srce_story_file_resolver, SvgPngStoryFileResolver)
@@ -118,3 +140,235 @@ class TestBuildSourceProfile:
         resolver = SVG_ADAPTIVE_PROFILE.srce_story_file_resolver
         assert isinstance(resolver, SvgPngStoryFileResolver)
         assert isinstance(resolver._fallback, FinalStoryFileResolver)  # noqa: SLF001
+
+
+def _make_line_art_page(size: tuple[int, int], mode: str = "RGB") -> Image.Image:
+    """Draw a deterministic page of inked panels, strokes and flat colour fills."""
+    paper = (255, 255, 255, 0) if mode == "RGBA" else (250, 246, 235)
+    ink = (0, 0, 0, 255) if mode == "RGBA" else (20, 20, 20)
+    page = Image.new(mode, size, paper)
+    draw = ImageDraw.Draw(page)
+    rng = random.Random(1942)
+    width, height = size
+    panel_height = height // 4
+    for row in range(4):
+        for col in range(2):
+            box = (
+                40 + col * (width // 2),
+                40 + row * panel_height,
+                (col + 1) * (width // 2) - 40,
+                (row + 1) * panel_height - 40,
+            )
+            if mode == "RGB":
+                fill = tuple(rng.randrange(120, 240) for _ in range(3))
+                draw.rectangle(box, fill=fill)
+            draw.rectangle(box, outline=ink, width=8)
+            for _ in range(25):
+                x0, y0 = rng.randrange(box[0], box[2]), rng.randrange(box[1], box[3])
+                x1, y1 = rng.randrange(box[0], box[2]), rng.randrange(box[1], box[3])
+                draw.line((x0, y0, x1, y1), fill=ink, width=rng.randrange(2, 7))
+            draw.ellipse(
+                (box[0] + 60, box[1] + 60, box[0] + 260, box[1] + 200), outline=ink, width=4
+            )
+    return page
+
+
+def _psnr(expected: Image.Image, actual: Image.Image) -> float:
+    diff = ImageChops.difference(expected, actual)
+    mean_square = sum(ImageStat.Stat(diff).sum2) / (3 * diff.width * diff.height)
+    return math.inf if mean_square == 0 else 10 * math.log10(255**2 / mean_square)
+
+
+def _mean_abs_diff(expected: Image.Image, actual: Image.Image) -> float:
+    return sum(ImageStat.Stat(ImageChops.difference(expected, actual)).mean) / 3
+
+
+def _make_pages(page_type: PageType = PageType.BODY) -> tuple[CleanPage, CleanPage]:
+    srce_page = CleanPage("srce.jpg", page_type, page_num=5)
+    srce_page.panels_bbox = BoundingBox(52, 75, 2036, 3112)
+    dest_page = CleanPage("dest.jpg", page_type, page_num=7)
+    dest_page.panels_bbox = BoundingBox(100, 157, 2019, 3021)
+    return srce_page, dest_page
+
+
+class TestDisplayPageImage:
+    """Golden-image checks: the fused display build against the two-pass build."""
+
+    @pytest.fixture
+    def builder(self, tmp_path: Path) -> ComicBookImageBuilder:
+        empty_page_file = tmp_path / "empty_page.png"
+        Image.new("RGB", (DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT), (250, 246, 235)).save(
+            empty_page_file
+        )
+        builder = ComicBookImageBuilder(MagicMock(), empty_page_file)
+        builder.set_required_dim(RequiredDimensions(page_num_y_bottom=90))
+        return builder
+
+    @staticmethod
+    def _two_pass(
+        builder: ComicBookImageBuilder,
+        srce_image: Image.Image,
+        pages: tuple[CleanPage, CleanPage],
+        max_size: tuple[int, int],
+    ) -> Image.Image:
+        dest_image = builder.get_dest_page_image(srce_image, *pages)
+        return ImageOps.contain(dest_image, max_size, Image.Resampling.LANCZOS)
+
+    @pytest.mark.parametrize("max_size", [(1920, 1080), (1280, 2000), (800, 600), (3000, 4000)])
+    def test_fused_build_matches_two_pass_build(
+        self, builder: ComicBookImageBuilder, max_size: tuple[int, int]
+    ) -> None:
+        srce_image = _make_line_art_page((2090, 3170))
+        pages = _make_pages()
+
+        expected = self._two_pass(builder, srce_image, pages, max_size)
+        actual = builder.get_display_page_image(srce_image, *pages, *max_size)
+
+        assert actual.mode == "RGB"
+        assert actual.size == expected.size
+        # Only resampling differences remain; upscaling to (3000, 4000) shows the most.
+        assert _psnr(expected, actual) > 35.0
+        assert _mean_abs_diff(expected, actual) < 1.5
+
+    def test_alpha_source_uses_two_pass_build(self, tmp_path: Path) -> None:
+        empty_page_file = tmp_path / "empty_page.png"
+        Image.new("RGB", (DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT), (250, 246, 235)).save(
+            empty_page_file
+        )
+        builder = ComicBookImageBuilder(
+            MagicMock(), empty_page_file, page_image_source=AdaptivePageImageSource()
+        )
+        builder.set_required_dim(RequiredDimensions(page_num_y_bottom=90))
+        srce_image = _make_line_art_page((2090, 3170), mode="RGBA")
+        pages = _make_pages()
+
+        expected = self._two_pass(builder, srce_image, pages, (1920, 1080))
+        actual = builder.get_display_page_image(srce_image, *pages, 1920, 1080)
+
+        assert actual.tobytes() == expected.tobytes()
+
+    def test_page_without_panels_uses_two_pass_build(self, builder: ComicBookImageBuilder) -> None:
+        srce_image = _make_line_art_page((DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT))
+        pages = _make_pages(PageType.COVER)
+
+        expected = self._two_pass(builder, srce_image, pages, (1920, 1080))
+        actual = builder.get_display_page_image(srce_image, *pages, 1920, 1080)
+
+        assert actual.tobytes() == expected.tobytes()
+
+    @pytest.mark.parametrize(
+        "max_size", [(1920, 1080), (1080, 1920), (2120, 3200), (1325, 2000), (4000, 4000)]
+    )
+    def test_display_page_size_matches_image_ops_contain(self, max_size: tuple[int, int]) -> None:
+        dest_image = Image.new("L", (DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT))
+
+        expected = ImageOps.contain(dest_image, max_size).size
+
+        assert get_display_page_size(*max_size) == expected
+
+
+class TestReducedDecode:
+    """Display builds from JPEG sources decoded at 1/2, 1/4 or 1/8 scale."""
+
+    @staticmethod
+    def _make_builder(tmp_path: Path, *, allow_reduced_decode: bool) -> ComicBookImageBuilder:
+        empty_page_file = tmp_path / "empty_page.png"
+        Image.new("RGB", (DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT), (250, 246, 235)).save(
+            empty_page_file
+        )
+        builder = ComicBookImageBuilder(
+            MagicMock(), empty_page_file, allow_reduced_decode=allow_reduced_decode
+        )
+        builder.set_required_dim(RequiredDimensions(page_num_y_bottom=90))
+        return builder
+
+    @staticmethod
+    def _make_jpg_bytes() -> bytes:
+        jpg_bytes = io.BytesIO()
+        _make_line_art_page((2090, 3170)).save(jpg_bytes, format="JPEG", quality=95)
+        return jpg_bytes.getvalue()
+
+    def test_full_decode_unless_allowed(self, tmp_path: Path) -> None:
+        builder = self._make_builder(tmp_path, allow_reduced_decode=False)
+
+        assert builder.get_srce_min_decode_scale(*_make_pages(), 800, 600) == 1.0
+
+    def test_full_decode_for_pages_without_panels(self, tmp_path: Path) -> None:
+        builder = self._make_builder(tmp_path, allow_reduced_decode=True)
+        pages = _make_pages(PageType.COVER)
+
+        assert builder.get_srce_min_decode_scale(*pages, 800, 600) == 1.0
+
+    @pytest.mark.parametrize("max_size", [(1920, 1080), (800, 600), (1280, 2000)])
+    def test_min_decode_scale_keeps_oversample(
+        self, tmp_path: Path, max_size: tuple[int, int]
+    ) -> None:
+        builder = self._make_builder(tmp_path, allow_reduced_decode=True)
+        srce_page, dest_page = _make_pages()
+        display_height = get_display_page_size(*max_size)[1]
+
+        min_decode_scale = builder.get_srce_min_decode_scale(srce_page, dest_page, *max_size)
+
+        # The decoded panels keep at least the oversample factor times the displayed rows.
+        decoded_panels_height = srce_page.panels_bbox.get_height() * min_decode_scale
+        displayed_panels_height = (
+            dest_page.panels_bbox.get_height() * display_height / DEST_TARGET_HEIGHT
+        )
+        assert min_decode_scale <= 1.0
+        assert decoded_panels_height >= min(
+            srce_page.panels_bbox.get_height(),
+            REDUCED_DECODE_MIN_OVERSAMPLE * displayed_panels_height - 1e-6,
+        )
+
+    @pytest.mark.parametrize(
+        ("max_size", "expected_reduction"), [((1920, 1080), (2.0, 2.0)), ((800, 600), (4.0, 4.0))]
+    )
+    def test_reduced_decode_matches_full_decode(
+        self, tmp_path: Path, max_size: tuple[int, int], expected_reduction: tuple[float, float]
+    ) -> None:
+        builder = self._make_builder(tmp_path, allow_reduced_decode=True)
+        pages = _make_pages()
+        jpg_bytes = self._make_jpg_bytes()
+        min_decode_scale = builder.get_srce_min_decode_scale(*pages, *max_size)
+
+        full_image = load_pil_image_from_bytes(jpg_bytes, ".jpg")
+        reduced_image = load_pil_image_from_bytes(jpg_bytes, ".jpg", min_decode_scale)
+
+        expected = builder.get_display_page_image(full_image, *pages, *max_size)
+        actual = builder.get_display_page_image(reduced_image, *pages, *max_size)
+
+        assert get_decode_reduction(reduced_image) == expected_reduction
+        assert actual.size == expected.size
+        assert _psnr(expected, actual) > 35.0
+        assert _mean_abs_diff(expected, actual) < 1.5
+
+    def test_reduced_decode_maps_panels_box_per_axis(self, tmp_path: Path) -> None:
+        """An eighth-scale decode of 2090x3170 is 262x397, but its pixels are still 8 across."""
+        builder = self._make_builder(tmp_path, allow_reduced_decode=True)
+        pages = _make_pages()
+        jpg_bytes = self._make_jpg_bytes()
+        full_image = load_pil_image_from_bytes(jpg_bytes, ".jpg")
+        reduced_image = load_pil_image_from_bytes(jpg_bytes, ".jpg", 0.1)
+        resize = Image.Image.resize
+
+        boxes = []
+        for srce_image in (full_image, reduced_image):
+            with patch.object(Image.Image, "resize", autospec=True, side_effect=resize) as spy:
+                builder.get_display_page_image(srce_image, *pages, 800, 600)
+            boxes.extend(c.kwargs["box"] for c in spy.call_args_list if "box" in c.kwargs)
+
+        full_box, reduced_box = boxes
+        assert reduced_image.size == (262, 397)
+        assert reduced_box == pytest.approx(tuple(side / 8 for side in full_box))
+
+    def test_two_pass_build_rejects_reduced_source(self, tmp_path: Path) -> None:
+        builder = self._make_builder(tmp_path, allow_reduced_decode=True)
+        reduced_image = load_pil_image_from_bytes(self._make_jpg_bytes(), ".jpg", 0.5)
+
+        with pytest.raises(ValueError, match="full size source"):
+            builder.get_display_page_image(
+                reduced_image,
+                *_make_pages(PageType.COVER),
+                800,
+                600,
+            )
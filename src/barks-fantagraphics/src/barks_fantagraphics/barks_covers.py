@@ -5,10 +5,19 @@
 Bootstrap-generated by experiments/bibliography/parse_bibliography.py --emit-covers,
 then hand-maintained (like comic_book_info.py). The reconciliation report verifies
 the one-to-one match between these records and the bibliography's cover entries.
+
+`BARKS_COVERS` and `COVER_LOCATIONS` are built at import, since comic_book_info and
+fanta_series_data build their cover titles and series entries from them at import.
+The lookup tables derived from them (`get_cover_by_key`, `get_cover_by_title`) are
+built on first use. Most of this module's cold import time is compiling its large
+literals, which the interpreter's cached bytecode already saves; there is no
+separate snapshot.
 """
 
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cache
+from typing import Any
 
 from comic_utils.comic_consts import MONTH_AS_SHORT_STR
 
@@ -4022,8 +4031,20 @@ BARKS_COVERS: list[BarksCover] = [
     ),
 ]
 
-BARKS_COVER_BY_KEY: dict[CoverKey, BarksCover] = {cover.key: cover for cover in BARKS_COVERS}
-assert len(BARKS_COVER_BY_KEY) == len(BARKS_COVERS), "duplicate BarksCover keys"
+
+@cache
+def get_cover_by_key() -> dict[CoverKey, BarksCover]:
+    """Return each cover keyed by its `BarksCover.key`, built on first use.
+
+    Returns:
+        The covers by key. Don't modify it; it is shared.
+
+    """
+    cover_by_key = {cover.key: cover for cover in BARKS_COVERS}
+    assert len(cover_by_key) == len(BARKS_COVERS), "duplicate BarksCover keys"
+    assert set(COVER_LOCATIONS) <= set(cover_by_key), "COVER_LOCATIONS key not in BARKS_COVERS"
+    return cover_by_key
+
 
 # Location of each cover's reprint in the Fantagraphics CCBDL volumes (usually the
 # volume's back-matter cover gallery). Maps a BarksCover key to
@@ -4225,9 +4246,6 @@ COVER_LOCATIONS: dict[CoverKey, tuple[int, int]] = {
 # fmt: on
 
 
-assert set(COVER_LOCATIONS) <= set(BARKS_COVER_BY_KEY), "COVER_LOCATIONS key not in BARKS_COVERS"
-
-
 def get_cover_location(cover: BarksCover) -> tuple[int, int] | None:
     """Return a cover's `(fanta_volume, fanta_page)` CCBDL reprint location, or None.
 
@@ -4376,8 +4394,17 @@ def get_cover_title(cover: BarksCover) -> Titles:
     return STR_TITLE_TO_ENUM[get_cover_title_str(cover)]
 
 
-COVER_BY_TITLE: dict[Titles, BarksCover] = {get_cover_title(cover): cover for cover in BARKS_COVERS}
-assert len(COVER_BY_TITLE) == len(BARKS_COVERS), "duplicate cover titles"
+@cache
+def get_cover_by_title() -> dict[Titles, BarksCover]:
+    """Return each cover keyed by its `Titles` member, built on first use.
+
+    Returns:
+        The covers by title. Don't modify it; it is shared.
+
+    """
+    cover_by_title = {get_cover_title(cover): cover for cover in BARKS_COVERS}
+    assert len(cover_by_title) == len(BARKS_COVERS), "duplicate cover titles"
+    return cover_by_title
 
 
 def get_cover_collection_page_num(title: Titles) -> int | None:
@@ -4392,7 +4419,7 @@ def get_cover_collection_page_num(title: Titles) -> int | None:
         The 1-based page number, or None if the cover has no authored location.
 
     """
-    cover = COVER_BY_TITLE.get(title)
+    cover = get_cover_by_title().get(title)
     if cover is None:
         return None
     located = get_located_covers()
@@ -4429,3 +4456,13 @@ def get_cover_display_title(cover: BarksCover) -> str:
         date = str(cover.issue_year)
 
     return f"{issue} ({date}){_COVER_KIND_SUFFIX[cover.kind]}"
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The module's old eager lookup tables, now built on first use.
+    if name == "BARKS_COVER_BY_KEY":
+        return get_cover_by_key()
+    if name == "COVER_BY_TITLE":
+        return get_cover_by_title()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
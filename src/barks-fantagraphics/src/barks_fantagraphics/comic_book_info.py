@@ -2,7 +2,9 @@
 
 from dataclasses import dataclass
 from datetime import date
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 from comic_utils.comic_consts import DEC, JAN, PanelPath
 
@@ -1589,27 +1591,58 @@ SYNTHETIC_TITLES = [
     Titles.ALL_COVERS,
 ]
 
-BARKS_ISSUE_DICT: dict[str, list[Titles]] = {
-    f"{_get_shortest_issue_name(info.issue_name)} {info.issue_number}": sorted(
-        inf.title
-        for inf in BARKS_TITLE_INFO
-        if (inf.issue_name == info.issue_name)
-        and (inf.issue_number == info.issue_number)
-        and (inf.title not in ONE_PAGERS)
-        and (inf.title not in COVERS_SET)
-    )
-    for info in BARKS_TITLE_INFO
-}
-# Add Uncle Scrooge special cases:
-BARKS_ISSUE_DICT[f"{SHORT_ISSUE_NAME[Issues.US]} 1"] = BARKS_ISSUE_DICT[
-    f"{SHORT_ISSUE_NAME[Issues.FC]} {US_1_FC_ISSUE_NUM}"
-]
-BARKS_ISSUE_DICT[f"{SHORT_ISSUE_NAME[Issues.US]} 2"] = BARKS_ISSUE_DICT[
-    f"{SHORT_ISSUE_NAME[Issues.FC]} {US_2_FC_ISSUE_NUM}"
-]
-BARKS_ISSUE_DICT[f"{SHORT_ISSUE_NAME[Issues.US]} 3"] = BARKS_ISSUE_DICT[
-    f"{SHORT_ISSUE_NAME[Issues.FC]} {US_3_FC_ISSUE_NUM}"
-]
+
+def _get_barks_issue_dict() -> dict[str, list[Titles]]:
+    # Group the titles by issue in one pass: scanning every title for each
+    # title's issue was most of this module's import time.
+    one_pagers = frozenset(ONE_PAGERS)
+    issue_titles: dict[tuple[Issues, int], list[Titles]] = {}
+    for info in BARKS_TITLE_INFO:
+        titles = issue_titles.setdefault((info.issue_name, info.issue_number), [])
+        if info.title not in one_pagers and info.title not in COVERS_SET:
+            titles.append(info.title)
+
+    return {
+        f"{_get_shortest_issue_name(info.issue_name)} {info.issue_number}": sorted(
+            issue_titles[(info.issue_name, info.issue_number)]
+        )
+        for info in BARKS_TITLE_INFO
+    }
+
+
+@cache
+def get_barks_issue_dict() -> dict[str, list[Titles]]:
+    """Return the Barks titles in each issue, keyed by short issue name, e.g. "DD 26".
+
+    Only title searches by issue use this, so it is built on first use rather
+    than at import.
+
+    Returns:
+        The titles in each issue, in title order. Don't modify it; it is shared.
+
+    """
+    barks_issue_dict = _get_barks_issue_dict()
+    # Add Uncle Scrooge special cases:
+    barks_issue_dict[f"{SHORT_ISSUE_NAME[Issues.US]} 1"] = barks_issue_dict[
+        f"{SHORT_ISSUE_NAME[Issues.FC]} {US_1_FC_ISSUE_NUM}"
+    ]
+    barks_issue_dict[f"{SHORT_ISSUE_NAME[Issues.US]} 2"] = barks_issue_dict[
+        f"{SHORT_ISSUE_NAME[Issues.FC]} {US_2_FC_ISSUE_NUM}"
+    ]
+    barks_issue_dict[f"{SHORT_ISSUE_NAME[Issues.US]} 3"] = barks_issue_dict[
+        f"{SHORT_ISSUE_NAME[Issues.FC]} {US_3_FC_ISSUE_NUM}"
+    ]
+
+    return barks_issue_dict
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The module's old eager 'BARKS_ISSUE_DICT' table, now built on first use.
+    if name == "BARKS_ISSUE_DICT":
+        return get_barks_issue_dict()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 _FUN_WHATS_THAT = "Fun? What's That?"
 _WANT_TO_BUY_AN_ISLAND = "Want to Buy an Island?"
@@ -17,12 +17,16 @@ from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import TYPE_CHECKING
 
+from .search_ports import WORD_SEARCH_PAGE_LEN
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
     from pathlib import Path
 
     from .barks_tags import TagGroups, Tags
     from .barks_titles import Titles
-    from .search_ports import AlphaSplitTerms, FullTextSearchPort
+    from .search_ports import AlphaSplitTerms, FullTextSearchPort, SpeechHitsPage
+    from .term_vocabulary import TermVocabulary
     from .title_search import BarksTitleSearch
     from .whoosh_search_engine import TitleDict
 
@@ -175,11 +179,15 @@ class ComicSearch:
         """Return the alphabetically-split word term index for A-Z browsing."""
         return self._get_full_text().get_cleaned_alpha_split_terms()
 
+    def get_word_vocabulary(self) -> TermVocabulary:
+        """Return the word term list with a prefix index, for matching typed words."""
+        return self._get_full_text().get_word_vocabulary()
+
     def get_alpha_split_entity_terms(self, entity_type: str) -> AlphaSplitTerms:
         """Return alphabetically-split entity terms for the given type."""
         return self._get_full_text().get_alpha_split_entity_terms(entity_type)
 
-    def get_entity_terms(self, entity_type: str) -> list[str]:
+    def get_entity_terms(self, entity_type: str) -> Sequence[str]:
         """Return the flat entity term list for the given type."""
         return self._get_full_text().get_entity_terms(entity_type)
 
@@ -198,6 +206,83 @@ class ComicSearch:
         """
         return self._get_full_text().find_words(search_words)
 
+    def find_words_page(
+        self, search_words: str, page_num: int = 1, page_len: int = WORD_SEARCH_PAGE_LEN
+    ) -> SpeechHitsPage:
+        """Return one page of ranked speech bubble hits for a full-text search.
+
+        Unlike ``find_words``, results are not capped: pass back the page's
+        ``next_page_num`` to continue where it left off.
+
+        Args:
+            search_words: The search query.
+            page_num: Which page to return, numbered from 1.
+            page_len: The number of hits per page.
+
+        Returns:
+            The hits on the page, best first, each with a highlighted fragment
+            of its speech text.
+
+        """
+        return self._get_full_text().find_words_page(search_words, page_num, page_len)
+
+    def iter_word_search_pages(
+        self, search_words: str, page_len: int = WORD_SEARCH_PAGE_LEN
+    ) -> Iterator[SpeechHitsPage]:
+        """Yield successive pages of ``find_words_page`` until the hits run out.
+
+        Lets a screen show the first hits straight away and add the rest as it
+        pulls more pages.
+
+        Args:
+            search_words: The search query.
+            page_len: The number of hits per page.
+
+        """
+        page_num: int | None = 1
+        while page_num is not None:
+            page = self.find_words_page(search_words, page_num, page_len)
+            if page.hits:
+                yield page
+            page_num = page.next_page_num
+
+    def iter_word_search_titles(
+        self, search_words: str, page_len: int = WORD_SEARCH_PAGE_LEN
+    ) -> Iterator[TitleDict]:
+        """Yield the word search hits grouped by title, a page of hits at a time.
+
+        The same ``TitleDict`` is yielded each time, with the latest page's hits
+        added. Its pages and speech bubbles are in order, as with ``find_words``,
+        but it holds every hit rather than the first 1000.
+
+        Args:
+            search_words: The search query.
+            page_len: The number of hits per page.
+
+        """
+        from .whoosh_search_engine import PageInfo, SpeechInfo, TitleInfo  # noqa: PLC0415
+
+        found: TitleDict = {}
+        for page in self.iter_word_search_pages(search_words, page_len):
+            page_titles: set[str] = set()
+            for hit in page.hits:
+                title_info = found.setdefault(hit.title, TitleInfo(hit.fanta_vol))
+                page_info = title_info.fanta_pages.setdefault(
+                    hit.fanta_page, PageInfo(hit.comic_page, [])
+                )
+                page_info.speech_info_list.append(
+                    SpeechInfo(hit.group_id, hit.panel_num, hit.speech_text)
+                )
+                page_titles.add(hit.title)
+
+            for title in page_titles:
+                title_info = found[title]
+                title_info.fanta_pages = dict(sorted(title_info.fanta_pages.items()))
+                for page_info in title_info.fanta_pages.values():
+                    page_info.speech_info_list.sort(key=lambda x: int(x.group_id))
+
+            yield found
+
     def find_entities(self, entity_type: str, entity_name: str) -> TitleDict:
         """Direct entity search returning raw ``TitleDict``.
 
@@ -241,6 +326,8 @@ class ComicSearch:
             if not titles:
                 seen = set(titles)
                 titles.extend(t for t in ts.get_titles_containing(query) if t not in seen)
+            if not titles:
+                titles = ts.get_titles_matching_fuzzy(query)
         return SearchResult(
             mode=SearchMode.TITLE,
             titles=titles,
@@ -249,10 +336,13 @@ class ComicSearch:
 
     def _search_tags(self, query: str) -> SearchResult:
         ts = self._get_title_search()
-        matched = ts.get_tags_matching_prefix(query)
+        matched: list[Tags | TagGroups] = list(ts.get_tags_matching_prefix(query))
+        min_chars = 2
+        if not matched and len(query) > min_chars:
+            matched = ts.get_tags_matching_fuzzy(query)
         return SearchResult(
             mode=SearchMode.TAG,
-            matched_tags=list(matched),
+            matched_tags=matched,
         )
 
     def _search_words(self, query: str) -> SearchResult:
@@ -1,9 +1,8 @@
 # ruff: noqa: ERA001
 
-import configparser
 import difflib
 import functools
-from configparser import ConfigParser, ExtendedInterpolation
+import threading
 from pathlib import Path
 
 from comic_utils.comic_consts import JPG_FILE_EXT, PNG_FILE_EXT, PanelPath
@@ -63,6 +62,7 @@ from .fanta_comics_info import (
     get_fanta_volume_str,
 )
 from .page_classes import OriginalPage
+from .story_index import StoryIndex, StoryIni
 
 
 class TitleNotFoundError(Exception):
@@ -72,7 +72,19 @@ class TitleNotFoundError(Exception):
 
 
 class ComicsDatabase:
-    def __init__(self, for_building_comics: bool = True) -> None:
+    """The story titles and their comic books.
+
+    Each title's ini file is parsed once, through a ``StoryIndex``. If a
+    *story_index_path* is given, the parsed ini files are saved there and only
+    changed ini files are parsed again by later databases. Comic books are kept
+    once built; :meth:`invalidate_comic_books` forgets them, and re-reads any
+    changed ini files. Comic books can be got from more than one thread (the
+    reader preloads the next comic on a background thread).
+    """
+
+    def __init__(
+        self, for_building_comics: bool = True, story_index_path: Path | None = None
+    ) -> None:
         self._database_dir = INTERNAL_DATA_DIR
         self._for_building_comics = for_building_comics
         self._story_titles_dir = _get_story_titles_dir(self._database_dir)
@@ -82,10 +94,20 @@ class ComicsDatabase:
         self._issue_titles = self._get_all_issue_titles()
         self._inset_dir = PNG_INSET_DIR
         self._inset_ext = PNG_FILE_EXT
+        self._story_index = StoryIndex(self._story_titles_dir, story_index_path)
+        self._is_story_index_loaded = False
+        self._comic_books: dict[tuple[str, str], ComicBook] = {}
+        # Guards the story index load and the comic books. Bumped whenever the
+        # comic books are forgotten, so one built meanwhile is not kept.
+        self._lock = threading.Lock()
+        self._comic_books_generation = 0
 
     def set_inset_info(self, inset_dir: Path, inset_ext: str) -> None:
         self._inset_dir = inset_dir
         self._inset_ext = inset_ext
+        # The comic books built so far have the old default insets.
+        with self._lock:
+            self._forget_comic_books()
         assert self._inset_dir.is_dir()
         assert self._inset_ext in [JPG_FILE_EXT, PNG_FILE_EXT]
 
@@ -101,6 +123,23 @@ class ComicsDatabase:
 
         return all_issues
 
+    def invalidate_comic_books(self) -> None:
+        """Forget the comic books built so far, and re-read any changed ini files."""
+        with self._lock:
+            self._forget_comic_books()
+            self._is_story_index_loaded = False
+
+    def _forget_comic_books(self) -> None:
+        self._comic_books.clear()
+        self._comic_books_generation += 1
+
+    def _get_story_ini(self, ini_filename: str) -> StoryIni:
+        with self._lock:
+            if not self._is_story_index_loaded:
+                self._story_index.load()
+                self._is_story_index_loaded = True
+        return self._story_index.get_story_ini(ini_filename)
+
     def get_comics_database_dir(self) -> Path:
         return self._database_dir
 
@@ -183,14 +222,10 @@ class ComicsDatabase:
         volume: int,
         exclude_non_comics: bool = False,
     ) -> list[tuple[str, FantaComicBookInfo]]:
-        config = ConfigParser(interpolation=ExtendedInterpolation())
-
         story_titles = []
         fanta_key = f"FANTA_{volume:02}"
         for file in self._ini_files:
-            ini_file = self._story_titles_dir / file
-            config.read(ini_file)
-            if config["info"]["source_comic"] == fanta_key:
+            if self._get_story_ini(file).info["source_comic"] == fanta_key:
                 story_title = get_title_str_from_filename(file)
                 if not exclude_non_comics or STR_TITLE_TO_ENUM[story_title] not in NON_COMIC_TITLES:
                     comic_info = self._all_comic_book_info[STR_TITLE_TO_ENUM[story_title]]
@@ -409,6 +444,23 @@ class ComicsDatabase:
         return self._all_comic_book_info[STR_TITLE_TO_ENUM[title]]
 
     def get_comic_book(self, title: str, intro_inset_file: PanelPath | None = None) -> ComicBook:
+        comic_key = (title, str(intro_inset_file) if intro_inset_file else "")
+        with self._lock:
+            comic = self._comic_books.get(comic_key)
+            generation = self._comic_books_generation
+        if comic is not None:
+            return comic
+
+        # Built outside the lock; if another thread built the same one meanwhile,
+        # both callers get the first.
+        comic = self._make_comic_book(title, intro_inset_file)
+        with self._lock:
+            if generation == self._comic_books_generation:
+                comic = self._comic_books.setdefault(comic_key, comic)
+
+        return comic
+
+    def _make_comic_book(self, title: str, intro_inset_file: PanelPath | None) -> ComicBook:
         story_title = ""
 
         found, titles, close = self.get_story_title_from_issue(title)
@@ -418,6 +470,7 @@ class ComicsDatabase:
                 msg = f"You cannot use an issue title that has multiple titles: {titles_str}."
                 raise RuntimeError(msg)
             story_title = titles[0]
+            fanta_info = self.get_fanta_comic_book_info(story_title)
         elif close:
             msg = f'Could not find issue title "{title}". Did you mean "{close}"?'
             raise RuntimeError(msg)
@@ -426,6 +479,8 @@ class ComicsDatabase:
             found, close = self.is_story_title(title)
             if found:
                 story_title = title
+                # Already known not to be an issue title.
+                fanta_info = self._all_comic_book_info[STR_TITLE_TO_ENUM[story_title]]
             else:
                 if close:
                     msg = f'Could not find title "{title}". Did you mean "{close}"?'
@@ -433,22 +488,21 @@ class ComicsDatabase:
                 msg = f'Could not find title "{title}".'
                 raise TitleNotFoundError(msg, title)
 
-        ini_file = self._story_titles_dir / get_filename_from_title_str(story_title, ".ini")
+        ini_filename = get_filename_from_title_str(story_title, ".ini")
+        ini_file = self._story_titles_dir / ini_filename
 
         if not intro_inset_file:
             intro_inset_file = self._get_inset_file(ini_file)
         assert intro_inset_file is not None
 
-        fanta_info: FantaComicBookInfo = self.get_fanta_comic_book_info(story_title)
-
-        config = configparser.ConfigParser(interpolation=configparser.ExtendedInterpolation())
-        config.read(ini_file)
-        fanta_book = FANTA_SOURCE_COMICS[config["info"]["source_comic"]]
+        story_ini = self._get_story_ini(ini_filename)
+        fanta_book = FANTA_SOURCE_COMICS[story_ini.info["source_comic"]]
         comic_book_dirs = self._get_comic_book_dirs(fanta_book)
 
         return _build_comic_book(
             story_title=story_title,
             ini_file=ini_file,
+            story_ini=story_ini,
             fanta_info=fanta_info,
             fanta_book=fanta_book,
             intro_inset_file=intro_inset_file,
@@ -493,6 +547,7 @@ class ComicsDatabase:
 def _build_comic_book(
     story_title: str,
     ini_file: Path,
+    story_ini: StoryIni,
     fanta_info: FantaComicBookInfo,
     fanta_book: FantaBook,
     intro_inset_file: PanelPath,
@@ -501,12 +556,12 @@ def _build_comic_book(
 ) -> ComicBook:
     logger.debug(f'Getting comic book info from config file "{get_relpath(ini_file)}".')
 
-    config = configparser.ConfigParser(interpolation=configparser.ExtendedInterpolation())
-    config.read(ini_file)
+    info = story_ini.info
+    pages = story_ini.pages
 
-    issue_title = config["info"].get("issue_title", "")
+    issue_title = info.get("issue_title", "")
 
-    title = config["info"]["title"]
+    title = info["title"]
     if not title and fanta_info.comic_book_info.is_barks_title:
         msg = f'"{story_title}" is a barks title and should be set in the ini file.'
         raise RuntimeError(msg)
@@ -520,7 +575,7 @@ def _build_comic_book(
     submitted_date = get_formatted_submitted_date(fanta_info.comic_book_info)
 
     publication_text = get_main_publication_info(story_title, fanta_info, fanta_book)
-    extra_pub_info = config["info"].get("extra_pub_info", "")
+    extra_pub_info = info.get("extra_pub_info", "")
 
     if is_one_pager_collection(fanta_info.comic_book_info.title):
         # The "All One-Pagers" collection's pages are not listed in the ini. They are
@@ -533,12 +588,12 @@ def _build_comic_book(
         config_page_images = get_cover_collection_pages()
     else:
         config_page_images = [
-            OriginalPage(key, PageType[config["pages"][key]])
-            for key in config["pages"]
+            OriginalPage(key, PageType[page_type])
+            for key, page_type in pages.items()
             if key != "solo_pages"
         ]
 
-    solo_pages_str = config["pages"].get("solo_pages", "")
+    solo_pages_str = pages.get("solo_pages", "")
     solo_page_keys: frozenset[str] = (
         frozenset(f"{int(k.strip()):03d}" for k in solo_pages_str.split(",") if k.strip())
         if solo_pages_str
@@ -549,12 +604,9 @@ def _build_comic_book(
         ini_file=ini_file,
         title=title,
         title_font_file=INTRO_TITLE_DEFAULT_FONT_FILE,
-        title_font_size=config["info"].getint("title_font_size", INTRO_TITLE_DEFAULT_FONT_SIZE),
+        title_font_size=int(info.get("title_font_size", INTRO_TITLE_DEFAULT_FONT_SIZE)),
         issue_title=issue_title,
-        author_font_size=config["info"].getint(
-            "author_font_size",
-            INTRO_AUTHOR_DEFAULT_FONT_SIZE,
-        ),
+        author_font_size=int(info.get("author_font_size", INTRO_AUTHOR_DEFAULT_FONT_SIZE)),
         srce_dir_num_page_files=srce_dir_num_page_files,
         dirs=comic_book_dirs,
         intro_inset_file=intro_inset_file,
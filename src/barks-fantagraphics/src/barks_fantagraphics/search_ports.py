@@ -10,14 +10,56 @@ No Whoosh imports in this module.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Mapping, Sequence
 
+    from .term_vocabulary import TermVocabulary
     from .whoosh_search_engine import TitleDict
 
-type AlphaSplitTerms = dict[str, dict[str, list[str]]]
+type AlphaSplitTerms = Mapping[str, Mapping[str, Sequence[str]]]
+
+WORD_SEARCH_PAGE_LEN = 50
+
+
+@dataclass(frozen=True, slots=True)
+class SpeechHit:
+    """One speech bubble matching a word search, with its relevance score.
+
+    Attributes:
+        fragment: An excerpt of the speech text with the matched words marked up.
+        speech_text: The whole speech text, as stored in the index.
+
+    """
+
+    title: str
+    fanta_vol: int
+    fanta_page: str
+    comic_page: str
+    group_id: str
+    panel_num: int
+    score: float
+    fragment: str
+    speech_text: str
+
+
+@dataclass(frozen=True, slots=True)
+class SpeechHitsPage:
+    """A page of ranked word search hits.
+
+    Attributes:
+        hits: The hits on this page, best first.
+        total: The number of hits for the whole search.
+        next_page_num: Pass this back to get the following page, or ``None`` if
+            this is the last page.
+
+    """
+
+    hits: list[SpeechHit]
+    total: int
+    next_page_num: int | None
 
 
 @runtime_checkable
@@ -28,6 +70,12 @@ class FullTextSearchPort(Protocol):
         """Full-text search across all indexed speech bubble text."""
         ...
 
+    def find_words_page(
+        self, search_words: str, page_num: int = 1, page_len: int = WORD_SEARCH_PAGE_LEN
+    ) -> SpeechHitsPage:
+        """Return one page of ranked, highlighted speech bubble hits."""
+        ...
+
     def find_entities(self, entity_type: str, entity_name: str) -> TitleDict:
         """Search for a named entity of the given type."""
         ...
@@ -36,15 +84,19 @@ class FullTextSearchPort(Protocol):
         """Return all comic title strings present in the index."""
         ...
 
-    def get_cleaned_terms(self) -> list[str]:
+    def get_cleaned_terms(self) -> Sequence[str]:
         """Return the cleaned, display-ready word list."""
         ...
 
+    def get_word_vocabulary(self) -> TermVocabulary:
+        """Return the cleaned word list with a prefix index."""
+        ...
+
     def get_cleaned_alpha_split_terms(self) -> AlphaSplitTerms:
         """Return cleaned terms grouped by first letter then by prefix."""
         ...
 
-    def get_entity_terms(self, entity_type: str) -> list[str]:
+    def get_entity_terms(self, entity_type: str) -> Sequence[str]:
         """Return sorted entity names for the given entity type."""
         ...
 
@@ -62,6 +114,7 @@ class IndexBuilderPort(Protocol):
         volumes: list[int],
         entity_tagger: Callable[[str], dict[str, set[str]]] | None = None,
         entity_provider: Callable[[str, str, str], dict[str, set[str]]] | None = None,
+        max_workers: int = 1,
     ) -> None:
         """Build or rebuild the search index for the given volumes."""
         ...
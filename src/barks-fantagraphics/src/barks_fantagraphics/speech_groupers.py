@@ -1,10 +1,12 @@
 import json
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import StrEnum
 from itertools import groupby
 from pathlib import Path
 from typing import Any
 
+from loguru import logger
+
 from .barks_titles import Titles
 from .comic_book import ComicBook
 from .comics_consts import RESTORABLE_PAGE_TYPES
@@ -107,12 +109,23 @@ class SpeechPageGroup:
 class SpeechGroups:
     _comics_database: ComicsDatabase
 
-    # TODO: Have a way to get with/with json and ocr file.
-    def get_speech_page_groups(self, title: Titles) -> list[SpeechPageGroup]:
+    def get_speech_page_groups(
+        self, title: Titles, with_json: bool = True
+    ) -> list[SpeechPageGroup]:
+        """Return the speech of each page of *title*, for each OCR engine.
+
+        Without *with_json*, the groups come from the title's speech groups
+        cache, which is rebuilt if any of the title's OCR prelim JSON files has
+        changed. Their ``speech_page_json`` is then empty, so they can't be
+        checked for changes or saved.
+        """
         volume = self._comics_database.get_fanta_volume_int_for(title)
         comic = self._comics_database.get_comic_book_for(title)
         srce_dest_map = self._get_srce_page_to_dest_page_map(comic)
 
+        if not with_json:
+            return self._get_cached_speech_page_groups(volume, title, srce_dest_map)
+
         speech_page_groups: list[SpeechPageGroup] = []
         for srce_page, dest_page in srce_dest_map.items():
             for ocr_index in OcrTypes:
@@ -123,6 +136,53 @@ class SpeechGroups:
 
         return speech_page_groups
 
+    def _get_cached_speech_page_groups(
+        self, volume: int, title: Titles, srce_dest_map: dict[str, str]
+    ) -> list[SpeechPageGroup]:
+        from .speech_groups_cache import (  # noqa: PLC0415
+            get_source_signature,
+            get_speech_groups_cache_file,
+            load_speech_groups_cache,
+            write_speech_groups_cache,
+        )
+
+        ocr_prelim_dir = self._comics_database.get_fantagraphics_restored_ocr_prelim_volume_dir(
+            volume
+        )
+        cache_file = get_speech_groups_cache_file(ocr_prelim_dir, title)
+        pages = [
+            (ocr_index, srce_page, dest_page)
+            for srce_page, dest_page in srce_dest_map.items()
+            for ocr_index in OcrTypes
+        ]
+
+        cached_groups = load_speech_groups_cache(cache_file, title, volume, ocr_prelim_dir, pages)
+        if cached_groups is not None:
+            return cached_groups
+
+        speech_page_groups: list[SpeechPageGroup] = []
+        source_signatures = []
+        for ocr_index, srce_page, dest_page in pages:
+            # Taken before reading, so a file changed while it's read looks stale.
+            source_signatures.append(
+                get_source_signature(
+                    ocr_prelim_dir / get_ocr_prelim_groups_json_filename(srce_page, ocr_index)
+                )
+            )
+            speech_page_group = get_speech_page_group(
+                self._comics_database, volume, title, ocr_index, srce_page, dest_page
+            )
+            speech_page_groups.append(replace(speech_page_group, speech_page_json={}))
+
+        try:
+            write_speech_groups_cache(
+                cache_file, title, volume, speech_page_groups, source_signatures
+            )
+        except (OSError, ValueError) as e:
+            logger.warning(f'Could not write speech groups cache "{cache_file}": {e}')
+
+        return speech_page_groups
+
     @staticmethod
     def _get_srce_page_to_dest_page_map(comic: ComicBook) -> dict[str, str]:
         srce_dest_map = {}
@@ -187,7 +247,7 @@ def _get_speech_text_list(
             raw_ai_text=raw_ai_text,
             ai_text=ai_text,
             type=group["type"],
-            text_box=group["text_box"],
+            text_box=[(x, y) for x, y in group["text_box"]],
         )
 
     return speech_groups, ocr_prelim_group
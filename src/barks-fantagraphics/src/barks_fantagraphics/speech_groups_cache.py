@@ -0,0 +1,324 @@
+"""Per-title binary cache of the grouped OCR speech that ``SpeechGroups`` reads.
+
+Reading a title's speech means parsing one OCR prelim groups JSON per page and
+OCR engine. Index builds, statistics scripts and validators do that for every
+title, over and over, so ``SpeechGroups.get_speech_page_groups(title,
+with_json=False)`` keeps each title's speech in a compact record file next to
+the volume's prelim JSON, and reads it back through a memory map.
+
+A cache file is only used while every page it was built from has the same
+modification time and size as when it was written, and the title still has
+the same pages. Otherwise it is rebuilt from the JSON.
+
+File layout (little-endian)::
+
+    header       magic, format version, title, volume and section sizes
+    string lens  the length in characters of each distinct string
+    strings      the UTF-8 text of the strings; records refer to a string by
+                 its index
+    pages        one record per page and OCR engine, with its JSON file's
+                 name, modification time and size
+    texts        one record per speech text
+    coords       text box coordinates, as doubles
+    int coords   text box coordinates of the boxes with only int coordinates
+
+Each distinct string is decoded once per load, and shared by the records
+using it.
+"""
+
+import mmap
+import struct
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate
+from pathlib import Path
+
+from .barks_titles import Titles
+from .speech_groupers import OcrTypes, SpeechPageGroup, SpeechText
+
+SPEECH_GROUPS_CACHE_DIR_NAME = ".speech-groups-cache"
+SPEECH_GROUPS_CACHE_VERSION = 1
+
+_MAGIC = b"BKSG"
+
+# magic, version, title, volume, num strings, string bytes, num pages,
+# num texts, num coords, num int coords
+_HEADER = struct.Struct("<4sHIIIIIIII")
+# ocr type, fanta page, comic page, source file name, source mtime_ns,
+# source size, first text, num texts
+_PAGE = struct.Struct("<4IqqII")
+# group id, raw ai text, ai text, type, panel num, int coords flag,
+# first coord, num coords
+_TEXT = struct.Struct("<4IiBII")
+
+type SourceSignature = tuple[int, int]
+type PageKey = tuple[OcrTypes, str, str]
+
+# No file has a negative size.
+_MISSING_SOURCE_SIGNATURE: SourceSignature = (0, -1)
+
+
+def get_speech_groups_cache_file(ocr_prelim_dir: Path, title: Titles) -> Path:
+    return ocr_prelim_dir / SPEECH_GROUPS_CACHE_DIR_NAME / f"{title.name.lower()}.bin"
+
+
+def get_source_signature(source_file: Path) -> SourceSignature | None:
+    """Return the modification time and size of *source_file*, or None if it's missing."""
+    try:
+        stat = source_file.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self._indexes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._indexes)
+
+    def add(self, s: str) -> int:
+        index = self._indexes.get(s)
+        if index is None:
+            index = self._indexes[s] = len(self._indexes)
+        return index
+
+    def get_lengths(self) -> array[int]:
+        return array("I", map(len, self._indexes))
+
+    def to_bytes(self) -> bytes:
+        return "".join(self._indexes).encode("utf-8", "surrogatepass")
+
+
+def write_speech_groups_cache(
+    cache_file: Path,
+    title: Titles,
+    fanta_vol: int,
+    speech_page_groups: list[SpeechPageGroup],
+    source_signatures: list[SourceSignature | None],
+) -> None:
+    """Write *speech_page_groups* to *cache_file*, replacing it atomically.
+
+    *source_signatures* are the signatures of the groups' JSON files, taken
+    before the files were read. A page without one is never up to date.
+
+    Raises:
+        ValueError: If the speech can't be stored in the record format.
+
+    """
+    strings = _StringTable()
+    pages = bytearray()
+    texts = bytearray()
+    coords = array("d")
+    int_coords = array("q")
+    num_texts = 0
+
+    for page, signature in zip(speech_page_groups, source_signatures, strict=True):
+        mtime_ns, size = _MISSING_SOURCE_SIGNATURE if signature is None else signature
+        first_text = num_texts
+        for speech_text in page.speech_groups.values():
+            if not isinstance(speech_text.panel_num, int):
+                msg = f"Panel num is not an int: {speech_text}"
+                raise ValueError(msg)  # noqa: TRY004
+            text_coords = [c for point in speech_text.text_box for c in _get_point(point)]
+            int_text_coords = [c for c in text_coords if type(c) is int]
+            is_int = len(int_text_coords) == len(text_coords)
+            texts += _TEXT.pack(
+                strings.add(speech_text.group_id),
+                strings.add(speech_text.raw_ai_text),
+                strings.add(speech_text.ai_text),
+                strings.add(speech_text.type),
+                speech_text.panel_num,
+                is_int,
+                len(int_coords) if is_int else len(coords),
+                len(text_coords),
+            )
+            try:
+                if is_int:
+                    int_coords.extend(int_text_coords)
+                else:
+                    coords.extend(text_coords)
+            except (OverflowError, TypeError) as e:
+                msg = f"Text box is not numeric: {speech_text}"
+                raise ValueError(msg) from e
+            num_texts += 1
+
+        pages += _PAGE.pack(
+            strings.add(page.ocr_index.value),
+            strings.add(page.fanta_page),
+            strings.add(page.comic_page),
+            strings.add(page.ocr_prelim_groups_json_file.name),
+            mtime_ns,
+            size,
+            first_text,
+            num_texts - first_text,
+        )
+
+    string_bytes = strings.to_bytes()
+    header = _HEADER.pack(
+        _MAGIC,
+        SPEECH_GROUPS_CACHE_VERSION,
+        title.value,
+        fanta_vol,
+        len(strings),
+        len(string_bytes),
+        len(speech_page_groups),
+        num_texts,
+        len(coords),
+        len(int_coords),
+    )
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = cache_file.with_suffix(".tmp")
+    with temp_file.open("wb") as f:
+        f.write(header)
+        f.write(strings.get_lengths().tobytes())
+        f.write(string_bytes)
+        f.write(pages)
+        f.write(texts)
+        f.write(coords.tobytes())
+        f.write(int_coords.tobytes())
+    temp_file.replace(cache_file)
+
+
+def _get_point(point: list[int | float] | tuple[int | float, ...]) -> list[int | float]:
+    if len(point) != 2:  # noqa: PLR2004
+        msg = f"Text box point is not an (x, y) pair: {point}"
+        raise ValueError(msg)
+    return list(point)
+
+
+def load_speech_groups_cache(
+    cache_file: Path,
+    title: Titles,
+    fanta_vol: int,
+    ocr_prelim_dir: Path,
+    expected_pages: list[PageKey],
+) -> list[SpeechPageGroup] | None:
+    """Return the cached speech of *title*, or None if there's no up-to-date cache.
+
+    The cache is out of date if its pages aren't *expected_pages*, in order, or
+    any of its pages' JSON files has changed since it was written. The returned
+    groups have an empty ``speech_page_json``.
+    """
+    try:
+        with (
+            cache_file.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm,
+        ):
+            return _read_speech_groups(mm, title, fanta_vol, ocr_prelim_dir, expected_pages)
+    except (OSError, ValueError, IndexError, struct.error):
+        # Missing, empty or unreadable: rebuild it.
+        return None
+
+
+def _read_speech_groups(
+    mm: mmap.mmap,
+    title: Titles,
+    fanta_vol: int,
+    ocr_prelim_dir: Path,
+    expected_pages: list[PageKey],
+) -> list[SpeechPageGroup] | None:
+    (
+        magic,
+        version,
+        cached_title,
+        cached_vol,
+        num_strings,
+        string_len,
+        num_pages,
+        num_texts,
+        num_coords,
+        num_int_coords,
+    ) = _HEADER.unpack_from(mm)
+    if (magic, version, cached_title, cached_vol) != (
+        _MAGIC,
+        SPEECH_GROUPS_CACHE_VERSION,
+        title.value,
+        fanta_vol,
+    ):
+        return None
+    if num_pages != len(expected_pages):
+        return None
+
+    strings_start = _HEADER.size + num_strings * 4
+    pages_start = strings_start + string_len
+    texts_start = pages_start + num_pages * _PAGE.size
+    coords_start = texts_start + num_texts * _TEXT.size
+    int_coords_start = coords_start + num_coords * 8
+    if len(mm) != int_coords_start + num_int_coords * 8:
+        return None
+
+    strings = _get_strings(mm, num_strings, strings_start, pages_start)
+    coords = array("d", mm[coords_start:int_coords_start]).tolist()
+    int_coords = array("q", mm[int_coords_start:]).tolist()
+    speech_texts = [
+        SpeechText(
+            group_id=strings[group_id],
+            panel_num=panel_num,
+            raw_ai_text=strings[raw_ai_text_id],
+            ai_text=strings[ai_text_id],
+            type=strings[type_id],
+            text_box=_get_text_box(
+                int_coords if is_int else coords, first_coord, first_coord + num_text_coords
+            ),
+        )
+        for (
+            group_id,
+            raw_ai_text_id,
+            ai_text_id,
+            type_id,
+            panel_num,
+            is_int,
+            first_coord,
+            num_text_coords,
+        ) in _TEXT.iter_unpack(mm[texts_start:coords_start])
+    ]
+
+    speech_page_groups = []
+    for page_record, expected_page in zip(
+        _PAGE.iter_unpack(mm[pages_start:texts_start]), expected_pages, strict=True
+    ):
+        ocr_id, fanta_page_id, comic_page_id, source_id = page_record[:4]
+        mtime_ns, size, first_text, page_num_texts = page_record[4:]
+
+        page_key = (strings[ocr_id], strings[fanta_page_id], strings[comic_page_id])
+        if page_key != expected_page:
+            return None
+        source_file = ocr_prelim_dir / strings[source_id]
+        if get_source_signature(source_file) != (mtime_ns, size):
+            return None
+
+        speech_page_groups.append(
+            SpeechPageGroup(
+                fanta_vol=fanta_vol,
+                title=title,
+                ocr_index=OcrTypes(page_key[0]),
+                fanta_page=page_key[1],
+                comic_page=page_key[2],
+                speech_groups={
+                    t.group_id: t for t in speech_texts[first_text : first_text + page_num_texts]
+                },
+                speech_page_json={},
+                ocr_prelim_groups_json_file=source_file,
+            )
+        )
+
+    return speech_page_groups
+
+
+def _get_strings(mm: mmap.mmap, num_strings: int, start: int, end: int) -> list[str]:
+    lengths = array("I", mm[start - num_strings * 4 : start])
+    text = mm[start:end].decode("utf-8", "surrogatepass")
+    if sum(lengths) != len(text):
+        msg = "String lengths don't match the strings."
+        raise ValueError(msg)
+    offsets = [0, *accumulate(lengths)]
+    return [text[offsets[i] : offsets[i + 1]] for i in range(num_strings)]
+
+
+def _get_text_box(
+    coords: Sequence[int | float], start: int, end: int
+) -> list[tuple[int | float, int | float]]:
+    return [(coords[i], coords[i + 1]) for i in range(start, end, 2)]
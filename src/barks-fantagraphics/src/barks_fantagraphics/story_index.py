@@ -0,0 +1,178 @@
+"""Compiled index of the story titles' ini files.
+
+``ComicsDatabase`` needs the ``[info]`` and ``[pages]`` sections of a title's
+ini file every time it builds a ``ComicBook``. A ``StoryIndex`` parses each ini
+file once, and can save the parsed sections of every title in one JSON file.
+A later index only re-parses the ini files that are new, or have a different
+modification time or size since then.
+"""
+
+import json
+import os
+import tempfile
+from collections.abc import Mapping
+from configparser import ConfigParser, ExtendedInterpolation
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, TypeIs
+
+from loguru import logger
+
+# Bump when the index layout or the way the ini files are read changes.
+STORY_INDEX_VERSION = 1
+
+type IniSignature = list[int]
+
+
+@dataclass(frozen=True, slots=True)
+class StoryIni:
+    """The sections of a story title's ini file, as ``ConfigParser`` reads them.
+
+    Keys are lower-cased, values are interpolated, and each section keeps the
+    order of the file.
+    """
+
+    info: Mapping[str, str]
+    pages: Mapping[str, str]
+
+
+def read_story_ini(ini_file: Path) -> StoryIni:
+    config = ConfigParser(interpolation=ExtendedInterpolation())
+    if not config.read(ini_file):
+        msg = f'Could not read story title ini file "{ini_file}".'
+        raise FileNotFoundError(msg)
+
+    return StoryIni(
+        info=MappingProxyType(dict(config["info"])),
+        pages=MappingProxyType(dict(config["pages"])),
+    )
+
+
+class StoryIndex:
+    """The parsed ini files of a story titles directory, keyed by file name.
+
+    If an *index_path* is given, the parsed sections are saved there by
+    :meth:`load` and reused by later indexes for every unchanged ini file.
+    """
+
+    def __init__(self, story_titles_dir: Path, index_path: Path | None = None) -> None:
+        self._story_titles_dir = story_titles_dir
+        self._index_path = index_path
+        self._story_inis: dict[str, StoryIni] = {}
+        self.num_inis_parsed = 0
+
+    def get_story_ini(self, ini_filename: str) -> StoryIni:
+        """Return the sections of *ini_filename*, which must be in the directory.
+
+        Raises:
+            KeyError: If there's no such ini file in the indexed directory.
+
+        """
+        return self._story_inis[ini_filename]
+
+    def load(self) -> None:
+        """Index the directory's ini files, parsing only those that have changed."""
+        signatures = {
+            entry.name: _get_ini_signature(entry)
+            for entry in os.scandir(self._story_titles_dir)
+            if entry.name.endswith(".ini") and entry.is_file()
+        }
+
+        indexed_inis = self._read_index()
+
+        new_indexed_inis: dict[str, dict[str, Any]] = {}
+        # Built aside and swapped in whole, so a reader never sees it half filled.
+        story_inis: dict[str, StoryIni] = {}
+        self.num_inis_parsed = 0
+
+        for ini_filename in sorted(signatures):
+            signature = signatures[ini_filename]
+            entry = indexed_inis.get(ini_filename)
+            if entry is not None and not _is_index_entry(entry):
+                logger.warning(f'Ignoring malformed story index entry for "{ini_filename}".')
+                entry = None
+            if entry is not None and entry["signature"] == signature:
+                story_ini = StoryIni(
+                    info=MappingProxyType(entry["info"]), pages=MappingProxyType(entry["pages"])
+                )
+            else:
+                story_ini = read_story_ini(self._story_titles_dir / ini_filename)
+                self.num_inis_parsed += 1
+                entry = {
+                    "signature": signature,
+                    "info": dict(story_ini.info),
+                    "pages": dict(story_ini.pages),
+                }
+
+            story_inis[ini_filename] = story_ini
+            new_indexed_inis[ini_filename] = entry
+
+        self._story_inis = story_inis
+        if self.num_inis_parsed or new_indexed_inis.keys() != indexed_inis.keys():
+            self._write_index(new_indexed_inis)
+
+    def _read_index(self) -> dict[str, Any]:
+        """Return the index's ini entries, unchecked, or `{}` if it is unusable."""
+        if self._index_path is None or not self._index_path.is_file():
+            return {}
+
+        try:
+            with self._index_path.open("r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable story index "{self._index_path}": {e}')
+            return {}
+
+        if not isinstance(index, dict) or index.get("version") != STORY_INDEX_VERSION:
+            logger.info(f'Ignoring out of date story index "{self._index_path}".')
+            return {}
+
+        inis = index.get("inis")
+        if not isinstance(inis, dict):
+            logger.warning(f'Ignoring malformed story index "{self._index_path}".')
+            return {}
+
+        return inis
+
+    def _write_index(self, inis: dict[str, dict[str, Any]]) -> None:
+        if self._index_path is None:
+            return
+
+        index = {"version": STORY_INDEX_VERSION, "inis": inis}
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                prefix=self._index_path.name, dir=self._index_path.parent
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(index, f)
+                Path(temp_name).replace(self._index_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f'Could not write story index "{self._index_path}": {e}')
+            return
+
+        logger.debug(f'Wrote story index "{self._index_path}".')
+
+
+def _is_index_entry(entry: object) -> TypeIs[dict[str, Any]]:
+    """Whether *entry* has the shape :meth:`StoryIndex.load` writes."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("signature"), list)
+        and _is_json_section(entry.get("info"))
+        and _is_json_section(entry.get("pages"))
+    )
+
+
+def _is_json_section(section: object) -> bool:
+    return isinstance(section, dict) and all(isinstance(v, str) for v in section.values())
+
+
+def _get_ini_signature(entry: os.DirEntry[str]) -> IniSignature:
+    stat = entry.stat()
+    return [stat.st_size, stat.st_mtime_ns]
@@ -0,0 +1,84 @@
+"""Immutable term vocabularies for browsing and prefix lookups.
+
+The search index's word and entity term lists are loaded once and kept for as
+long as their files don't change, so they are held in compact, read-only
+structures: tuples of interned strings, which the alphabetical split of a
+vocabulary shares with its flat term list.
+
+No Whoosh imports in this module.
+"""
+
+from __future__ import annotations
+
+import sys
+from bisect import bisect_left
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+    from .search_ports import AlphaSplitTerms
+
+# Sorts after any character a term can have, to bound a prefix range.
+_MAX_CHAR = chr(sys.maxunicode)
+
+
+class TermVocabulary:
+    """A read-only term list with a case-insensitive prefix index.
+
+    Args:
+        terms: The terms, in display order.
+
+    """
+
+    __slots__ = ("_index_keys", "_index_terms", "_terms")
+
+    def __init__(self, terms: Iterable[str]) -> None:
+        self._terms = tuple(sys.intern(t) for t in terms)
+
+        # Lowercased terms in code point order, so a prefix's matches are a
+        # contiguous range that can be found by bisection.
+        index = sorted((t.lower(), i) for i, t in enumerate(self._terms))
+        self._index_keys = tuple(sys.intern(key) for key, _ in index)
+        self._index_terms = tuple(self._terms[i] for _, i in index)
+
+    @property
+    def terms(self) -> tuple[str, ...]:
+        """All the terms, in display order."""
+        return self._terms
+
+    def __len__(self) -> int:
+        """Return the number of terms."""
+        return len(self._terms)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the terms in display order."""
+        return iter(self._terms)
+
+    def with_prefix(self, prefix: str) -> tuple[str, ...]:
+        """Return the terms starting with *prefix*, ignoring case.
+
+        The matches come in lowercased code point order.
+        """
+        key = prefix.lower()
+        start = bisect_left(self._index_keys, key)
+        end = bisect_left(self._index_keys, key + _MAX_CHAR, lo=start)
+        return self._index_terms[start:end]
+
+
+def freeze_alpha_split_terms(
+    alpha_split_terms: Mapping[str, Mapping[str, Iterable[str]]],
+) -> AlphaSplitTerms:
+    """Return a read-only copy of *alpha_split_terms*, with interned terms."""
+    return MappingProxyType(
+        {
+            sys.intern(letter): MappingProxyType(
+                {
+                    sys.intern(prefix): tuple(sys.intern(t) for t in terms)
+                    for prefix, terms in prefix_terms.items()
+                }
+            )
+            for letter, prefix_terms in alpha_split_terms.items()
+        }
+    )
@@ -15,8 +15,11 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from barks_fantagraphics.search_ports import WORD_SEARCH_PAGE_LEN, SpeechHitsPage
+from barks_fantagraphics.term_vocabulary import TermVocabulary
+
 if TYPE_CHECKING:
-    from barks_fantagraphics.search_ports import AlphaSplitTerms
+    from barks_fantagraphics.search_ports import AlphaSplitTerms, SpeechHit
     from barks_fantagraphics.whoosh_search_engine import TitleDict
 
 
@@ -25,6 +28,7 @@ class InMemoryFullTextSearch:
     """Fake ``FullTextSearchPort`` backed by plain dicts. No Whoosh, no disk."""
 
     find_words_results: dict[str, TitleDict] = field(default_factory=dict)
+    find_words_hits: dict[str, list[SpeechHit]] = field(default_factory=dict)
     find_entities_results: dict[tuple[str, str], TitleDict] = field(default_factory=dict)
     all_titles: set[str] = field(default_factory=set)
     cleaned_terms: list[str] = field(default_factory=list)
@@ -36,6 +40,16 @@ class InMemoryFullTextSearch:
         """Return canned results for the given query, or empty dict."""
         return self.find_words_results.get(search_words, {})
 
+    def find_words_page(
+        self, search_words: str, page_num: int = 1, page_len: int = WORD_SEARCH_PAGE_LEN
+    ) -> SpeechHitsPage:
+        """Return a page of the canned hits for the given query."""
+        hits = self.find_words_hits.get(search_words, [])
+        end = page_num * page_len
+        return SpeechHitsPage(
+            hits[end - page_len : end], len(hits), page_num + 1 if end < len(hits) else None
+        )
+
     def find_entities(self, entity_type: str, entity_name: str) -> TitleDict:
         """Return canned results for the given entity lookup, or empty dict."""
         return self.find_entities_results.get((entity_type, entity_name), {})
@@ -48,6 +62,10 @@ class InMemoryFullTextSearch:
         """Return the configured cleaned term list."""
         return self.cleaned_terms
 
+    def get_word_vocabulary(self) -> TermVocabulary:
+        """Return the configured cleaned term list with a prefix index."""
+        return TermVocabulary(self.cleaned_terms)
+
     def get_cleaned_alpha_split_terms(self) -> AlphaSplitTerms:
         """Return the configured alpha-split terms."""
         return self.cleaned_alpha_split_terms
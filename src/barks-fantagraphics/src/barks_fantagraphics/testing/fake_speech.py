@@ -0,0 +1,158 @@
+"""Synthetic speech bubble corpus for search index build tests and benchmarks.
+
+``SyntheticComicsDatabase`` answers the ``ComicsDatabase`` calls that
+``SearchEngineCreator`` makes, and ``SyntheticSpeechGroups`` stands in for
+``SpeechGroups``, so an index can be built without any OCR files::
+
+    comics_database = SyntheticComicsDatabase(titles_per_volume=4)
+    speech_groups = SyntheticSpeechGroups(titles_per_volume=4)
+    with patch.object(whoosh_search_engine, "SpeechGroups", return_value=speech_groups):
+        SearchEngineCreator(comics_database, index_dir, OcrTypes.EASYOCR).index_volumes([1, 2])
+
+The speech text is pseudo-random but fixed for a given title, so two builds of
+the same volumes see exactly the same documents. ``SyntheticSpeechGroups`` is
+picklable, so it can be handed to the index build worker processes. Those
+workers start in a fresh interpreter, so an entity tagger given to a parallel
+build must be importable there: ``tag_scrooge`` and ``tag_curated_persons`` are.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+from barks_fantagraphics.barks_titles import ENUM_TO_STR_TITLE, Titles
+from barks_fantagraphics.entity_types import EntityType
+from barks_fantagraphics.speech_groupers import OcrTypes, SpeechPageGroup, SpeechText
+
+SYNTHETIC_WORDS = (
+    "money",
+    "dime",
+    "treasure",
+    "gold",
+    "boat",
+    "island",
+    "nephews",
+    "uncle",
+    "scrooge",
+    "donald",
+    "gladstone",
+    "luck",
+    "storm",
+    "jungle",
+    "map",
+    "rocket",
+    "bin",
+    "beagle",
+    "woodchucks",
+    "duckburg",
+    "can't",
+    "spell-binder",
+    *(f"zork{i}" for i in range(200)),
+)
+
+
+def _get_volume_titles(volume: int, titles_per_volume: int) -> list[Titles]:
+    first = (volume - 1) * titles_per_volume
+    return list(Titles)[first : first + titles_per_volume]
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticComicsDatabase:
+    """Puts ``titles_per_volume`` consecutive titles in each Fantagraphics volume."""
+
+    titles_per_volume: int = 4
+
+    def get_configured_titles_in_fantagraphics_volume(
+        self, volume: int, exclude_non_comics: bool = False
+    ) -> list[tuple[str, Any]]:
+        """Return ``(title_str, fanta_info)`` pairs for the titles in *volume*."""
+        _ = exclude_non_comics
+        return [
+            (
+                ENUM_TO_STR_TITLE[title],
+                SimpleNamespace(comic_book_info=SimpleNamespace(title=title)),
+            )
+            for title in _get_volume_titles(volume, self.titles_per_volume)
+        ]
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticSpeechGroups:
+    """Generates fixed pseudo-random speech pages for each title, for both OCR types.
+
+    The speech text of the *edited_titles* is different, as if their OCR had been
+    corrected since.
+    """
+
+    titles_per_volume: int = 4
+    pages_per_title: int = 8
+    bubbles_per_page: int = 6
+    words_per_bubble: int = 10
+    edited_titles: frozenset[Titles] = frozenset()
+
+    def get_speech_page_groups(
+        self, title: Titles, with_json: bool = True
+    ) -> list[SpeechPageGroup]:
+        """Return the speech pages of *title*, always with an empty ``speech_page_json``."""
+        _ = with_json
+        rng = random.Random(f"{title.value}-edited" if title in self.edited_titles else title.value)
+        fanta_vol = title.value // self.titles_per_volume + 1
+
+        speech_page_groups = []
+        for page in range(self.pages_per_title):
+            for ocr_index in OcrTypes:
+                speech_groups = {}
+                for group_num in range(self.bubbles_per_page):
+                    words = rng.choices(SYNTHETIC_WORDS, k=self.words_per_bubble)
+                    raw_ai_text = " ".join(words).upper().replace(" ", "\n", 1)
+                    group_id = str(group_num)
+                    speech_groups[group_id] = SpeechText(
+                        group_id=group_id,
+                        panel_num=1 + group_num % 6,
+                        raw_ai_text=raw_ai_text,
+                        ai_text=raw_ai_text.replace("\n", " "),
+                        type="speech",
+                        text_box=[(0, 0), (10, 0), (10, 10), (0, 10)],
+                    )
+                speech_page_groups.append(
+                    SpeechPageGroup(
+                        fanta_vol=fanta_vol,
+                        title=title,
+                        ocr_index=ocr_index,
+                        fanta_page=f"{title.value * 10 + page:03d}",
+                        comic_page=str(page + 1),
+                        speech_groups=speech_groups,
+                        speech_page_json={},
+                        ocr_prelim_groups_json_file=Path(),
+                    )
+                )
+
+        return speech_page_groups
+
+
+def tag_scrooge(speech_text: str) -> dict[str, set[str]]:
+    """Tag "Scrooge" as a person in any speech text that mentions him."""
+    return {"person": {"Scrooge"}} if "scrooge" in speech_text.lower() else {}
+
+
+@cache
+def _get_person_patterns() -> list[tuple[str, re.Pattern[str]]]:
+    from barks_fantagraphics.whoosh_search_engine import _build_curated_entity_sets  # noqa: PLC0415
+
+    return [
+        (name, re.compile(rf"\b{re.escape(name)}\b", re.IGNORECASE))
+        for name in sorted(_build_curated_entity_sets()[EntityType.PERSON])
+    ]
+
+
+def tag_curated_persons(speech_text: str) -> dict[str, set[str]]:
+    """Tag every curated person name in the speech text, standing in for the real tagger's cost."""
+    return {
+        "person": {name for name, pattern in _get_person_patterns() if pattern.search(speech_text)}
+    }
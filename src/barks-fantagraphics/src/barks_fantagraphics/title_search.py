@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import cache
 from typing import TYPE_CHECKING
 
 from .barks_tags import (
@@ -12,14 +13,49 @@ from .barks_tags import (
     Tags,
     get_all_tags_in_tag_group,
 )
-from .comic_book_info import BARKS_ISSUE_DICT, BARKS_TITLE_INFO
+from .comic_book_info import BARKS_TITLE_INFO, get_barks_issue_dict
 from .comic_issues import Issues
+from .trigram_index import FUZZY_SEARCH_LIMIT, TrigramIndex
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from .barks_titles import Titles
 
 PREFIX_LEN = 2
 
+_LEADING_ARTICLES = ("The ", "A ", "An ")
+
+
+@cache
+def _get_title_trigrams() -> TrigramIndex[Titles]:
+    """Return the trigram index of the titles, built on the first search that needs it."""
+    return TrigramIndex(
+        (info.title, title_str)
+        for info in BARKS_TITLE_INFO
+        if info.issue_name != Issues.EXTRAS
+        for title_str in _get_title_search_strs(info.get_title_str())
+    )
+
+
+@cache
+def _get_tag_trigrams() -> TrigramIndex[Tags | TagGroups]:
+    """Return the trigram index of the tag and tag group aliases."""
+    entries: list[tuple[Tags | TagGroups, str]] = [
+        *((tag, alias) for alias, tag in BARKS_TAG_ALIASES.items()),
+        *((group, alias) for alias, group in BARKS_TAG_GROUPS_ALIASES.items()),
+    ]
+    return TrigramIndex(entries)
+
+
+def _get_title_search_strs(title_str: str) -> Iterator[str]:
+    """Yield *title_str*, and the title without its leading article, if any."""
+    yield title_str
+    for article in _LEADING_ARTICLES:
+        if title_str.startswith(article):
+            yield title_str.removeprefix(article)
+            return
+
 
 class BarksTitleSearch:
     def __init__(self) -> None:
@@ -75,22 +111,29 @@ class BarksTitleSearch:
 
     @staticmethod
     def get_titles_from_issue_num(issue_num: str) -> list[Titles]:
-        issue_num = issue_num.upper()
-        if issue_num not in BARKS_ISSUE_DICT:
-            return []
-        return BARKS_ISSUE_DICT[issue_num]
+        return get_barks_issue_dict().get(issue_num.upper(), [])
 
     @staticmethod
     def get_titles_containing(word: str) -> list[Titles]:
         if len(word) <= 1:
             return []
 
-        word = word.lower()
-        return [
-            info.title
-            for info in BARKS_TITLE_INFO
-            if info.issue_name != Issues.EXTRAS and word in info.get_title_str().lower()
-        ]
+        return _get_title_trigrams().find_containing(word)
+
+    @staticmethod
+    def get_titles_matching_fuzzy(query: str, limit: int = FUZZY_SEARCH_LIMIT) -> list[Titles]:
+        """Return the titles closest to *query*, allowing for typos, best match first.
+
+        Alternate forms of the titles (without their leading article) match too.
+        """
+        return [m.key for m in _get_title_trigrams().search(query, limit=limit)]
+
+    @staticmethod
+    def get_tags_matching_fuzzy(
+        query: str, limit: int = FUZZY_SEARCH_LIMIT
+    ) -> list[Tags | TagGroups]:
+        """Return the tags and tag groups with aliases closest to *query*, best match first."""
+        return [m.key for m in _get_tag_trigrams().search(query, limit=limit)]
 
     def get_tags_matching_prefix(self, prefix: str) -> list[Tags] | list[Tags | TagGroups]:
         prefix = prefix.lower()
@@ -98,10 +141,9 @@ class BarksTitleSearch:
             return []
 
         if len(prefix) == 1:
-            return self._get_titles_with_one_char_tag_search(prefix)
-
-        short_prefix = prefix[:PREFIX_LEN]
-        candidate_aliases = self.tag_prefix_dict.get(short_prefix, [])
+            candidate_aliases = self._get_one_char_prefix_aliases(prefix)
+        else:
+            candidate_aliases = self.tag_prefix_dict.get(prefix[:PREFIX_LEN], [])
 
         tag_list = self._get_tags_from_aliases(prefix, candidate_aliases)
 
@@ -130,20 +172,18 @@ class BarksTitleSearch:
     def get_direct_group_members(tag_group: TagGroups) -> list[Tags | TagGroups]:
         return list(BARKS_TAG_GROUPS.get(tag_group, []))
 
-    def _get_titles_with_one_char_tag_search(self, prefix: str) -> list[Tags | TagGroups]:
+    def _get_one_char_prefix_aliases(self, prefix: str) -> list[str]:
         assert len(prefix) == 1
-        all_aliases = list(BARKS_TAG_ALIASES.keys()) + list(BARKS_TAG_GROUPS_ALIASES.keys())
-        return self._get_tags_from_aliases(prefix, all_aliases)
-
-    def _get_tags_from_aliases(self, prefix: str, aliases: list[str]) -> list[Tags | TagGroups]:
-        prefix = prefix.lower()
-
-        if len(prefix) == 0:
-            return []
-
-        if len(prefix) == 1:
-            return self._get_titles_with_one_char_tag_search(prefix)
+        # Only the aliases filed under two-char prefixes starting with this char.
+        return [
+            alias_tag_str
+            for short_prefix, aliases in self.tag_prefix_dict.items()
+            if short_prefix.startswith(prefix)
+            for alias_tag_str in aliases
+        ]
 
+    @staticmethod
+    def _get_tags_from_aliases(prefix: str, aliases: list[str]) -> list[Tags | TagGroups]:
         tag_list = []
         for alias_tag_str in aliases:
             if not alias_tag_str.startswith(prefix):
@@ -0,0 +1,265 @@
+"""Typo-tolerant lookups of short texts, such as titles and tag names.
+
+A ``TrigramIndex`` maps each trigram of its folded texts to the texts that
+contain it. A query only looks at texts sharing a trigram with it, scores them
+by trigram overlap, and lets those within a couple of edits of the query (a
+misspelling, a missing or swapped letter) rank as near-exact matches::
+
+    index = TrigramIndex([(Titles.LUCK_OF_THE_NORTH, "Luck of the North"), ...])
+    index.search("luck of the noth")  # [FuzzyMatch(Titles.LUCK_OF_THE_NORTH, ...)]
+
+Texts are folded before indexing and matching: accents are dropped, case is
+folded, apostrophes are removed, and any other punctuation separates words.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+import unicodedata
+from collections import Counter
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+FUZZY_SEARCH_LIMIT = 10
+MIN_FUZZY_SCORE = 0.4
+MAX_EDIT_DISTANCE = 2
+
+_APOSTROPHES_RE = re.compile("['`\u2018\u2019]")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+
+# An edit changes at most this many of a string's padded word trigrams (four
+# for a swap of two letters).
+_TRIGRAMS_PER_EDIT = 4
+
+
+def fold_text(text: str) -> str:
+    """Return *text* without accents, case, or punctuation, in single-spaced words."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    unaccented = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_WORD_RE.sub(" ", _APOSTROPHES_RE.sub("", unaccented.casefold())).split())
+
+
+def get_trigrams(folded_text: str) -> frozenset[str]:
+    """Return the trigrams of each word of *folded_text*, padded to mark its ends."""
+    return frozenset(
+        padded[i : i + 3]
+        for word in folded_text.split()
+        for padded in (f"  {word} ",)
+        for i in range(len(padded) - 2)
+    )
+
+
+def _get_inner_trigrams(folded_text: str) -> frozenset[str]:
+    return frozenset(word[i : i + 3] for word in folded_text.split() for i in range(len(word) - 2))
+
+
+def get_bounded_edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Return the edit distance between *a* and *b*, up to ``max_distance + 1``.
+
+    Insertions, deletions, substitutions and swaps of adjacent characters each
+    count as one edit. Any distance over *max_distance* is returned as
+    ``max_distance + 1``, which lets the comparison stop early.
+    """
+    too_far = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return too_far
+
+    # Near duplicates differ in a few characters: only compare those.
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    a_end, b_end = len(a), len(b)
+    while a_end > start and b_end > start and a[a_end - 1] == b[b_end - 1]:
+        a_end -= 1
+        b_end -= 1
+    a, b = a[start:a_end], b[start:b_end]
+
+    # Only the cells within max_distance of the diagonal can stay in bounds.
+    len_b = len(b)
+    prev_prev_row: list[int] = []
+    prev_row = [j if j <= max_distance else too_far for j in range(len_b + 1)]
+    for i in range(1, len(a) + 1):
+        a_char = a[i - 1]
+        row = [too_far] * (len_b + 1)
+        row[0] = row_min = i if i <= max_distance else too_far
+        for j in range(max(1, i - max_distance), min(len_b, i + max_distance) + 1):
+            b_char = b[j - 1]
+            if a_char == b_char:
+                distance = prev_row[j - 1]
+            else:
+                distance = 1 + min(prev_row[j], row[j - 1], prev_row[j - 1])
+                if i > 1 and j > 1 and a_char == b[j - 2] and a[i - 2] == b_char:
+                    distance = min(distance, prev_prev_row[j - 2] + 1)
+            row[j] = distance
+            row_min = min(row_min, distance)
+        if row_min > max_distance:
+            return too_far
+        prev_prev_row, prev_row = prev_row, row
+
+    return min(prev_row[-1], too_far)
+
+
+@dataclass(frozen=True, slots=True)
+class FuzzyMatch[K]:
+    """A text matching a fuzzy query.
+
+    Attributes:
+        key: The key the text was indexed under.
+        text: The matching text, as indexed.
+        score: How well the text matches, from 0 to 1 for an exact match.
+
+    """
+
+    key: K
+    text: str
+    score: float
+
+
+class TrigramIndex[K]:
+    """A trigram index over short texts, each stored under a key.
+
+    A key can have several texts (a title and its alternate forms, say). A
+    query returns each key once, with its best matching text.
+
+    Args:
+        entries: ``(key, text)`` pairs to index.
+
+    """
+
+    __slots__ = ("_folded_texts", "_keys", "_postings", "_texts", "_trigram_counts")
+
+    def __init__(self, entries: Iterable[tuple[K, str]]) -> None:
+        self._keys: list[K] = []
+        self._texts: list[str] = []
+        self._folded_texts: list[str] = []
+        self._trigram_counts: list[int] = []
+        postings: dict[str, list[int]] = {}
+
+        for key, text in entries:
+            entry_id = len(self._keys)
+            folded = fold_text(text)
+            trigrams = get_trigrams(folded)
+            self._keys.append(key)
+            self._texts.append(text)
+            self._folded_texts.append(folded)
+            self._trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                postings.setdefault(trigram, []).append(entry_id)
+
+        self._postings = {t: tuple(ids) for t, ids in postings.items()}
+
+    def __len__(self) -> int:
+        """Return the number of indexed texts."""
+        return len(self._keys)
+
+    def search(
+        self,
+        query: str,
+        limit: int = FUZZY_SEARCH_LIMIT,
+        min_score: float = MIN_FUZZY_SCORE,
+        max_edit_distance: int = MAX_EDIT_DISTANCE,
+    ) -> list[FuzzyMatch[K]]:
+        """Return up to *limit* keys whose texts best match *query*, best first.
+
+        A text scores the mean of the fraction of the query's trigrams it has
+        and the trigram similarity of the two. A text within *max_edit_distance*
+        edits of the query scores at least ``1 - edits / (len(query) + 1)``.
+        Texts scoring under *min_score* are left out.
+        """
+        folded_query = fold_text(query)
+        if not folded_query or limit <= 0:
+            return []
+
+        scores = self._get_scores(folded_query, limit, max_edit_distance, min_score)
+
+        best_scores: dict[K, tuple[float, int]] = {}
+        for entry_id, score in scores.items():
+            if score < min_score:
+                continue
+            key = self._keys[entry_id]
+            best = best_scores.get(key)
+            if best is None or score > best[0]:
+                best_scores[key] = (score, entry_id)
+
+        top = heapq.nsmallest(
+            limit, best_scores.items(), key=lambda item: (-item[1][0], self._texts[item[1][1]])
+        )
+        return [FuzzyMatch(key, self._texts[entry_id], score) for key, (score, entry_id) in top]
+
+    def _get_scores(
+        self, folded_query: str, limit: int, max_edit_distance: int, min_score: float
+    ) -> dict[int, float]:
+        query_trigrams = get_trigrams(folded_query)
+        shared_counts: Counter[int] = Counter()
+        for trigram in query_trigrams:
+            shared_counts.update(self._postings.get(trigram, ()))
+
+        num_query_trigrams = len(query_trigrams)
+        query_len = len(folded_query)
+        min_shared_for_edits = num_query_trigrams - _TRIGRAMS_PER_EDIT * max_edit_distance
+        # A text's trigram score is at most the fraction of the query's trigrams
+        # it has, so texts with too few are out unless they're near misspellings.
+        min_shared = min(min_score * num_query_trigrams, min_shared_for_edits)
+        trigram_counts = self._trigram_counts
+        folded_texts = self._folded_texts
+
+        scores: dict[int, float] = {}
+        edit_candidates: list[int] = []
+        for entry_id, num_shared in shared_counts.items():
+            if num_shared < min_shared:
+                continue
+            score = (
+                num_shared / num_query_trigrams
+                + num_shared / (num_query_trigrams + trigram_counts[entry_id] - num_shared)
+            ) / 2
+            scores[entry_id] = score
+            if (
+                score < 1.0
+                and num_shared >= min_shared_for_edits
+                and abs(len(folded_texts[entry_id]) - query_len) <= max_edit_distance
+            ):
+                edit_candidates.append(entry_id)
+
+        # A near misspelling of a text shares more of its trigrams than the
+        # text's near duplicates do, so only the *limit* texts sharing the most
+        # are worth the edit distance.
+        for entry_id in heapq.nlargest(limit, edit_candidates, key=shared_counts.__getitem__):
+            distance = get_bounded_edit_distance(
+                folded_query, folded_texts[entry_id], max_edit_distance
+            )
+            if distance <= max_edit_distance:
+                scores[entry_id] = max(scores[entry_id], 1.0 - distance / (query_len + 1))
+
+        return scores
+
+    def find_containing(self, text: str) -> list[K]:
+        """Return the keys with a text containing *text*, ignoring accents and punctuation.
+
+        Keys come in the order they were indexed, each once.
+        """
+        folded = fold_text(text)
+        if not folded:
+            return []
+
+        # Every word of a contained text is inside a word of the containing
+        # text, so the candidates have all the query's within-word trigrams.
+        candidates: set[int] | None = None
+        for trigram in _get_inner_trigrams(folded):
+            entry_ids = self._postings.get(trigram, ())
+            candidates = (
+                set(entry_ids) if candidates is None else candidates.intersection(entry_ids)
+            )
+            if not candidates:
+                return []
+
+        entry_ids = range(len(self._keys)) if candidates is None else sorted(candidates)
+        keys: dict[K, None] = {}
+        for entry_id in entry_ids:
+            if folded in self._folded_texts[entry_id]:
+                keys[self._keys[entry_id]] = None
+
+        return list(keys)
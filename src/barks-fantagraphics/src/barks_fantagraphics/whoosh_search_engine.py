@@ -1,21 +1,34 @@
+import hashlib
 import heapq
 import json
+import multiprocessing
+import sys
+import threading
 from collections import Counter, defaultdict
 from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import cache
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import cast
+from typing import Any, cast
 
+from loguru import logger
 from pyuca import Collator
-from whoosh.analysis import STOP_WORDS, LowercaseFilter, StopFilter
+from whoosh.analysis import STOP_WORDS, Analyzer, LowercaseFilter, StopFilter, Token
 from whoosh.fields import ID, KEYWORD, TEXT, Schema
-from whoosh.index import create_in, open_dir
+from whoosh.highlight import ContextFragmenter, Formatter, get_text, highlight
+from whoosh.index import Index, create_in, exists_in, open_dir
 from whoosh.qparser import QueryParser
-from whoosh.searching import Hit
+from whoosh.searching import Hit, Searcher
 
+from .barks_titles import Titles
 from .comics_database import ComicsDatabase
 from .entity_types import EntityType
-from .speech_groupers import OcrTypes, SpeechGroups
+from .search_ports import WORD_SEARCH_PAGE_LEN, AlphaSplitTerms, SpeechHit, SpeechHitsPage
+from .speech_groupers import OcrTypes, SpeechGroups, SpeechPageGroup
+from .term_vocabulary import TermVocabulary, freeze_alpha_split_terms
 from .whoosh_barks_terms import (
     ALL_CAPS,
     BARKSIAN_ENTITY_TYPE_MAP,
@@ -29,10 +42,34 @@ from .whoosh_barks_terms import (
 )
 from .whoosh_punct_tokenizer import WordWithPunctTokenizer
 
-COLLATOR = Collator()
+
+@cache
+def get_collator() -> Collator:
+    """Return the Unicode collator the cleaned terms are sorted with.
+
+    Building a ``Collator`` loads the whole Unicode collation table, which takes
+    longer than importing the rest of this module, and only an index build needs it.
+    """
+    return Collator()
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The module's old eager 'COLLATOR' constant, now built on first use.
+    if name == "COLLATOR":
+        return get_collator()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
 
 SUB_ALPHA_SPLIT_SIZE = 56
 
+# Matched words in a speech fragment are wrapped in Kivy markup, which is what the
+# reader displays fragments with.
+FRAGMENT_MATCH_START = "[b]"
+FRAGMENT_MATCH_END = "[/b]"
+FRAGMENT_MAX_CHARS = 120
+FRAGMENT_SURROUND_CHARS = 40
+
 MY_STOP_WORDS = STOP_WORDS.union(["oh"])
 
 ENTITY_TYPES = list(EntityType)
@@ -92,6 +129,249 @@ def _normalize_entity_names(extra_terms: set[str], existing_lower: set[str]) ->
     return normalized
 
 
+type EntityTagger = Callable[[str], dict[str, set[str]]]
+type EntityProvider = Callable[[str, str, str], dict[str, set[str]]]
+
+# Bump when the title contents file format, or what goes into a content hash, changes.
+TITLE_CONTENTS_VERSION = 2
+
+
+def _make_punct_analyzer() -> Analyzer:
+    # For keeping apostrophes and hyphens within words
+    return WordWithPunctTokenizer() | LowercaseFilter() | StopFilter(stoplist=MY_STOP_WORDS)
+
+
+def _make_schema() -> Schema:
+    return Schema(
+        title=ID(stored=True),
+        fanta_vol=ID(stored=True),
+        fanta_page=ID(stored=True),
+        comic_page=ID(stored=True),
+        content_id=ID(stored=True),
+        panel_num=ID(stored=True),
+        unstemmed=TEXT(stored=False, lang="en", analyzer=_make_punct_analyzer()),
+        content_raw=TEXT(stored=True, lang="en"),
+        entities_person=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_location=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_org=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_work=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_misc=KEYWORD(stored=True, commas=True, scorable=True),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class TitleContents:
+    """What one title contributes to the index.
+
+    Attributes:
+        content_hash: Hash of the title's speech text, to tell when it changes.
+        term_counts: How often each "unstemmed" term occurs in the title.
+        entity_names: The title's entity names, by entity type.
+
+    """
+
+    content_hash: str
+    term_counts: dict[str, int] = field(default_factory=dict)
+    entity_names: dict[str, list[str]] = field(default_factory=dict)
+
+
+type TitleDocuments = tuple[str, TitleContents, list[dict[str, str]] | None]
+
+
+def _get_entity_source(
+    entity_tagger: EntityTagger | None, entity_provider: EntityProvider | None
+) -> str:
+    """Return what tells the entities of *entity_tagger* and *entity_provider* apart."""
+
+    def get_name(func: Callable[..., Any] | None) -> str:
+        if func is None:
+            return "none"
+        name = getattr(func, "__qualname__", type(func).__qualname__)
+        return f"{func.__module__}.{name}"
+
+    return f"tagger={get_name(entity_tagger)};provider={get_name(entity_provider)}"
+
+
+def _load_title_contents(
+    path: Path, ocr_index: OcrTypes
+) -> tuple[str, dict[str, TitleContents]] | None:
+    """Return the saved entity source and title contents, or ``None`` if missing or outdated."""
+    try:
+        saved = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(saved, dict)
+        or saved.get("version") != TITLE_CONTENTS_VERSION
+        or saved.get("ocr_index") != ocr_index
+        or not isinstance(saved.get("entity_source"), str)
+    ):
+        return None
+
+    try:
+        return saved["entity_source"], {
+            title_str: TitleContents(c["hash"], c["term_counts"], c["entity_names"])
+            for title_str, c in saved["titles"].items()
+        }
+    except (AttributeError, KeyError, TypeError):
+        return None
+
+
+def _save_title_contents(
+    path: Path,
+    ocr_index: OcrTypes,
+    entity_source: str,
+    title_contents: dict[str, TitleContents],
+) -> None:
+    saved = {
+        "version": TITLE_CONTENTS_VERSION,
+        "ocr_index": str(ocr_index),
+        "entity_source": entity_source,
+        "titles": {
+            title_str: {
+                "hash": c.content_hash,
+                "term_counts": c.term_counts,
+                "entity_names": c.entity_names,
+            }
+            for title_str, c in sorted(title_contents.items())
+        },
+    }
+    path.write_text(json.dumps(saved, separators=(",", ":")))
+
+
+def _get_speech_content_hash(speech_pages: list[SpeechPageGroup]) -> str:
+    content = [
+        (
+            page.fanta_vol,
+            page.fanta_page,
+            page.comic_page,
+            group_id,
+            speech_text.panel_num,
+            speech_text.ai_text,
+            speech_text.raw_ai_text,
+        )
+        for page in speech_pages
+        for group_id, speech_text in page.speech_groups.items()
+    ]
+    return hashlib.sha256(json.dumps(content).encode("utf-8")).hexdigest()
+
+
+def _get_volume_documents(
+    speech_groups: SpeechGroups,
+    titles: list[tuple[str, Titles]],
+    ocr_index_to_use: OcrTypes,
+    entity_tagger: EntityTagger | None,
+    entity_provider: EntityProvider | None,
+    known_hashes: dict[str, str],
+) -> list[TitleDocuments]:
+    """Return the index documents for the speech bubbles of one volume's titles.
+
+    A title whose speech content hash is in *known_hashes* is unchanged: it is
+    not entity-tagged, and comes back with only its hash and no documents.
+
+    Runs in an index build worker process, so everything passed in is pickled.
+    """
+    curated_sets = _build_curated_entity_sets()
+    analyzer = _make_punct_analyzer()
+
+    title_documents: list[TitleDocuments] = []
+    for title_str, title in titles:
+        speech_pages = [
+            speech_page
+            for speech_page in speech_groups.get_speech_page_groups(title, with_json=False)
+            if speech_page.ocr_index == ocr_index_to_use
+        ]
+        content_hash = _get_speech_content_hash(speech_pages)
+        if known_hashes.get(title_str) == content_hash:
+            title_documents.append((title_str, TitleContents(content_hash), None))
+            continue
+
+        documents = []
+        term_counts: Counter[str] = Counter()
+        entity_names: dict[str, set[str]] = defaultdict(set)
+        for speech_page in speech_pages:
+            for group_id, speech_text in speech_page.speech_groups.items():
+                if entity_provider:
+                    entities = entity_provider(title_str, speech_page.fanta_page, group_id)
+                elif entity_tagger:
+                    entities = entity_tagger(speech_text.ai_text)
+                else:
+                    entities = None
+
+                if entities is not None:
+                    entities = _filter_entities_to_curated(
+                        cast("dict[EntityType, set[str]]", entities), curated_sets
+                    )
+                    entity_kwargs = {
+                        f"entities_{et}": ",".join(sorted(entities.get(et, set())))
+                        for et in ENTITY_TYPES
+                    }
+                    for et in ENTITY_TYPES:
+                        entity_names[et].update(entities.get(et, set()))
+                else:
+                    entity_kwargs = dict.fromkeys(ENTITY_FIELDS, "")
+
+                term_counts.update(token.text for token in analyzer(speech_text.ai_text))
+
+                documents.append(
+                    {
+                        "title": title_str,
+                        "fanta_vol": str(speech_page.fanta_vol),
+                        "fanta_page": speech_page.fanta_page,
+                        "comic_page": speech_page.comic_page,
+                        "content_id": group_id,
+                        "panel_num": str(speech_text.panel_num),
+                        "unstemmed": speech_text.ai_text,
+                        "content_raw": speech_text.raw_ai_text,
+                        **entity_kwargs,
+                    }
+                )
+
+        contents = TitleContents(
+            content_hash,
+            dict(term_counts),
+            {et: sorted({n.strip() for n in names} - {""}) for et, names in entity_names.items()},
+        )
+        title_documents.append((title_str, contents, documents))
+
+    return title_documents
+
+
+type _IndexBuildWorkerArgs = tuple[
+    SpeechGroups, OcrTypes, EntityTagger | None, EntityProvider | None, dict[str, str]
+]
+
+# What every volume of an index build shares, handed to each worker process
+# once, when it starts, rather than pickled again for every volume.
+_index_build_worker_args: _IndexBuildWorkerArgs | None = None
+
+
+def _init_index_build_worker(*args: Any) -> None:  # noqa: ANN401
+    global _index_build_worker_args  # noqa: PLW0603
+    _index_build_worker_args = cast("_IndexBuildWorkerArgs", args)
+
+
+def _get_worker_volume_documents(titles: list[tuple[str, Titles]]) -> list[TitleDocuments]:
+    assert _index_build_worker_args is not None
+    speech_groups, ocr_index_to_use, entity_tagger, entity_provider, known_hashes = (
+        _index_build_worker_args
+    )
+    return _get_volume_documents(
+        speech_groups, titles, ocr_index_to_use, entity_tagger, entity_provider, known_hashes
+    )
+
+
+def _get_index_build_mp_context() -> BaseContext:
+    # Forking a process with threads running can deadlock the child, so the
+    # workers are started from a fresh server process, or spawned where there is none.
+    start_methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in start_methods else "spawn")
+
+
+def _intern_terms(terms: list[str]) -> tuple[str, ...]:
+    return tuple(sys.intern(t) for t in terms)
+
+
 def _is_valid_entity_term(term: str) -> bool:
     """Filter garbage spaCy-only entity names not matched by curated sets."""
     if not term or "\n" in term:
@@ -127,9 +407,100 @@ class TitleInfo:
 type TitleDict = dict[str, TitleInfo]
 
 
+def _escape_markup(text: str) -> str:
+    """Escape `&`, `[` and `]`, so Kivy markup shows them as they are."""
+    return text.replace("&", "&amp;").replace("[", "&bl;").replace("]", "&br;")
+
+
+class _MatchFormatter(Formatter):
+    """Wraps the matched words of a highlighted fragment in start and end markers.
+
+    The fragment's text is escaped, so the markers are its only Kivy markup.
+    """
+
+    between = " ... "
+
+    def _text(self, text: str) -> str:
+        return _escape_markup(text)
+
+    def format_token(self, text: str, token: Token, replace: bool = False) -> str:
+        matched = _escape_markup(get_text(text, token, replace))
+        return f"{FRAGMENT_MATCH_START}{matched}{FRAGMENT_MATCH_END}"
+
+
+class SearcherPool:
+    """Leases long-lived searchers on a Whoosh index to concurrent callers.
+
+    Opening a searcher opens a reader on every index segment, and closing it
+    throws their caches away, so searchers are kept open and reused. A Whoosh
+    searcher must not be used by two threads at once, so each caller leases one
+    of its own for the length of a query; the pool grows to the number of
+    concurrent callers. When the index generation changes, idle searchers are
+    closed and leased ones are closed when they come back.
+    """
+
+    def __init__(self, index: Index) -> None:
+        self._index = index
+
+        self._lock = threading.Lock()
+        self._idle: list[Searcher] = []
+        self._generation = index.latest_generation()
+        self._closed = False
+        self.num_opened = 0
+
+    @property
+    def num_idle(self) -> int:
+        """Number of open searchers not currently leased."""
+        with self._lock:
+            return len(self._idle)
+
+    @contextmanager
+    def lease(self) -> Iterator[Searcher]:
+        """Lend a searcher on the latest index generation for the ``with`` block."""
+        generation, searcher = self._acquire()
+        try:
+            yield searcher
+        finally:
+            self._release(generation, searcher)
+
+    def close(self) -> None:
+        """Close the idle searchers; leased ones are closed when they come back."""
+        with self._lock:
+            self._closed = True
+            self._close_idle()
+
+    def _acquire(self) -> tuple[int, Searcher]:
+        generation = self._index.latest_generation()
+        with self._lock:
+            if self._closed:
+                msg = "The searcher pool is closed."
+                raise ValueError(msg)
+            if generation != self._generation:
+                self._close_idle()
+                self._generation = generation
+            if self._idle:
+                return generation, self._idle.pop()
+            self.num_opened += 1
+
+        return generation, self._index.searcher()
+
+    def _release(self, generation: int, searcher: Searcher) -> None:
+        with self._lock:
+            if not self._closed and generation == self._generation:
+                self._idle.append(searcher)
+                return
+        searcher.close()
+
+    def _close_idle(self) -> None:
+        for searcher in self._idle:
+            searcher.close()
+        self._idle.clear()
+
+
 class SearchEngine:
     def __init__(self, index_dir: Path) -> None:
         self._index = open_dir(index_dir)
+        self._searchers = SearcherPool(self._index)
 
         self._unstemmed_terms_path = self._index.storage.folder / "unstemmed-terms.json"
         self._cleaned_terms_path = self._index.storage.folder / "cleaned-unstemmed-terms.json"
@@ -146,6 +517,9 @@ class SearchEngine:
             t: self._index.storage.folder / f"entities-{t}-terms.json" for t in ENTITY_TYPES
         }
 
+        self._vocabularies_lock = threading.Lock()
+        self._vocabularies: dict[tuple[Path, str], tuple[tuple[int, int, int], Any]] = {}
+
     @staticmethod
     def _get_entity_types(hit: Hit, search_words: str) -> tuple[str, ...]:
         words_lower = [w.lower() for w in search_words.split()]
@@ -193,32 +567,148 @@ class SearchEngine:
 
         return title_results
 
+    def close(self) -> None:
+        """Release the index's open searchers."""
+        self._searchers.close()
+
     def find_words(self, search_words: str) -> TitleDict:
-        with self._index.searcher() as searcher:
+        with self._searchers.lease() as searcher:
             query = QueryParser("unstemmed", self._index.schema).parse(search_words, debug=False)
             results = searcher.search(query, limit=1000)
             return self._collect_and_sort_results(results, search_words)
 
+    def find_words_page(
+        self, search_words: str, page_num: int = 1, page_len: int = WORD_SEARCH_PAGE_LEN
+    ) -> SpeechHitsPage:
+        """Return one page of the speech bubbles matching *search_words*, best first.
+
+        Unlike ``find_words``, nothing is truncated: keep passing back
+        ``next_page_num`` to page through every hit. Only the hits on the
+        requested page are loaded and highlighted.
+
+        Args:
+            search_words: The search query.
+            page_num: Which page to return, numbered from 1.
+            page_len: The number of hits per page.
+
+        Returns:
+            The page of hits, each with a fragment of its speech text in which
+            the matched words are marked up.
+
+        """
+        if page_num < 1 or page_len < 1:
+            msg = f"Invalid page {page_num} of length {page_len}."
+            raise ValueError(msg)
+
+        with self._searchers.lease() as searcher:
+            query = QueryParser("unstemmed", self._index.schema).parse(search_words, debug=False)
+            results_page = searcher.search_page(query, page_num, pagelen=page_len)
+            if results_page.total == 0 or page_num > results_page.pagecount:
+                return SpeechHitsPage([], results_page.total, None)
+
+            terms = frozenset(
+                text.decode("utf-8") if isinstance(text, bytes) else text
+                for field_name, text in query.all_terms()
+                if field_name == "unstemmed"
+            )
+            hits = [self._get_speech_hit(hit, terms) for hit in results_page]
+
+            return SpeechHitsPage(
+                hits,
+                results_page.total,
+                None if results_page.is_last_page() else page_num + 1,
+            )
+
+    def _get_speech_hit(self, hit: Hit, terms: frozenset[str]) -> SpeechHit:
+        return SpeechHit(
+            hit["title"],
+            int(hit["fanta_vol"]),
+            hit["fanta_page"],
+            hit["comic_page"],
+            hit["content_id"],
+            int(hit["panel_num"]),
+            hit.score if hit.score is not None else 0.0,
+            self._get_fragment(hit["content_raw"], terms),
+            hit["content_raw"],
+        )
+
+    def _get_fragment(self, speech_text: str, terms: frozenset[str]) -> str:
+        # The raw text is highlighted with the analyzer the search words went
+        # through, so its words line up with the query terms.
+        text = speech_text.replace("\n", " ")
+        fragment = highlight(
+            text,
+            terms,
+            self._index.schema["unstemmed"].analyzer,
+            ContextFragmenter(maxchars=FRAGMENT_MAX_CHARS, surround=FRAGMENT_SURROUND_CHARS),
+            _MatchFormatter(),
+            top=1,
+        )
+        return fragment or _escape_markup(text[:FRAGMENT_MAX_CHARS])
+
     def iter_all_stored_fields(self) -> Iterator[dict[str, str]]:
         """Yield stored fields for every document in the index."""
-        with self._index.reader() as reader:
+        with self._searchers.lease() as searcher:
+            reader = searcher.reader()
             for docnum in reader.all_doc_ids():
                 yield reader.stored_fields(docnum)
 
     def get_all_titles(self) -> set[str]:
-        with self._index.reader() as reader:
-            return {t.decode("utf-8") for t in reader.lexicon("title")}
+        with self._searchers.lease() as searcher:
+            return {t.decode("utf-8") for t in searcher.reader().lexicon("title")}
 
-    def get_cleaned_terms(self) -> list[str]:
-        return json.loads(self._cleaned_terms_path.read_text())
+    def get_cleaned_terms(self) -> tuple[str, ...]:
+        return self.get_word_vocabulary().terms
 
-    def get_cleaned_alpha_split_terms(self) -> dict[str, dict[str, list[str]]]:
-        return json.loads(self._cleaned_alpha_split_terms_path.read_text())
+    def get_word_vocabulary(self) -> TermVocabulary:
+        return self._get_cached_vocabulary(
+            self._cleaned_terms_path, "vocabulary", TermVocabulary, TermVocabulary(())
+        )
+
+    def get_cleaned_alpha_split_terms(self) -> AlphaSplitTerms:
+        return self._get_cached_vocabulary(
+            self._cleaned_alpha_split_terms_path,
+            "alpha-split",
+            freeze_alpha_split_terms,
+            freeze_alpha_split_terms({}),
+        )
+
+    def _forget_vocabularies(self) -> None:
+        # A file rewritten within the file system's timestamp granularity, at the
+        # same size, would look unchanged.
+        with self._vocabularies_lock:
+            self._vocabularies.clear()
+
+    def _get_cached_vocabulary[T](
+        self, path: Path, kind: str, build: Callable[[Any], T], missing: T
+    ) -> T:
+        """Return *build* applied to the JSON in *path*, re-reading it only if it changed.
+
+        The term files are rewritten whenever the index is rebuilt, so their
+        inode, modification time and size tell when a cached vocabulary is stale.
+        """
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return missing
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        key = (path, kind)
+        with self._vocabularies_lock:
+            cached = self._vocabularies.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        vocabulary = build(json.loads(path.read_text()))
+        with self._vocabularies_lock:
+            self._vocabularies[key] = (signature, vocabulary)
+
+        return vocabulary
 
     def find_entities(self, entity_type: str, entity_name: str) -> TitleDict:
         field_name = f"entities_{entity_type}"
         # noinspection GrazieInspection,GrazieInspectionRunner
-        with self._index.searcher() as searcher:
+        with self._searchers.lease() as searcher:
             # Quote the entity name so multi-word names (e.g. "Duk Duk") match
             # as a single token in the comma-separated KEYWORD field.
             quoted_name = f'"{entity_name}"'
@@ -226,16 +716,20 @@ class SearchEngine:
             results = searcher.search(query, limit=1000)
             return self._collect_and_sort_results(results, entity_name)
 
-    def get_entity_terms(self, entity_type: str) -> list[str]:
+    def get_entity_terms(self, entity_type: str) -> tuple[str, ...]:
         path = self._entity_terms_paths[EntityType(entity_type)]
-        if path.exists():
-            return json.loads(path.read_text())
-        return []
+        return self._get_cached_vocabulary(path, "terms", _intern_terms, ())
 
-    def get_alpha_split_entity_terms(self, entity_type: str) -> dict[str, dict[str, list[str]]]:
-        terms = self.get_entity_terms(entity_type)
-        if not terms:
-            return {}
+    def get_alpha_split_entity_terms(self, entity_type: str) -> AlphaSplitTerms:
+        path = self._entity_terms_paths[EntityType(entity_type)]
+        return self._get_cached_vocabulary(
+            path,
+            "alpha-split",
+            self._get_frozen_alpha_split_entity_terms,
+            freeze_alpha_split_terms({}),
+        )
+
+    def _get_frozen_alpha_split_entity_terms(self, terms: list[str]) -> AlphaSplitTerms:
         # Entity terms may contain garbage entries with invalid first chars (e.g. "-ER-").
         # Filter to only terms starting with a letter, digit, or apostrophe.
         valid = [
@@ -243,7 +737,7 @@ class SearchEngine:
             for t in terms
             if t and (("a" <= t[0].lower() <= "z") or ("0" <= t[0] <= "9") or t[0] == "'")
         ]
-        return self._get_alpha_split_terms(valid) if valid else {}
+        return freeze_alpha_split_terms(self._get_alpha_split_terms(valid) if valid else {})
 
     def _get_alpha_split_terms(self, terms: list[str]) -> dict[str, dict[str, list[str]]]:
         alpha_dict = {}
@@ -336,32 +830,33 @@ class SearchEngine:
 
 class SearchEngineCreator(SearchEngine):
     def __init__(
-        self, comics_database: ComicsDatabase, index_dir: Path, ocr_index_to_use: OcrTypes
+        self,
+        comics_database: ComicsDatabase,
+        index_dir: Path,
+        ocr_index_to_use: OcrTypes,
+        incremental: bool = False,
     ) -> None:
+        """Prepare to build the index in *index_dir*.
+
+        With *incremental*, an existing index built for the same OCR type is
+        kept, and ``index_volumes`` only re-indexes the titles whose speech
+        text has changed, as long as the entity tagger and provider are the
+        same as last time. Otherwise, or if there is no such index, the index
+        is built from scratch.
+        """
         self._comics_database = comics_database
         self._ocr_index_to_use = ocr_index_to_use
 
-        # For keeping apostrophes and hyphens within words
-        punct_analyzer = (
-            WordWithPunctTokenizer() | LowercaseFilter() | StopFilter(stoplist=MY_STOP_WORDS)
-        )
-        schema = Schema(
-            title=ID(stored=True),
-            fanta_vol=ID(stored=True),
-            fanta_page=ID(stored=True),
-            comic_page=ID(stored=True),
-            content_id=ID(stored=True),
-            panel_num=ID(stored=True),
-            unstemmed=TEXT(stored=False, lang="en", analyzer=punct_analyzer),
-            content_raw=TEXT(stored=True, lang="en"),
-            entities_person=KEYWORD(stored=True, commas=True, scorable=True),
-            entities_location=KEYWORD(stored=True, commas=True, scorable=True),
-            entities_org=KEYWORD(stored=True, commas=True, scorable=True),
-            entities_work=KEYWORD(stored=True, commas=True, scorable=True),
-            entities_misc=KEYWORD(stored=True, commas=True, scorable=True),
-        )
         index_dir.mkdir(parents=True, exist_ok=True)
-        self._index = create_in(index_dir, schema)
+        self._title_contents_path = index_dir / "title-contents.json"
+        self._title_contents: dict[str, TitleContents] | None = None
+        self._entity_source: str | None = None
+        if incremental and exists_in(index_dir):
+            saved = _load_title_contents(self._title_contents_path, ocr_index_to_use)
+            if saved is not None:
+                self._entity_source, self._title_contents = saved
+        if self._title_contents is None:
+            create_in(index_dir, _make_schema())
 
         super().__init__(index_dir)
 
@@ -372,131 +867,221 @@ class SearchEngineCreator(SearchEngine):
     def index_volumes(
         self,
         volumes: list[int],
-        entity_tagger: Callable[[str], dict[str, set[str]]] | None = None,
-        entity_provider: Callable[[str, str, str], dict[str, set[str]]] | None = None,
+        entity_tagger: EntityTagger | None = None,
+        entity_provider: EntityProvider | None = None,
+        max_workers: int = 1,
     ) -> None:
+        """Build the index for *volumes*, and the term lists that go with it.
+
+        By default, everything is done in this process. With *max_workers* above
+        1, the speech bubble documents of each volume are read, cleaned and
+        entity-tagged in a pool of up to that many processes, so
+        *entity_tagger* and *entity_provider* must be picklable. Either way,
+        one whoosh writer in this process writes the documents.
+
+        When updating an existing index (see ``incremental``), only titles whose
+        speech text changed are tagged and re-indexed, and titles no longer in
+        *volumes* are removed. The term lists are built from each title's saved
+        term counts, so the result is the same as a full build. The unchanged
+        titles keep their saved entities, so if *entity_tagger* or
+        *entity_provider* (told apart by their qualified names) differs from
+        the last build's, the index is built from scratch instead.
+        """
+        entity_source = _get_entity_source(entity_tagger, entity_provider)
+        if self._title_contents is not None and entity_source != self._entity_source:
+            logger.info("The entity tagger or provider changed: rebuilding the whole index.")
+            self._recreate_index()
+
         json_volumes_path = self._index.storage.folder / "volumes.json"
         with json_volumes_path.open("w") as f:
             json.dump(volumes, f, indent=4)
 
-        self._index_volume_titles(
-            volumes, entity_tagger=entity_tagger, entity_provider=entity_provider
+        title_contents = self._index_volume_titles(
+            volumes,
+            entity_tagger=entity_tagger,
+            entity_provider=entity_provider,
+            max_workers=max_workers,
+        )
+        _save_title_contents(
+            self._title_contents_path, self._ocr_index_to_use, entity_source, title_contents
         )
+        self._title_contents = title_contents
+        self._entity_source = entity_source
 
         if entity_tagger or entity_provider:
-            self._generate_entity_term_lists()
+            self._write_entity_term_lists(title_contents)
+            self._forget_vocabularies()
 
         all_entity_names: set[str] = set()
         for entity_type in ENTITY_TYPES:
             all_entity_names.update(self.get_entity_terms(entity_type))
 
-        with self._index.reader() as reader:
-            all_unstemmed_terms = [t.decode("utf-8") for t in reader.lexicon("unstemmed")]
+        # Summing the saved per-title counts means the unchanged titles of an
+        # incremental update are not re-scanned.
+        term_counts: Counter[str] = Counter()
+        for contents in title_contents.values():
+            term_counts.update(contents.term_counts)
+        all_unstemmed_terms = sorted(term_counts)
+
         with self._unstemmed_terms_path.open("w") as f:
             json.dump(all_unstemmed_terms, f, indent=4)
         with self._cleaned_terms_path.open("w") as f:
             cleaned_terms = sorted(
                 self._get_cleaned_terms(all_unstemmed_terms, entity_names=all_entity_names),
-                key=COLLATOR.sort_key,
+                key=get_collator().sort_key,
             )
             json.dump(cleaned_terms, f, indent=4)
         with self._cleaned_alpha_split_terms_path.open("w") as f:
             json.dump(self._get_alpha_split_terms(cleaned_terms), f, indent=4)
 
-        most_frequent_words = self._get_ai_text_term_frequencies().most_common()
+        # Terms in alphabetical order, so equally common terms stay that way.
+        most_frequent_words = Counter({t: term_counts[t] for t in all_unstemmed_terms})
         with self._most_common_unstemmed_terms_path.open("w") as f:
-            json.dump(most_frequent_words, f, indent=4)
+            json.dump(most_frequent_words.most_common(), f, indent=4)
 
-        least_frequent_words = self._get_least_common_ai_text_terms()
+        least_frequent_words = self._get_least_common_ai_text_terms(term_counts)
         with self._least_common_unstemmed_terms_path.open("w") as f:
             json.dump(least_frequent_words, f, indent=4)
 
+        self._forget_vocabularies()
+
+    def _recreate_index(self) -> None:
+        """Replace the index with an empty one, so ``index_volumes`` builds it from scratch."""
+        self._searchers.close()
+        self._index = create_in(self._index.storage.folder, _make_schema())
+        self._searchers = SearcherPool(self._index)
+        self._title_contents = None
+
     def _index_volume_titles(
         self,
         volumes: list[int],
-        entity_tagger: Callable[[str], dict[str, set[str]]] | None = None,
-        entity_provider: Callable[[str, str, str], dict[str, set[str]]] | None = None,
-    ) -> None:
-        all_speech_groups = SpeechGroups(self._comics_database)
-        curated_sets = _build_curated_entity_sets()
-
+        entity_tagger: EntityTagger | None = None,
+        entity_provider: EntityProvider | None = None,
+        max_workers: int = 1,
+    ) -> dict[str, TitleContents]:
+        speech_groups = SpeechGroups(self._comics_database)
+        volume_titles = [
+            [
+                (title_str, fanta_info.comic_book_info.title)
+                for title_str, fanta_info in sorted(
+                    self._comics_database.get_configured_titles_in_fantagraphics_volume(
+                        volume, exclude_non_comics=True
+                    )
+                )
+            ]
+            for volume in volumes
+        ]
+        known_contents = self._title_contents or {}
+        known_hashes = {title_str: c.content_hash for title_str, c in known_contents.items()}
+        num_workers = min(max_workers, len(volumes))
+
+        if num_workers <= 1:
+            volume_documents = [
+                _get_volume_documents(
+                    speech_groups,
+                    titles,
+                    self._ocr_index_to_use,
+                    entity_tagger,
+                    entity_provider,
+                    known_hashes,
+                )
+                for titles in volume_titles
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=_get_index_build_mp_context(),
+                initializer=_init_index_build_worker,
+                initargs=(
+                    speech_groups,
+                    self._ocr_index_to_use,
+                    entity_tagger,
+                    entity_provider,
+                    known_hashes,
+                ),
+            ) as executor:
+                # 'map' hands back the volumes in order, whichever finishes first.
+                volume_documents = list(executor.map(_get_worker_volume_documents, volume_titles))
+
+        title_contents: dict[str, TitleContents] = {}
+        changed_documents: list[tuple[str, list[dict[str, str]]]] = []
+        for title_documents in volume_documents:
+            for title_str, contents, documents in title_documents:
+                if documents is None:
+                    title_contents[title_str] = known_contents[title_str]
+                else:
+                    title_contents[title_str] = contents
+                    changed_documents.append((title_str, documents))
+
+        if self._title_contents is None:
+            self._write_all_documents(changed_documents)
+        else:
+            removed_titles = known_contents.keys() - title_contents.keys()
+            self._update_documents(changed_documents, removed_titles)
+
+        return title_contents
+
+    def _write_all_documents(self, title_documents: list[tuple[str, list[dict[str, str]]]]) -> None:
+        # whoosh's multi-process writer forks its writer processes, and its extra
+        # segments had to be merged again, which made builds slower, not faster.
         writer = self._index.writer()
+        try:
+            for _title_str, documents in title_documents:
+                for document in documents:
+                    writer.add_document(**document)
+        except BaseException:
+            writer.cancel()
+            raise
+        writer.commit()
 
-        titles = self._comics_database.get_configured_titles_in_fantagraphics_volumes(
-            volumes, exclude_non_comics=True
+    def _update_documents(
+        self,
+        changed_documents: list[tuple[str, list[dict[str, str]]]],
+        removed_titles: set[str],
+    ) -> None:
+        logger.info(
+            f"Re-indexing {len(changed_documents)} changed titles"
+            f" and removing {len(removed_titles)} titles."
         )
-        for title_str, fanta_info in titles:
-            title = fanta_info.comic_book_info.title
-            speech_page_groups = all_speech_groups.get_speech_page_groups(title)
-            for speech_page in speech_page_groups:
-                if speech_page.ocr_index != self._ocr_index_to_use:
-                    continue
-                for group_id, speech_text in speech_page.speech_groups.items():
-                    if entity_provider:
-                        entities = entity_provider(title_str, speech_page.fanta_page, group_id)
-                    elif entity_tagger:
-                        entities = entity_tagger(speech_text.ai_text)
-                    else:
-                        entities = None
-
-                    if entities is not None:
-                        entities = _filter_entities_to_curated(
-                            cast("dict[EntityType, set[str]]", entities), curated_sets
-                        )
-                        entity_kwargs = {
-                            f"entities_{et}": ",".join(sorted(entities.get(et, set())))
-                            for et in ENTITY_TYPES
-                        }
-                    else:
-                        entity_kwargs = dict.fromkeys(ENTITY_FIELDS, "")
-
-                    writer.add_document(
-                        title=title_str,
-                        fanta_vol=str(speech_page.fanta_vol),
-                        fanta_page=speech_page.fanta_page,
-                        comic_page=speech_page.comic_page,
-                        content_id=group_id,
-                        panel_num=str(speech_text.panel_num),
-                        unstemmed=speech_text.ai_text,
-                        content_raw=speech_text.raw_ai_text,
-                        **entity_kwargs,
-                    )
+        if not changed_documents and not removed_titles:
+            return
 
-        writer.commit()
-
-    def _generate_entity_term_lists(self) -> None:
-        with self._index.reader() as reader:
-            for entity_type in ENTITY_TYPES:
-                field_name = f"entities_{entity_type}"
-                terms = sorted({t.decode("utf-8") for t in reader.lexicon(field_name)})
-                path = self._entity_terms_paths[entity_type]
-                with path.open("w") as f:
-                    json.dump(terms, f, indent=4)
-
-    def _get_ai_text_term_frequencies(self) -> Counter:
-        token_counts = Counter()
-
-        with self._index.reader() as reader:
-            # iter_field yields tuples: (text, doc_freq, total_freq)
-            for text, terminfo in reader.iter_field("unstemmed"):
-                # total_freq = Total times word appears across ALL docs
-                # _doc_freq   = Number of unique docs containing the word
-                token_counts[text.decode("utf-8")] = round(terminfo.weight())
-
-        return token_counts
-
-    def _get_least_common_ai_text_terms(self, top_n: int = 200) -> list[tuple[str, int]]:
-        with self._index.reader() as reader:
-            # Create a generator that yields (total_freq, text).
-            # We swap the order so the heap sorts by frequency first.
-            term_generator = (
-                (text.decode("utf-8"), round(terminfo.weight()))
-                for text, terminfo in reader.iter_field("unstemmed")
-                if terminfo.weight() > 1
+        # A title's bubbles can come and go, so all its documents are replaced,
+        # rather than updated one by one. Optimizing purges the deleted documents,
+        # which would otherwise still show in the title lexicon and term stats.
+        writer = self._index.writer()
+        try:
+            for title_str in sorted(removed_titles | {t for t, _ in changed_documents}):
+                writer.delete_by_term("title", title_str)
+            for _title_str, documents in changed_documents:
+                for document in documents:
+                    writer.add_document(**document)
+        except BaseException:
+            writer.cancel()
+            raise
+        writer.commit(optimize=True)
+
+    def _write_entity_term_lists(self, title_contents: dict[str, TitleContents]) -> None:
+        for entity_type in ENTITY_TYPES:
+            terms = sorted(
+                {
+                    name
+                    for contents in title_contents.values()
+                    for name in contents.entity_names.get(entity_type, [])
+                }
             )
+            path = self._entity_terms_paths[entity_type]
+            with path.open("w") as f:
+                json.dump(terms, f, indent=4)
+
+    @staticmethod
+    def _get_least_common_ai_text_terms(
+        term_counts: Counter[str], top_n: int = 200
+    ) -> list[tuple[str, int]]:
+        term_generator = ((text, count) for text, count in term_counts.items() if count > 1)
 
-            # Efficiently find the N smallest items without sorting the whole list.
-            return heapq.nsmallest(top_n, term_generator)
+        # Efficiently find the N smallest items without sorting the whole list.
+        return heapq.nsmallest(top_n, term_generator)
 
     @staticmethod
     def _get_cleaned_terms(
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from barks_fantagraphics.comics_consts import BARKS_ROOT_DIR
@@ -25,6 +27,9 @@ from barks_fantagraphics.fanta_comics_info import (
     LAST_VOLUME_NUMBER,
 )
 
+if TYPE_CHECKING:
+    from barks_fantagraphics.comic_book import ComicBook
+
 # ---------------------------------------------------------------------------
 # TitleNotFoundError
 # ---------------------------------------------------------------------------
@@ -232,3 +237,91 @@ class TestComicsDatabaseInstance:
 
     def test_get_story_titles_dir_is_dir(self, db: ComicsDatabase) -> None:
         assert db.get_story_titles_dir().is_dir()
+
+
+# ---------------------------------------------------------------------------
+# ComicsDatabase — compiled story index and comic book memo
+# ---------------------------------------------------------------------------
+
+
+def _write_story_index(story_index_path: Path) -> None:
+    db = ComicsDatabase(for_building_comics=False, story_index_path=story_index_path)
+    db.get_configured_titles_in_fantagraphics_volume(FIRST_VOLUME_NUMBER)
+    assert story_index_path.is_file()
+
+
+class TestComicsDatabaseStoryIndex:
+    def test_compiled_comic_books_equal_parsed(self, tmp_path: Path) -> None:
+        story_index_path = tmp_path / "story-titles-index.json"
+        _write_story_index(story_index_path)
+        parsed_db = ComicsDatabase(for_building_comics=False)
+        compiled_db = ComicsDatabase(for_building_comics=False, story_index_path=story_index_path)
+
+        for title in parsed_db.get_all_story_titles():
+            assert compiled_db.get_comic_book(title) == parsed_db.get_comic_book(title), title
+        assert compiled_db._story_index.num_inis_parsed == 0  # noqa: SLF001
+
+    def test_configured_titles_same_as_parsed(self, db: ComicsDatabase, tmp_path: Path) -> None:
+        story_index_path = tmp_path / "story-titles-index.json"
+        _write_story_index(story_index_path)
+        compiled_db = ComicsDatabase(for_building_comics=False, story_index_path=story_index_path)
+
+        volumes = list(range(FIRST_VOLUME_NUMBER, LAST_VOLUME_NUMBER + 1))
+        assert compiled_db.get_configured_titles_in_fantagraphics_volumes(
+            volumes
+        ) == db.get_configured_titles_in_fantagraphics_volumes(volumes)
+
+    def test_comic_books_are_memoized(self, known_title: str) -> None:
+        db = ComicsDatabase(for_building_comics=False)
+
+        comic = db.get_comic_book(known_title)
+
+        assert db.get_comic_book(known_title) is comic
+        assert db.get_comic_book(known_title, Path("other-inset.png")) is not comic
+
+    def test_new_inset_info_rebuilds_comic_books(self, known_title: str, tmp_path: Path) -> None:
+        db = ComicsDatabase(for_building_comics=False)
+        comic = db.get_comic_book(known_title)
+
+        db.set_inset_info(tmp_path, ".jpg")
+
+        rebuilt = db.get_comic_book(known_title)
+        assert rebuilt.intro_inset_file.parent == tmp_path
+        assert comic.intro_inset_file.parent != tmp_path
+
+    def test_invalidate_rebuilds_comic_books(self, known_title: str) -> None:
+        db = ComicsDatabase(for_building_comics=False)
+        comic = db.get_comic_book(known_title)
+
+        db.invalidate_comic_books()
+
+        rebuilt = db.get_comic_book(known_title)
+        assert rebuilt is not comic
+        assert rebuilt == comic
+
+    def test_comic_book_built_across_an_invalidate_is_not_kept(
+        self, known_title: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A book another thread was still building when the books were forgotten is stale."""
+        db = ComicsDatabase(for_building_comics=False)
+        make_comic_book = db._make_comic_book  # noqa: SLF001
+
+        def make_then_invalidate(title: str, intro_inset_file: Path | None) -> ComicBook:
+            comic = make_comic_book(title, intro_inset_file)
+            db.invalidate_comic_books()
+            return comic
+
+        monkeypatch.setattr(db, "_make_comic_book", make_then_invalidate)
+        stale = db.get_comic_book(known_title)
+        monkeypatch.undo()
+
+        assert db.get_comic_book(known_title) is not stale
+
+    def test_concurrent_first_loads_share_one_comic_book(self, known_title: str) -> None:
+        db = ComicsDatabase(for_building_comics=False)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            comics = list(executor.map(lambda _: db.get_comic_book(known_title), range(8)))
+
+        assert all(comic is comics[0] for comic in comics)
+        assert db.get_comic_book(known_title) is comics[0]
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# Building the 'Titles' enum is work every import has to do, so the other modules'
+# import times are measured against it, rather than against a machine-dependent budget.
+YARDSTICK_MODULE = "barks_fantagraphics.barks_titles"
+
+IMPORT_CODE = """\
+import barks_fantagraphics.barks_covers as barks_covers
+import barks_fantagraphics.barks_tags
+import barks_fantagraphics.comic_book_info as comic_book_info
+import barks_fantagraphics.comics_database
+import barks_fantagraphics.whoosh_search_engine as whoosh_search_engine
+
+lazy_builders = [
+    barks_covers.get_cover_by_key,
+    barks_covers.get_cover_by_title,
+    comic_book_info.get_barks_issue_dict,
+    whoosh_search_engine.get_collator,
+]
+print(sum(builder.cache_info().currsize for builder in lazy_builders))
+"""
+
+NUM_RUNS = 3
+
+
+def _import_with_importtime(pycache_dir: Path) -> tuple[dict[str, int], str]:
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env["PYTHONPYCACHEPREFIX"] = str(pycache_dir)
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", IMPORT_CODE],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+    # Lines look like 'import time:  self [us] | cumulative | imported package'.
+    self_times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _cumulative, module = line.removeprefix("import time:").split("|")
+        if self_time.strip().isdigit():
+            self_times[module.strip()] = int(self_time)
+
+    return self_times, result.stdout.strip()
+
+
+@pytest.fixture(scope="module")
+def self_import_times(tmp_path_factory: pytest.TempPathFactory) -> dict[str, int]:
+    pycache_dir = tmp_path_factory.mktemp("pycache")
+
+    # The first run compiles the modules; the fastest of the later runs is the least noisy.
+    _import_with_importtime(pycache_dir)
+    best_times: dict[str, int] = {}
+    for _ in range(NUM_RUNS):
+        self_times, num_built = _import_with_importtime(pycache_dir)
+        assert num_built == "0"
+        for module, self_time in self_times.items():
+            best_times[module] = min(self_time, best_times.get(module, self_time))
+
+    return best_times
+
+
+class TestImportTime:
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "barks_fantagraphics.barks_covers",
+            "barks_fantagraphics.comic_book_info",
+            "barks_fantagraphics.whoosh_search_engine",
+        ],
+    )
+    def test_module_imports_faster_than_titles(
+        self, self_import_times: dict[str, int], module: str
+    ) -> None:
+        assert self_import_times[module] < self_import_times[YARDSTICK_MODULE]
@@ -1,10 +1,24 @@
 """Tests for search_ports protocols and the InMemoryFullTextSearch fake."""
 
-from barks_fantagraphics.search_ports import FullTextSearchPort
+# ruff: noqa: PLR2004, SLF001
+
+from barks_fantagraphics.barks_tags import Tags
+from barks_fantagraphics.barks_titles import Titles
+from barks_fantagraphics.comic_search import ComicSearch, SearchMode
+from barks_fantagraphics.search_ports import FullTextSearchPort, SpeechHit
 from barks_fantagraphics.testing.fake_search import InMemoryFullTextSearch
 from barks_fantagraphics.whoosh_search_engine import TitleInfo
 
 
+def _speech_hits(num_hits: int) -> list[SpeechHit]:
+    return [
+        SpeechHit(
+            "Title A", 1, f"{i:03d}", str(i), str(i), 1, 1.0 / (i + 1), "[b]DUCK[/b]", "DUCK!"
+        )
+        for i in range(num_hits)
+    ]
+
+
 class TestInMemoryFullTextSearch:
     def test_satisfies_protocol(self) -> None:
         fake = InMemoryFullTextSearch()
@@ -16,6 +30,19 @@ class TestInMemoryFullTextSearch:
         assert fake.find_words("duck") == expected
         assert fake.find_words("missing") == {}
 
+    def test_find_words_page_pages_canned_hits(self) -> None:
+        hits = _speech_hits(5)
+        fake = InMemoryFullTextSearch(find_words_hits={"duck": hits})
+
+        page = fake.find_words_page("duck", page_len=2)
+        assert page.hits == hits[:2]
+        assert page.total == 5
+        assert page.next_page_num == 2
+
+        page = fake.find_words_page("duck", 3, page_len=2)
+        assert page.hits == hits[4:]
+        assert page.next_page_num is None
+
     def test_find_entities_returns_canned_result(self) -> None:
         expected = {"Title B": TitleInfo(fanta_vol=2)}
         fake = InMemoryFullTextSearch(find_entities_results={("person", "Donald Duck"): expected})
@@ -49,9 +76,89 @@ class TestInMemoryFullTextSearch:
     def test_defaults_are_empty(self) -> None:
         fake = InMemoryFullTextSearch()
         assert fake.find_words("anything") == {}
+        assert fake.find_words_page("anything").hits == []
         assert fake.find_entities("person", "anyone") == {}
         assert fake.get_all_titles() == set()
         assert fake.get_cleaned_terms() == []
         assert fake.get_cleaned_alpha_split_terms() == {}
         assert fake.get_entity_terms("person") == []
         assert fake.get_alpha_split_entity_terms("person") == {}
+
+
+class TestComicSearchWordPages:
+    @staticmethod
+    def _search(fake: InMemoryFullTextSearch) -> ComicSearch:
+        search = ComicSearch(index_dir=None)  # ty: ignore[invalid-argument-type]
+        search._full_text = fake
+        return search
+
+    def test_iter_word_search_pages_yields_every_page(self) -> None:
+        hits = _speech_hits(5)
+        search = self._search(InMemoryFullTextSearch(find_words_hits={"duck": hits}))
+
+        pages = list(search.iter_word_search_pages("duck", page_len=2))
+
+        assert [len(page.hits) for page in pages] == [2, 2, 1]
+        assert [hit for page in pages for hit in page.hits] == hits
+
+    def test_iter_word_search_pages_with_no_hits(self) -> None:
+        search = self._search(InMemoryFullTextSearch())
+        assert list(search.iter_word_search_pages("duck")) == []
+
+    def test_iter_word_search_titles_groups_every_page_by_title(self) -> None:
+        hits = [
+            SpeechHit("Title B", 2, "010", "8", "12", 3, 0.9, "", "B 12"),
+            SpeechHit("Title A", 1, "005", "3", "7", 1, 0.8, "", "A 7"),
+            SpeechHit("Title B", 2, "004", "2", "5", 2, 0.7, "", "B 5"),
+            SpeechHit("Title B", 2, "010", "8", "9", 1, 0.6, "", "B 9"),
+            SpeechHit("Title B", 2, "010", "8", "10", 2, 0.5, "", "B 10"),
+        ]
+        search = self._search(InMemoryFullTextSearch(find_words_hits={"duck": hits}))
+
+        found_after_each_page = []
+        for found in search.iter_word_search_titles("duck", page_len=2):
+            found_after_each_page.append(
+                {title: len(info.fanta_pages) for title, info in found.items()}
+            )
+
+        assert found_after_each_page == [
+            {"Title B": 1, "Title A": 1},
+            {"Title B": 2, "Title A": 1},
+            {"Title B": 2, "Title A": 1},
+        ]
+        title_b = found["Title B"]
+        assert title_b.fanta_vol == 2
+        assert list(title_b.fanta_pages) == ["004", "010"]
+        assert title_b.fanta_pages["010"].comic_page == "8"
+        assert [s.group_id for s in title_b.fanta_pages["010"].speech_info_list] == [
+            "9",
+            "10",
+            "12",
+        ]
+        assert [s.speech_text for s in title_b.fanta_pages["010"].speech_info_list] == [
+            "B 9",
+            "B 10",
+            "B 12",
+        ]
+
+    def test_iter_word_search_titles_with_no_hits(self) -> None:
+        search = self._search(InMemoryFullTextSearch())
+        assert list(search.iter_word_search_titles("duck")) == []
+
+
+class TestComicSearchFuzzyFallback:
+    def test_misspelled_title_falls_back_to_fuzzy_match(self) -> None:
+        search = ComicSearch(index_dir=None)  # ty: ignore[invalid-argument-type]
+        result = search.search("Luck of the Noth", SearchMode.TITLE)
+        assert result.titles[0] == Titles.LUCK_OF_THE_NORTH
+        assert result.title_strings[0] == "Luck of the North"
+
+    def test_misspelled_tag_falls_back_to_fuzzy_match(self) -> None:
+        search = ComicSearch(index_dir=None)  # ty: ignore[invalid-argument-type]
+        result = search.search("gyro gearlose", SearchMode.TAG)
+        assert result.matched_tags[0] == Tags.GYRO_GEARLOOSE
+
+    def test_prefix_matches_come_before_fuzzy_ones(self) -> None:
+        search = ComicSearch(index_dir=None)  # ty: ignore[invalid-argument-type]
+        result = search.search("luck of", SearchMode.TITLE)
+        assert result.titles == [Titles.LUCK_OF_THE_NORTH]
@@ -0,0 +1,195 @@
+# ruff: noqa: SLF001
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from barks_fantagraphics import speech_groupers
+from barks_fantagraphics.barks_titles import Titles
+from barks_fantagraphics.ocr_file_paths import get_ocr_prelim_groups_json_filename
+from barks_fantagraphics.speech_groupers import OcrTypes, SpeechGroups, SpeechPageGroup
+from barks_fantagraphics.speech_groups_cache import (
+    get_speech_groups_cache_file,
+    load_speech_groups_cache,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+TITLE = Titles.LUCK_OF_THE_NORTH
+VOLUME = 9
+SRCE_DEST_MAP = {"201": "1", "202": "2", "203": "3"}
+
+
+def _make_groups(page: str, ocr_index: OcrTypes) -> dict[str, Any]:
+    return {
+        "0": {
+            "ai_text": f"UNCA SCROOGE'S\nMONEY ON {page}-{ocr_index}!",
+            "panel_num": 1,
+            "type": "speech",
+            "notes": "",
+            "text_box": [[10, 20], [300, 20], [300, 80], [10, 80]],
+        },
+        "1": {
+            "ai_text": "A BEAUTI-\nFUL ÉCLAIR­\nCAKE — \U0001f986",
+            "panel_num": 2,
+            "type": "thought",
+            "notes": None,
+            "text_box": [[10.5, 20.25], [300.0, 20.0], [300.0, 80.75], [10.0, 80.0]],
+        },
+        "2": {
+            "ai_text": page,
+            "panel_num": -1,
+            "type": "caption",
+            "notes": "Page number",
+            "text_box": [[500, 900], [520, 920]],
+        },
+        "3": {
+            "ai_text": "",
+            "panel_num": -1,
+            "type": "sound",
+            "notes": "",
+            "text_box": [],
+        },
+    }
+
+
+def _write_page_json(ocr_prelim_dir: Path, page: str, ocr_index: OcrTypes, text: str) -> Path:
+    groups = _make_groups(page, ocr_index)
+    groups["0"]["ai_text"] = text or groups["0"]["ai_text"]
+    json_file = ocr_prelim_dir / get_ocr_prelim_groups_json_filename(page, ocr_index)
+    json_file.write_text(json.dumps({"groups": groups}))
+    return json_file
+
+
+@pytest.fixture
+def ocr_prelim_dir(tmp_path: Path) -> Path:
+    for page in SRCE_DEST_MAP:
+        for ocr_index in OcrTypes:
+            _write_page_json(tmp_path, page, ocr_index, "")
+    return tmp_path
+
+
+@pytest.fixture
+def speech_groups(ocr_prelim_dir: Path) -> Iterator[SpeechGroups]:
+    db = MagicMock()
+    db.get_fanta_volume_int_for.return_value = VOLUME
+    db.get_fantagraphics_restored_ocr_prelim_volume_dir.return_value = ocr_prelim_dir
+    srce_dest_map = dict(SRCE_DEST_MAP)
+    with patch.object(
+        SpeechGroups, "_get_srce_page_to_dest_page_map", side_effect=lambda _: srce_dest_map
+    ):
+        yield SpeechGroups(db)
+
+
+def _without_json(groups: list[SpeechPageGroup]) -> list[SpeechPageGroup]:
+    return [replace(g, speech_page_json={}) for g in groups]
+
+
+class TestCachedSpeechPageGroups:
+    def test_same_speech_as_the_json(self, speech_groups: SpeechGroups) -> None:
+        from_json = speech_groups.get_speech_page_groups(TITLE)
+
+        built = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+        loaded = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert built == _without_json(from_json)
+        assert loaded == _without_json(from_json)
+        # Down to the coordinate types.
+        assert repr(loaded) == repr(_without_json(from_json))
+        assert [list(g.speech_groups) for g in loaded] == [["0", "1", "3"]] * 6
+
+    def test_cache_is_read_without_parsing_json(
+        self, speech_groups: SpeechGroups, ocr_prelim_dir: Path
+    ) -> None:
+        speech_groups.get_speech_page_groups(TITLE, with_json=False)
+        assert get_speech_groups_cache_file(ocr_prelim_dir, TITLE).is_file()
+
+        with patch.object(speech_groupers, "_get_speech_text_list", side_effect=AssertionError):
+            loaded = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert len(loaded) == len(SRCE_DEST_MAP) * len(OcrTypes)
+        assert all(g.speech_page_json == {} for g in loaded)
+
+    def test_edited_json_is_reread(self, speech_groups: SpeechGroups, ocr_prelim_dir: Path) -> None:
+        speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        json_file = _write_page_json(ocr_prelim_dir, "202", OcrTypes.PADDLEOCR, "FIXED TEXT")
+        # Same size and modification time, except for the size of the new text.
+        os.utime(json_file, ns=(0, 1_000_000_000))
+
+        loaded = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert loaded == _without_json(speech_groups.get_speech_page_groups(TITLE))
+        assert loaded[3].speech_groups["0"].ai_text == "FIXED TEXT"
+
+    def test_touched_json_is_reread(
+        self, speech_groups: SpeechGroups, ocr_prelim_dir: Path
+    ) -> None:
+        speech_groups.get_speech_page_groups(TITLE, with_json=False)
+        json_file = ocr_prelim_dir / get_ocr_prelim_groups_json_filename("201", OcrTypes.EASYOCR)
+        os.utime(json_file, ns=(0, 1_000_000_000))
+
+        with patch.object(
+            speech_groupers, "_get_speech_text_list", wraps=speech_groupers._get_speech_text_list
+        ) as get_speech_text_list:
+            speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert get_speech_text_list.call_count == len(SRCE_DEST_MAP) * len(OcrTypes)
+
+    def test_changed_pages_are_reread(self, speech_groups: SpeechGroups) -> None:
+        speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        with patch.object(
+            SpeechGroups, "_get_srce_page_to_dest_page_map", return_value={"201": "1", "203": "2"}
+        ):
+            loaded = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert [(g.fanta_page, g.comic_page) for g in loaded] == [
+            ("201", "1"),
+            ("201", "1"),
+            ("203", "2"),
+            ("203", "2"),
+        ]
+
+    @pytest.mark.parametrize("contents", [b"", b"BKSG", b"not a cache file at all" * 10])
+    def test_unreadable_cache_is_rebuilt(
+        self, speech_groups: SpeechGroups, ocr_prelim_dir: Path, contents: bytes
+    ) -> None:
+        cache_file = get_speech_groups_cache_file(ocr_prelim_dir, TITLE)
+        cache_file.parent.mkdir()
+        cache_file.write_bytes(contents)
+
+        loaded = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert loaded == _without_json(speech_groups.get_speech_page_groups(TITLE))
+        assert cache_file.stat().st_size > len(contents)
+
+    def test_cache_for_another_title_is_not_used(
+        self, speech_groups: SpeechGroups, ocr_prelim_dir: Path
+    ) -> None:
+        speech_groups.get_speech_page_groups(TITLE, with_json=False)
+        cache_file = get_speech_groups_cache_file(ocr_prelim_dir, TITLE)
+        pages = [(o, s, d) for s, d in SRCE_DEST_MAP.items() for o in OcrTypes]
+
+        assert load_speech_groups_cache(cache_file, TITLE, VOLUME, ocr_prelim_dir, pages)
+        assert (
+            load_speech_groups_cache(cache_file, Titles.GOOD_DEEDS, VOLUME, ocr_prelim_dir, pages)
+            is None
+        )
+
+    def test_unwritable_cache_still_returns_the_speech(
+        self, speech_groups: SpeechGroups, ocr_prelim_dir: Path
+    ) -> None:
+        # A file where the cache directory should be.
+        get_speech_groups_cache_file(ocr_prelim_dir, TITLE).parent.write_text("")
+
+        loaded = speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        assert loaded == _without_json(speech_groups.get_speech_page_groups(TITLE))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_fantagraphics.story_index import STORY_INDEX_VERSION, StoryIndex, read_story_ini
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_INI = """\
+[info]
+title = Luck of the North
+source_comic = FANTA_09
+issue_title = ${title} Again
+title_font_size = 35
+
+[pages]
+title_empty = TITLE
+068 - 071 = BODY
+Solo_Pages = 68, 70
+"""
+
+
+@pytest.fixture
+def story_titles_dir(tmp_path: Path) -> Path:
+    titles_dir = tmp_path / "story-titles"
+    titles_dir.mkdir()
+    (titles_dir / "Luck of the North.ini").write_text(_INI)
+    (titles_dir / "Good Deeds.ini").write_text(
+        "[info]\ntitle =\nsource_comic = FANTA_02\n\n[pages]\n001 - 010 = BODY\n"
+    )
+    (titles_dir / "notes.txt").write_text("Not an ini file.")
+    return titles_dir
+
+
+class TestReadStoryIni:
+    def test_reads_sections_like_config_parser(self, story_titles_dir: Path) -> None:
+        story_ini = read_story_ini(story_titles_dir / "Luck of the North.ini")
+
+        assert dict(story_ini.info) == {
+            "title": "Luck of the North",
+            "source_comic": "FANTA_09",
+            "issue_title": "Luck of the North Again",
+            "title_font_size": "35",
+        }
+        assert list(story_ini.pages.items()) == [
+            ("title_empty", "TITLE"),
+            ("068 - 071", "BODY"),
+            ("solo_pages", "68, 70"),
+        ]
+
+    def test_missing_file_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError, match="Could not read"):
+            read_story_ini(tmp_path / "Missing.ini")
+
+
+class TestStoryIndex:
+    def test_without_index_file_parses_every_ini(self, story_titles_dir: Path) -> None:
+        index = StoryIndex(story_titles_dir)
+        index.load()
+
+        assert index.num_inis_parsed == 2  # noqa: PLR2004
+        assert index.get_story_ini("Good Deeds.ini").info["source_comic"] == "FANTA_02"
+        with pytest.raises(KeyError):
+            index.get_story_ini("notes.txt")
+
+    def test_index_file_is_reused(self, story_titles_dir: Path, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        parsed = StoryIndex(story_titles_dir, index_path)
+        parsed.load()
+
+        compiled = StoryIndex(story_titles_dir, index_path)
+        compiled.load()
+
+        assert compiled.num_inis_parsed == 0
+        for ini_filename in ["Luck of the North.ini", "Good Deeds.ini"]:
+            assert compiled.get_story_ini(ini_filename) == parsed.get_story_ini(ini_filename)
+            assert list(compiled.get_story_ini(ini_filename).pages) == list(
+                parsed.get_story_ini(ini_filename).pages
+            )
+
+    def test_changed_ini_is_reparsed(self, story_titles_dir: Path, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        StoryIndex(story_titles_dir, index_path).load()
+
+        ini_file = story_titles_dir / "Good Deeds.ini"
+        ini_file.write_text(ini_file.read_text().replace("FANTA_02", "FANTA_03"))
+        os.utime(ini_file, ns=(0, 1_000_000_000))
+        (story_titles_dir / "Trick or Treat.ini").write_text(
+            "[info]\ntitle =\nsource_comic = FANTA_12\n\n[pages]\n001 = BODY\n"
+        )
+        (story_titles_dir / "Luck of the North.ini").unlink()
+
+        index = StoryIndex(story_titles_dir, index_path)
+        index.load()
+
+        assert index.num_inis_parsed == 2  # noqa: PLR2004
+        assert index.get_story_ini("Good Deeds.ini").info["source_comic"] == "FANTA_03"
+        assert index.get_story_ini("Trick or Treat.ini").info["source_comic"] == "FANTA_12"
+        with pytest.raises(KeyError):
+            index.get_story_ini("Luck of the North.ini")
+        assert sorted(json.loads(index_path.read_text())["inis"]) == [
+            "Good Deeds.ini",
+            "Trick or Treat.ini",
+        ]
+
+    @pytest.mark.parametrize(
+        "contents",
+        ["{not json", json.dumps({"version": STORY_INDEX_VERSION + 1, "inis": {}}), "[]"],
+    )
+    def test_unusable_index_file_is_rebuilt(
+        self, story_titles_dir: Path, tmp_path: Path, contents: str
+    ) -> None:
+        index_path = tmp_path / "index.json"
+        index_path.write_text(contents)
+
+        index = StoryIndex(story_titles_dir, index_path)
+        index.load()
+
+        assert index.num_inis_parsed == 2  # noqa: PLR2004
+        assert json.loads(index_path.read_text())["version"] == STORY_INDEX_VERSION
+
+    @pytest.mark.parametrize(
+        "contents",
+        [
+            json.dumps({"version": STORY_INDEX_VERSION}),
+            json.dumps({"version": STORY_INDEX_VERSION, "inis": ["Good Deeds.ini"]}),
+        ],
+    )
+    def test_malformed_index_file_is_rebuilt(
+        self, story_titles_dir: Path, tmp_path: Path, contents: str
+    ) -> None:
+        index_path = tmp_path / "index.json"
+        index_path.write_text(contents)
+
+        index = StoryIndex(story_titles_dir, index_path)
+        index.load()
+
+        assert index.num_inis_parsed == 2  # noqa: PLR2004
+        reread = StoryIndex(story_titles_dir, index_path)
+        reread.load()
+        assert reread.num_inis_parsed == 0
+
+    def test_malformed_entries_are_reparsed(self, story_titles_dir: Path, tmp_path: Path) -> None:
+        index_path = tmp_path / "index.json"
+        parsed = StoryIndex(story_titles_dir, index_path)
+        parsed.load()
+
+        saved = json.loads(index_path.read_text())
+        del saved["inis"]["Good Deeds.ini"]["signature"]
+        saved["inis"]["Luck of the North.ini"]["pages"] = ["068 - 071"]
+        index_path.write_text(json.dumps(saved))
+
+        index = StoryIndex(story_titles_dir, index_path)
+        index.load()
+
+        assert index.num_inis_parsed == 2  # noqa: PLR2004
+        for ini_filename in ["Luck of the North.ini", "Good Deeds.ini"]:
+            assert index.get_story_ini(ini_filename) == parsed.get_story_ini(ini_filename)
+        reread = StoryIndex(story_titles_dir, index_path)
+        reread.load()
+        assert reread.num_inis_parsed == 0
+
+    def test_unwritable_index_file_still_loads(
+        self, story_titles_dir: Path, tmp_path: Path
+    ) -> None:
+        not_a_dir = tmp_path / "not-a-dir"
+        not_a_dir.write_text("")
+
+        index = StoryIndex(story_titles_dir, not_a_dir / "index.json")
+        index.load()
+
+        assert index.get_story_ini("Luck of the North.ini").info["source_comic"] == "FANTA_09"
@@ -0,0 +1,101 @@
+"""Tests for the immutable term vocabularies and their prefix index."""
+
+import gc
+import json
+import tracemalloc
+
+import pytest
+from barks_fantagraphics.term_vocabulary import TermVocabulary, freeze_alpha_split_terms
+
+TERMS = ["dance", "Daniel Boone", "don", "Don Gaspar", "done", "Donna Duck", "quixote", "Éclair"]
+
+
+class TestTermVocabulary:
+    def test_keeps_display_order(self) -> None:
+        vocabulary = TermVocabulary(TERMS)
+        assert vocabulary.terms == tuple(TERMS)
+        assert list(vocabulary) == TERMS
+        assert len(vocabulary) == len(TERMS)
+
+    def test_with_prefix_ignores_case(self) -> None:
+        vocabulary = TermVocabulary(TERMS)
+        assert vocabulary.with_prefix("don") == ("don", "Don Gaspar", "done", "Donna Duck")
+        assert vocabulary.with_prefix("DON G") == ("Don Gaspar",)
+        assert vocabulary.with_prefix("é") == ("Éclair",)
+
+    def test_with_prefix_spans_letter_groups(self) -> None:
+        vocabulary = TermVocabulary(TERMS)
+        assert vocabulary.with_prefix("d") == TermVocabulary(TERMS[:6]).terms
+
+    def test_with_prefix_no_match(self) -> None:
+        vocabulary = TermVocabulary(TERMS)
+        assert vocabulary.with_prefix("zz") == ()
+        assert vocabulary.with_prefix("donald") == ()
+
+    def test_empty_prefix_matches_everything(self) -> None:
+        assert set(TermVocabulary(TERMS).with_prefix("")) == set(TERMS)
+
+    def test_empty_vocabulary(self) -> None:
+        vocabulary = TermVocabulary(())
+        assert len(vocabulary) == 0
+        assert vocabulary.with_prefix("a") == ()
+
+    def test_prefix_matches_share_the_term_strings(self) -> None:
+        vocabulary = TermVocabulary(TERMS)
+        assert all(
+            any(match is term for term in vocabulary.terms) for match in vocabulary.with_prefix("")
+        )
+
+
+class TestFreezeAlphaSplitTerms:
+    ALPHA_SPLIT: dict = {"d": {"da": ["dance"], "do": ["don", "done"]}}  # noqa: RUF012
+
+    def test_same_contents_as_tuples(self) -> None:
+        frozen = freeze_alpha_split_terms(self.ALPHA_SPLIT)
+        assert frozen == {"d": {"da": ("dance",), "do": ("don", "done")}}
+
+    def test_is_read_only(self) -> None:
+        frozen = freeze_alpha_split_terms(self.ALPHA_SPLIT)
+        with pytest.raises(TypeError):
+            frozen["e"] = {}  # ty: ignore[invalid-assignment]
+        with pytest.raises(TypeError):
+            frozen["d"]["de"] = ()  # ty: ignore[invalid-assignment]
+
+    def test_shares_strings_with_the_vocabulary(self) -> None:
+        # Separately decoded, as the two term files are.
+        vocabulary = TermVocabulary(json.loads(json.dumps(["don", "done"])))
+        frozen = freeze_alpha_split_terms(json.loads(json.dumps(self.ALPHA_SPLIT)))
+        assert frozen["d"]["do"][0] is vocabulary.terms[0]
+        assert frozen["d"]["do"][1] is vocabulary.terms[1]
+
+
+def _get_retained_bytes(terms_json: str, keep: list[TermVocabulary]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        keep.append(TermVocabulary(json.loads(terms_json)))
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+class TestMemoryFootprint:
+    NUM_TERMS = 20_000
+
+    def test_reloaded_vocabulary_reuses_the_interned_strings(self) -> None:
+        terms_json = json.dumps(
+            [f"Term number {i:05d} of the vocabulary" for i in range(self.NUM_TERMS)]
+        )
+        keep: list[TermVocabulary] = []
+
+        first_load = _get_retained_bytes(terms_json, keep)
+        reload = _get_retained_bytes(terms_json, keep)
+
+        # The first load keeps a string per term and its lowercased key. A reload
+        # keeps just its tuples: the decoded strings are dropped for the
+        # interned ones.
+        assert all(a is b for a, b in zip(keep[0].terms, keep[1].terms, strict=True))
+        assert reload < 3 * 8 * self.NUM_TERMS + 4096
+        assert reload < first_load / 3
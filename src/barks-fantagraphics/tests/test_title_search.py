@@ -1,5 +1,10 @@
 import pytest
-from barks_fantagraphics.barks_tags import TagGroups, Tags
+from barks_fantagraphics.barks_tags import (
+    BARKS_TAG_ALIASES,
+    BARKS_TAG_GROUPS_ALIASES,
+    TagGroups,
+    Tags,
+)
 from barks_fantagraphics.barks_titles import Titles
 from barks_fantagraphics.title_search import BarksTitleSearch
 
@@ -119,3 +124,58 @@ class TestBarksTitleSearch:
 
         titles = BarksTitleSearch.get_titles_from_issue_num("US 10")
         assert titles == [Titles.FABULOUS_PHILOSOPHERS_STONE_THE, Titles.HEIRLOOM_WATCH]
+
+    def test_get_titles_containing_ignores_punctuation(self) -> None:
+        assert Titles.RABBITS_FOOT_THE in self.search.get_titles_containing("rabbits foot")
+
+    def test_get_titles_containing_keeps_chronological_order(self) -> None:
+        results = self.search.get_titles_containing("christmas")
+        assert results == sorted(results)
+
+    def test_get_tags_matching_prefix_one_char(self) -> None:
+        results = self.search.get_tags_matching_prefix("g")
+        assert Tags.GYRO_GEARLOOSE in results
+        assert set(results) == {
+            tag
+            for alias, tag in [*BARKS_TAG_ALIASES.items(), *BARKS_TAG_GROUPS_ALIASES.items()]
+            if alias.startswith("g")
+        }
+
+    def test_get_titles_matching_fuzzy_misspelling(self) -> None:
+        results = self.search.get_titles_matching_fuzzy("Luck of the Noth")
+        assert results[0] == Titles.LUCK_OF_THE_NORTH
+
+    @pytest.mark.parametrize(
+        ("query", "title"),
+        [
+            ("golden helmt", Titles.GOLDEN_HELMET_THE),
+            ("victry garden", Titles.VICTORY_GARDEN_THE),
+            ("the rabits foot", Titles.RABBITS_FOOT_THE),
+            ("HORSERADISH STORY", Titles.HORSERADISH_STORY_THE),
+            ("Vacaton Tmie", Titles.VACATION_TIME),
+        ],
+    )
+    def test_get_titles_matching_fuzzy_best_match(self, query: str, title: Titles) -> None:
+        assert self.search.get_titles_matching_fuzzy(query)[0] == title
+
+    def test_get_titles_matching_fuzzy_each_title_once(self) -> None:
+        results = self.search.get_titles_matching_fuzzy("the golden helmet", limit=50)
+        assert len(results) == len(set(results))
+
+    def test_get_titles_matching_fuzzy_limit(self) -> None:
+        assert len(self.search.get_titles_matching_fuzzy("christmas", limit=2)) == 2  # noqa: PLR2004
+
+    def test_get_titles_matching_fuzzy_no_match(self) -> None:
+        assert self.search.get_titles_matching_fuzzy("qzxjvw") == []
+        assert self.search.get_titles_matching_fuzzy("") == []
+
+    @pytest.mark.parametrize(
+        ("query", "tag"),
+        [
+            ("gyro gearlose", Tags.GYRO_GEARLOOSE),
+            ("alaksa", Tags.ALASKA),
+            ("pig vilains", TagGroups.PIG_VILLAINS),
+        ],
+    )
+    def test_get_tags_matching_fuzzy_best_match(self, query: str, tag: Tags | TagGroups) -> None:
+        assert self.search.get_tags_matching_fuzzy(query)[0] == tag
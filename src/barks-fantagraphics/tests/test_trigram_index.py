@@ -0,0 +1,95 @@
+"""Tests for the fuzzy trigram index."""
+
+# ruff: noqa: PLR2004
+
+import pytest
+from barks_fantagraphics.trigram_index import (
+    TrigramIndex,
+    fold_text,
+    get_bounded_edit_distance,
+    get_trigrams,
+)
+
+
+class TestFoldText:
+    def test_drops_accents_case_and_punctuation(self) -> None:
+        assert fold_text("Café au Lait, Señor!") == "cafe au lait senor"
+
+    def test_removes_apostrophes(self) -> None:
+        assert fold_text("The Rabbit\u2019s Foot") == fold_text("the rabbits foot")
+
+    def test_punctuation_separates_words(self) -> None:
+        assert fold_text("Hark,Hark--the  Ark") == "hark hark the ark"
+
+
+class TestGetTrigrams:
+    def test_pads_each_word(self) -> None:
+        assert get_trigrams("ab cd") == {"  a", " ab", "ab ", "  c", " cd", "cd "}
+
+    def test_empty(self) -> None:
+        assert get_trigrams("") == frozenset()
+
+
+class TestGetBoundedEditDistance:
+    @pytest.mark.parametrize(
+        ("a", "b", "distance"),
+        [
+            ("north", "north", 0),
+            ("noth", "north", 1),
+            ("alaksa", "alaska", 1),
+            ("kitten", "sitting", 3),
+            ("", "ab", 2),
+        ],
+    )
+    def test_within_bound(self, a: str, b: str, distance: int) -> None:
+        assert get_bounded_edit_distance(a, b, 3) == distance
+
+    def test_over_bound_is_capped(self) -> None:
+        assert get_bounded_edit_distance("kitten", "sitting", 2) == 3
+        assert get_bounded_edit_distance("a", "abcdef", 2) == 3
+
+
+class TestTrigramIndex:
+    ENTRIES = (
+        (1, "Luck of the North"),
+        (2, "North of the Yukon"),
+        (3, "The Golden Helmet"),
+        (3, "Golden Helmet"),
+        (4, "Crème Brûlée"),
+    )
+
+    @pytest.fixture
+    def index(self) -> TrigramIndex[int]:
+        return TrigramIndex(self.ENTRIES)
+
+    def test_len_counts_texts(self, index: TrigramIndex[int]) -> None:
+        assert len(index) == len(self.ENTRIES)
+
+    def test_exact_match_scores_one(self, index: TrigramIndex[int]) -> None:
+        match = index.search("luck of the north")[0]
+        assert (match.key, match.text, match.score) == (1, "Luck of the North", 1.0)
+
+    def test_misspelling_ranks_first(self, index: TrigramIndex[int]) -> None:
+        matches = index.search("Luck of the Noth")
+        assert [m.key for m in matches] == [1, 2]
+        assert matches[0].score > 0.9
+
+    def test_accents_are_folded(self, index: TrigramIndex[int]) -> None:
+        assert index.search("creme brulee")[0].key == 4
+
+    def test_key_returned_once_with_best_text(self, index: TrigramIndex[int]) -> None:
+        matches = index.search("golden helmt")
+        assert [(m.key, m.text) for m in matches] == [(3, "Golden Helmet")]
+
+    def test_min_score_and_limit(self, index: TrigramIndex[int]) -> None:
+        assert index.search("north", min_score=0.99) == []
+        assert len(index.search("north", limit=1)) == 1
+        assert index.search("north", limit=0) == []
+
+    def test_find_containing(self, index: TrigramIndex[int]) -> None:
+        assert index.find_containing("of the") == [1, 2]
+        assert index.find_containing("HELMET") == [3]
+        assert index.find_containing("brulee") == [4]
+        assert index.find_containing("of") == [1, 2]
+        assert index.find_containing("yukon luck") == []
+        assert index.find_containing("") == []
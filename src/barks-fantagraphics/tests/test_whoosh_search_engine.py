@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, cast
+import json
+from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import MagicMock
 
 import pytest
+from barks_fantagraphics.barks_titles import Titles
 from barks_fantagraphics.entity_types import EntityType
+from barks_fantagraphics.testing.fake_speech import tag_scrooge
 from barks_fantagraphics.whoosh_search_engine import (
     SUB_ALPHA_SPLIT_SIZE,
     SearchEngine,
@@ -18,8 +21,10 @@ from barks_fantagraphics.whoosh_search_engine import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
+    from barks_fantagraphics.search_ports import SpeechHit
     from whoosh.searching import Hit
 
 # ---------------------------------------------------------------------------
@@ -568,3 +573,515 @@ class TestFindWords:
         assert len(docs) == 2
         assert {d["title"] for d in docs} == {"Alpha", "Beta"}
         assert all("unstemmed" not in d for d in docs)
+
+
+# ---------------------------------------------------------------------------
+# SearchEngine.find_words_page — ranked, paged, highlighted hits
+# ---------------------------------------------------------------------------
+
+
+def _add_speech_documents(index_dir: Path, speech_texts: list[str]) -> None:
+    from whoosh.index import open_dir
+
+    writer = open_dir(str(index_dir)).writer()
+    for i, speech_text in enumerate(speech_texts):
+        writer.add_document(
+            title=f"Title {i:02d}",
+            fanta_vol="5",
+            fanta_page=f"{i + 1:03d}",
+            comic_page=str(i + 1),
+            content_id=str(i),
+            panel_num="2",
+            unstemmed=speech_text.lower(),
+            content_raw=speech_text,
+        )
+    writer.commit()
+
+
+class TestFindWordsPage:
+    @pytest.fixture
+    def index_dir(self, tmp_path: Path) -> Path:
+        index_dir = _build_words_index(tmp_path)
+        _add_speech_documents(
+            index_dir,
+            [f"WHAT A LOT OF MONEY! BOX {i}" for i in range(7)]
+            + ["MONEY, MONEY, MONEY!\nI LOVE MONEY!"],
+        )
+        return index_dir
+
+    def test_hits_are_paged_past_the_last_page(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+
+        page = engine.find_words_page("money", page_len=3)
+        assert page.total == 8
+        assert len(page.hits) == 3
+        assert page.next_page_num == 2
+
+        page = engine.find_words_page("money", page.next_page_num, page_len=3)
+        assert len(page.hits) == 3
+        assert page.next_page_num == 3
+
+        page = engine.find_words_page("money", page.next_page_num, page_len=3)
+        assert len(page.hits) == 2
+        assert page.next_page_num is None
+
+        assert engine.find_words_page("money", 4, page_len=3).hits == []
+
+    def test_all_pages_together_give_every_hit_once(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        group_ids = [
+            hit.group_id
+            for page_num in (1, 2, 3)
+            for hit in engine.find_words_page("money", page_num, page_len=3).hits
+        ]
+        assert sorted(group_ids) == [str(i) for i in range(8)]
+
+    def test_hits_are_ranked_best_first(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        hits = engine.find_words_page("money").hits
+
+        assert hits[0].group_id == "7"
+        scores = [hit.score for hit in hits]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_hit_fields(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        (hit,) = engine.find_words_page("love").hits
+
+        assert hit.title == "Title 07"
+        assert hit.fanta_vol == 5
+        assert hit.fanta_page == "008"
+        assert hit.comic_page == "8"
+        assert hit.group_id == "7"
+        assert hit.panel_num == 2
+        assert hit.score > 0
+        assert hit.speech_text == "MONEY, MONEY, MONEY!\nI LOVE MONEY!"
+
+    def test_matched_words_are_marked_in_the_fragment(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        hit = engine.find_words_page("money").hits[0]
+
+        assert hit.fragment.count("[b]MONEY[/b]") == 4
+        assert "\n" not in hit.fragment
+
+    def test_fragment_text_is_escaped_for_markup(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+
+        fragment = engine._get_fragment("MONEY [b]& GOLD[/b] COINS", frozenset({"money"}))
+        assert fragment == "[b]MONEY[/b] &bl;b&br;&amp; GOLD&bl;/b&br; COINS"
+
+        fallback = engine._get_fragment("[i]NOTHING & NOBODY", frozenset({"money"}))
+        assert fallback == "&bl;i&br;NOTHING &amp; NOBODY"
+
+    def test_no_hits(self, index_dir: Path) -> None:
+        page = SearchEngine(index_dir).find_words_page("nonexistentword")
+        assert page.hits == []
+        assert page.total == 0
+        assert page.next_page_num is None
+
+    @pytest.mark.parametrize(("page_num", "page_len"), [(0, 10), (1, 0)])
+    def test_invalid_page_raises(self, index_dir: Path, page_num: int, page_len: int) -> None:
+        with pytest.raises(ValueError, match="Invalid page"):
+            SearchEngine(index_dir).find_words_page("money", page_num, page_len)
+
+
+# ---------------------------------------------------------------------------
+# SearcherPool — long-lived searchers shared by SearchEngine queries
+# ---------------------------------------------------------------------------
+
+
+def _add_gamma_document(index_dir: Path) -> None:
+    from whoosh.index import open_dir
+
+    writer = open_dir(str(index_dir)).writer()
+    writer.add_document(
+        title="Gamma",
+        fanta_vol="30",
+        fanta_page="005",
+        comic_page="1",
+        content_id="2",
+        panel_num="1",
+        unstemmed="voodoo once more",
+        content_raw="RAW",
+    )
+    writer.commit()
+
+
+class TestSearcherPool:
+    @pytest.fixture
+    def index_dir(self, tmp_path: Path) -> Path:
+        return _build_words_index(tmp_path)
+
+    def test_queries_reuse_one_searcher(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+
+        for _ in range(3):
+            engine.find_words("voodoo")
+            engine.find_entities("person", "Duk Duk")
+        engine.get_all_titles()
+
+        assert engine._searchers.num_opened == 1
+        assert engine._searchers.num_idle == 1
+
+    def test_concurrent_leases_get_their_own_searchers(self, index_dir: Path) -> None:
+        pool = SearchEngine(index_dir)._searchers
+
+        with pool.lease() as searcher_a, pool.lease() as searcher_b:
+            assert searcher_a is not searcher_b
+
+        assert pool.num_opened == 2
+        assert pool.num_idle == 2
+
+    def test_leases_from_many_threads(self, index_dir: Path) -> None:
+        import threading
+
+        engine = SearchEngine(index_dir)
+        errors: list[Exception] = []
+
+        def query() -> None:
+            try:
+                for _ in range(20):
+                    assert list(engine.find_words("voodoo")) == ["Alpha", "Beta"]
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [threading.Thread(target=query) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert engine._searchers.num_opened <= len(threads)
+
+    def test_new_index_generation_is_picked_up(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        assert list(engine.find_words("voodoo")) == ["Alpha", "Beta"]
+        with engine._searchers.lease() as old_searcher:
+            pass
+
+        _add_gamma_document(index_dir)
+
+        assert list(engine.find_words("voodoo")) == ["Alpha", "Beta", "Gamma"]
+        assert engine._searchers.num_opened == 2
+        assert old_searcher.is_closed
+
+    def test_searcher_leased_across_a_new_generation_is_closed_on_return(
+        self, index_dir: Path
+    ) -> None:
+        engine = SearchEngine(index_dir)
+        pool = engine._searchers
+
+        with pool.lease() as old_searcher:
+            _add_gamma_document(index_dir)
+            assert list(engine.find_words("voodoo")) == ["Alpha", "Beta", "Gamma"]
+            assert not old_searcher.is_closed
+
+        assert old_searcher.is_closed
+        assert pool.num_idle == 1
+
+    def test_close(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        with engine._searchers.lease() as searcher:
+            pass
+
+        engine.close()
+
+        assert searcher.is_closed
+        with pytest.raises(ValueError, match="closed"):
+            engine.find_words("voodoo")
+
+
+# ---------------------------------------------------------------------------
+# SearchEngineCreator.index_volumes — parallel build (synthetic corpus)
+# ---------------------------------------------------------------------------
+
+
+def _tag_nobody(speech_text: str) -> dict[str, set[str]]:  # noqa: ARG001
+    return {}
+
+
+def _build_synthetic_index(
+    index_dir: Path,
+    max_workers: int,
+    volumes: tuple[int, ...] = (1, 2, 3),
+    edited_titles: frozenset[Titles] = frozenset(),
+    incremental: bool = False,
+    entity_tagger: Callable[[str], dict[str, set[str]]] = tag_scrooge,
+) -> SearchEngine:
+    from unittest.mock import patch
+
+    from barks_fantagraphics import whoosh_search_engine
+    from barks_fantagraphics.speech_groupers import OcrTypes
+    from barks_fantagraphics.testing.fake_speech import (
+        SyntheticComicsDatabase,
+        SyntheticSpeechGroups,
+    )
+
+    speech_groups = SyntheticSpeechGroups(pages_per_title=3, edited_titles=edited_titles)
+    with patch.object(whoosh_search_engine, "SpeechGroups", return_value=speech_groups):
+        creator = SearchEngineCreator(
+            cast("Any", SyntheticComicsDatabase()),
+            index_dir,
+            OcrTypes.EASYOCR,
+            incremental=incremental,
+        )
+        creator.index_volumes(list(volumes), entity_tagger=entity_tagger, max_workers=max_workers)
+
+    return SearchEngine(index_dir)
+
+
+class TestIndexVolumes:
+    QUERIES = ("money", "scrooge", "can't", "spell-binder", "zork7", "gold AND boat")
+
+    @pytest.fixture
+    def serial_engine(self, tmp_path: Path) -> SearchEngine:
+        return _build_synthetic_index(tmp_path / "serial", max_workers=1)
+
+    @pytest.fixture
+    def parallel_engine(self, tmp_path: Path) -> SearchEngine:
+        return _build_synthetic_index(tmp_path / "parallel", max_workers=3)
+
+    def test_only_the_chosen_ocr_type_is_indexed(self, serial_engine: SearchEngine) -> None:
+        # 3 volumes x 4 titles x 3 pages x 6 bubbles.
+        assert len(list(serial_engine.iter_all_stored_fields())) == 216
+        assert len(serial_engine.get_all_titles()) == 12
+
+    def test_parallel_build_writes_one_segment(self, parallel_engine: SearchEngine) -> None:
+        with parallel_engine._searchers.lease() as searcher:
+            assert len(searcher.reader().leaf_readers()) == 1
+        assert len(list(parallel_engine.iter_all_stored_fields())) == 216
+
+    def test_parallel_build_gives_the_same_results(
+        self, serial_engine: SearchEngine, parallel_engine: SearchEngine
+    ) -> None:
+        assert parallel_engine.get_all_titles() == serial_engine.get_all_titles()
+        for query in self.QUERIES:
+            assert parallel_engine.find_words(query) == serial_engine.find_words(query), query
+        assert parallel_engine.find_entities("person", "Scrooge") == (
+            serial_engine.find_entities("person", "Scrooge")
+        )
+        assert parallel_engine.find_entities("person", "Scrooge")
+
+    def test_parallel_build_gives_the_same_term_lists(
+        self, serial_engine: SearchEngine, parallel_engine: SearchEngine
+    ) -> None:
+        assert parallel_engine.get_cleaned_terms() == serial_engine.get_cleaned_terms()
+        assert parallel_engine.get_cleaned_alpha_split_terms() == (
+            serial_engine.get_cleaned_alpha_split_terms()
+        )
+        assert parallel_engine.get_entity_terms("person") == ("Scrooge",)
+        assert serial_engine.get_entity_terms("person") == ("Scrooge",)
+
+    def test_parallel_build_does_not_fork_this_process(
+        self, tmp_path: Path, recwarn: pytest.WarningsRecorder
+    ) -> None:
+        _build_synthetic_index(tmp_path / "parallel", max_workers=3)
+        assert not [w for w in recwarn if "fork" in str(w.message)]
+
+    def test_repeated_parallel_builds_agree(
+        self, parallel_engine: SearchEngine, tmp_path: Path
+    ) -> None:
+        rebuilt_engine = _build_synthetic_index(tmp_path / "rebuilt", max_workers=3)
+        for query in self.QUERIES:
+            assert rebuilt_engine.find_words(query) == parallel_engine.find_words(query), query
+
+
+# ---------------------------------------------------------------------------
+# SearchEngineCreator incremental updates (synthetic corpus)
+# ---------------------------------------------------------------------------
+
+_TERM_FILES = (
+    "unstemmed-terms.json",
+    "cleaned-unstemmed-terms.json",
+    "cleaned-alpha-split-unstemmed-terms.json",
+    "most-common-unstemmed-terms.json",
+    "least-common-unstemmed-terms.json",
+    "entities-person-terms.json",
+)
+
+
+def _hit_order(hit: SpeechHit) -> tuple[float, str, str, str]:
+    return -hit.score, hit.title, hit.fanta_page, hit.group_id
+
+
+class TestIncrementalIndexUpdate:
+    QUERIES = ("money", "scrooge", "can't", "spell-binder", "zork7", "zork150", "gold AND boat")
+    EDITED = frozenset({Titles.DONALD_DUCK_FINDS_PIRATE_GOLD, Titles.RABBITS_FOOT_THE})
+
+    @staticmethod
+    def _assert_same_index(engine: SearchEngine, expected: SearchEngine) -> None:
+        assert engine.get_all_titles() == expected.get_all_titles()
+        for query in TestIncrementalIndexUpdate.QUERIES:
+            assert engine.find_words(query) == expected.find_words(query), query
+            # Hits with equal scores can come in a different document order.
+            page = engine.find_words_page(query, page_len=1000)
+            expected_page = expected.find_words_page(query, page_len=1000)
+            assert page.total == expected_page.total, query
+            assert sorted(page.hits, key=_hit_order) == sorted(expected_page.hits, key=_hit_order)
+        assert engine.find_entities("person", "Scrooge") == (
+            expected.find_entities("person", "Scrooge")
+        )
+
+        index_dir = engine._index.storage.folder
+        expected_index_dir = expected._index.storage.folder
+        for term_file in _TERM_FILES:
+            assert (index_dir / term_file).read_text() == (
+                expected_index_dir / term_file
+            ).read_text(), term_file
+
+    def test_edited_and_removed_titles_match_a_full_build(self, tmp_path: Path) -> None:
+        _build_synthetic_index(tmp_path / "incremental", max_workers=2)
+        updated = _build_synthetic_index(
+            tmp_path / "incremental",
+            max_workers=2,
+            volumes=(1, 2),
+            edited_titles=self.EDITED,
+            incremental=True,
+        )
+        full = _build_synthetic_index(
+            tmp_path / "full", max_workers=2, volumes=(1, 2), edited_titles=self.EDITED
+        )
+
+        self._assert_same_index(updated, full)
+        assert len(updated.get_all_titles()) == 8
+
+    def test_added_volume_matches_a_full_build(self, tmp_path: Path) -> None:
+        _build_synthetic_index(tmp_path / "incremental", max_workers=1, volumes=(1,))
+        updated = _build_synthetic_index(
+            tmp_path / "incremental", max_workers=1, volumes=(1, 2), incremental=True
+        )
+        full = _build_synthetic_index(tmp_path / "full", max_workers=1, volumes=(1, 2))
+
+        self._assert_same_index(updated, full)
+
+    def test_only_edited_titles_are_re_tagged(self, tmp_path: Path) -> None:
+        tagged_texts: list[str] = []
+
+        def tagger(speech_text: str) -> dict[str, set[str]]:
+            tagged_texts.append(speech_text)
+            return tag_scrooge(speech_text)
+
+        _build_synthetic_index(tmp_path, max_workers=1, entity_tagger=tagger)
+        tagged_texts.clear()
+
+        _build_synthetic_index(
+            tmp_path,
+            max_workers=1,
+            edited_titles=self.EDITED,
+            incremental=True,
+            entity_tagger=tagger,
+        )
+
+        # 2 edited titles x 3 pages x 6 bubbles.
+        assert len(tagged_texts) == 36
+
+    def test_term_lists_match_the_index_lexicon(self, tmp_path: Path) -> None:
+        engine = _build_synthetic_index(tmp_path, max_workers=1)
+
+        with engine._index.reader() as reader:
+            lexicon = [t.decode("utf-8") for t in reader.lexicon("unstemmed")]
+            weights = {
+                t.decode("utf-8"): round(info.weight())
+                for t, info in reader.iter_field("unstemmed")
+            }
+            persons = sorted(t.decode("utf-8") for t in reader.lexicon("entities_person"))
+
+        assert json.loads((tmp_path / "unstemmed-terms.json").read_text()) == lexicon
+        most_common = json.loads((tmp_path / "most-common-unstemmed-terms.json").read_text())
+        assert dict(most_common) == weights
+        assert engine.get_entity_terms("person") == tuple(persons)
+
+    def test_without_an_index_builds_from_scratch(self, tmp_path: Path) -> None:
+        engine = _build_synthetic_index(tmp_path, max_workers=1, incremental=True)
+        assert len(list(engine.iter_all_stored_fields())) == 216
+
+    def test_outdated_title_contents_force_a_full_build(self, tmp_path: Path) -> None:
+        _build_synthetic_index(tmp_path, max_workers=1)
+        (tmp_path / "title-contents.json").write_text("{}")
+
+        tagged_texts: list[str] = []
+
+        def tagger(speech_text: str) -> dict[str, set[str]]:
+            tagged_texts.append(speech_text)
+            return {}
+
+        engine = _build_synthetic_index(
+            tmp_path, max_workers=1, incremental=True, entity_tagger=tagger
+        )
+
+        assert len(tagged_texts) == 216
+        assert len(list(engine.iter_all_stored_fields())) == 216
+
+    def test_changed_entity_tagger_forces_a_full_build(self, tmp_path: Path) -> None:
+        _build_synthetic_index(tmp_path / "incremental", max_workers=1)
+        updated = _build_synthetic_index(
+            tmp_path / "incremental",
+            max_workers=1,
+            edited_titles=self.EDITED,
+            incremental=True,
+            entity_tagger=_tag_nobody,
+        )
+        full = _build_synthetic_index(
+            tmp_path / "full", max_workers=1, edited_titles=self.EDITED, entity_tagger=_tag_nobody
+        )
+
+        self._assert_same_index(updated, full)
+        assert not updated.find_entities("person", "Scrooge")
+
+
+# ---------------------------------------------------------------------------
+# SearchEngine term vocabularies (cached by term file)
+# ---------------------------------------------------------------------------
+
+
+class TestTermVocabularyCache:
+    @pytest.fixture
+    def index_dir(self, tmp_path: Path) -> Path:
+        index_dir = _build_words_index(tmp_path)
+        (index_dir / "cleaned-unstemmed-terms.json").write_text(
+            json.dumps(["don", "Don Quixote", "done", "voodoo"])
+        )
+        (index_dir / "entities-person-terms.json").write_text(json.dumps(["Scrooge", "Gladstone"]))
+        return index_dir
+
+    def test_repeated_calls_share_one_vocabulary(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+
+        assert engine.get_word_vocabulary() is engine.get_word_vocabulary()
+        assert engine.get_cleaned_terms() is engine.get_word_vocabulary().terms
+        assert engine.get_entity_terms("person") is engine.get_entity_terms("person")
+        assert engine.get_alpha_split_entity_terms("person") is (
+            engine.get_alpha_split_entity_terms("person")
+        )
+
+    def test_vocabulary_has_a_prefix_index(self, index_dir: Path) -> None:
+        vocabulary = SearchEngine(index_dir).get_word_vocabulary()
+        assert vocabulary.with_prefix("DON") == ("don", "Don Quixote", "done")
+
+    def test_rewritten_term_file_is_reloaded(self, index_dir: Path) -> None:
+        engine = SearchEngine(index_dir)
+        old_vocabulary = engine.get_word_vocabulary()
+        old_persons = engine.get_entity_terms("person")
+
+        (index_dir / "cleaned-unstemmed-terms.json").write_text(json.dumps(["gold"]))
+        (index_dir / "entities-person-terms.json").write_text(json.dumps(["Magica"]))
+
+        assert engine.get_word_vocabulary() is not old_vocabulary
+        assert engine.get_cleaned_terms() == ("gold",)
+        assert engine.get_entity_terms("person") is not old_persons
+        assert engine.get_entity_terms("person") == ("Magica",)
+        assert engine.get_alpha_split_entity_terms("person") == {"m": {"ma": ("Magica",)}}
+
+    def test_cached_alpha_split_terms_are_read_only(self, index_dir: Path) -> None:
+        alpha_split = SearchEngine(index_dir).get_alpha_split_entity_terms("person")
+        with pytest.raises(TypeError):
+            alpha_split["x"] = {}  # ty: ignore[invalid-assignment]
+
+    def test_missing_term_files_give_empty_vocabularies(self, tmp_path: Path) -> None:
+        engine = SearchEngine(_build_words_index(tmp_path))
+
+        assert len(engine.get_word_vocabulary()) == 0
+        assert engine.get_cleaned_alpha_split_terms() == {}
+        assert engine.get_entity_terms("location") == ()
+        assert engine.get_alpha_split_entity_terms("location") == {}
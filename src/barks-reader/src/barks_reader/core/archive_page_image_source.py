@@ -3,7 +3,10 @@
 Handles both prebuilt CBZ archives and Fantagraphics volume archives
 (with override/extra image priority). Actual read/decode/resize/encode
 stages live in :mod:`image_pipeline`; this module composes them and
-owns archive-specific source resolution.
+owns archive-specific source resolution. Pages are delivered either as raw
+pixel buffers (the reader's path) or as uncompressed PNG streams. Raw pixel
+pages can be served from, and saved to, a persistent
+:class:`~.rendered_page_cache.RenderedPageCache`.
 """
 
 from __future__ import annotations
@@ -20,6 +23,7 @@ from .image_pipeline import (
     encode_png_stream,
     load_pil,
     resize_contain,
+    to_page_image,
 )
 from .reader_utils import PNG_EXT_FOR_KIVY, is_blank_page, is_title_page
 
@@ -31,6 +35,8 @@ if TYPE_CHECKING:
 
     from .comic_book_page_info import PageInfo
     from .fantagraphics_volumes import FantagraphicsArchive
+    from .page_image_source import PageImage
+    from .rendered_page_cache import RenderedPageCache
 
 
 class ArchivePageImageSource:
@@ -51,6 +57,8 @@ class ArchivePageImageSource:
         use_fantagraphics_overrides: Whether to prefer override images over originals.
         max_width: Maximum display width for resizing.
         max_height: Maximum display height for resizing.
+        rendered_page_cache: Optional disk cache of display-ready pages, checked by
+            :meth:`load_page_pixels` before the archive is read.
 
     """
 
@@ -63,6 +71,7 @@ class ArchivePageImageSource:
         use_fantagraphics_overrides: bool,
         max_width: int,
         max_height: int,
+        rendered_page_cache: RenderedPageCache | None = None,
     ) -> None:
         self._archive_path = archive_path
         self._archive: zipfile.ZipFile | None = None
@@ -72,6 +81,7 @@ class ArchivePageImageSource:
         self._use_fantagraphics_overrides = use_fantagraphics_overrides
         self._max_width = max_width
         self._max_height = max_height
+        self._rendered_page_cache = rendered_page_cache
 
     def open(self) -> None:
         """Open the backing ZIP archive. Must be called before :meth:`load_page_image`."""
@@ -91,6 +101,32 @@ class ArchivePageImageSource:
         if self._fanta_volume_archive:
             self._fanta_volume_archive.override_archive = None
 
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:
+        """Load, transform, and resize a page image into a raw pixel buffer.
+
+        Args:
+            page_info: Metadata identifying which page to load.
+
+        Returns:
+            The display-ready page as a contiguous RGB/RGBA :class:`PageImage`.
+
+        """
+        cache_key = self._get_rendered_page_cache_key(page_info)
+        if cache_key is not None:
+            assert self._rendered_page_cache is not None
+            page_image = self._rendered_page_cache.get(cache_key)
+            if page_image is not None:
+                logger.debug(f"Page index {page_info.page_index} loaded from rendered page cache.")
+                return page_image
+
+        page_image = to_page_image(self._build_page_image(page_info))
+
+        if cache_key is not None:
+            assert self._rendered_page_cache is not None
+            self._rendered_page_cache.put(cache_key, page_image)
+
+        return page_image
+
     def load_page_image(self, page_info: PageInfo) -> tuple[io.BytesIO, str]:
         """Load, transform, resize, and encode a page image.
 
@@ -101,6 +137,20 @@ class ArchivePageImageSource:
             A tuple of (*png_bytes_stream*, *kivy_image_ext*).
 
         """
+        resized = self._build_page_image(page_info)
+        return encode_png_stream(resized, compress_level=0), PNG_EXT_FOR_KIVY
+
+    def get_image_info_str(self, page_info: PageInfo) -> str:
+        """Return a human-readable description of the image source for *page_info*."""
+        image_path, is_from_archive = self._get_image_path(page_info)
+        file_source = "from archive" if is_from_archive else "from override"
+        return f'"{image_path!s}" ({file_source})'
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _build_page_image(self, page_info: PageInfo) -> Image:
         image_path, is_from_archive = self._get_image_path(page_info)
 
         logger.debug(
@@ -108,26 +158,61 @@ class ArchivePageImageSource:
             f' image_path = "{image_path}", is_from_archive = {is_from_archive}.'
         )
 
-        pil_image = self._read_image(page_info, image_path, is_from_archive)
+        min_decode_scale = (
+            self._comic_book_image_builder.get_srce_min_decode_scale(
+                page_info.srce_page, page_info.dest_page, self._max_width, self._max_height
+            )
+            if self._fanta_volume_archive and self._comic_book_image_builder
+            else 1.0
+        )
+        pil_image = self._read_image(page_info, image_path, is_from_archive, min_decode_scale)
 
         if self._fanta_volume_archive:
             assert self._comic_book_image_builder
-            pil_image = self._comic_book_image_builder.get_dest_page_image(
-                pil_image, page_info.srce_page, page_info.dest_page
+            # Builds the dest page straight at display size, resampling the source once.
+            return self._comic_book_image_builder.get_display_page_image(
+                pil_image,
+                page_info.srce_page,
+                page_info.dest_page,
+                self._max_width,
+                self._max_height,
             )
 
-        resized = resize_contain(pil_image, self._max_width, self._max_height)
-        return encode_png_stream(resized, compress_level=0), PNG_EXT_FOR_KIVY
+        return resize_contain(pil_image, self._max_width, self._max_height)
+
+    def _get_rendered_page_cache_key(self, page_info: PageInfo) -> str | None:
+        if self._rendered_page_cache is None:
+            return None
 
-    def get_image_info_str(self, page_info: PageInfo) -> str:
-        """Return a human-readable description of the image source for *page_info*."""
         image_path, is_from_archive = self._get_image_path(page_info)
-        file_source = "from archive" if is_from_archive else "from override"
-        return f'"{image_path!s}" ({file_source})'
+        # Only pages read from the library/prebuilt archive are cached. Title and
+        # blank pages are cheap, and override/extra pages come from the encrypted
+        # override archive - their decrypted pixels must not be persisted.
+        if not is_from_archive or self._archive is None:
+            return None
+        try:
+            zip_info = self._archive.getinfo(image_path)
+        except KeyError:
+            return None
+
+        transform_token = (
+            self._comic_book_image_builder.get_dest_page_cache_token(
+                page_info.srce_page, page_info.dest_page
+            )
+            if self._fanta_volume_archive and self._comic_book_image_builder
+            else ""
+        )
 
-    # ------------------------------------------------------------------
-    # Internals
-    # ------------------------------------------------------------------
+        return self._rendered_page_cache.make_key(
+            self._archive_path.name,
+            zip_info.filename,
+            zip_info.CRC,
+            zip_info.file_size,
+            zip_info.date_time,
+            transform_token,
+            self._max_width,
+            self._max_height,
+        )
 
     def _get_image_path(self, page_info: PageInfo) -> tuple[str, bool]:
         if not self._fanta_volume_archive:
@@ -158,7 +243,13 @@ class ArchivePageImageSource:
 
         return Path(self._fanta_volume_archive.archive_images_page_map[page_str]), True
 
-    def _read_image(self, page_info: PageInfo, image_path: str, is_from_archive: bool) -> Image:
+    def _read_image(
+        self,
+        page_info: PageInfo,
+        image_path: str,
+        is_from_archive: bool,
+        min_decode_scale: float,
+    ) -> Image:
         if is_from_archive:
             assert self._archive is not None, (
                 "Page requires the Fantagraphics library archive, but it is not available."
@@ -167,6 +258,7 @@ class ArchivePageImageSource:
                 zipfile.Path(self._archive, at=str(image_path)),
                 encrypted_zip=False,
                 use_ext_hint=True,
+                min_decode_scale=min_decode_scale,
             )
 
         if page_info.srce_page.page_type in [PageType.BLANK_PAGE, PageType.TITLE]:
@@ -179,4 +271,5 @@ class ArchivePageImageSource:
             zipfile.Path(self._fanta_volume_archive.override_archive, at=str(image_path)),
             encrypted_zip=True,
             use_ext_hint=True,
+            min_decode_scale=min_decode_scale,
         )
@@ -15,7 +15,7 @@ from __future__ import annotations
 from functools import cache
 from itertools import pairwise
 
-from barks_fantagraphics.barks_covers import COVER_BY_TITLE, get_located_covers
+from barks_fantagraphics.barks_covers import get_cover_by_title, get_located_covers
 from barks_fantagraphics.barks_titles import Titles
 from barks_fantagraphics.comic_book_info import get_located_one_pagers
 from barks_fantagraphics.fanta_comics_info import ALL_FANTA_COMIC_BOOK_INFO
@@ -84,7 +84,7 @@ def _assert_tiling(ranges: list[tuple[int, int]], total: int) -> None:
 @cache
 def get_cover_collection_group_ranges() -> list[tuple[int, int]]:
     """Contiguous page ranges of the cover collection's year-range groups."""
-    title_by_cover = {cover: title for title, cover in COVER_BY_TITLE.items()}
+    title_by_cover = {cover: title for title, cover in get_cover_by_title().items()}
     located = [title_by_cover[cover] for cover in get_located_covers()]
     return _group_ranges(located, COVER_YEAR_RANGES)
 
@@ -9,6 +9,7 @@ import traceback
 import zipfile
 from collections import OrderedDict
 from concurrent.futures import FIRST_COMPLETED, CancelledError, Future, ThreadPoolExecutor, wait
+from dataclasses import replace
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -22,29 +23,32 @@ from barks_fantagraphics.fanta_comics_info import (
     get_fanta_volume_from_str,
 )
 from comic_utils.comic_consts import CBZ_FILE_EXT, ZIP_FILE_EXT
-from comic_utils.pil_image_utils import get_pil_image_as_png_bytes
 from comic_utils.timing import Timing
 from loguru import logger
-from PIL import Image
 
 from .comic_book_loader_platform_settings import (
     autotune_worker_count,
     get_prefetch_tuning,
 )
+from .comic_book_page_info import build_display_units
+from .comic_preloader import ComicPreloader
 from .fantagraphics_volumes import (
     FantagraphicsVolumeArchives,
     MissingArchiveFilesError,
     MissingVolumeError,
 )
-from .reader_utils import PNG_EXT_FOR_KIVY, is_blank_page, is_title_page
+from .image_pipeline import from_page_image, to_page_image
+from .page_cache import PageCache
+from .reader_utils import is_blank_page, is_title_page
+from .rendered_page_cache import DEFAULT_RENDERED_PAGE_CACHE_MAX_MIB, RenderedPageCache
 
 if TYPE_CHECKING:
-    import io
     from collections.abc import Callable, Mapping
 
     from .comic_book_page_info import PageInfo
+    from .comic_preloader import PreloadSourceBuilder
     from .fantagraphics_volumes import FantagraphicsArchive
-    from .page_image_source import PageImageSource
+    from .page_image_source import PageImage, PageImageSource
     from .ports import Cursor, Scheduler
     from .reader_settings import ReaderSettings
 
@@ -70,11 +74,38 @@ def _page_needs_real_archive(
     return fanta_volume_archive.needs_real_archive_for(page_str)
 
 
+def _get_spread_for_index(page_map: Mapping[str, PageInfo]) -> dict[int, tuple[int, int]]:
+    """Map every page shown as half of a double-page spread to that spread."""
+    display_units, _ = build_display_units(OrderedDict(page_map))
+    spread_for_index: dict[int, tuple[int, int]] = {}
+    for unit in display_units:
+        if unit.right_page_index is not None:
+            spread = (unit.left_page_index, unit.right_page_index)
+            spread_for_index[unit.left_page_index] = spread
+            spread_for_index[unit.right_page_index] = spread
+    return spread_for_index
+
+
+def _assemble_spread(left_image: PageImage, right_image: PageImage) -> PageImage:
+    return to_page_image(
+        build_double_page_image(from_page_image(left_image), from_page_image(right_image))
+    )
+
+
 class ComicBookLoader:
     """Orchestrates background loading of comic book page images.
 
     Manages prefetch threading, page caching, and callback delivery.
     Delegates actual image I/O to a :class:`PageImageSource`.
+
+    Decoded pages live in a byte-budgeted :class:`PageCache`. A page evicted
+    from it has its loaded event cleared; navigating back to it goes through
+    :meth:`prioritize_page`, which re-queues it on the loader thread (restarting
+    that thread if the initial load has already finished).
+
+    Double-page spreads are assembled on the worker threads as soon as both of
+    their pages are loaded, and cached alongside them, so showing a spread is
+    just a lookup.
     """
 
     def __init__(
@@ -101,15 +132,28 @@ class ComicBookLoader:
         self._image_load_order: list[str] = []
         self._page_map: OrderedDict[str, PageInfo] = OrderedDict()
         self._index_to_key: dict[int, str] = {}
-        self._images: list[None | tuple[io.BytesIO, str]] = []
+        self._page_cache = PageCache(0)
+        # Page index -> (left, right) page indices of the spread it belongs to.
+        self._spread_for_index: dict[int, tuple[int, int]] = {}
 
         # Page keys the user has navigated to that should jump the prefetch queue.
         # Written from the UI thread (prioritize_page), drained on the loader thread.
         self._priority_keys: queue.SimpleQueue[str] = queue.SimpleQueue()
+        # Guards _loader_active: whether a loader thread is still going to drain
+        # _priority_keys. Lets prioritize_page decide atomically whether it must
+        # start a thread to reload an evicted page.
+        self._loader_lock = threading.Lock()
+        self._loader_active = False
+
+        # Speculatively decodes the first pages of the likely next comic while this
+        # loader is idle; set_comic takes them over if that comic is opened.
+        self._preloader = ComicPreloader(is_loader_busy=lambda: self._loader_active)
+        self._handover_pages: dict[int, PageImage] = {}
 
         self._stop = False
         self._current_comic_desc = ""
         self._image_source: PageImageSource | None = None
+        self._rendered_page_cache: RenderedPageCache | None = None
 
         self._on_first_image_loaded: Callable[[], None] = on_first_image_loaded
         self._on_all_images_loaded: Callable[[], None] = on_all_images_loaded
@@ -142,6 +186,21 @@ class ComicBookLoader:
         """Maximum display height for image resizing."""
         return self._max_window_height
 
+    @property
+    def rendered_page_cache(self) -> RenderedPageCache:
+        """The persistent disk cache of display-ready pages (created on first use)."""
+        if self._rendered_page_cache is None:
+            self._rendered_page_cache = RenderedPageCache(
+                self._reader_settings.rendered_page_cache_dir,
+                int(DEFAULT_RENDERED_PAGE_CACHE_MAX_MIB * 1024 * 1024),
+            )
+            logger.debug(
+                f"Rendered page cache:"
+                f' "{self._rendered_page_cache.cache_dir}"'
+                f" (max {DEFAULT_RENDERED_PAGE_CACHE_MAX_MIB:.0f} MiB)."
+            )
+        return self._rendered_page_cache
+
     def init_data(self) -> None:
         """Preload Fantagraphics volume metadata (if not using prebuilt archives)."""
         if self._reader_settings.use_prebuilt_archives:
@@ -155,6 +214,7 @@ class ComicBookLoader:
                 self._reader_settings.fantagraphics_volumes_dir,
                 self._sys_file_paths.get_barks_reader_fantagraphics_overrides_root_dir(),
                 ALL_FANTA_VOLUMES,
+                manifest_path=self._reader_settings.fantagraphics_volumes_manifest_path,
             )
             try:
                 fanta_volume_archives.load()
@@ -167,7 +227,10 @@ class ComicBookLoader:
                 raise
             self._fanta_volume_archives = fanta_volume_archives
 
-            logger.info(f"Finished loading all volumes in {timing.get_elapsed_time_with_unit()}.")
+            logger.info(
+                f"Finished loading all volumes in {timing.get_elapsed_time_with_unit()}"
+                f" ({fanta_volume_archives.num_volumes_scanned} scanned, the rest from manifest)."
+            )
 
     # ------------------------------------------------------------------
     # Source creation helpers (used by callers before set_comic)
@@ -177,6 +240,7 @@ class ComicBookLoader:
         self,
         fanta_info: FantaComicBookInfo,
         page_map: Mapping[str, PageInfo],
+        detached: bool = False,
     ) -> tuple[Path, FantagraphicsArchive | None]:
         """Look up the archive path and volume metadata for a comic.
 
@@ -184,6 +248,9 @@ class ComicBookLoader:
             fanta_info: The comic to resolve.
             page_map: The comic's pages, used to decide whether a missing volume can
                 still be read purely from bundled override/extra pages.
+            detached: Return a private copy of the volume metadata with its own
+                override archive handle, leaving the shared one (possibly in use by
+                the comic being read) untouched. Used for preloading.
 
         Returns:
             A tuple of (*archive_path*, *fanta_volume_archive*).
@@ -216,6 +283,9 @@ class ComicBookLoader:
                 fanta_info.comic_book_info.title,
             )
 
+        if detached:
+            fanta_volume_archive = replace(fanta_volume_archive, override_archive=None)
+
         if fanta_volume_archive.has_overrides():
             assert fanta_volume_archive.override_archive_filename
             fanta_volume_archive.override_archive = zipfile.ZipFile(
@@ -234,6 +304,8 @@ class ComicBookLoader:
         image_load_order: list[str],
         page_map: OrderedDict[str, PageInfo],
         archive_desc: str = "",
+        preload_id: str = "",
+        assemble_spreads: bool = False,
     ) -> None:
         """Start loading a comic using the given image source.
 
@@ -242,6 +314,12 @@ class ComicBookLoader:
             image_load_order: Page keys in the order they should be loaded.
             page_map: Ordered mapping of page keys to ``PageInfo`` objects.
             archive_desc: Human-readable description for logging.
+            preload_id: Id this comic was given in :meth:`preload_comic`, if any.
+                Pages already preloaded for it are taken over, not decoded again.
+            assemble_spreads: Assemble and cache the double-page spreads of the
+                page map as their pages load (see
+                :meth:`get_double_page_image_ready_for_reading` and
+                :meth:`set_assemble_spreads`).
 
         """
         assert len(image_load_order) == len(page_map)
@@ -254,56 +332,79 @@ class ComicBookLoader:
         self._image_load_order = image_load_order
         self._page_map = page_map
         self._index_to_key = {page_info.page_index: key for key, page_info in page_map.items()}
+        self._spread_for_index = _get_spread_for_index(page_map) if assemble_spreads else {}
         # Safe to swap the queue: set_comic and prioritize_page both run on the UI
         # thread, and the stop_now() above has joined the old loader thread (the only
         # reader of _priority_keys), so nothing can be draining or writing it here.
         self._priority_keys = queue.SimpleQueue()
         self._current_comic_desc = archive_desc
         self._stop = False
+        self._handover_pages = self._preloader.take(preload_id, page_map)
 
         logger.info(f"Archive source: {self._current_comic_desc}.")
 
         self._init_load_events()
+        self._init_page_cache(self._page_map[image_load_order[0]].page_index)
         self._start_loading_thread()
 
-    def get_image_ready_for_reading(self, page_index: int) -> tuple[io.BytesIO, str]:
-        """Return the cached image for *page_index*, rewound to position 0."""
-        assert self._images
-        assert 0 <= page_index < len(self._images)
+    def set_assemble_spreads(self, assemble_spreads: bool) -> None:
+        """Start or stop assembling the current comic's spreads as its pages load.
+
+        Called when double-page mode is toggled. Spreads of pages already loaded
+        are not assembled ahead: they are composited when shown. Stopping drops
+        the cached spreads, so they no longer crowd pages out of the cache.
+        """
+        # Swapped whole: the loader thread only ever reads the mapping.
+        self._spread_for_index = _get_spread_for_index(self._page_map) if assemble_spreads else {}
+        if not assemble_spreads:
+            self._page_cache.drop_spreads()
+
+    def preload_comic(self, preload_id: str, build_source: PreloadSourceBuilder) -> None:
+        """Speculatively decode the first pages of a comic that may be opened next.
+
+        Runs at low priority: only while this loader is idle, pausing whenever
+        the current comic needs it (including :meth:`prioritize_page` reloads).
+        Pass the same *preload_id* to :meth:`set_comic` to take the pages over.
+        """
+        self._preloader.preload(preload_id, build_source)
+
+    def get_image_ready_for_reading(self, page_index: int) -> PageImage:
+        """Return the cached raw pixel buffer for *page_index*.
 
-        image_stream, image_ext = self._images[page_index]  # ty:ignore[not-iterable]
-        assert image_stream
+        The page must be loaded (see :meth:`wait_load_event`) and should be at, or
+        next to, the position given to :meth:`set_current_page`, which pins it
+        against eviction.
+        """
+        assert self._image_loaded_events
+        assert 0 <= page_index < len(self._image_loaded_events)
 
-        image_stream.seek(0)  # Ensure stream is at the beginning for reading
+        page_image = self._page_cache.get(page_index)
+        assert page_image is not None
 
-        return image_stream, image_ext
+        return page_image
 
-    def get_double_page_image_ready_for_reading(
-        self, left_idx: int, right_idx: int
-    ) -> tuple[io.BytesIO, str]:
-        """Composite two cached page images side-by-side for double-page display.
+    def get_double_page_image_ready_for_reading(self, left_idx: int, right_idx: int) -> PageImage:
+        """Return two cached page images side-by-side for double-page display.
+
+        Spreads assembled by the workers are served from the page cache. Any other
+        (e.g. an evicted spread) is composited here, but not cached: only the
+        loader thread inserts into the page cache.
 
         Args:
             left_idx: Page index of the left page.
             right_idx: Page index of the right page.
 
         Returns:
-            A tuple of (BytesIO, str) where BytesIO contains the composited PNG image
-            and str is the image extension for Kivy.
+            The composited spread as a raw pixel buffer.
 
         """
-        left_stream, _left_ext = self.get_image_ready_for_reading(left_idx)
-        right_stream, _right_ext = self.get_image_ready_for_reading(right_idx)
-
-        left_image = Image.open(left_stream)
-        right_image = Image.open(right_stream)
+        spread_image = self._page_cache.get_spread(left_idx, right_idx)
+        if spread_image is not None:
+            return spread_image
 
-        composited_image = build_double_page_image(left_image, right_image)
-        composited_stream = get_pil_image_as_png_bytes(composited_image, compress_level=0)
-        assert composited_stream
-        composited_stream.seek(0)  # Ensure stream is at the beginning for reading
-
-        return composited_stream, PNG_EXT_FOR_KIVY
+        return _assemble_spread(
+            self.get_image_ready_for_reading(left_idx), self.get_image_ready_for_reading(right_idx)
+        )
 
     def get_image_info_str(self, page_str: str) -> str:
         """Return a human-readable description of the image source for a page."""
@@ -313,25 +414,50 @@ class ComicBookLoader:
 
     def wait_load_event(self, page_index: int, timeout: float) -> bool:
         """Block until the image at *page_index* is loaded, or *timeout* expires."""
-        if not self._images:
+        if not self._image_loaded_events:
             return True
-        assert 0 <= page_index < len(self._images)
+        assert 0 <= page_index < len(self._image_loaded_events)
         return self._image_loaded_events[page_index].wait(timeout)
 
+    def set_current_page(self, page_index: int) -> None:
+        """Record the reading position so the page cache keeps its neighborhood.
+
+        Pages near *page_index* are pinned against eviction. Any of them that
+        were evicted earlier are re-queued so paging on from here does not stall.
+        """
+        if not self._image_loaded_events:
+            return
+        self._page_cache.set_focus(page_index)
+        for evicted_index in self._page_cache.evicted_near_focus():
+            self.prioritize_page(evicted_index)
+
     def prioritize_page(self, page_index: int) -> None:
         """Ask the background loader to fetch *page_index* next.
 
         Used when the user navigates to a page that has not been prefetched yet
-        (e.g. paging backward, where pages load last). The page jumps to the front
-        of the prefetch queue so it loads as soon as a worker slot frees up, rather
-        than in its normal load-order position. A no-op if the page is already
-        loaded or the comic is not currently loading.
+        (e.g. paging backward, where pages load last), or one that was evicted
+        from the page cache. The page jumps to the front of the prefetch queue so
+        it loads as soon as a worker slot frees up, rather than in its normal
+        load-order position. If the initial load has already finished, a loader
+        thread is restarted to reload it. A no-op if the page is already loaded
+        or no comic is open.
         """
-        if not self._images or self._image_loaded_events[page_index].is_set():
+        if not self._image_loaded_events or self._image_loaded_events[page_index].is_set():
             return
         load_key = self._index_to_key.get(page_index)
-        if load_key is not None:
+        if load_key is None:
+            return
+
+        with self._loader_lock:
             self._priority_keys.put(load_key)
+            if self._loader_active or self._stop:
+                return
+            self._loader_active = True
+
+        logger.debug(f"Restarting loader thread to reload evicted page index {page_index}.")
+        thread = threading.Thread(target=self._reload_pages_in_thread, daemon=True)
+        self._thread = thread
+        thread.start()
 
     def close_comic(self) -> None:
         """Stop loading and release all cached images."""
@@ -345,7 +471,7 @@ class ComicBookLoader:
         if self._image_source and hasattr(self._image_source, "close"):
             self._image_source.close()  # ty: ignore[call-non-callable]
         self._image_source = None
-        self._images.clear()
+        self._page_cache.clear()
         self._image_loaded_events.clear()
         self._current_comic_desc = ""
 
@@ -396,6 +522,8 @@ class ComicBookLoader:
             return
 
         logger.debug(f'Starting comic load in background thread for: "{self._current_comic_desc}"')
+        with self._loader_lock:
+            self._loader_active = True
         thread = threading.Thread(target=self._load_comic_in_thread, daemon=True)
         thread.start()
         self._thread = thread
@@ -405,41 +533,91 @@ class ComicBookLoader:
         for _ in range(len(self._page_map)):
             self._image_loaded_events.append(threading.Event())
 
+    def _init_page_cache(self, first_page_index: int) -> None:
+        num_pages = len(self._page_map)
+        tuning = get_prefetch_tuning(self.get_worker_count_for_pages(num_pages), num_pages)
+        self._page_cache = PageCache(tuning.page_cache_budget_bytes, self._on_page_evicted)
+        self._page_cache.set_focus(first_page_index)
+
+    def _on_page_evicted(self, page_index: int) -> None:
+        # Called under the page cache lock, so the page stops reading as loaded
+        # atomically with it leaving the cache.
+        self._image_loaded_events[page_index].clear()
+
+    def _store_page(self, page_index: int, page_image: PageImage) -> None:
+        """Cache a decoded page and publish it as loaded.
+
+        Only ever called from the (single) active loader thread, so no other
+        insertion can evict the page between caching and publishing it.
+        """
+        self._page_cache.put(page_index, page_image)
+        self._image_loaded_events[page_index].set()
+
+    def _get_spread_to_assemble(self, page_index: int) -> tuple[int, int] | None:
+        """Return the spread that loading *page_index* completed, unless it is cached."""
+        spread = self._spread_for_index.get(page_index)
+        if (
+            spread is None
+            or spread in self._page_cache
+            or not all(self._image_loaded_events[index].is_set() for index in spread)
+        ):
+            return None
+        return spread
+
+    def _assemble_cached_spread(self, spread: tuple[int, int]) -> PageImage | None:
+        """Composite a spread from its cached pages; ``None`` if one was evicted meanwhile.
+
+        Runs on a worker thread. The result is stored by the loader thread with
+        :meth:`_store_spread`.
+        """
+        left_image = self._page_cache.get(spread[0])
+        right_image = self._page_cache.get(spread[1])
+        if left_image is None or right_image is None:
+            return None
+        return _assemble_spread(left_image, right_image)
+
+    def _store_spread(self, spread: tuple[int, int], spread_image: PageImage | None) -> None:
+        if spread_image is not None:
+            self._page_cache.put_spread(*spread, spread_image)
+
     @staticmethod
     def _process_rss_mib() -> float:
         """Return this process's current resident set size (RSS), in MiB."""
         return psutil.Process().memory_info().rss / (1024 * 1024)
 
     def _log_retained_image_memory(self, rss_before_mib: float) -> None:
-        """Log how much RAM the fully-loaded comic's retained pages occupy.
+        """Log how much RAM the loaded comic's retained pages occupy.
 
-        Every loaded page is kept in ``self._images`` as encoded, window-resized
-        bytes until ``close_comic``. This reports the aggregate so the cost of large
-        collections (e.g. the 186-page "All Covers") is visible in the logs.
+        Loaded pages are kept in the byte-budgeted ``self._page_cache`` as raw,
+        window-resized pixel buffers until evicted or ``close_comic``. This reports
+        the aggregate so the cost of large collections (e.g. the 186-page "All
+        Covers") and how often the budget forced evictions is visible in the logs.
         """
-        sizes = [entry[0].getbuffer().nbytes for entry in self._images if entry is not None]
+        sizes = self._page_cache.page_sizes()
         loaded = len(sizes)
-        total_mib = sum(sizes) / (1024 * 1024)
+        total_mib = self._page_cache.total_bytes / (1024 * 1024)
+        budget_mib = self._page_cache.max_bytes / (1024 * 1024)
         avg_kib = (sum(sizes) / loaded / 1024) if loaded else 0.0
         max_kib = (max(sizes) / 1024) if sizes else 0.0
         rss_now = self._process_rss_mib()
         logger.info(
-            f"[mem] Retained pages: {loaded} pages hold {total_mib:.1f} MiB "
-            f"(avg {avg_kib:.0f} KiB/page, max {max_kib:.0f} KiB). "
+            f"[mem] Retained pages: {loaded} pages and {self._page_cache.num_spreads} spreads"
+            f" hold {total_mib:.1f} MiB of a"
+            f" {budget_mib:.0f} MiB budget ({self._page_cache.num_evictions} evicted)"
+            f" (avg {avg_kib:.0f} KiB/page, max {max_kib:.0f} KiB). "
             f"Process RSS {rss_now:.0f} MiB (+{rss_now - rss_before_mib:.0f} MiB since load start)."
         )
 
-    def _load_comic_in_thread(self) -> None:
+    def _load_comic_in_thread(self) -> None:  # noqa: C901
         logger.debug(f'Load comic: "{self._current_comic_desc}"')
 
         load_error = False
         load_warning_only = False
+        loader_released = False
         rss_before_mib = self._process_rss_mib()
         self._cursor.set_busy()
 
         try:
-            self._images = [None for _i in range(len(self._page_map))]
-
             assert self._image_source is not None
             if hasattr(self._image_source, "open"):
                 self._image_source.open()  # ty: ignore[call-non-callable]
@@ -456,12 +634,15 @@ class ComicBookLoader:
                     return
 
                 assert num_loaded == len(self._page_map)
-                assert all(ev.is_set() for ev in self._image_loaded_events)
                 logger.info(f'Loaded {num_loaded} images from "{self._current_comic_desc}".')
                 self._log_retained_image_memory(rss_before_mib)
 
                 self._scheduler.schedule_once(self._on_all_images_loaded)
 
+                # Serve any evicted pages the user navigated back to meanwhile.
+                self._reload_pages()
+                loader_released = True
+
             except FileNotFoundError:
                 logger.exception(f'Comic file not found: "{self._current_comic_desc}".')
                 load_error = True
@@ -494,27 +675,77 @@ class ComicBookLoader:
                 load_error = True
 
         finally:
+            if not loader_released:
+                self._set_loader_inactive()
             self._cursor.set_normal()
             if load_error:
                 self._close_and_report_load_error(load_warning_only)
 
+    def _reload_pages_in_thread(self) -> None:
+        # noinspection PyBroadException
+        try:
+            self._reload_pages()
+        except Exception:  # noqa: BLE001
+            logger.exception(f'Error reloading an evicted page of "{self._current_comic_desc}": ')
+            self._set_loader_inactive()
+            self._close_and_report_load_error(load_warning_only=False)
+
+    def _reload_pages(self) -> None:
+        """Reload evicted pages queued by :meth:`prioritize_page` until none are left.
+
+        Runs on the loader thread after the initial load, one page at a time: these
+        are pages the user is waiting on, not bulk prefetch. Always marks the
+        loader inactive on a normal return; when the queue runs dry it does so
+        while holding ``_loader_lock``, so a concurrent ``prioritize_page`` either
+        sees this thread still active or starts a fresh one.
+        """
+        assert self._image_source is not None
+        image_source = self._image_source
+
+        while not self._stop:
+            with self._loader_lock:
+                try:
+                    load_key = self._priority_keys.get_nowait()
+                except queue.Empty:
+                    self._loader_active = False
+                    return
+
+            page_info = self._page_map[load_key]
+            if self._image_loaded_events[page_info.page_index].is_set():
+                continue
+
+            logger.debug(f"Reloading evicted page index {page_info.page_index}.")
+            self._store_page(page_info.page_index, image_source.load_page_pixels(page_info))
+
+            spread = self._get_spread_to_assemble(page_info.page_index)
+            if spread is not None:
+                self._store_spread(spread, self._assemble_cached_spread(spread))
+
+        self._set_loader_inactive()
+
+    def _set_loader_inactive(self) -> None:
+        with self._loader_lock:
+            self._loader_active = False
+
     def _load_pages(self) -> int:  # noqa: C901, PLR0912, PLR0915
         """Platform-aware dynamic prefetch window implementation.
 
         Uses system profile (CPU, RAM) to pick prefetch and memory thresholds.
-        Worker threads call ``self._image_source.load_page_image()``.
+        Worker threads call ``self._image_source.load_page_pixels()``, so pages
+        arrive as raw buffers that need no decoding on the UI thread.
         Maintains a sliding window of in-flight tasks, adjusting size based
         on memory.  Ensures ordered delivery and early first-page callback.
+        Returns the number of distinct pages loaded.
         """
         assert self._image_source is not None
         image_source = self._image_source
 
-        def load_wrapper(pg_info: PageInfo) -> tuple[io.BytesIO, str]:
+        def load_wrapper(pg_info: PageInfo) -> PageImage:
             if self._stop:
                 msg = "Load cancelled before starting work."
                 raise CancelledError(msg)
 
-            result = image_source.load_page_image(pg_info)
+            result = image_source.load_page_pixels(pg_info)
 
             if self._stop:
                 msg = "Load cancelled during work."
@@ -542,26 +773,42 @@ class ComicBookLoader:
             f" mem_high={tuning.memory_high_water_mib} MiB."
         )
 
-        num_loaded = 0
+        loaded_indices: set[int] = set()
         load_iter = iter(self._image_load_order)
         submitted: set[str] = set()
         futures: dict[Future, int] = {}
+        spread_futures: dict[Future, tuple[int, int]] = {}
+
+        # Pages decoded by the preloader before this comic was opened.
+        handover_pages, self._handover_pages = self._handover_pages, {}
+        for page_index, page_image in handover_pages.items():
+            self._store_page(page_index, page_image)
+            loaded_indices.add(page_index)
+            submitted.add(self._index_to_key[page_index])
+        if first_page_index_to_display in handover_pages:
+            logger.info(
+                f"First page index to display, {first_page_index_to_display}, was preloaded."
+            )
+            self._scheduler.schedule_once(self._on_first_image_loaded)
+            self._cursor.set_normal()
 
         def next_load_key() -> str | None:
             """Return the next page key to load, honoring user navigation requests.
 
             Priority requests (pages the user navigated to) jump ahead of the
-            normal prefetch order. Keys already submitted or loaded are skipped so
-            every page is still submitted exactly once.
+            normal prefetch order. Keys already in flight or loaded are skipped, so
+            each page is submitted once in normal order, plus again only if it was
+            evicted from the page cache and then navigated back to.
             """
             while True:
                 try:
                     key = self._priority_keys.get_nowait()
                 except queue.Empty:
                     break
-                if key in submitted:
+                page_index = self._page_map[key].page_index
+                if page_index in futures.values():
                     continue
-                if self._image_loaded_events[self._page_map[key].page_index].is_set():
+                if self._image_loaded_events[page_index].is_set():
                     submitted.add(key)
                     continue
                 return key
@@ -575,6 +822,12 @@ class ComicBookLoader:
         # We'll keep a sliding window of futures up to prefetch_window in size.
         with ThreadPoolExecutor(max_workers=worker_count) as executor:
 
+            def submit_spread(page_index: int) -> None:
+                """Assemble the spread *page_index* completed, if any, on a worker."""
+                spread = self._get_spread_to_assemble(page_index)
+                if spread is not None and spread not in spread_futures.values():
+                    spread_futures[executor.submit(self._assemble_cached_spread, spread)] = spread
+
             def submit_next() -> bool:
                 """Submit the next page if window not full."""
                 nonlocal dynamic_window
@@ -595,17 +848,19 @@ class ComicBookLoader:
             for _ in range(dynamic_window):
                 if not submit_next():
                     break
+            for page_index in handover_pages:
+                submit_spread(page_index)
 
             try:
                 # Process futures as they complete, maintaining the prefetch window.
-                while futures:
+                while futures or spread_futures:
                     if self._stop:
                         logger.warning("Stop flag set. Cancelling remaining page loads.")
-                        for f in futures:
+                        for f in [*futures, *spread_futures]:
                             f.cancel()
                         break
 
-                    done, _ = wait(futures.keys(), return_when=FIRST_COMPLETED)
+                    done, _ = wait([*futures, *spread_futures], return_when=FIRST_COMPLETED)
 
                     current_mib, dynamic_window = tuning.get_new_dynamic_window(dynamic_window)
                     logger.debug(
@@ -614,6 +869,10 @@ class ComicBookLoader:
                     )
 
                     for future in done:
+                        if future in spread_futures:
+                            self._handle_spread_future(spread_futures.pop(future), future)
+                            continue
+
                         page_index = futures.pop(future)
 
                         if self._stop:
@@ -621,7 +880,7 @@ class ComicBookLoader:
                             break
 
                         try:
-                            image_stream, image_ext = future.result()
+                            page_image = future.result()
                         except CancelledError:
                             logger.warning(f"Page {page_index} cancelled.")
                             break
@@ -630,9 +889,10 @@ class ComicBookLoader:
                             raise CancelledError(e) from e
 
                         # Normal page delivery.
-                        self._images[page_index] = (image_stream, image_ext)
-                        self._image_loaded_events[page_index].set()
-                        num_loaded += 1
+                        self._store_page(page_index, page_image)
+                        loaded_indices.add(page_index)
+                        submit_spread(page_index)
+                        num_loaded = len(loaded_indices)
 
                         logger.debug(
                             f"Loaded page index {page_index} ({num_loaded}/{num_pages},"
@@ -668,6 +928,7 @@ class ComicBookLoader:
                 tuning.stop_mem_trace()
                 logger.debug("Platform-aware comic loading executor shut down.")
 
+        num_loaded = len(loaded_indices)
         logger.debug(
             f"Load finished: {num_loaded}/{num_pages} pages "
             f"processed in {timing.get_elapsed_time_with_unit()} (stop={self._stop})."
@@ -675,6 +936,16 @@ class ComicBookLoader:
 
         return num_loaded
 
+    def _handle_spread_future(self, spread: tuple[int, int], future: Future) -> None:
+        # A spread can always be composited on demand, so failing to assemble one
+        # is not a load error.
+        try:
+            self._store_spread(spread, future.result())
+        except CancelledError:
+            pass
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Error assembling spread {spread}")
+
     def get_worker_count_for_pages(self, num_pages: int) -> int:
         """Return the worker thread count to use for *num_pages* pages."""
         return min(self._max_worker_count, num_pages)
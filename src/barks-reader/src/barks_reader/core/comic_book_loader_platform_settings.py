@@ -23,6 +23,11 @@ class SystemProfile:
     is_high_end: bool
 
 
+# Byte budget for decoded pages retained by the loader's page cache, when not
+# set by the system profile.
+DEFAULT_PAGE_CACHE_BUDGET_MIB = 512.0
+
+
 class PrefetchTuning:
     def __init__(
         self,
@@ -32,11 +37,13 @@ class PrefetchTuning:
         memory_high_water_mib: float,
         worker_count: int,
         num_pages: int,
+        page_cache_budget_mib: float = DEFAULT_PAGE_CACHE_BUDGET_MIB,
     ) -> None:
         self.prefetch_min: int = prefetch_min
         self.prefetch_max_factor: float = prefetch_max_factor
         self.memory_low_water_mib: float = memory_low_water_mib
         self.memory_high_water_mib: float = memory_high_water_mib
+        self.page_cache_budget_mib: float = page_cache_budget_mib
         self._worker_count = worker_count
         self._num_pages = num_pages
         self.base_max_window = max(self.prefetch_min, int(worker_count * self.prefetch_max_factor))
@@ -60,6 +67,10 @@ class PrefetchTuning:
         _current, peak = tracemalloc.get_traced_memory()
         return peak / (1024 * 1024)
 
+    @property
+    def page_cache_budget_bytes(self) -> int:
+        return int(self.page_cache_budget_mib * 1024 * 1024)
+
     def get_initial_dynamic_window(self) -> int:
         return min(self.base_max_window, self._num_pages)
 
@@ -156,22 +167,26 @@ def get_prefetch_tuning(worker_count: int, num_pages: int) -> PrefetchTuning:
         # Old laptops / tiny RAM:
         # - smaller window
         # - tighter memory thresholds
+        # - only a few dozen decoded pages retained
         prefetch_min = 1
         prefetch_max_factor = 0.5
         mem_low = 150.0
         mem_high = 300.0
+        page_cache_mib = 192.0
     elif profile.is_mid_range:
         # Modest PCs / mid-laptops:
         prefetch_min = 2
         prefetch_max_factor = 0.75
         mem_low = 200.0
         mem_high = 350.0
+        page_cache_mib = DEFAULT_PAGE_CACHE_BUDGET_MIB
     else:
         # High-end desktop / modern Ryzen / big RAM:
         prefetch_min = 2
         prefetch_max_factor = 1.0
         mem_low = 250.0
         mem_high = 450.0
+        page_cache_mib = 1024.0
 
     _PREFETCH_TUNING = PrefetchTuning(
         prefetch_min=prefetch_min,
@@ -180,13 +195,14 @@ def get_prefetch_tuning(worker_count: int, num_pages: int) -> PrefetchTuning:
         memory_high_water_mib=mem_high,
         worker_count=worker_count,
         num_pages=num_pages,
+        page_cache_budget_mib=page_cache_mib,
     )
     assert _PREFETCH_TUNING is not None
     _PREFETCH_TUNING.base_max_window = max(prefetch_min, int(worker_count * prefetch_max_factor))
 
     logger.debug(
         f"Prefetch tuning: min={prefetch_min}, max_factor={prefetch_max_factor},"
-        f" mem_low={mem_low} MiB, mem_high={mem_high} MiB."
+        f" mem_low={mem_low} MiB, mem_high={mem_high} MiB, page_cache={page_cache_mib} MiB."
     )
 
     return _PREFETCH_TUNING
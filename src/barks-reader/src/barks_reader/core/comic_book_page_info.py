@@ -84,7 +84,7 @@ class ComicLayout:
         self._page_map = page_map
         self._last_body_page = last_body_page
         self._index_to_page: dict[int, PageInfo] = {p.page_index: p for p in page_map.values()}
-        self._display_units, self._unit_idx_for_index = _build_display_units(page_map)
+        self._display_units, self._unit_idx_for_index = build_display_units(page_map)
 
     @property
     def page_map(self) -> OrderedDict[str, PageInfo]:
@@ -237,9 +237,19 @@ def _build_page_map(
     return page_map, last_body_page
 
 
-def _build_display_units(
+def build_display_units(
     page_map: OrderedDict[str, PageInfo],
 ) -> tuple[list[DisplayUnit], dict[int, int]]:
+    """Pair the pages of *page_map* into double-page display units.
+
+    Consecutive non-solo pages are paired left/right; a solo page, or a page
+    whose neighbor is solo or missing, is a unit on its own.
+
+    Returns:
+        The display units in reading order, and a mapping of page index to the
+        index of the unit that shows it.
+
+    """
     pages = list(page_map.values())
     units: list[DisplayUnit] = []
     unit_idx_for_index: dict[int, int] = {}
@@ -0,0 +1,176 @@
+"""Speculative preloading of the comic the user is likely to read next.
+
+While the current comic is being read, :class:`ComicPreloader` builds the next
+comic's layout and decodes its first few pages on one background thread. It
+only works while ``ComicBookLoader`` is idle and checks again before every
+page, so it gives way to the current comic's prefetch and to pages the user
+navigates to. When the user does open the preloaded comic, ``ComicBookLoader``
+takes over the decoded pages instead of decoding them again.
+
+Cancelling never waits for the thread: a page decode can't be interrupted, and
+cancelling is done on the UI thread. A cancelled preload's thread instead drops
+whatever it finishes, and stops before its next page.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections import OrderedDict
+    from collections.abc import Callable
+
+    from .comic_book_page_info import PageInfo
+    from .page_image_source import PageImage, PageImageSource
+
+    # Returns the source to decode from, the comic's page map, and the page keys to
+    # preload (most wanted first). Called on the preload thread.
+    PreloadSourceBuilder = Callable[
+        [], tuple[PageImageSource, OrderedDict[str, PageInfo], list[str]]
+    ]
+
+# How many pages of the next comic to decode ahead of time.
+PRELOAD_NUM_PAGES = 4
+# How often a paused preload rechecks whether the loader has gone idle.
+_IDLE_POLL_SECS = 0.1
+
+
+@dataclass(slots=True)
+class _PreloadedComic:
+    preload_id: str
+    page_keys: tuple[str, ...] = ()
+    pages: dict[int, PageImage] = field(default_factory=dict)
+
+
+class ComicPreloader:
+    """Decodes the first pages of one comic ahead of time, at low priority.
+
+    Args:
+        is_loader_busy: Returns whether the current comic's loader is working.
+            The preload pauses until it returns ``False``.
+        num_pages: Maximum number of pages to preload.
+
+    """
+
+    def __init__(
+        self,
+        is_loader_busy: Callable[[], bool],
+        num_pages: int = PRELOAD_NUM_PAGES,
+    ) -> None:
+        self._is_loader_busy = is_loader_busy
+        self._num_pages = num_pages
+
+        # Guards the preloaded comic, and the cancelling of its thread, which
+        # only stores a page while holding it.
+        self._lock = threading.Lock()
+        self._preloaded: _PreloadedComic | None = None
+        self._cancel = threading.Event()
+
+    @property
+    def preload_id(self) -> str:
+        """Id of the comic being (or already) preloaded, or ``""``."""
+        with self._lock:
+            return self._preloaded.preload_id if self._preloaded else ""
+
+    def preload(self, preload_id: str, build_source: PreloadSourceBuilder) -> None:
+        """Start preloading the comic identified by *preload_id*.
+
+        Replaces (and discards) any other preload. A no-op if this comic is
+        already being preloaded.
+        """
+        if preload_id == self.preload_id:
+            return
+
+        preloaded = _PreloadedComic(preload_id)
+        cancel = threading.Event()
+        with self._lock:
+            self._cancel.set()
+            self._preloaded = preloaded
+            self._cancel = cancel
+        threading.Thread(
+            target=self._preload_in_thread,
+            args=(preloaded, build_source, cancel),
+            daemon=True,
+        ).start()
+
+    def take(self, preload_id: str, page_map: OrderedDict[str, PageInfo]) -> dict[int, PageImage]:
+        """Stop preloading and hand over the pages decoded for *preload_id*.
+
+        Returns page index -> page for every preloaded page, or an empty dict if
+        a different comic (or a different layout of it) was preloaded. Either
+        way the preloader is empty afterwards.
+        """
+        with self._lock:
+            preloaded = self._preloaded
+            self._cancel.set()
+            self._preloaded = None
+        if not preload_id or preloaded is None or preloaded.preload_id != preload_id:
+            return {}
+
+        if preloaded.page_keys != tuple(page_map):
+            logger.debug(f'Preloaded layout of "{preload_id}" differs; not using it.')
+            return {}
+
+        logger.info(f'Taking over {len(preloaded.pages)} preloaded pages of "{preload_id}".')
+        return preloaded.pages
+
+    def cancel(self) -> None:
+        """Stop any preload in progress and drop its pages, without waiting for its thread."""
+        with self._lock:
+            self._cancel.set()
+            self._preloaded = None
+
+    def _wait_until_loader_idle(self, cancel: threading.Event) -> bool:
+        """Block while the loader is busy; return ``False`` if cancelled meanwhile."""
+        while self._is_loader_busy():
+            if cancel.wait(_IDLE_POLL_SECS):
+                return False
+        return not cancel.is_set()
+
+    def _preload_in_thread(
+        self,
+        preloaded: _PreloadedComic,
+        build_source: PreloadSourceBuilder,
+        cancel: threading.Event,
+    ) -> None:
+        preload_id = preloaded.preload_id
+        if not self._wait_until_loader_idle(cancel):
+            return
+
+        # noinspection PyBroadException
+        try:
+            image_source, page_map, preload_keys = build_source()
+        except Exception as e:  # noqa: BLE001
+            # Speculative only: the comic may not be readable (e.g. a missing volume).
+            logger.debug(f'Not preloading "{preload_id}": {e}')
+            return
+
+        try:
+            with self._lock:
+                if cancel.is_set():
+                    return
+                preloaded.page_keys = tuple(page_map)
+
+            if hasattr(image_source, "open"):
+                image_source.open()  # ty: ignore[call-non-callable]
+
+            preload_keys = preload_keys[: self._num_pages]
+            for key in preload_keys:
+                if not self._wait_until_loader_idle(cancel):
+                    return
+                page_info = page_map[key]
+                page_image = image_source.load_page_pixels(page_info)
+                with self._lock:
+                    if cancel.is_set():
+                        return
+                    preloaded.pages[page_info.page_index] = page_image
+            logger.debug(f'Preloaded {len(preload_keys)} pages of "{preload_id}".')
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f'Stopped preloading "{preload_id}": {e}')
+        finally:
+            if hasattr(image_source, "close"):
+                image_source.close()  # ty: ignore[call-non-callable]
@@ -12,6 +12,9 @@ from .reader_setup import prepare_comic_for_reading
 from .user_error_types import ErrorInfo, ErrorTypes
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from barks_build_comic_images.build_comic_images import ComicBookImageBuilder
     from barks_fantagraphics.barks_titles import Titles
     from barks_fantagraphics.comic_book import ComicBook
     from barks_fantagraphics.comics_database import ComicsDatabase
@@ -146,6 +149,34 @@ class ComicReaderManager:
             collection_page_range=collection_page_range,
         )
 
+    def preload_barks_comic_book(
+        self,
+        fanta_info: FantaComicBookInfo,
+        get_comic: Callable[[], ComicBook],
+        page_to_first_goto: str,
+        use_overrides_active: bool,
+    ) -> None:
+        """Start decoding the opening pages of a comic the user is likely to read next.
+
+        Args:
+            fanta_info: Metadata about the Fantagraphics volume/comic.
+            get_comic: Returns the ComicBook to preload. Called in the background.
+            page_to_first_goto: The page ID the comic would be opened at.
+            use_overrides_active: Whether censorship overrides would be applied.
+
+        """
+        assert self._comic_book_reader
+
+        def prepare_comic() -> tuple[ComicLayout, ComicBookImageBuilder]:
+            return prepare_comic_for_reading(
+                get_comic(), self._reader_settings, self._layout_builder
+            )
+
+        logger.debug(f'Preload "{fanta_info.comic_book_info.get_title_str()}".')
+        self._comic_book_reader.preload_comic(
+            fanta_info, use_overrides_active, page_to_first_goto, prepare_comic
+        )
+
     def _read_comic_book(
         self,
         comic: ComicBook,
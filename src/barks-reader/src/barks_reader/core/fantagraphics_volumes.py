@@ -1,8 +1,12 @@
+import json
+import os
 import re
+import tempfile
 import zipfile
 from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, TypeIs
 
 from barks_fantagraphics.barks_titles import ENUM_TO_STR_TITLE, Titles
 from barks_fantagraphics.comic_book import get_page_str
@@ -16,6 +20,15 @@ from loguru import logger
 
 _VALID_IMAGE_EXTENSION = [PNG_FILE_EXT, JPG_FILE_EXT]
 
+# Bump when the manifest layout or the way page maps are derived changes.
+VOLUMES_MANIFEST_VERSION = 1
+
+_MANIFEST_PAGE_MAP_KEYS = (
+    "archive_images_page_map",
+    "override_images_page_map",
+    "extra_images_page_map",
+)
+
 
 class MissingArchiveFilesError(Exception):
     def __init__(self, missing_file_vols: list[int], archive_root: Path) -> None:
@@ -129,14 +142,29 @@ class FantagraphicsArchive:
 
 
 class FantagraphicsVolumeArchives:
-    """Manages the loading and validation of Fantagraphics volume archives."""
-
-    def __init__(self, archive_root: Path, override_root: Path, volume_list: list[int]) -> None:
+    """Manages the loading and validation of Fantagraphics volume archives.
+
+    Scanning a volume means opening its zip (and its override zip), sorting and
+    validating the member names, and deriving the page maps. If a *manifest_path*
+    is given, the results are saved there and reused by later :meth:`load` calls
+    for every volume whose archive and override zip are unchanged (same size and
+    mtime), so a normal startup opens no zips at all.
+    """
+
+    def __init__(
+        self,
+        archive_root: Path,
+        override_root: Path,
+        volume_list: list[int],
+        manifest_path: Path | None = None,
+    ) -> None:
         self._archive_root = archive_root
         self._override_root = override_root
         self._volume_list = volume_list
+        self._manifest_path = manifest_path
 
         self._fantagraphics_archive_dict: dict[int, FantagraphicsArchive] = {}
+        self.num_volumes_scanned = 0
 
     def get_volume_list(self) -> list[int]:
         return self._volume_list
@@ -222,56 +250,135 @@ class FantagraphicsVolumeArchives:
             )
             self._fantagraphics_archive_dict[missing_volume] = archive_page_map
 
-        for archive_filename in archive_filenames:
-            logger.debug(f'Processing Fantagraphics archive "{archive_filename}"...')
+        manifest_volumes = self._read_manifest()
+        new_manifest_volumes: dict[str, dict[str, Any]] = {}
+        self.num_volumes_scanned = 0
 
+        for archive_filename in archive_filenames:
             fanta_volume = self._get_fanta_volume(archive_filename)
             override_archive_filename = override_archive_filenames.get(fanta_volume, None)
+            signature = _get_volume_signature(archive_filename, override_archive_filename)
 
-            archive_image_subdir, image_filenames = self._get_archive_contents(archive_filename)
-            image_ext = Path(image_filenames[0]).suffix
-            if image_ext not in _VALID_IMAGE_EXTENSION:
-                msg = (
-                    f'For image "{image_filenames[0]}",'
-                    f' expecting extension to be in "{_VALID_IMAGE_EXTENSION}".'
+            manifest_entry = manifest_volumes.get(str(fanta_volume))
+            if manifest_entry is not None and not _is_manifest_entry(manifest_entry):
+                logger.warning(
+                    f"Ignoring malformed volumes manifest entry for volume {fanta_volume}."
                 )
-                raise PageExtError(msg)
-
-            first_page, last_page = self._get_first_and_last_page_nums(image_filenames)
-            self._check_image_names(image_filenames, first_page, last_page, image_ext)
-
-            archive_images_page_map = self._get_archive_image_page_map(
-                archive_image_subdir, image_filenames, first_page, last_page
-            )
-            override_images_page_map, extra_images_page_map = (
-                self._get_override_and_extra_images_page_maps(
-                    override_archive_filename, archive_images_page_map
+                manifest_entry = None
+            if manifest_entry is not None and manifest_entry["signature"] == signature:
+                archive_page_map = _archive_from_manifest_entry(
+                    manifest_entry, fanta_volume, archive_filename, override_archive_filename
                 )
-            )
+            else:
+                archive_page_map = self._scan_volume(
+                    fanta_volume, archive_filename, override_archive_filename
+                )
+                self.num_volumes_scanned += 1
+                manifest_entry = _archive_to_manifest_entry(archive_page_map, signature)
 
-            archive_page_map = FantagraphicsArchive(
-                fanta_volume,
-                archive_filename,
-                archive_image_subdir,
-                image_ext,
-                first_page,
-                last_page,
-                archive_images_page_map,
-                override_images_page_map,
-                extra_images_page_map,
-                override_archive_filename,
-                is_missing=False,
-            )
             self._fantagraphics_archive_dict[fanta_volume] = archive_page_map
+            new_manifest_volumes[str(fanta_volume)] = manifest_entry
 
-            logger.debug(
-                f'Finished processing archive "{archive_filename}"'
-                f" ({first_page}-{last_page}, {last_page - first_page + 1} pages)."
-            )
+        if new_manifest_volumes != manifest_volumes:
+            self._write_manifest(new_manifest_volumes)
 
         if missing_volumes:
             raise MissingArchiveFilesError(missing_volumes, self._archive_root)
 
+    def _scan_volume(
+        self,
+        fanta_volume: int,
+        archive_filename: Path,
+        override_archive_filename: Path | None,
+    ) -> FantagraphicsArchive:
+        logger.debug(f'Processing Fantagraphics archive "{archive_filename}"...')
+
+        archive_image_subdir, image_filenames = self._get_archive_contents(archive_filename)
+        image_ext = Path(image_filenames[0]).suffix
+        if image_ext not in _VALID_IMAGE_EXTENSION:
+            msg = (
+                f'For image "{image_filenames[0]}",'
+                f' expecting extension to be in "{_VALID_IMAGE_EXTENSION}".'
+            )
+            raise PageExtError(msg)
+
+        first_page, last_page = self._get_first_and_last_page_nums(image_filenames)
+        self._check_image_names(image_filenames, first_page, last_page, image_ext)
+
+        archive_images_page_map = self._get_archive_image_page_map(
+            archive_image_subdir, image_filenames, first_page, last_page
+        )
+        override_images_page_map, extra_images_page_map = (
+            self._get_override_and_extra_images_page_maps(
+                override_archive_filename, archive_images_page_map
+            )
+        )
+
+        logger.debug(
+            f'Finished processing archive "{archive_filename}"'
+            f" ({first_page}-{last_page}, {last_page - first_page + 1} pages)."
+        )
+
+        return FantagraphicsArchive(
+            fanta_volume,
+            archive_filename,
+            archive_image_subdir,
+            image_ext,
+            first_page,
+            last_page,
+            archive_images_page_map,
+            override_images_page_map,
+            extra_images_page_map,
+            override_archive_filename,
+            is_missing=False,
+        )
+
+    def _read_manifest(self) -> dict[str, Any]:
+        """Return the manifest's volume entries, unchecked, or `{}` if it is unusable."""
+        if self._manifest_path is None or not self._manifest_path.is_file():
+            return {}
+
+        try:
+            with self._manifest_path.open("r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f'Ignoring unreadable volumes manifest "{self._manifest_path}": {e}')
+            return {}
+
+        if not isinstance(manifest, dict) or manifest.get("version") != VOLUMES_MANIFEST_VERSION:
+            logger.info(f'Ignoring out of date volumes manifest "{self._manifest_path}".')
+            return {}
+
+        volumes = manifest.get("volumes")
+        if not isinstance(volumes, dict):
+            logger.warning(f'Ignoring malformed volumes manifest "{self._manifest_path}".')
+            return {}
+
+        return volumes
+
+    def _write_manifest(self, volumes: dict[str, dict[str, Any]]) -> None:
+        if self._manifest_path is None:
+            return
+
+        manifest = {"version": VOLUMES_MANIFEST_VERSION, "volumes": volumes}
+        try:
+            self._manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                prefix=self._manifest_path.name, dir=self._manifest_path.parent
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(manifest, f)
+                Path(temp_name).replace(self._manifest_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f'Could not write volumes manifest "{self._manifest_path}": {e}')
+            return
+
+        logger.debug(f'Wrote volumes manifest "{self._manifest_path}".')
+
     def get_all_volume_filenames(self) -> list[Path]:
         """Return a list of all valid volume archive filenames in the archive root."""
         archive_files = []
@@ -436,3 +543,81 @@ class FantagraphicsVolumeArchives:
             if img_ext != page_ext:
                 msg = f'For page "{page}", expecting extension "{img_ext}" but got "{page_ext}"'
                 raise RuntimeError(msg)
+
+
+def _get_file_signature(file_path: Path | None) -> list[Any] | None:
+    if file_path is None:
+        return None
+    stat = file_path.stat()
+    return [file_path.name, stat.st_size, stat.st_mtime_ns]
+
+
+def _get_volume_signature(
+    archive_filename: Path, override_archive_filename: Path | None
+) -> dict[str, Any]:
+    return {
+        "archive": _get_file_signature(archive_filename),
+        "override": _get_file_signature(override_archive_filename),
+    }
+
+
+def _page_map_to_json(page_map: dict[str, Path]) -> dict[str, str]:
+    return {page: path.as_posix() for page, path in page_map.items()}
+
+
+def _page_map_from_json(page_map: dict[str, str]) -> dict[str, Path]:
+    return {page: Path(path) for page, path in page_map.items()}
+
+
+def _is_manifest_entry(entry: object) -> TypeIs[dict[str, Any]]:
+    """Whether *entry* has the shape `_archive_to_manifest_entry` writes."""
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("signature"), dict)
+        and isinstance(entry.get("archive_image_subdir"), str)
+        and isinstance(entry.get("image_ext"), str)
+        and type(entry.get("first_page")) is int
+        and type(entry.get("last_page")) is int
+        and all(_is_json_page_map(entry.get(key)) for key in _MANIFEST_PAGE_MAP_KEYS)
+    )
+
+
+def _is_json_page_map(page_map: object) -> bool:
+    return isinstance(page_map, dict) and all(isinstance(p, str) for p in page_map.values())
+
+
+def _archive_to_manifest_entry(
+    archive: FantagraphicsArchive, signature: dict[str, Any]
+) -> dict[str, Any]:
+    assert archive.archive_image_subdir is not None
+    return {
+        "signature": signature,
+        "archive_image_subdir": archive.archive_image_subdir.as_posix(),
+        "image_ext": archive.image_ext,
+        "first_page": archive.first_page,
+        "last_page": archive.last_page,
+        "archive_images_page_map": _page_map_to_json(archive.archive_images_page_map),
+        "override_images_page_map": _page_map_to_json(archive.override_images_page_map),
+        "extra_images_page_map": _page_map_to_json(archive.extra_images_page_map),
+    }
+
+
+def _archive_from_manifest_entry(
+    entry: dict[str, Any],
+    fanta_volume: int,
+    archive_filename: Path,
+    override_archive_filename: Path | None,
+) -> FantagraphicsArchive:
+    return FantagraphicsArchive(
+        fanta_volume,
+        archive_filename,
+        Path(entry["archive_image_subdir"]),
+        entry["image_ext"],
+        entry["first_page"],
+        entry["last_page"],
+        _page_map_from_json(entry["archive_images_page_map"]),
+        _page_map_from_json(entry["override_images_page_map"]),
+        _page_map_from_json(entry["extra_images_page_map"]),
+        override_archive_filename,
+        is_missing=False,
+    )
@@ -18,10 +18,13 @@ from comic_utils.pil_image_utils import (
     get_pil_image_as_png_bytes,
     load_pil_image_from_bytes,
     load_pil_image_from_zip,
+    reduce_jpeg_decode,
 )
 from PIL import Image as PilImage
 from PIL import ImageOps
 
+from .page_image_source import PageImage
+
 if TYPE_CHECKING:
     from comic_utils.comic_consts import PanelPath
     from PIL.Image import Image
@@ -57,7 +60,7 @@ def read_raw_bytes(panel_path: PanelPath) -> bytes:
     raise TypeError(msg)
 
 
-def decode_pil(raw: bytes, *, ext: str | None = None) -> Image:
+def decode_pil(raw: bytes, *, ext: str | None = None, min_decode_scale: float = 1.0) -> Image:
     """Decode raw bytes to a fully-loaded PIL image.
 
     Args:
@@ -66,14 +69,18 @@ def decode_pil(raw: bytes, *, ext: str | None = None) -> Image:
             restricted to the matching format (enforced by
             ``load_pil_image_from_bytes``). When ``None``, PIL auto-detects
             the format.
+        min_decode_scale: Fraction of each side the decoded image must keep.
+            Below 1.0, JPEGs may be decoded at 1/2, 1/4 or 1/8 scale (see
+            ``comic_utils.pil_image_utils.reduce_jpeg_decode``).
 
     Returns:
         A PIL image with pixel data loaded into memory.
 
     """
     if ext is not None:
-        return load_pil_image_from_bytes(raw, ext)
+        return load_pil_image_from_bytes(raw, ext, min_decode_scale)
     image = PilImage.open(io.BytesIO(raw))
+    reduce_jpeg_decode(image, min_decode_scale)
     image.load()
     return image
 
@@ -83,6 +90,7 @@ def load_pil(
     *,
     encrypted_zip: bool = False,
     use_ext_hint: bool = False,
+    min_decode_scale: float = 1.0,
 ) -> Image:
     """Read-and-decode shortcut: ``panel_path → PIL image``.
 
@@ -94,6 +102,8 @@ def load_pil(
         use_ext_hint: When ``True``, pass the path's suffix to
             :func:`decode_pil` so PIL validates the format. (The encrypted-zip
             path always validates by extension.)
+        min_decode_scale: Passed to :func:`decode_pil`; also applied to
+            decrypted override bytes.
 
     Returns:
         A loaded PIL image.
@@ -104,11 +114,13 @@ def load_pil(
         # panel-key module restricts the decryptor to an allow-list of caller
         # modules that does NOT include this one. load_pil_image_from_zip is the
         # canonical allow-listed entry point (read + decrypt + decode-with-ext).
-        return load_pil_image_from_zip(panel_path, encrypted=True)
+        return load_pil_image_from_zip(
+            panel_path, encrypted=True, min_decode_scale=min_decode_scale
+        )
 
     raw = read_raw_bytes(panel_path)
     ext = panel_path.suffix if use_ext_hint else None
-    return decode_pil(raw, ext=ext)
+    return decode_pil(raw, ext=ext, min_decode_scale=min_decode_scale)
 
 
 def convert_mode(pil_image: Image, mode: str) -> Image:
@@ -130,3 +142,21 @@ def encode_png_stream(pil_image: Image, *, compress_level: int = 0) -> io.BytesI
     stream = get_pil_image_as_png_bytes(pil_image, compress_level=compress_level)
     stream.seek(0)
     return stream
+
+
+def to_page_image(pil_image: Image) -> PageImage:
+    """Flatten *pil_image* into a contiguous RGB/RGBA :class:`PageImage` buffer.
+
+    Images carrying transparency keep an alpha channel; everything else is
+    stored as RGB, which is 25% smaller than RGBA for the same page.
+    """
+    mode, colorfmt = ("RGBA", "rgba") if pil_image.has_transparency_data else ("RGB", "rgb")
+    if pil_image.mode != mode:
+        pil_image = pil_image.convert(mode)
+    return PageImage(pixels=pil_image.tobytes(), size=pil_image.size, colorfmt=colorfmt)
+
+
+def from_page_image(page_image: PageImage) -> Image:
+    """Wrap a :class:`PageImage` buffer as a PIL image (no pixel copy)."""
+    mode = page_image.colorfmt.upper()
+    return PilImage.frombuffer(mode, page_image.size, page_image.pixels, "raw", mode, 0, 1)
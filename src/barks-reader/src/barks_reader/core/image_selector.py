@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from barks_fantagraphics.fanta_comics_info import FantaComicBookInfo
     from comic_utils.comic_consts import PanelPath
 
+    from .panel_dimensions_index import PanelDimensions
     from .reader_settings import ReaderSettings
 
 NUM_RAND_ATTEMPTS = 10
@@ -114,6 +115,10 @@ class ImageFileResolver(Protocol):
         """Return search image files for a title."""
         ...
 
+    def get_panel_dimensions(self, image_file: PanelPath) -> PanelDimensions | None:
+        """Return the precomputed size of an image, or None if it is not known."""
+        ...
+
 
 class ImageSelector:
     """Selects random images from the comic library for display.
@@ -380,43 +385,61 @@ class ImageSelector:
 
         return FIT_MODE_COVER
 
-    @staticmethod
-    def _get_adaptive_fit_mode(image_filename: PanelPath) -> str:
+    def _get_adaptive_fit_mode(self, image_filename: PanelPath) -> str:
         """Pick a fit mode from the image's aspect ratio.
 
         Near-square and moderately wide images fill the view edge-to-edge (cover);
         images that are too tall or too wide are letterboxed (contain) so the whole
         image stays visible instead of being cropped hard on its long axis. Falls
-        back to contain when the dimensions cannot be read (e.g. a non-filesystem
-        path or an unreadable file).
+        back to contain when the dimensions are not known (see
+        :meth:`_get_aspect_ratio`).
         """
-        if not isinstance(image_filename, Path):
+        aspect_ratio = self._get_aspect_ratio(image_filename)
+        if aspect_ratio is None:
             return FIT_MODE_CONTAIN
 
+        if FIT_COVER_MIN_ASPECT_RATIO <= aspect_ratio <= FIT_COVER_MAX_ASPECT_RATIO:
+            return FIT_MODE_COVER
+        return FIT_MODE_CONTAIN
+
+    def _get_aspect_ratio(self, image_filename: PanelPath) -> float | None:
+        """Return the image's width / height, or None if it cannot be known cheaply.
+
+        Panels zip members come from the precomputed dimensions index; a member
+        missing from it is not read, as that would mean decrypting it. Filesystem
+        images have their header read.
+        """
+        dimensions = self._resolver.get_panel_dimensions(image_filename)
+        if dimensions is not None:
+            return dimensions.aspect_ratio
+
+        if not isinstance(image_filename, Path):
+            return None
+
         try:
             width, height = get_image_size(image_filename)
         except (OSError, ValueError) as e:
             logger.warning(f'Could not read image size for "{image_filename}": {e}. Using contain.')
-            return FIT_MODE_CONTAIN
-
-        if height <= 0:
-            return FIT_MODE_CONTAIN
+            return None
 
-        aspect_ratio = width / height
-        if FIT_COVER_MIN_ASPECT_RATIO <= aspect_ratio <= FIT_COVER_MAX_ASPECT_RATIO:
-            return FIT_MODE_COVER
-        return FIT_MODE_CONTAIN
+        return width / height if height > 0 else None
 
     def _is_never_crop(self, image_filename: PanelPath) -> bool:
         """Return True if this image is on the user's never-crop list."""
         if not self._never_crop_images:
             return False
 
+        # An entry matches the whole path or any suffix of it starting after a "/",
+        # so look each of those up rather than scanning the entries.
         image_posix = str(image_filename).replace("\\", "/")
-        return any(
-            image_posix == entry or image_posix.endswith(f"/{entry}")
-            for entry in self._never_crop_images
-        )
+        if image_posix in self._never_crop_images:
+            return True
+        start = image_posix.find("/")
+        while start != -1:
+            if image_posix[start + 1 :] in self._never_crop_images:
+                return True
+            start = image_posix.find("/", start + 1)
+        return False
 
     def _load_never_crop_images(self) -> frozenset[str]:
         """Load the optional user-curated set of never-crop image path suffixes.
@@ -0,0 +1,192 @@
+"""Byte-budgeted LRU cache of decoded comic pages.
+
+``ComicBookLoader`` stores every page it decodes here instead of keeping the
+whole comic resident. When the cache grows past its byte budget the least
+recently used pages are dropped, except those near the current reading
+position, which are pinned so the pages the reader is about to show are never
+evicted from under it.
+
+Double-page spreads assembled from two cached pages share the same budget and
+LRU order, keyed by their ``(left, right)`` page indices.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .page_image_source import PageImage
+
+# Pages within this many indices of the reading position are never evicted.
+# Covers a double-page spread plus the next spread in either direction.
+PAGE_CACHE_KEEP_RADIUS = 3
+
+# A page index, or the (left, right) page indices of an assembled spread.
+type PageCacheKey = int | tuple[int, int]
+
+
+class PageCache:
+    """Thread-safe, byte-bounded LRU mapping page index -> :class:`PageImage`.
+
+    Also holds assembled double-page spreads (see :meth:`put_spread`). A spread is
+    pinned when its left page is, and evicting one does not call ``on_evict``: it
+    can always be assembled again from its pages.
+
+    Args:
+        max_bytes: Byte budget. Pinned pages may push the total over it; the
+            excess is reclaimed by the next insertion after the reading
+            position moves on.
+        on_evict: Called with the page index of every evicted page, while the
+            cache lock is held, so callers can invalidate per-page state (e.g.
+            a "loaded" event) atomically with the eviction.
+        keep_radius: Number of pages either side of the focus that are pinned.
+
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        on_evict: Callable[[int], None] | None = None,
+        keep_radius: int = PAGE_CACHE_KEEP_RADIUS,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._on_evict = on_evict
+        self._keep_radius = keep_radius
+
+        self._lock = threading.Lock()
+        self._pages: OrderedDict[PageCacheKey, PageImage] = OrderedDict()
+        self._evicted: set[int] = set()
+        self._total_bytes = 0
+        self._focus_index = 0
+        self.num_evictions = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """The cache's byte budget."""
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently held by cached pages."""
+        with self._lock:
+            return self._total_bytes
+
+    @property
+    def num_spreads(self) -> int:
+        """Number of cached double-page spreads."""
+        with self._lock:
+            return sum(isinstance(key, tuple) for key in self._pages)
+
+    def __len__(self) -> int:
+        """Return the number of cached pages and spreads."""
+        with self._lock:
+            return len(self._pages)
+
+    def __contains__(self, page_index: object) -> bool:
+        """Return whether *page_index* is cached."""
+        with self._lock:
+            return page_index in self._pages
+
+    def get(self, page_index: int) -> PageImage | None:
+        """Return the page at *page_index* (marking it recently used), or ``None``."""
+        return self._get(page_index)
+
+    def put(self, page_index: int, page_image: PageImage) -> None:
+        """Insert or replace a page, then evict LRU pages until back under budget.
+
+        The page just inserted is never evicted by its own insertion.
+        """
+        self._put(page_index, page_image)
+
+    def get_spread(self, left_index: int, right_index: int) -> PageImage | None:
+        """Return the assembled spread of two pages (marking it recently used), or ``None``."""
+        return self._get((left_index, right_index))
+
+    def put_spread(self, left_index: int, right_index: int, spread_image: PageImage) -> None:
+        """Insert or replace an assembled spread, as :meth:`put` does for a page."""
+        self._put((left_index, right_index), spread_image)
+
+    def set_focus(self, page_index: int) -> None:
+        """Move the pinned window to be centered on *page_index*.
+
+        Only pins; any over-budget excess is reclaimed by the next :meth:`put`.
+        Keeping eviction on the (single) writer thread means a page's "loaded"
+        state can never be invalidated between its insertion and its publication.
+        """
+        with self._lock:
+            self._focus_index = page_index
+
+    def evicted_near_focus(self) -> list[int]:
+        """Return, in ascending order, pinned-window page indices that were evicted."""
+        with self._lock:
+            return sorted(idx for idx in self._evicted if self._is_pinned(idx))
+
+    def page_sizes(self) -> list[int]:
+        """Return the byte size of every cached page (spreads are not included)."""
+        with self._lock:
+            return [
+                page_image.nbytes
+                for key, page_image in self._pages.items()
+                if not isinstance(key, tuple)
+            ]
+
+    def drop_spreads(self) -> None:
+        """Drop every assembled spread, leaving their budget to pages."""
+        with self._lock:
+            for key in [key for key in self._pages if isinstance(key, tuple)]:
+                self._total_bytes -= self._pages.pop(key).nbytes
+
+    def clear(self) -> None:
+        """Drop every page without invoking ``on_evict``."""
+        with self._lock:
+            self._pages.clear()
+            self._evicted.clear()
+            self._total_bytes = 0
+            self._focus_index = 0
+
+    def _get(self, key: PageCacheKey) -> PageImage | None:
+        with self._lock:
+            page_image = self._pages.get(key)
+            if page_image is not None:
+                self._pages.move_to_end(key)
+            return page_image
+
+    def _put(self, key: PageCacheKey, page_image: PageImage) -> None:
+        with self._lock:
+            old = self._pages.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old.nbytes
+            self._pages[key] = page_image
+            self._total_bytes += page_image.nbytes
+            if not isinstance(key, tuple):
+                self._evicted.discard(key)
+
+            self._evict_over_budget(keep=key)
+
+    def _is_pinned(self, key: PageCacheKey) -> bool:
+        page_index = key[0] if isinstance(key, tuple) else key
+        return abs(page_index - self._focus_index) <= self._keep_radius
+
+    def _evict_over_budget(self, keep: PageCacheKey) -> None:
+        if self._total_bytes <= self._max_bytes:
+            return
+
+        # Oldest first; pinned pages and the page being kept are skipped, not evicted.
+        for key in list(self._pages):
+            if self._total_bytes <= self._max_bytes:
+                break
+            if key == keep or self._is_pinned(key):
+                continue
+
+            page_image = self._pages.pop(key)
+            self._total_bytes -= page_image.nbytes
+            if isinstance(key, tuple):
+                continue
+            self._evicted.add(key)
+            self.num_evictions += 1
+            if self._on_evict is not None:
+                self._on_evict(key)
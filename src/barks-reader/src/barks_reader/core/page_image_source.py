@@ -8,6 +8,7 @@ focused on prefetch orchestration and lifecycle management.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
@@ -16,12 +17,45 @@ if TYPE_CHECKING:
     from .comic_book_page_info import PageInfo
 
 
+@dataclass(frozen=True, slots=True)
+class PageImage:
+    """A decoded, display-ready page held as one contiguous pixel buffer.
+
+    Rows run top to bottom with no padding, so the buffer can be uploaded with
+    ``Texture.blit_buffer`` directly, skipping an encode/decode round-trip.
+    """
+
+    pixels: bytes
+    size: tuple[int, int]
+    colorfmt: str  # "rgb" or "rgba" (Kivy colorfmt names)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of the pixel buffer in bytes."""
+        return len(self.pixels)
+
+
 @runtime_checkable
 class PageImageSource(Protocol):
     """Resolves, loads, and transforms a single page image for display."""
 
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:
+        """Load and return a display-ready raw pixel buffer for the given page.
+
+        This is the path the reader uses: it runs on a worker thread and leaves
+        the UI thread with nothing to decode.
+
+        Args:
+            page_info: Metadata identifying which page to load.
+
+        Returns:
+            The page as a contiguous RGB or RGBA buffer plus its size.
+
+        """
+        ...
+
     def load_page_image(self, page_info: PageInfo) -> tuple[io.BytesIO, str]:
-        """Load and return a display-ready image for the given page.
+        """Load and return a display-ready encoded image for the given page.
 
         Args:
             page_info: Metadata identifying which page to load.
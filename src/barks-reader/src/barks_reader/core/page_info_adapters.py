@@ -28,8 +28,9 @@ class FantagraphicsPanelSegmentsAdapter:
     ) -> None:
         self._comics_database = comics_database
         self._panel_segments_root_dir = panel_segments_root_dir
-        self._cached_for: ComicBook | None = None
-        self._cached: tuple[SrceAndDestPages, RequiredDimensions] | None = None
+        # (comic, result) as one tuple, so a layout being built for a preload on a
+        # background thread can never pair one comic with another comic's pages.
+        self._cached: tuple[ComicBook, tuple[SrceAndDestPages, RequiredDimensions]] | None = None
 
     def get_sorted_pages(self, comic: ComicBook) -> SrceAndDestPages:
         return self._load(comic)[0]
@@ -38,7 +39,8 @@ class FantagraphicsPanelSegmentsAdapter:
         return self._load(comic)[1]
 
     def _load(self, comic: ComicBook) -> tuple[SrceAndDestPages, RequiredDimensions]:
-        if self._cached_for is not comic or self._cached is None:
+        cached = self._cached
+        if cached is None or cached[0] is not comic:
             vol_title = self._comics_database.get_fantagraphics_volume_title(
                 comic.get_fanta_volume()
             )
@@ -55,6 +57,6 @@ class FantagraphicsPanelSegmentsAdapter:
                     check_srce_page_timestamps=False,
                 )
             )
-            self._cached_for = comic
-            self._cached = (srce_and_dest_pages, required_dim)
-        return self._cached
+            cached = (comic, (srce_and_dest_pages, required_dim))
+            self._cached = cached
+        return cached[1]
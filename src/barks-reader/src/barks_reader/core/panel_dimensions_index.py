@@ -0,0 +1,146 @@
+"""Precomputed sizes of the images in the Barks panels zip.
+
+The panels in the zip are encrypted, so reading an image's size would mean
+decrypting and decoding it. ``ImageSelector`` needs the aspect ratio of every
+fun image it picks, so instead the sizes are computed once, when the zip is
+built, and stored in a small JSON index next to it (see
+``scripts/build_panel_dimensions_index.py``).
+
+Each entry records the zip member's CRC. When the index is loaded, entries
+whose CRC no longer matches the zip are dropped, so a stale index is never
+trusted: those panels just fall back to having no known size.
+"""
+
+from __future__ import annotations
+
+import json
+import zipfile
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from comic_utils.comic_consts import JPG_FILE_EXT, PNG_FILE_EXT
+from loguru import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from comic_utils.comic_consts import PanelPath
+
+# Bump when the index file format changes.
+PANEL_DIMENSIONS_INDEX_VERSION = 1
+PANEL_DIMENSIONS_INDEX_SUFFIX = ".dims.json"
+
+_IMAGE_EXTS = (JPG_FILE_EXT, PNG_FILE_EXT)
+
+type ImageSizeReader = Callable[[zipfile.ZipFile, zipfile.ZipInfo], tuple[int, int]]
+
+
+@dataclass(frozen=True, slots=True)
+class PanelDimensions:
+    """Pixel size of a panel image."""
+
+    width: int
+    height: int
+
+    @property
+    def aspect_ratio(self) -> float | None:
+        """Width / height, or ``None`` for a degenerate image."""
+        return self.width / self.height if self.height > 0 else None
+
+
+class PanelDimensionsIndex:
+    """Maps panels zip members to their :class:`PanelDimensions`."""
+
+    def __init__(self, dimensions: dict[str, PanelDimensions] | None = None) -> None:
+        self._dimensions = dimensions or {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed panels."""
+        return len(self._dimensions)
+
+    def get(self, panel_path: PanelPath) -> PanelDimensions | None:
+        """Return the size of *panel_path*, or ``None`` if it is not indexed.
+
+        Only zip members are indexed; filesystem paths always return ``None``.
+        """
+        if not isinstance(panel_path, zipfile.Path):
+            return None
+        return self._dimensions.get(panel_path.at)
+
+
+def get_panel_dimensions_index_file(panels_zip_file: Path) -> Path:
+    """Return the index file stored alongside *panels_zip_file*."""
+    return panels_zip_file.with_suffix(PANEL_DIMENSIONS_INDEX_SUFFIX)
+
+
+def write_panel_dimensions_index(
+    index_file: Path, panels_zip: zipfile.ZipFile, read_image_size: ImageSizeReader
+) -> int:
+    """Write the dimensions index for every image in *panels_zip*.
+
+    Args:
+        index_file: Where to write the index.
+        panels_zip: The open panels zip.
+        read_image_size: Returns the ``(width, height)`` of a zip member. This is
+            what knows how to decrypt the members, if they are encrypted.
+
+    Returns:
+        The number of images indexed.
+
+    """
+    members: dict[str, list[int]] = {}
+    for info in panels_zip.infolist():
+        if info.is_dir() or not info.filename.lower().endswith(_IMAGE_EXTS):
+            continue
+        width, height = read_image_size(panels_zip, info)
+        members[info.filename] = [info.CRC, width, height]
+
+    index = {"version": PANEL_DIMENSIONS_INDEX_VERSION, "members": members}
+    index_file.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+
+    return len(members)
+
+
+def load_panel_dimensions_index(
+    panels_zip: zipfile.ZipFile, index_file: Path
+) -> PanelDimensionsIndex:
+    """Load the index for *panels_zip*, keeping only entries that are still valid.
+
+    A missing, unreadable or outdated index file gives an empty index, and
+    entries whose CRC does not match the zip member are dropped.
+    """
+    try:
+        index = json.loads(index_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        logger.info(f'No panel dimensions index "{index_file}". Panel sizes will be unknown.')
+        return PanelDimensionsIndex()
+    except (OSError, ValueError) as e:
+        logger.warning(f'Could not read panel dimensions index "{index_file}": {e}.')
+        return PanelDimensionsIndex()
+
+    if not isinstance(index, dict) or index.get("version") != PANEL_DIMENSIONS_INDEX_VERSION:
+        logger.warning(f'Ignoring outdated panel dimensions index "{index_file}".')
+        return PanelDimensionsIndex()
+
+    member_crcs = {info.filename: info.CRC for info in panels_zip.infolist()}
+    dimensions: dict[str, PanelDimensions] = {}
+    num_stale = 0
+    try:
+        for filename, (crc, width, height) in index["members"].items():
+            if member_crcs.get(filename) != crc:
+                num_stale += 1
+                continue
+            dimensions[filename] = PanelDimensions(int(width), int(height))
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        logger.warning(f'Ignoring malformed panel dimensions index "{index_file}": {e}.')
+        return PanelDimensionsIndex()
+
+    if num_stale:
+        logger.warning(
+            f'Panel dimensions index "{index_file}" has {num_stale} stale entries.'
+            f" Rebuild it with scripts/build_panel_dimensions_index.py."
+        )
+    logger.debug(f"Loaded {len(dimensions)} panel dimensions.")
+
+    return PanelDimensionsIndex(dimensions)
@@ -0,0 +1,87 @@
+"""Byte-budgeted LRU cache of decoded panel images.
+
+The views cycle through the same fun, title and search panels on their rotation
+timers. ``PanelImageLoader`` keeps the RGBA pixel buffers it decodes here so a
+panel that comes round again is uploaded straight from memory instead of being
+read, decrypted, decoded and flattened once more.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .page_image_source import PageImage
+
+# A panel path, as a string.
+type PanelImageKey = str
+
+
+class PanelImageCache:
+    """Thread-safe, byte-bounded LRU mapping :data:`PanelImageKey` -> :class:`PageImage`.
+
+    Args:
+        max_bytes: Byte budget. An image larger than the whole budget is not
+            cached at all.
+
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._images: OrderedDict[PanelImageKey, PageImage] = OrderedDict()
+        self._total_bytes = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """The cache's byte budget."""
+        return self._max_bytes
+
+    @property
+    def total_bytes(self) -> int:
+        """Bytes currently held by cached images."""
+        with self._lock:
+            return self._total_bytes
+
+    def __len__(self) -> int:
+        """Return the number of cached images."""
+        with self._lock:
+            return len(self._images)
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether *key* is cached."""
+        with self._lock:
+            return key in self._images
+
+    def get(self, key: PanelImageKey) -> PageImage | None:
+        """Return the image for *key* (marking it recently used), or ``None``."""
+        with self._lock:
+            image = self._images.get(key)
+            if image is not None:
+                self._images.move_to_end(key)
+            return image
+
+    def put(self, key: PanelImageKey, image: PageImage) -> None:
+        """Insert or replace an image, then evict LRU images until back under budget."""
+        if image.nbytes > self._max_bytes:
+            return
+
+        with self._lock:
+            old_image = self._images.pop(key, None)
+            if old_image is not None:
+                self._total_bytes -= old_image.nbytes
+            self._images[key] = image
+            self._total_bytes += image.nbytes
+
+            while self._total_bytes > self._max_bytes:
+                _, evicted = self._images.popitem(last=False)
+                self._total_bytes -= evicted.nbytes
+
+    def clear(self) -> None:
+        """Drop every cached image."""
+        with self._lock:
+            self._images.clear()
+            self._total_bytes = 0
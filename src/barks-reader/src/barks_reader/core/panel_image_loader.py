@@ -1,21 +1,38 @@
 from __future__ import annotations
 
-from threading import Thread
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from loguru import logger
-from PIL import Image
 
 from .image_pipeline import convert_mode, load_pil
+from .page_image_source import PageImage
+from .panel_image_cache import PanelImageCache
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from concurrent.futures import Executor
 
     from comic_utils.comic_consts import PanelPath
+    from PIL import Image
 
     from .ports import Scheduler
 
-type ImageLoaderCallback = Callable[[Image.Image | None, Exception | None], None]
+type ImageLoaderCallback = Callable[[PageImage | None, Exception | None], None]
+
+# Panel loads are short and mostly I/O + decode; a couple of workers keep up with
+# every view's rotation timer without competing with the comic page loader.
+PANEL_LOAD_WORKERS = 2
+# Decoded RGBA panels are a few MB each; this holds every view's recent panels.
+PANEL_IMAGE_CACHE_MAX_BYTES = 96 * 1024 * 1024
+
+# Shared by every PanelImageLoader, so a panel decoded for one view is a cache hit
+# for all the others. The views live as long as the app, so the pool is never
+# shut down; at exit the interpreter only waits on the short decodes under way.
+_PANEL_LOAD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=PANEL_LOAD_WORKERS, thread_name_prefix="panel-loader"
+)
+_PANEL_IMAGE_CACHE = PanelImageCache(PANEL_IMAGE_CACHE_MAX_BYTES)
 
 
 def load_panel_pil(panel_path: PanelPath, *, encrypted_zip: bool = True) -> Image.Image:
@@ -37,19 +54,34 @@ def load_panel_pil(panel_path: PanelPath, *, encrypted_zip: bool = True) -> Imag
 
 
 class PanelImageLoader:
-    """Load an image in a background thread.
+    """Load an image on a shared worker pool.
 
       From either:
 
       - PanelPath = filesystem Path
       - PanelPath = zipfile.Path
 
-    Heavy work (I/O + Pillow decode) runs off the UI thread.
-    Texture upload always happens on the UI thread (required by Kivy).
+    Heavy work (I/O, Pillow decode and flattening to an RGBA pixel buffer) runs
+    off the UI thread, and the resulting buffers are kept in a
+    :class:`PanelImageCache` so panels that come round again are not decoded
+    twice. Texture upload always happens on the UI thread (required by Kivy).
+
+    Args:
+        scheduler: Marshals results back to the UI thread.
+        executor: Runs the decodes. Defaults to a small pool shared by all loaders.
+        cache: Decoded image cache. Defaults to one shared by all loaders.
+
     """
 
-    def __init__(self, scheduler: Scheduler) -> None:
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        executor: Executor | None = None,
+        cache: PanelImageCache | None = None,
+    ) -> None:
         self._scheduler = scheduler
+        self._executor = executor if executor is not None else _PANEL_LOAD_EXECUTOR
+        self._cache = cache if cache is not None else _PANEL_IMAGE_CACHE
         # Bumped on every new load or cancel; a worker whose captured generation
         # no longer matches is stale and must drop its result. This avoids ever
         # blocking the UI thread waiting for a superseded decode to finish.
@@ -59,19 +91,26 @@ class PanelImageLoader:
         """Cancel the current load if one is in flight."""
         self._generation += 1
 
-    def load_pil(self, panel_path: PanelPath, callback: ImageLoaderCallback) -> None:
-        """Schedule *panel_path* to be decoded; *callback* fires on the UI thread."""
-        self._start_worker(panel_path, callback=callback)
+    def load_pixels(self, panel_path: PanelPath, callback: ImageLoaderCallback) -> None:
+        """Schedule *panel_path* to be decoded; *callback* fires on the UI thread.
 
-    def _start_worker(self, panel_path: PanelPath, callback: ImageLoaderCallback) -> None:
+        The callback gets the panel as an RGBA :class:`PageImage`. A cached
+        image is still delivered through the scheduler, never synchronously.
+        """
         self._generation += 1
-        Thread(
-            target=self._worker,
-            args=(panel_path, callback, self._generation),
-            daemon=True,
-        ).start()
+        gen = self._generation
+
+        image = self._cache.get(str(panel_path))
+        if image is not None:
+            self._scheduler.schedule_once(lambda: self._deliver(gen, callback, image, None))
+            return
+
+        self._executor.submit(self._worker, panel_path, callback, gen)
 
     def _worker(self, panel_path: PanelPath, callback: ImageLoaderCallback, gen: int) -> None:
+        if self._generation != gen:
+            return  # Superseded while waiting for a free worker.
+
         try:
             # Panel zipfile.Path bytes are always encrypted in this app.
             pil = load_panel_pil(panel_path)
@@ -80,6 +119,10 @@ class PanelImageLoader:
                 return
 
             pil = convert_mode(pil, "RGBA")  # ensures reliable texture creation
+            image = PageImage(pixels=pil.tobytes(), size=pil.size, colorfmt="rgba")
+
+            # Worth keeping even if now stale: the rotation will come back to it.
+            self._cache.put(str(panel_path), image)
 
             if self._generation != gen:
                 return
@@ -90,16 +133,16 @@ class PanelImageLoader:
             self._scheduler.schedule_once(lambda: self._deliver(gen, callback, None, ex))
             return
 
-        self._scheduler.schedule_once(lambda: self._deliver(gen, callback, pil, None))
+        self._scheduler.schedule_once(lambda: self._deliver(gen, callback, image, None))
 
     def _deliver(
         self,
         gen: int,
         callback: ImageLoaderCallback,
-        pil: Image.Image | None,
+        image: PageImage | None,
         error: Exception | None,
     ) -> None:
         # Re-check on the UI thread: a stale worker may have scheduled its
         # callback just before a newer load bumped the generation.
         if self._generation == gen:
-            callback(pil, error)
+            callback(image, error)
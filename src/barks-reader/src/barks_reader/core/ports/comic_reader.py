@@ -11,11 +11,12 @@ from typing import TYPE_CHECKING, Protocol
 
 if TYPE_CHECKING:
     from collections import OrderedDict
+    from collections.abc import Callable
 
     from barks_build_comic_images.build_comic_images import ComicBookImageBuilder
     from barks_fantagraphics.fanta_comics_info import FantaComicBookInfo
 
-    from barks_reader.core.comic_book_page_info import PageInfo
+    from barks_reader.core.comic_book_page_info import ComicLayout, PageInfo
     from barks_reader.core.display_unit import DisplayUnit
 
 
@@ -42,6 +43,16 @@ class ComicBookReaderPort(Protocol):
         """Load *fanta_info*'s comic and start reading at *page_to_first_goto*."""
         ...
 
+    def preload_comic(
+        self,
+        fanta_info: FantaComicBookInfo,
+        use_fantagraphics_overrides: bool,
+        page_to_first_goto: str,
+        prepare_comic: Callable[[], tuple[ComicLayout, ComicBookImageBuilder]],
+    ) -> None:
+        """Decode the opening pages of a comic likely to be read next, in the background."""
+        ...
+
     def get_last_read_page(self) -> str:
         """Return the display page number the user last read."""
         ...
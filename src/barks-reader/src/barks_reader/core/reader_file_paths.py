@@ -17,12 +17,19 @@ from barks_fantagraphics.comic_book_info import (
 from comic_utils.comic_consts import JPG_FILE_EXT, PNG_FILE_EXT, ZIP_FILE_EXT, PanelPath
 from loguru import logger
 
+from .panel_dimensions_index import (
+    PanelDimensionsIndex,
+    get_panel_dimensions_index_file,
+    load_panel_dimensions_index,
+)
 from .reader_consts_and_types import NO_OVERRIDES_SUFFIX
 from .reader_utils import get_all_files_in_dir
 
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from .panel_dimensions_index import PanelDimensions
+
 EMERGENCY_INSET_FILE = Titles.BICEPS_BLUES
 
 _DEFAULT_BARKS_DIR = "${HOME}/Books/Carl Barks"
@@ -82,6 +89,7 @@ class ReaderFilePaths:
         self._barks_panels_zip: zipfile.ZipFile | None = None
         self.barks_panels_are_encrypted: bool = False
         self._panels_ext_type: BarksPanelsExtType | None = None
+        self._panel_dimensions = PanelDimensionsIndex()
 
         self._panel_dirs: dict[PanelDirNames, PanelPath] = {}
         self._inset_edited_files_dir: PanelPath | None = None
@@ -132,9 +140,13 @@ class ReaderFilePaths:
             self.barks_panels_are_encrypted = True
             self._barks_panels_zip = zipfile.ZipFile(self._barks_panels_source, "r")
             panels_root = zipfile.Path(self._barks_panels_zip)
+            self._panel_dimensions = load_panel_dimensions_index(
+                self._barks_panels_zip, get_panel_dimensions_index_file(source)
+            )
         else:
             self.barks_panels_are_encrypted = False
             panels_root = self._barks_panels_source
+            self._panel_dimensions = PanelDimensionsIndex()
 
         for dir_enum in PanelDirNames:
             dir_name = dir_enum.value + ("/" if is_zip else "")
@@ -190,6 +202,9 @@ class ReaderFilePaths:
     def get_file_ext(self) -> str:
         return self._inset_files_ext
 
+    def get_panel_dimensions(self, image_file: PanelPath) -> PanelDimensions | None:
+        return self._panel_dimensions.get(image_file)
+
     def get_emergency_inset_file(self) -> PanelPath:
         return self._panel_dirs[PanelDirNames.INSETS] / (
             BARKS_TITLE_INFO[EMERGENCY_INSET_FILE].get_title_str() + self._inset_files_ext
@@ -9,6 +9,7 @@ if TYPE_CHECKING:
     from barks_fantagraphics.barks_titles import Titles
     from comic_utils.comic_consts import PanelPath
 
+    from .panel_dimensions_index import PanelDimensions
     from .reader_file_paths import ReaderFilePaths
 
 
@@ -78,6 +79,10 @@ class ReaderFilePathsResolver:
         """Return search image files for a title."""
         return self._file_paths.get_comic_search_files(title_str, prefer_edited)
 
+    def get_panel_dimensions(self, image_file: PanelPath) -> PanelDimensions | None:
+        """Return the precomputed size of an image, if known."""
+        return self._file_paths.get_panel_dimensions(image_file)
+
     def get_file_type_titles(
         self, file_type: FileTypes, allowed_titles: set[str] | None = None
     ) -> list[str]:
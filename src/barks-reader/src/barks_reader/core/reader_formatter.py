@@ -7,7 +7,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
 import pyphen
-from barks_fantagraphics.barks_covers import COVER_BY_TITLE, get_cover_location
+from barks_fantagraphics.barks_covers import get_cover_by_title, get_cover_location
 from barks_fantagraphics.barks_extra_info import BARKS_EXTRA_INFO
 from barks_fantagraphics.barks_payments import BARKS_PAYMENTS, PaymentInfo
 from barks_fantagraphics.barks_titles import Titles
@@ -219,7 +219,7 @@ class ReaderFormatter:
         source = f"{FAN} CBDL, Vol {fanta_book.volume}, {fanta_book.year}"
         fanta_page = get_one_pager_fanta_page(title) if title in ONE_PAGERS else None
         if fanta_page is None and title in COVERS_SET:
-            cover_location = get_cover_location(COVER_BY_TITLE[title])
+            cover_location = get_cover_location(get_cover_by_title()[title])
             fanta_page = None if cover_location is None else cover_location[1]
         if fanta_page is not None:
             # One-pagers and covers also show the page within the Fantagraphics volume.
@@ -18,6 +18,9 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 READER_FILES_DIR = "Reader Files"  # relative to app data directory
+RENDERED_PAGE_CACHE_DIR = "Rendered Page Cache"  # relative to app data directory
+FANTA_VOLUMES_MANIFEST_FILE = "fantagraphics-volumes-manifest.json"  # relative to app data dir
+STORY_INDEX_FILE = "story-titles-index.json"  # relative to app data dir
 JPG_BARKS_PANELS_ZIP = "Barks Panels.zip"
 WIKI_BUNDLE_SUBDIR = "Carl Barks Wiki"
 
@@ -149,7 +152,7 @@ class ReaderSettings:
         self._app_settings_path = app_settings_path
         self._app_data_dir = app_data_dir
         self._user_data_path = app_settings_path.parent / "barks-reader.json"
-        self._user_history_path = app_settings_path.parent / "barks-reader-history.json"
+        self._user_history_path = app_settings_path.parent / "barks-reader-history.jsonl"
 
     def get_app_settings_path(self) -> Path:
         assert self._app_settings_path
@@ -216,6 +219,16 @@ class ReaderSettings:
     def get_reader_files_dir(app_data_dir: Path) -> Path:
         return app_data_dir / READER_FILES_DIR
 
+    @property
+    def rendered_page_cache_dir(self) -> Path:
+        assert self._app_data_dir
+        return self._app_data_dir / RENDERED_PAGE_CACHE_DIR
+
+    @property
+    def fantagraphics_volumes_manifest_path(self) -> Path:
+        assert self._app_data_dir
+        return self._app_data_dir / FANTA_VOLUMES_MANIFEST_FILE
+
     @property
     def prebuilt_comics_dir(self) -> Path:
         return self._read(PREBUILT_COMICS_DIR)
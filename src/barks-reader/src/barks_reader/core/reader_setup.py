@@ -8,7 +8,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from barks_build_comic_images.build_comic_images import ComicBookImageBuilder
+from barks_build_comic_images.build_comic_images import (
+    RGB_DISPLAY_PROFILE,
+    ComicBookImageBuilder,
+)
 from comic_utils.get_panel_bytes import get_decrypted_bytes
 
 if TYPE_CHECKING:
@@ -63,7 +66,9 @@ def prepare_comic_for_reading(
     image_builder = ComicBookImageBuilder(
         comic,
         reader_settings.sys_file_paths.get_empty_page_file(),
+        page_image_source=RGB_DISPLAY_PROFILE.page_image_source,
         get_inset_decrypted_bytes=get_decrypted_func,
+        allow_reduced_decode=RGB_DISPLAY_PROFILE.allow_reduced_decode,
     )
     image_builder.set_required_dim(layout_builder.get_required_dimensions(comic))
 
@@ -1,18 +1,22 @@
 """Record and browse the user's comic reading history (Kivy-free).
 
-Every comic open is appended to a JSON event log (``barks-reader-history.json``)
-as a :class:`ReadEvent`; closing the reader fills in the close time and last-read
-page. Pure derivation helpers turn the raw log into the two history views:
-a day-grouped journal (:func:`group_events_by_day`) and a per-title summary
-(:func:`summarize_titles`).
+Every comic open is appended to an event log (``barks-reader-history.jsonl``, a
+journal of JSON lines) as a :class:`ReadEvent`; closing the reader fills in the
+close time and last-read page. Pure derivation helpers turn the raw log into the
+two history views: a day-grouped journal (:func:`group_events_by_day`) and a
+per-title summary (:func:`summarize_titles`).
 """
 
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
 import uuid
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
+from pathlib import Path
 from typing import TYPE_CHECKING, Any, Self
 
 from loguru import logger
@@ -21,13 +25,22 @@ from .reader_consts_and_types import COMIC_BEGIN_PAGE
 
 if TYPE_CHECKING:
     from collections.abc import Callable
-    from pathlib import Path
 
     from .saved_page_info import SavedPageInfo
 
 JsonReadEvent = dict[str, Any]
-
-_STORE_VERSION = 1
+JsonRecord = dict[str, Any]
+
+# Queued history changes are written this often (and at shutdown).
+FLUSH_INTERVAL_SECS = 2.0
+
+_STORE_VERSION = 2  # 1 was a single JSON file, rewritten on every change
+_MIGRATED_SUFFIX = ".migrated"
+# The journal is compacted once it holds more than this many records and more
+# than this many records per event.
+_COMPACT_MIN_RECORDS = 256
+_COMPACT_RATIO = 2
+_JOIN_TIMEOUT_SECS = 5.0
 _MINS_PER_HOUR = 60
 
 
@@ -75,60 +88,232 @@ class ReadEvent:
 
 
 class ReadingHistoryStore:
-    """Persist the reading-history event log to a JSON file."""
+    """Persist the reading-history event log to an append-only journal file.
+
+    Each change is applied in memory at once and queued as a journal record (a
+    JSON line). A writer thread appends the queued records every
+    ``flush_interval_secs``, and :meth:`close` flushes the rest at shutdown, so
+    the caller (the UI thread) never waits on the disk. Once the journal holds
+    well over one record per event it is compacted: atomically rewritten as one
+    record per event. A crash loses at most the records not yet flushed; a
+    record torn by a crash mid-append is skipped on the next load.
+    """
+
+    def __init__(self, store_path: Path, flush_interval_secs: float = FLUSH_INTERVAL_SECS) -> None:
+        """Load the store, tolerating a missing, empty or torn journal.
 
-    def __init__(self, store_path: Path) -> None:
-        """Load the store, tolerating a missing or empty file.
+        A history JSON file written by an older version (``store_path`` with a
+        ``.json`` suffix) is migrated into a new journal on first load and
+        renamed aside.
 
         Args:
-            store_path: Path of the history JSON file.
+            store_path: Path of the history journal file.
+            flush_interval_secs: How often queued changes are written.
 
         """
         self._store_path = store_path
-        self._events: list[ReadEvent] = []
-
-        if store_path.exists() and (contents := store_path.read_text(encoding="utf-8").strip()):
-            try:
-                self._events = [ReadEvent.from_json(e) for e in json.loads(contents)["events"]]
-            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
-                logger.error(f'History: Could not load "{store_path}": {e}. Starting empty.')
-
-    def _sync(self) -> None:
-        json_data = {"version": _STORE_VERSION, "events": [e.to_json() for e in self._events]}
-        self._store_path.write_text(json.dumps(json_data, indent=4), encoding="utf-8")
+        self._flush_interval_secs = flush_interval_secs
+        self._lock = threading.Lock()  # guards the events and the queued records
+        self._flush_lock = threading.Lock()  # one flush writes the journal at a time
+        self._events: dict[str, ReadEvent] = {}  # by id, in the order first added
+        self._pending: list[JsonRecord] = []
+        self._num_journal_records = 0
+        self._writer: threading.Thread | None = None
+        self._stop_writer = threading.Event()
+        self._closed = False
+
+        # A compaction cut short by a crash leaves its temporary file behind.
+        for temp_path in store_path.parent.glob(f"{self._temp_prefix}*"):
+            temp_path.unlink(missing_ok=True)
+
+        legacy_path = store_path.with_suffix(".json")
+        if store_path.exists():
+            if self._load_journal():
+                self._compact()
+        elif legacy_path != store_path and legacy_path.exists():
+            self._migrate(legacy_path)
 
     def get_events(self) -> list[ReadEvent]:
         """Return all events in chronological (oldest-first) order."""
-        return list(self._events)
+        with self._lock:
+            return list(self._events.values())
 
     def add_event(self, event: ReadEvent) -> None:
-        """Append a new event and persist."""
-        self._events.append(event)
-        self._sync()
+        """Append a new event and queue it for writing."""
+        self._record({"op": "put", "event": event.to_json()})
 
     def update_event(self, event: ReadEvent) -> None:
-        """Replace the stored event with the same ``event_id`` and persist."""
-        for i, existing in enumerate(self._events):
-            if existing.event_id == event.event_id:
-                self._events[i] = event
-                self._sync()
-                return
-        logger.warning(f'History: Cannot update unknown event "{event.event_id}".')
+        """Replace the stored event with the same ``event_id`` and queue it for writing."""
+        with self._lock:
+            is_known = event.event_id in self._events
+        if not is_known:
+            logger.warning(f'History: Cannot update unknown event "{event.event_id}".')
+            return
+        self._record({"op": "put", "event": event.to_json()})
 
     def delete_event(self, event_id: str) -> None:
-        """Delete the event with the given id and persist."""
-        self._events = [e for e in self._events if e.event_id != event_id]
-        self._sync()
+        """Delete the event with the given id and queue the deletion for writing."""
+        self._record({"op": "delete", "id": event_id})
 
     def delete_events_for_title(self, title_str: str) -> None:
-        """Delete all events for a title and persist."""
-        self._events = [e for e in self._events if e.title_str != title_str]
-        self._sync()
+        """Delete all events for a title and queue the deletion for writing."""
+        self._record({"op": "delete_title", "title": title_str})
 
     def clear(self) -> None:
-        """Delete all events and persist."""
-        self._events = []
-        self._sync()
+        """Delete all events and queue the deletion for writing."""
+        self._record({"op": "clear"})
+
+    def flush(self) -> None:
+        """Write the queued records to the journal now, compacting it if it is due."""
+        with self._flush_lock:
+            with self._lock:
+                records, self._pending = self._pending, []
+                if not records:
+                    return
+                # The snapshot includes every queued record, so it replaces them.
+                snapshot = (
+                    self._get_snapshot()
+                    if self._needs_compaction(self._num_journal_records + len(records))
+                    else None
+                )
+            try:
+                if snapshot is None:
+                    self._append(records)
+                else:
+                    self._write_journal(snapshot)
+            except OSError as e:
+                logger.error(f'History: Could not write "{self._store_path}": {e}.')
+                with self._lock:
+                    self._pending[:0] = records  # try again on the next flush
+
+    def close(self) -> None:
+        """Stop the writer and flush; any later change is written at once."""
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+        self._stop_writer.set()
+        if writer is not None:
+            writer.join(timeout=_JOIN_TIMEOUT_SECS)
+            if writer.is_alive():
+                logger.error("History: Writer thread did not terminate in time.")
+        self.flush()
+
+    def _record(self, record: JsonRecord) -> None:
+        with self._lock:
+            self._apply(record)
+            self._pending.append(record)
+            if self._writer is None and not self._closed:
+                self._writer = threading.Thread(
+                    target=self._write_periodically, name="history-writer", daemon=True
+                )
+                self._writer.start()
+            closed = self._closed
+        if closed:
+            self.flush()
+
+    def _write_periodically(self) -> None:
+        while not self._stop_writer.wait(self._flush_interval_secs):
+            self.flush()
+
+    def _apply(self, record: JsonRecord) -> None:
+        """Apply one journal record to the in-memory events."""
+        op = record["op"]
+        if op == "put":
+            event = ReadEvent.from_json(record["event"])
+            self._events[event.event_id] = event
+        elif op == "delete":
+            self._events.pop(record["id"], None)
+        elif op == "delete_title":
+            title_str = record["title"]
+            self._events = {i: e for i, e in self._events.items() if e.title_str != title_str}
+        elif op == "clear":
+            self._events = {}
+        else:
+            msg = f'Unknown history journal op "{op}".'
+            raise ValueError(msg)
+
+    def _load_journal(self) -> bool:
+        """Replay the journal; return whether it held records that could not be read."""
+        try:
+            lines = self._store_path.read_text(encoding="utf-8").splitlines()
+        except OSError as e:
+            logger.error(f'History: Could not load "{self._store_path}": {e}. Starting empty.')
+            return False
+
+        num_bad_records = 0
+        for line in lines[1:]:  # the first line is the version header
+            try:
+                self._apply(json.loads(line))
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                num_bad_records += 1
+                logger.warning(f'History: Skipping unreadable record in "{self._store_path}": {e}.')
+        self._num_journal_records = len(lines)
+        return num_bad_records > 0
+
+    def _migrate(self, legacy_path: Path) -> None:
+        """Load an older version's history JSON file into a new journal, then rename it aside."""
+        try:
+            contents = legacy_path.read_text(encoding="utf-8").strip()
+            events = (
+                [ReadEvent.from_json(e) for e in json.loads(contents)["events"]] if contents else []
+            )
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.error(f'History: Could not migrate "{legacy_path}": {e}. Starting empty.')
+            return
+
+        self._events = {event.event_id: event for event in events}
+        if self._compact():
+            legacy_path.replace(legacy_path.with_name(legacy_path.name + _MIGRATED_SUFFIX))
+            logger.info(f'History: Migrated {len(events)} events from "{legacy_path}".')
+
+    def _compact(self) -> bool:
+        """Rewrite the journal from the in-memory events; return whether that worked."""
+        with self._flush_lock:
+            try:
+                self._write_journal(self._get_snapshot())
+            except OSError as e:
+                logger.error(f'History: Could not write "{self._store_path}": {e}.')
+                return False
+        return True
+
+    @property
+    def _temp_prefix(self) -> str:
+        return f".{self._store_path.name}-"
+
+    def _needs_compaction(self, num_records: int) -> bool:
+        return num_records > max(_COMPACT_MIN_RECORDS, _COMPACT_RATIO * len(self._events))
+
+    def _get_snapshot(self) -> list[JsonRecord]:
+        return [{"op": "put", "event": e.to_json()} for e in self._events.values()]
+
+    def _append(self, records: list[JsonRecord]) -> None:
+        if not self._store_path.exists():
+            self._write_journal(records)
+            return
+        with self._store_path.open("a", encoding="utf-8") as file:
+            file.write("".join(_to_journal_line(r) for r in records))
+            file.flush()
+            os.fsync(file.fileno())
+        self._num_journal_records += len(records)
+
+    def _write_journal(self, records: list[JsonRecord]) -> None:
+        """Atomically replace the journal with a version header and ``records``."""
+        fd, temp_name = tempfile.mkstemp(prefix=self._temp_prefix, dir=self._store_path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(_to_journal_line({"version": _STORE_VERSION}))
+                file.write("".join(_to_journal_line(r) for r in records))
+                file.flush()
+                os.fsync(file.fileno())
+            Path(temp_name).replace(self._store_path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        self._num_journal_records = len(records) + 1
+
+
+def _to_journal_line(record: JsonRecord) -> str:
+    return json.dumps(record, separators=(",", ":")) + "\n"
 
 
 class ReadingHistoryTracker:
@@ -0,0 +1,245 @@
+"""Persistent, content-addressed disk cache of display-ready comic pages.
+
+Building a page (read, crop/composite, two resizes) is by far the most
+expensive part of opening a comic. :class:`RenderedPageCache` stores the final
+resized pixels of each page on disk, keyed by everything the pixels depend on
+(see :meth:`RenderedPageCache.make_key`), so re-reading a recently viewed comic
+is little more than file reads.
+
+Each entry is one file: a small fixed header followed by the raw pixel buffer.
+Entries are written to a temp file and atomically renamed into place, so
+concurrent writers (loader threads, or two running readers) can never expose a
+partially written entry - the last rename simply wins. Recency is tracked via
+file mtimes (touched on every hit), and the oldest entries are deleted when the
+cache grows past its size cap.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from loguru import logger
+
+from .page_image_source import PageImage
+
+# Bump when the entry format or the meaning of key parts changes.
+RENDERED_PAGE_CACHE_FORMAT_VERSION = 2
+DEFAULT_RENDERED_PAGE_CACHE_MAX_MIB = 2048.0
+
+# After an eviction pass the cache is trimmed to this fraction of its cap, so
+# that a cache sitting at the cap does not rescan the directory on every write.
+_EVICT_TO_FRACTION = 0.9
+# Temp files older than this were left behind by a crashed writer.
+_STALE_TEMP_FILE_SECS = 60 * 60
+
+_ENTRY_SUFFIX = ".page"
+_TEMP_PREFIX = ".tmp-"
+_HEADER = struct.Struct("<4sBII")  # magic, colorfmt code, width, height
+_MAGIC = b"BRPC"
+_COLORFMT_CODES = {"rgb": 3, "rgba": 4}
+_CODE_COLORFMTS = {code: colorfmt for colorfmt, code in _COLORFMT_CODES.items()}
+
+
+class RenderedPageCache:
+    """Disk-backed LRU mapping cache key -> :class:`PageImage`.
+
+    All methods are safe to call from multiple threads, and multiple processes
+    may share the same *cache_dir*. I/O failures are logged and treated as
+    cache misses; the cache never makes a page fail to load.
+
+    Args:
+        cache_dir: Directory holding the entries (created on first write).
+        max_bytes: Size cap for all entries. Exceeding it triggers deletion of
+            the least recently used entries.
+
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        self._cache_dir = cache_dir
+        self._max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        # Estimated size of the cache; ``None`` until the first write scans it.
+        self._total_bytes: int | None = None
+        self.num_hits = 0
+        self.num_misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding the cache entries."""
+        return self._cache_dir
+
+    @property
+    def max_bytes(self) -> int:
+        """The cache's size cap."""
+        return self._max_bytes
+
+    @staticmethod
+    def make_key(*parts: object) -> str:
+        """Return a stable cache key for *parts* (their ``str`` forms are hashed)."""
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(str(RENDERED_PAGE_CACHE_FORMAT_VERSION).encode())
+        for part in parts:
+            hasher.update(b"\0")
+            hasher.update(str(part).encode())
+        return hasher.hexdigest()
+
+    def get(self, key: str) -> PageImage | None:
+        """Return the cached page for *key* (marking it recently used), or ``None``."""
+        entry_path = self._get_entry_path(key)
+        try:
+            data = entry_path.read_bytes()
+        except FileNotFoundError:
+            self._count(hit=False)
+            return None
+        except OSError as e:
+            logger.warning(f'Could not read rendered page cache entry "{entry_path}": {e}')
+            self._count(hit=False)
+            return None
+
+        page_image = _decode_entry(data)
+        if page_image is None:
+            logger.warning(f'Discarding corrupt rendered page cache entry "{entry_path}".')
+            entry_path.unlink(missing_ok=True)
+            self._count(hit=False)
+            return None
+
+        # May have been evicted by someone else in the meantime - the data is still good.
+        with contextlib.suppress(OSError):
+            os.utime(entry_path)
+
+        self._count(hit=True)
+        return page_image
+
+    def put(self, key: str, page_image: PageImage) -> None:
+        """Atomically store *page_image* under *key*, then enforce the size cap."""
+        entry_path = self._get_entry_path(key)
+        data = _encode_entry(page_image)
+
+        # A re-put replaces the entry, so only the difference in size is added.
+        old_size = _get_file_size(entry_path)
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=entry_path.parent)
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    file.write(data)
+                Path(temp_name).replace(entry_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.warning(f'Could not write rendered page cache entry "{entry_path}": {e}')
+            return
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total_bytes()
+            else:
+                self._total_bytes += len(data) - old_size
+            if self._total_bytes > self._max_bytes:
+                self._total_bytes = self._evict_lru()
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        with self._lock:
+            for entry_path, _size, _mtime in self._scan_entries():
+                entry_path.unlink(missing_ok=True)
+            self._total_bytes = 0
+
+    def _count(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.num_hits += 1
+            else:
+                self.num_misses += 1
+
+    def _get_entry_path(self, key: str) -> Path:
+        # Fan out over 256 subdirectories to keep directory sizes reasonable.
+        return self._cache_dir / key[:2] / (key + _ENTRY_SUFFIX)
+
+    def _scan_entries(self) -> list[tuple[Path, int, float]]:
+        entries: list[tuple[Path, int, float]] = []
+        if not self._cache_dir.is_dir():
+            return entries
+
+        now = time.time()
+        for sub_dir in self._cache_dir.iterdir():
+            if not sub_dir.is_dir():
+                continue
+            for file_path in sub_dir.iterdir():
+                try:
+                    stat = file_path.stat()
+                except FileNotFoundError:
+                    continue  # Deleted by a concurrent eviction.
+                if file_path.name.startswith(_TEMP_PREFIX):
+                    if now - stat.st_mtime > _STALE_TEMP_FILE_SECS:
+                        file_path.unlink(missing_ok=True)
+                    continue
+                if file_path.suffix == _ENTRY_SUFFIX:
+                    entries.append((file_path, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    def _scan_total_bytes(self) -> int:
+        return sum(size for _path, size, _mtime in self._scan_entries())
+
+    def _evict_lru(self) -> int:
+        entries = sorted(self._scan_entries(), key=lambda entry: entry[2])
+        total_bytes = sum(size for _path, size, _mtime in entries)
+        target_bytes = int(self._max_bytes * _EVICT_TO_FRACTION)
+
+        num_evicted = 0
+        for entry_path, size, _mtime in entries:
+            if total_bytes <= target_bytes:
+                break
+            try:
+                entry_path.unlink(missing_ok=True)
+            except OSError as e:  # e.g. open by a reader on Windows - try the next one.
+                logger.debug(f'Could not evict rendered page cache entry "{entry_path}": {e}')
+                continue
+            total_bytes -= size
+            num_evicted += 1
+
+        logger.debug(
+            f"Rendered page cache: evicted {num_evicted} entries;"
+            f" now {total_bytes / (1024 * 1024):.1f} MiB"
+            f" of {self._max_bytes / (1024 * 1024):.1f} MiB."
+        )
+        return total_bytes
+
+
+def _get_file_size(file_path: Path) -> int:
+    try:
+        return file_path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _encode_entry(page_image: PageImage) -> bytes:
+    width, height = page_image.size
+    header = _HEADER.pack(_MAGIC, _COLORFMT_CODES[page_image.colorfmt], width, height)
+    return header + page_image.pixels
+
+
+def _decode_entry(data: bytes) -> PageImage | None:
+    if len(data) < _HEADER.size:
+        return None
+
+    magic, colorfmt_code, width, height = _HEADER.unpack_from(data)
+    colorfmt = _CODE_COLORFMTS.get(colorfmt_code)
+    if magic != _MAGIC or colorfmt is None:
+        return None
+
+    pixels = data[_HEADER.size :]
+    if len(pixels) != width * height * colorfmt_code:
+        return None
+
+    return PageImage(pixels=pixels, size=(width, height), colorfmt=colorfmt)
@@ -14,18 +14,18 @@ from __future__ import annotations
 
 import hashlib
 import re
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from itertools import pairwise
 from typing import TYPE_CHECKING, Any, ClassVar
 
 from barks_fantagraphics.barks_titles import ENUM_TO_STR_TITLE, STR_TITLE_TO_ENUM, Titles
 from barks_fantagraphics.comic_book_info import BARKS_TITLE_INFO
 from barks_fantagraphics.fanta_comics_info import ALL_FANTA_COMIC_BOOK_INFO, SERIES_EXTRAS
-from okf_reader.core.backgrounds import PageBackground
+from okf_reader.core.backgrounds import PageBackground, PixelBuffer
 from okf_reader.core.theme import ViewerThemeSpec
 from okf_reader.core.top_bar import TopBarSpec
 
-from .image_pipeline import encode_png_stream
+from .image_pipeline import to_page_image
 from .image_selector import ImageSelector
 from .panel_image_loader import load_panel_pil
 from .reader_consts_and_types import (
@@ -42,14 +42,23 @@ from .reader_palette import color_to_markup_hex, theme
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from concurrent.futures import Executor, Future
     from pathlib import Path
 
+    from comic_utils.comic_consts import PanelPath
+    from okf_reader.core.backgrounds import CancelToken
+
     from .reader_formatter import FontManagerProtocol
     from .reader_settings import ReaderSettings
     from .system_file_paths import SystemFilePaths
 
 WIKI_TITLE = "Carl Barks Wiki"
 
+# One worker is enough: only the latest page's background is ever wanted. The
+# wiki screen builds a new BarksPanelsImageProvider with every viewer, so the
+# providers share this app-lifetime pool rather than each leaving a thread behind.
+_WIKI_BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wiki-background")
+
 
 def wiki_session_path(app_data_dir: Path, bundle: Path) -> Path:
     """Return the wiki session file for ``bundle``, under the app data dir.
@@ -60,8 +69,20 @@ def wiki_session_path(app_data_dir: Path, bundle: Path) -> Path:
     never clobber the Barks wiki's resume point (the session payload itself is
     only a bundle-relative page path).
     """
-    digest = hashlib.sha256(str(bundle.resolve()).encode("utf-8")).hexdigest()[:12]
-    return app_data_dir / f"okf-reader-session-{digest}.json"
+    return app_data_dir / f"okf-reader-session-{_bundle_digest(bundle)}.json"
+
+
+def wiki_search_index_path(app_data_dir: Path, bundle: Path) -> Path:
+    """Return the saved full-text search index for ``bundle``, under the app data dir.
+
+    Keyed like `wiki_session_path`, so both hosts share one index per bundle and
+    only re-read the pages changed since either last searched it.
+    """
+    return app_data_dir / f"okf-reader-search-index-{_bundle_digest(bundle)}.json"
+
+
+def _bundle_digest(bundle: Path) -> str:
+    return hashlib.sha256(str(bundle.resolve()).encode("utf-8")).hexdigest()[:12]
 
 
 def wiki_top_bar_spec(
@@ -232,32 +253,39 @@ def title_can_have_wiki_page(title_enum: Titles) -> bool:
 
 
 class BarksPanelsImageProvider:
-    """Back wiki pages with the Barks Reader's panel imagery (an okf ImageProvider).
+    """Back wiki pages with the Barks Reader's panel imagery (an okf AsyncImageProvider).
 
     Wraps the app's own ``ImageSelector``: a story page draws from that title's
     panel images across every panel directory (favourites, insets, covers,
     splash, silhouettes, closeups, original art, B/W, AI, censorship); any other
     page gets a random image across all Fantagraphics titles, with the
-    selector's recently-used tracking avoiding repeats. Panels may live in an
-    encrypted zip, whose members kivy cannot open by filename — those are
-    decrypted and re-encoded to PNG bytes here (``panel_image_loader.
-    load_panel_pil`` is the allow-listed decrypt path).
+    selector's recently-used tracking avoiding repeats. The panel is chosen on
+    the calling (UI) thread, then read — decrypted, if it is a member of an
+    encrypted zip (``panel_image_loader.load_panel_pil`` is the allow-listed
+    decrypt path) — and decoded to raw pixels on a worker, so the viewer only
+    has to upload a texture.
 
     Pass the app's existing ``ImageSelector`` when embedding, so the wiki
     shares its no-repeat memory; the standalone launcher lets one be built.
     """
 
     def __init__(
-        self, reader_settings: ReaderSettings, image_selector: ImageSelector | None = None
+        self,
+        reader_settings: ReaderSettings,
+        image_selector: ImageSelector | None = None,
+        executor: Executor | None = None,
     ) -> None:
         self._file_paths = reader_settings.file_paths
         self._selector = image_selector or ImageSelector(
             ReaderFilePathsResolver(self._file_paths), reader_settings
         )
+        self._executor = executor if executor is not None else _WIKI_BACKGROUND_EXECUTOR
         self._all_titles = list(ALL_FANTA_COMIC_BOOK_INFO.values())
 
-    def background_for(self, frontmatter: dict[str, Any], page_path: Path) -> PageBackground | None:
-        """Return a title-specific image for a story page, else a random one."""
+    def load_background(
+        self, frontmatter: dict[str, Any], page_path: Path, cancel: CancelToken
+    ) -> Future[PageBackground | None]:
+        """Start decoding a title-specific panel for a story page, else a random one."""
         title_enum = story_page_title(frontmatter, page_path)
         if title_enum is not None:
             panel = self._selector.get_random_image_for_title(
@@ -265,12 +293,19 @@ class BarksPanelsImageProvider:
             )
         else:
             panel = self._selector.get_random_image(self._all_titles).filename
-        if panel is None:
+
+        return self._executor.submit(self._decode_panel, panel, cancel)
+
+    def _decode_panel(self, panel: PanelPath | None, cancel: CancelToken) -> PageBackground | None:
+        """Worker: read and decode ``panel``, unless the page was left meanwhile."""
+        if panel is None or cancel.cancelled:
+            return None
+        pil = load_panel_pil(panel, encrypted_zip=self._file_paths.barks_panels_are_encrypted)
+        if cancel.cancelled:
             return None
-        if isinstance(panel, zipfile.Path):
-            pil = load_panel_pil(panel, encrypted_zip=self._file_paths.barks_panels_are_encrypted)
-            return PageBackground(ext=".png", data=encode_png_stream(pil).getvalue())
-        return PageBackground(ext=panel.suffix, path=panel)
+        page_image = to_page_image(pil)
+        pixels = PixelBuffer(page_image.pixels, page_image.size, page_image.colorfmt)
+        return PageBackground(ext=panel.suffix, pixels=pixels)
 
 
 class BarksTableRewriter:
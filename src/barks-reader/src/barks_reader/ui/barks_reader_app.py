@@ -28,7 +28,11 @@ from barks_reader.core.reader_consts_and_types import (
     OPTIONS_SETTING,
 )
 from barks_reader.core.reader_palette import set_active_theme
-from barks_reader.core.reader_settings import ALT_ESCAPE_KEY, BARKS_READER_SECTION
+from barks_reader.core.reader_settings import (
+    ALT_ESCAPE_KEY,
+    BARKS_READER_SECTION,
+    STORY_INDEX_FILE,
+)
 from barks_reader.core.reader_setup import bootstrap_reader_environment
 from barks_reader.core.reader_utils import COMIC_PAGE_ASPECT_RATIO
 from barks_reader.core.screen_metrics import SCREEN_METRICS
@@ -169,7 +173,7 @@ class BarksReaderApp(App):
             self._main_screen.app_closing()
 
         if self._wiki_reader_screen is not None:
-            self._wiki_reader_screen.save_session()
+            self._wiki_reader_screen.app_closing()
 
     @override
     def display_settings(self, settings: Widget) -> bool:
@@ -565,7 +569,10 @@ def reader_main(config_info: ConfigInfo) -> None:
     try:
         log_screen_metrics()
 
-        comics_database = ComicsDatabase(for_building_comics=False)
+        comics_database = ComicsDatabase(
+            for_building_comics=False,
+            story_index_path=config_info.app_data_dir / STORY_INDEX_FILE,
+        )
 
         logger.debug("Running kivy app...")
 
@@ -4,7 +4,7 @@ import random
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from barks_fantagraphics.barks_covers import COVER_BY_TITLE, get_cover_display_title
+from barks_fantagraphics.barks_covers import get_cover_by_title, get_cover_display_title
 from barks_fantagraphics.comic_book_info import (
     COVERS_SET,
     ONE_PAGERS,
@@ -434,7 +434,7 @@ class BottomTitleViewScreen(FloatLayout):
         # Covers similarly show their issue plus cover date, e.g.
         # "Uncle Scrooge #7 (Sep 1954)".
         if comic_book_info.title in COVERS_SET:
-            return get_cover_display_title(COVER_BY_TITLE[comic_book_info.title])
+            return get_cover_display_title(get_cover_by_title()[comic_book_info.title])
 
         if comic_book_info.is_barks_title:
             if comic_book_info.title in LONG_TITLE_SPLITS:
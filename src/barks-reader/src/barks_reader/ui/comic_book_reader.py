@@ -34,7 +34,7 @@ from screeninfo import get_monitors
 
 from barks_reader.core.archive_page_image_source import ArchivePageImageSource
 from barks_reader.core.comic_book_loader import ComicBookLoader
-from barks_reader.core.display_unit import DisplayUnit
+from barks_reader.core.comic_book_page_info import build_display_units
 from barks_reader.core.reader_consts_and_types import COMIC_BEGIN_PAGE
 from barks_reader.core.reader_formatter import get_action_bar_title
 from barks_reader.core.reader_utils import PNG_EXT_FOR_KIVY, get_win_dimensions
@@ -67,7 +67,9 @@ if TYPE_CHECKING:
     from kivy.input import MotionEvent
     from kivy.uix.widget import Widget
 
-    from barks_reader.core.comic_book_page_info import PageInfo
+    from barks_reader.core.comic_book_page_info import ComicLayout, PageInfo
+    from barks_reader.core.display_unit import DisplayUnit
+    from barks_reader.core.page_image_source import PageImage
     from barks_reader.core.reader_settings import ReaderSettings
 
     from .font_manager import FontManager
@@ -87,6 +89,43 @@ GOTO_PAGE_BUTTON_CURRENT_PAGE_COLOR = (1, 1, 0, 1)
 COMIC_BOOK_READER_KV_FILE = Path(__file__).with_suffix(".kv")
 
 
+def get_first_page_to_read_index(
+    page_map: OrderedDict[str, PageInfo], page_to_first_goto: str
+) -> int:
+    """Return the page index a comic opened at *page_to_first_goto* starts from."""
+    return 0 if page_to_first_goto == COMIC_BEGIN_PAGE else page_map[page_to_first_goto].page_index
+
+
+def get_image_load_order(
+    page_map: OrderedDict[str, PageInfo], first_page_to_read_index: int
+) -> list[str]:
+    """Determine the optimal order to load images for a smooth user experience."""
+    if first_page_to_read_index == 0:
+        return list(page_map.keys())
+
+    index_to_page_map = {page_info.page_index: page_str for page_str, page_info in page_map.items()}
+    last_page_index = len(page_map) - 1
+
+    # Start with the current page
+    image_load_order = [index_to_page_map[first_page_to_read_index]]
+
+    # Then the previous page (for immediate back navigation).
+    image_load_order.append(index_to_page_map[first_page_to_read_index - 1])
+
+    # Then all subsequent pages.
+    image_load_order.extend(
+        index_to_page_map[page_index]
+        for page_index in range(first_page_to_read_index + 1, last_page_index + 1)
+    )
+
+    # Finally, the rest of the previous pages in reverse order.
+    image_load_order.extend(
+        index_to_page_map[page_index] for page_index in range(first_page_to_read_index - 2, -1, -1)
+    )
+
+    return image_load_order
+
+
 class _ComicPageManager(EventDispatcher):
     """Manages the state and navigation logic for a comic book's pages."""
 
@@ -217,11 +256,7 @@ class _ComicPageManager(EventDispatcher):
             page_info.page_index: page_str for page_str, page_info in page_map.items()
         }
 
-        self._first_page_to_read_index = (
-            0
-            if page_to_first_goto == COMIC_BEGIN_PAGE
-            else self.page_map[page_to_first_goto].page_index
-        )
+        self._first_page_to_read_index = get_first_page_to_read_index(page_map, page_to_first_goto)
 
         self._first_page_index = next(iter(self.page_map.values())).page_index
         self._last_page_index = next(reversed(self.page_map.values())).page_index
@@ -229,54 +264,13 @@ class _ComicPageManager(EventDispatcher):
         assert self._first_page_index == 0
         assert (self._last_page_index + 1) == len(self.page_map)
 
-        self._build_display_units(page_map)
-
-    def _build_display_units(self, page_map: OrderedDict[str, PageInfo]) -> None:
-        """Pre-compute display units for double-page mode from the page map."""
-        pages = list(page_map.values())
-        self._display_units = []
-        self._page_index_to_unit_idx = {}
-
-        i = 0
-        while i < len(pages):
-            if pages[i].is_solo or (i + 1 >= len(pages)) or pages[i + 1].is_solo:
-                unit_idx = len(self._display_units)
-                self._display_units.append(DisplayUnit(i, None))
-                self._page_index_to_unit_idx[i] = unit_idx
-                i += 1
-            else:
-                unit_idx = len(self._display_units)
-                self._display_units.append(DisplayUnit(i, i + 1))
-                self._page_index_to_unit_idx[i] = unit_idx
-                self._page_index_to_unit_idx[i + 1] = unit_idx
-                i += 2
+        # Pre-compute display units for double-page mode from the page map.
+        self._display_units, self._page_index_to_unit_idx = build_display_units(page_map)
 
     def get_image_load_order(self) -> list[str]:
         """Determine the optimal order to load images for a smooth user experience."""
         assert self.page_map is not None
-        if self._first_page_to_read_index == 0:
-            return list(self.page_map.keys())
-
-        # Start with the current page
-        image_load_order = [self._index_to_page_map[self._first_page_to_read_index]]
-
-        # Then the previous page (for immediate back navigation).
-        if self._first_page_to_read_index > 0:
-            image_load_order.append(self._index_to_page_map[self._first_page_to_read_index - 1])
-
-        # Then all subsequent pages.
-        image_load_order.extend(
-            self._index_to_page_map[page_index]
-            for page_index in range(self._first_page_to_read_index + 1, self._last_page_index + 1)
-        )
-
-        # Finally, the rest of the previous pages in reverse order.
-        image_load_order.extend(
-            self._index_to_page_map[page_index]
-            for page_index in range(self._first_page_to_read_index - 2, -1, -1)
-        )
-
-        return image_load_order
+        return get_image_load_order(self.page_map, self._first_page_to_read_index)
 
 
 class ComicBookReader(FloatLayout):
@@ -469,6 +463,7 @@ class ComicBookReader(FloatLayout):
             use_fantagraphics_overrides=use_fantagraphics_overrides,
             max_width=self._comic_book_loader.max_window_width,
             max_height=self._comic_book_loader.max_window_height,
+            rendered_page_cache=self._comic_book_loader.rendered_page_cache,
         )
         archive_desc = str(archive_path)
         self._comic_book_loader.set_comic(
@@ -476,6 +471,10 @@ class ComicBookReader(FloatLayout):
             self._page_manager.get_image_load_order(),
             page_map,
             archive_desc=archive_desc,
+            preload_id=self._get_preload_id(fanta_info, use_fantagraphics_overrides),
+            # Spreads are twice a page's size and share the page cache's budget,
+            # so they are only built while they can be shown.
+            assemble_spreads=self._page_manager.double_page_mode,
         )
 
         self._closed = False
@@ -483,6 +482,53 @@ class ComicBookReader(FloatLayout):
         self._on_comic_is_ready_to_read()
         Clock.schedule_once(lambda _dt: self._show_loading_page(), 0)
 
+    def preload_comic(
+        self,
+        fanta_info: FantaComicBookInfo,
+        use_fantagraphics_overrides: bool,
+        page_to_first_goto: str,
+        prepare_comic: Callable[[], tuple[ComicLayout, ComicBookImageBuilder]],
+    ) -> None:
+        """Speculatively decode the opening pages of a comic likely to be read next.
+
+        *prepare_comic* builds the comic's layout and image builder; it and all
+        decoding run on the loader's low-priority preload thread. If the comic is
+        then opened with :meth:`read_comic`, the decoded pages are reused.
+        """
+
+        def build_source() -> tuple[ArchivePageImageSource, OrderedDict[str, PageInfo], list[str]]:
+            layout, comic_book_image_builder = prepare_comic()
+            page_map = layout.page_map
+            archive_path, fanta_volume_archive = self._comic_book_loader.resolve_archive_for_comic(
+                fanta_info, page_map, detached=True
+            )
+            image_source = ArchivePageImageSource(
+                archive_path=archive_path,
+                fanta_volume_archive=fanta_volume_archive,
+                comic_book_image_builder=comic_book_image_builder,
+                empty_page_image=self._comic_book_loader.empty_page_image,
+                use_fantagraphics_overrides=use_fantagraphics_overrides,
+                max_width=self._comic_book_loader.max_window_width,
+                max_height=self._comic_book_loader.max_window_height,
+                rendered_page_cache=self._comic_book_loader.rendered_page_cache,
+            )
+            first_index = (
+                get_first_page_to_read_index(page_map, page_to_first_goto)
+                if page_to_first_goto in page_map
+                else 0
+            )
+            return image_source, page_map, get_image_load_order(page_map, first_index)
+
+        self._comic_book_loader.preload_comic(
+            self._get_preload_id(fanta_info, use_fantagraphics_overrides), build_source
+        )
+
+    def _get_preload_id(
+        self, fanta_info: FantaComicBookInfo, use_fantagraphics_overrides: bool
+    ) -> str:
+        overrides = "overrides" if use_fantagraphics_overrides else "no-overrides"
+        return f"{self.get_reader_comic_title(fanta_info)} ({overrides})"
+
     @staticmethod
     def get_reader_comic_title(fanta_info: FantaComicBookInfo) -> str:
         if fanta_info.comic_book_info.is_barks_title:
@@ -579,6 +625,9 @@ class ComicBookReader(FloatLayout):
             self._set_cover_action_bar_title(page_str)
 
         left_idx, right_idx = self._get_current_display_indices()
+        # Pin this page's neighborhood in the loader's page cache before checking
+        # readiness, so a page seen as loaded cannot be evicted before it is drawn.
+        self._comic_book_loader.set_current_page(left_idx)
 
         if self._pages_ready(left_idx, right_idx):
             self._render_page(left_idx, right_idx)
@@ -608,9 +657,11 @@ class ComicBookReader(FloatLayout):
         return [idx for idx in (left_page_index, right_page_index) if idx is not None]
 
     def _pages_ready(self, left_page_index: int, right_page_index: int | None) -> bool:
-        """Return whether every page needed to display is loaded (non-blocking)."""
-        if self._all_loaded:
-            return True
+        """Return whether every page needed to display is loaded (non-blocking).
+
+        Checked per page even once the whole comic has loaded: the loader's page
+        cache may since have evicted a page the user is now paging back to.
+        """
         return all(
             self._comic_book_loader.wait_load_event(idx, 0)
             for idx in self._needed_indices(left_page_index, right_page_index)
@@ -668,22 +719,18 @@ class ComicBookReader(FloatLayout):
 
         # noinspection PyBroadException
         try:
-            # Kivy Image widget can load from BytesIO
             self._comic_image.texture = None  # Clear previous texture
             self._comic_image.source = ""  # Clear previous source
             self._comic_image.reload()  # Ensure reload if source was same BytesIO object
 
             if right_page_index is not None:
-                image_stream, image_ext = (
-                    self._comic_book_loader.get_double_page_image_ready_for_reading(
-                        left_page_index, right_page_index
-                    )
+                page_image = self._comic_book_loader.get_double_page_image_ready_for_reading(
+                    left_page_index, right_page_index
                 )
             else:
-                image_stream, image_ext = self._comic_book_loader.get_image_ready_for_reading(
-                    left_page_index
-                )
-            self._comic_image.texture = CoreImage(image_stream, ext=image_ext).texture
+                page_image = self._comic_book_loader.get_image_ready_for_reading(left_page_index)
+            # The loader delivers raw pixels, so this is a straight upload - no decode.
+            self._comic_image.texture = get_page_texture(page_image)
         except Exception:  # noqa: BLE001
             logger.exception(f"Error displaying image with index {self._current_page_index}: ")
             # Optionally display a placeholder image or error message
@@ -731,6 +778,7 @@ class ComicBookReader(FloatLayout):
             # The collections are always single-page - ignore the toggle.
             return
         self._page_manager.double_page_mode = not self._page_manager.double_page_mode
+        self._comic_book_loader.set_assemble_spreads(self._page_manager.double_page_mode)
         self._show_page(None, None)
 
     def goto_page(self) -> None:
@@ -1195,3 +1243,11 @@ def get_image_stream(file: PanelPath) -> Texture:
     image_stream = io.BytesIO(zip_bytes)
     image_stream.seek(0)
     return CoreImage(image_stream, ext=PNG_EXT_FOR_KIVY).texture
+
+
+def get_page_texture(page_image: PageImage) -> Texture:
+    """Upload a loader-decoded page buffer straight into a new texture."""
+    texture = Texture.create(size=page_image.size, colorfmt=page_image.colorfmt)
+    texture.blit_buffer(page_image.pixels, colorfmt=page_image.colorfmt, bufferfmt="ubyte")
+    texture.flip_vertical()
+    return texture
@@ -64,6 +64,10 @@ class EntityIndexScreen(SpeechIndexScreen):
     def _find_words(self, index_terms: str) -> TitleDict:
         return self._search.find_entities(self._entity_type, index_terms)
 
+    @override
+    def _find_background_titles(self, index_terms: str) -> list[str]:
+        return list(self._find_words(index_terms))
+
     # --- Skip the prefix layer: go straight from alphabet to items grid ---
 
     @override
@@ -120,6 +120,7 @@ class MainScreen(ReaderScreen, DropdownNavMixin, ActionBarNavMixin):
         components = build_main_screen_components(self, window_manager)
         self._random_title_images = components.random_title_images
         self._json_settings_manager = components.json_settings_manager
+        self._reading_history_store = components.reading_history_store
         self._special_fanta_overrides = components.special_fanta_overrides
         self._comic_reader_manager = components.comic_reader_manager
         self._window_helper = components.window_helper
@@ -355,6 +356,9 @@ class MainScreen(ReaderScreen, DropdownNavMixin, ActionBarNavMixin):
                 self._tree_view_screen.get_selected_node()
             )
 
+        # Reading history is written on a timer; write what is still queued.
+        self._reading_history_store.close()
+
         # TODO: Still need a stale check?
         # This is not a bad place to give a warning if there is stale cpi data.
         # It's not easy to do near the start of the app because of cpi module load times.
@@ -54,6 +54,7 @@ class MainScreenComponents:
 
     random_title_images: ImageSelector
     json_settings_manager: SettingsManager
+    reading_history_store: ReadingHistoryStore
     special_fanta_overrides: SpecialFantaOverrides
     comic_reader_manager: ComicReaderManager
     window_helper: MainScreenWindowHelper
@@ -188,6 +189,7 @@ def build_main_screen_components(
     return MainScreenComponents(
         random_title_images=random_title_images,
         json_settings_manager=json_settings_manager,
+        reading_history_store=reading_history_store,
         special_fanta_overrides=special_fanta_overrides,
         comic_reader_manager=comic_reader_manager,
         window_helper=window_helper,
@@ -22,7 +22,9 @@ from barks_fantagraphics.comic_book_info import (
 from barks_fantagraphics.comics_database import TitleNotFoundError
 from barks_fantagraphics.fanta_comics_info import (
     ALL_FANTA_COMIC_BOOK_INFO,
+    SERIES_COVERS,
     SERIES_EXTRAS,
+    SERIES_ONE_PAGERS,
     FantaComicBookInfo,
     get_fanta_info,
 )
@@ -44,6 +46,8 @@ from barks_reader.core.reader_tree_view_utils import find_tree_view_title_node
 from barks_reader.core.user_error_types import ErrorInfo, ErrorTypes, TitleNotInFantaInfoError
 from barks_reader.core.wiki_integration import wiki_page_for_title
 
+from .tree_view_nodes import TitleTreeViewNode
+
 if TYPE_CHECKING:
     from collections.abc import Callable
     from pathlib import Path
@@ -66,6 +70,10 @@ if TYPE_CHECKING:
     from .view_renderer import ViewRenderer
 
 
+# Series whose titles are not read one after another as standalone comics.
+_SERIES_NOT_PRELOADED = {SERIES_ONE_PAGERS, SERIES_COVERS, SERIES_EXTRAS}
+
+
 @dataclass(frozen=True, slots=True)
 class TitleTarget:
     """Immutable description of a title navigation target.
@@ -372,8 +380,94 @@ class NavigationCoordinator:
             self._get_page_to_first_goto(),
             self._bottom_title_view_screen.use_overrides_active,
         )
+        self._preload_next_comic(title)
         return True
 
+    def _preload_next_comic(self, title: Titles) -> None:
+        """Preload the comic most likely to be read after *title*.
+
+        That is the next comic in the tree's title list *title* was picked from
+        (a year, series, tag or other filtered list) or, if it wasn't picked from
+        one, the next title, chronologically, in the same series - opened at its
+        last-read page, exactly as ``read_comic`` would open it.
+        """
+        title_list = self._get_selected_title_list(title)
+        next_fanta_info = (
+            self._get_next_title_in_series(title)
+            if title_list is None
+            else self._get_next_comic_in_list(title, title_list)
+        )
+        if next_fanta_info is None:
+            return
+
+        next_title = next_fanta_info.comic_book_info.title
+        next_title_str = next_fanta_info.comic_book_info.get_title_str()
+        use_overrides = self._reader_settings.use_prebuilt_archives or (
+            not self._special_fanta_overrides.is_title_where_overrides_are_optional(next_title)
+            or self._special_fanta_overrides.get_overrides_setting(next_title)
+        )
+        overrides_intro_inset_file = self._special_fanta_overrides.get_inset_file(
+            next_title, use_overrides
+        )
+        last_read_page = self._comic_reader_manager.get_last_read_page(next_title_str)
+
+        self._comic_reader_manager.preload_barks_comic_book(
+            next_fanta_info,
+            lambda: self._comics_database.get_comic_book(
+                next_title_str, overrides_intro_inset_file
+            ),
+            last_read_page.display_page_num if last_read_page else COMIC_BEGIN_PAGE,
+            use_overrides,
+        )
+
+    def _get_selected_title_list(self, title: Titles) -> list[FantaComicBookInfo] | None:
+        """Return the titles listed beside *title*'s selected tree row, if it is selected."""
+        selected = self._tree_view_screen.get_selected_node()
+        if not isinstance(selected, TitleTreeViewNode) or selected.get_title() != title:
+            return None
+        parent = selected.parent_node
+        if parent is None:
+            return None
+        return [node.fanta_info for node in parent.nodes if isinstance(node, TitleTreeViewNode)]
+
+    @staticmethod
+    def _get_next_title_in_series(title: Titles) -> FantaComicBookInfo | None:
+        fanta_info = ALL_FANTA_COMIC_BOOK_INFO.get(title)
+        if fanta_info is None or fanta_info.series_name in _SERIES_NOT_PRELOADED:
+            return None
+
+        titles = list(ALL_FANTA_COMIC_BOOK_INFO)
+        for next_title in titles[titles.index(title) + 1 :]:
+            next_fanta_info = ALL_FANTA_COMIC_BOOK_INFO[next_title]
+            if (
+                next_fanta_info.series_name == fanta_info.series_name
+                and next_title not in NON_COMIC_TITLES
+            ):
+                return next_fanta_info
+
+        return None
+
+    @staticmethod
+    def _get_next_comic_in_list(
+        title: Titles, title_list: list[FantaComicBookInfo]
+    ) -> FantaComicBookInfo | None:
+        """Return the first standalone comic after *title* in *title_list*, if any."""
+        titles = [info.comic_book_info.title for info in title_list]
+        if title not in titles:
+            return None
+
+        for next_fanta_info in title_list[titles.index(title) + 1 :]:
+            next_title = next_fanta_info.comic_book_info.title
+            if (
+                next_fanta_info.series_name not in _SERIES_NOT_PRELOADED
+                and next_title not in NON_COMIC_TITLES
+                and next_title not in ONE_PAGERS
+                and next_title not in COVERS_SET
+            ):
+                return next_fanta_info
+
+        return None
+
     def _read_title_in_collection(
         self, title: Titles, collection: Titles, page_num: int | None
     ) -> bool:
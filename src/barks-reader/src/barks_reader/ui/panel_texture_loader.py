@@ -2,8 +2,8 @@ from collections.abc import Callable
 
 from comic_utils.comic_consts import PanelPath
 from kivy.core.image import Texture
-from PIL import Image
 
+from barks_reader.core.page_image_source import PageImage
 from barks_reader.core.panel_image_loader import PanelImageLoader
 
 from .adapters import KivyClockScheduler
@@ -12,7 +12,7 @@ type TextureLoaderCallback = Callable[[Texture | None, Exception | None], None]
 
 
 class PanelTextureLoader:
-    """Load a texture in a background thread.
+    """Load a texture on a background worker.
 
       From either:
 
@@ -20,7 +20,7 @@ class PanelTextureLoader:
       - PanelPath = zipfile.Path
 
     Composes a :class:`PanelImageLoader` for the off-UI read/decode work, and
-    uploads the resulting PIL image to a Kivy texture on the UI thread.
+    uploads the resulting pixel buffer to a Kivy texture on the UI thread.
     """
 
     def __init__(self, pil_loader: PanelImageLoader | None = None) -> None:
@@ -32,20 +32,20 @@ class PanelTextureLoader:
         self._pil_loader.cancel()
 
     def load_texture(self, panel_path: PanelPath, callback: TextureLoaderCallback) -> None:
-        def pil_callback(img: Image.Image | None, err: Exception | None) -> None:
+        def image_callback(image: PageImage | None, err: Exception | None) -> None:
             if err is not None:
                 callback(None, err)
                 return
 
-            assert img is not None
-            callback(self._pil_to_texture(img), None)
+            assert image is not None
+            callback(self._image_to_texture(image), None)
 
-        self._pil_loader.load_pil(panel_path, pil_callback)
+        self._pil_loader.load_pixels(panel_path, image_callback)
 
     @staticmethod
-    def _pil_to_texture(pil: Image.Image) -> Texture:
-        tex = Texture.create(size=pil.size)
-        tex.blit_buffer(pil.tobytes(), colorfmt="rgba", bufferfmt="ubyte")
+    def _image_to_texture(image: PageImage) -> Texture:
+        tex = Texture.create(size=image.size, colorfmt=image.colorfmt)
+        tex.blit_buffer(image.pixels, colorfmt=image.colorfmt, bufferfmt="ubyte")
         tex.flip_vertical()
 
         return tex
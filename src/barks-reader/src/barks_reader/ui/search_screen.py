@@ -46,9 +46,10 @@ from .reader_keyboard_nav import (
 from .touch_keyboard import TouchAwareTextInput  # noqa: F401  # used in .kv
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator
 
-    from barks_fantagraphics.whoosh_search_engine import TitleInfo
+    from barks_fantagraphics.whoosh_search_engine import TitleDict, TitleInfo
+    from kivy.clock import ClockEvent
     from kivy.uix.scrollview import ScrollView
 
     from barks_reader.core.reader_colors import Color
@@ -195,7 +196,9 @@ class SearchScreen(FloatLayout):
 
         # Word search state
         self._word_search_results: list[tuple[str, str, str, TitleInfo]] = []
-        self._word_terms = self._search.get_alpha_split_terms()
+        self._word_search_pages: Iterator[TitleDict] | None = None
+        self._word_search_pages_event: ClockEvent | None = None
+        self._word_vocabulary = self._search.get_word_vocabulary()
         self._selected_word: str = ""
 
         # Last activated result (for restoring focus after go-back)
@@ -419,6 +422,7 @@ class SearchScreen(FloatLayout):
     # --- Word Search ---
 
     def on_word_search_text(self, text: str) -> None:
+        self._cancel_word_search_pages()
         self.ids.word_chips_layout.clear_widgets()
         self.ids.word_results_layout.clear_widgets()
         self._word_search_results = []
@@ -437,19 +441,7 @@ class SearchScreen(FloatLayout):
             self._on_word_chip_selected(words[0])
 
     def _get_words_matching_prefix(self, text: str) -> list[str]:
-        query = text.lower()
-        first_char = query[0]
-        letter_group = self._word_terms.get(first_char, {})
-
-        min_prefix_len = 2
-        if len(query) >= min_prefix_len:
-            candidates = letter_group.get(query[:min_prefix_len], [])
-        else:
-            candidates = [w for group in letter_group.values() for w in group]
-
-        matching = [w for w in candidates if w.lower().startswith(query)]
-        matching.sort()
-        return matching
+        return sorted(self._word_vocabulary.with_prefix(text))
 
     def _on_word_chip_selected(self, word: str) -> None:
         logger.info(f'Word search: selected chip "{word}".')
@@ -461,23 +453,53 @@ class SearchScreen(FloatLayout):
             else:
                 btn.background_color = _row_stripe(btn.row_index)
 
-        found = self._search.find_words(word)
-
-        results_layout: BoxLayout = self.ids.word_results_layout
-        results_layout.clear_widgets()
+        # Show the best hits straight away, then pull the rest a page per frame and
+        # show them all together, so the rows don't shift under the user page by page.
+        self._cancel_word_search_pages()
+        word_search_pages = self._search.iter_word_search_titles(word)
+        found = next(word_search_pages, None)
 
-        self._word_search_results = self._build_word_results(found)
-        self._populate_word_results_layout(results_layout)
-
-        if not found:
+        if found is None:
+            results_layout: BoxLayout = self.ids.word_results_layout
+            results_layout.clear_widgets()
+            self._word_search_results = []
             results_layout.add_widget(
                 _SearchResultButton(text=f'No results for "{word}"', disabled=True)
             )
             return
 
+        self._show_word_results(found)
+
         word_result_titles = [STR_TITLE_TO_ENUM[ct] for ct in found if ct in STR_TITLE_TO_ENUM]
         self._update_background_from_results(word_result_titles)
 
+        self._word_search_pages = word_search_pages
+        self._word_search_pages_event = Clock.schedule_interval(
+            lambda _dt: self._pull_word_search_page(found), 0
+        )
+
+    def _pull_word_search_page(self, found: TitleDict) -> bool:
+        assert self._word_search_pages is not None
+        if next(self._word_search_pages, None) is not None:
+            return True
+
+        self._cancel_word_search_pages()
+        self._show_word_results(found)
+        return False
+
+    def _cancel_word_search_pages(self) -> None:
+        if self._word_search_pages_event:
+            self._word_search_pages_event.cancel()
+            self._word_search_pages_event = None
+        self._word_search_pages = None
+
+    def _show_word_results(self, found: TitleDict) -> None:
+        results_layout: BoxLayout = self.ids.word_results_layout
+        results_layout.clear_widgets()
+
+        self._word_search_results = self._build_word_results(found)
+        self._populate_word_results_layout(results_layout)
+
     @staticmethod
     def _build_word_results(found: dict[str, TitleInfo]) -> list[tuple[str, str, str, TitleInfo]]:
         results: list[tuple[str, str, str, TitleInfo]] = []
@@ -563,6 +585,7 @@ class SearchScreen(FloatLayout):
 
     def on_word_clear(self) -> None:
         self._cancel_image_change_event()
+        self._cancel_word_search_pages()
         self.ids.word_search_input.text = ""
         self.ids.word_chips_layout.clear_widgets()
         self.ids.word_results_layout.clear_widgets()
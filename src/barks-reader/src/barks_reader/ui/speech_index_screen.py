@@ -137,7 +137,7 @@ class SpeechIndexScreen(IndexScreen):
         self._texture_loader = PanelTextureLoader()
         self._found_words_cache: dict[IndexItem, TitleDict] = {}
         # Separate cache for background image word searches — never used for click results.
-        self._background_words_cache: dict[str, TitleDict] = {}
+        self._background_titles_cache: dict[str, list[str]] = {}
 
         # Map from base word (lowercase) → sorted list of (EntityType, canonical) pairs.
         # Built from CONTEXT_SENSITIVE_WORDS so ambiguous words expand into typed index entries.
@@ -164,7 +164,15 @@ class SpeechIndexScreen(IndexScreen):
         )
 
     def _find_words(self, index_terms: str) -> TitleDict:
-        return self._search.find_words(index_terms)
+        # Every hit, rather than the first 1000 that find_words stops at.
+        found: TitleDict = {}
+        for found_so_far in self._search.iter_word_search_titles(index_terms):
+            found = found_so_far
+        return found
+
+    def _find_background_titles(self, index_terms: str) -> list[str]:
+        # The titles with the best hits are plenty to pick a background image from.
+        return list(next(self._search.iter_word_search_titles(index_terms), {}))
 
     def _populate_index_for_letter(self, first_letter: str) -> None:
         self._populate_top_alphabet_split_menu(first_letter)
@@ -438,9 +446,9 @@ class SpeechIndexScreen(IndexScreen):
         rand_item = random.choice(index_terms)
         rand_id = str(rand_item.id)
 
-        if rand_id not in self._background_words_cache:
-            self._background_words_cache[rand_id] = self._find_words(rand_id)
-        found = self._background_words_cache[rand_id]
+        if rand_id not in self._background_titles_cache:
+            self._background_titles_cache[rand_id] = self._find_background_titles(rand_id)
+        found = self._background_titles_cache[rand_id]
 
         found_titles = [
             ALL_FANTA_COMIC_BOOK_INFO[STR_TITLE_TO_ENUM[title_str]] for title_str in found
@@ -19,6 +19,7 @@ from kivy.clock import Clock
 from kivy.core.window import Window
 from loguru import logger
 from okf_reader.core.actions import PageAction
+from okf_reader.core.search import FullTextSearcher
 from okf_reader.ui.viewer import OKFViewer
 
 from barks_reader.core.reader_utils import get_win_dimensions
@@ -26,6 +27,7 @@ from barks_reader.core.wiki_integration import (
     BarksPanelsImageProvider,
     BarksTableRewriter,
     tree_navigable_title,
+    wiki_search_index_path,
     wiki_session_path,
     wiki_theme_spec,
     wiki_top_bar_spec,
@@ -255,12 +257,21 @@ class WikiReaderScreen(ReaderScreen):
     def save_session(self) -> None:
         """Persist the reading position (a no-op before the first open).
 
-        Besides `close`, the app calls this from its stop hook, so quitting
-        while the wiki screen is open doesn't lose the resume point.
+        Called by `close`, and by `app_closing` so quitting while the wiki
+        screen is open doesn't lose the resume point.
         """
         if self._viewer is not None:
             self._viewer.save_session()
 
+    def app_closing(self) -> None:
+        """Save the reading position and stop the viewer's worker threads.
+
+        The app calls this from its stop hook; the screen isn't opened again.
+        """
+        self.save_session()
+        if self._viewer is not None:
+            self._viewer.close()
+
     def _goto_title(self, title: Titles) -> None:
         # Land the user on the main screen with the title selected in the tree
         # and shown in the bottom title view — the reading controls live there.
@@ -271,6 +282,7 @@ class WikiReaderScreen(ReaderScreen):
         logger.info(f'Building wiki viewer for bundle "{bundle}".')
         if self._viewer is not None:
             self._viewer.save_session()  # the outgoing bundle's position survives
+            self._viewer.close()
             self.remove_widget(self._viewer)
         # The shared bar builder; on_close leaves this screen instead of
         # stopping the app. The title markup bakes in the current font size
@@ -290,6 +302,9 @@ class WikiReaderScreen(ReaderScreen):
             theme=wiki_theme_spec(),
             state_path=wiki_session_path(self._app_data_dir, bundle),
             on_exit=self.close,
+            search_provider=FullTextSearcher(
+                bundle, wiki_search_index_path(self._app_data_dir, bundle)
+            ),
         )
         self._bundle = bundle
         self.add_widget(self._viewer)
@@ -0,0 +1,81 @@
+# ruff: noqa: INP001
+
+"""Cost of getting the ``ComicBook`` of every story title.
+
+* Parse per call: each title is looked up as an issue title twice, and its ini
+  file parsed twice with ``ConfigParser`` (how ``get_comic_book`` used to work).
+* Cold index: a new ``ComicsDatabase`` without a story index file looks each
+  title up once, and parses each ini file once.
+* Warm index: a new ``ComicsDatabase`` reads the ini files' sections from an
+  up-to-date story index file, so no ini file is parsed.
+* Memo: the same ``ComicsDatabase`` walks the titles again.
+"""
+
+from __future__ import annotations
+
+from configparser import ConfigParser, ExtendedInterpolation
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_fantagraphics.comic_book_info import get_filename_from_title_str
+from barks_fantagraphics.comics_database import ComicsDatabase, _build_comic_book
+from barks_fantagraphics.fanta_comics_info import FANTA_SOURCE_COMICS
+from barks_fantagraphics.story_index import StoryIni
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from barks_fantagraphics.comic_book import ComicBook
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+
+def _get_comic_book_parsing_ini(db: ComicsDatabase, story_title: str) -> ComicBook:
+    db.get_story_title_from_issue(story_title)
+    db.is_story_title(story_title)
+    ini_file = db.get_story_titles_dir() / get_filename_from_title_str(story_title, ".ini")
+    for _ in range(2):
+        config = ConfigParser(interpolation=ExtendedInterpolation())
+        config.read(ini_file)
+    story_ini = StoryIni(info=dict(config["info"]), pages=dict(config["pages"]))
+    fanta_book = FANTA_SOURCE_COMICS[story_ini.info["source_comic"]]
+
+    return _build_comic_book(
+        story_title=story_title,
+        ini_file=ini_file,
+        story_ini=story_ini,
+        fanta_info=db.get_fanta_comic_book_info(story_title),
+        fanta_book=fanta_book,
+        intro_inset_file=db._get_inset_file(ini_file),  # noqa: SLF001
+        comic_book_dirs=db._get_comic_book_dirs(fanta_book),  # noqa: SLF001
+        for_building_comics=False,
+    )
+
+
+@pytest.mark.parametrize("walk", ["parse_per_call", "cold_index", "warm_index", "memo"])
+def test_comics_database_walk_benchmark(
+    benchmark: BenchmarkFixture, tmp_path: Path, walk: str
+) -> None:
+    story_index_path = tmp_path / "story-titles-index.json"
+    memo_db = ComicsDatabase(for_building_comics=False, story_index_path=story_index_path)
+    titles = memo_db.get_all_story_titles()
+    for title in titles:
+        memo_db.get_comic_book(title)
+
+    def walk_titles() -> None:
+        if walk == "parse_per_call":
+            db = ComicsDatabase(for_building_comics=False)
+            for title in titles:
+                _get_comic_book_parsing_ini(db, title)
+            return
+
+        if walk == "memo":
+            db = memo_db
+        elif walk == "cold_index":
+            db = ComicsDatabase(for_building_comics=False)
+        else:
+            db = ComicsDatabase(for_building_comics=False, story_index_path=story_index_path)
+        for title in titles:
+            db.get_comic_book(title)
+
+    benchmark.extra_info["titles"] = len(titles)
+    benchmark.pedantic(walk_titles, rounds=5, iterations=1, warmup_rounds=1)
@@ -0,0 +1,102 @@
+# ruff: noqa: INP001
+
+"""Per-page cost of building a Fantagraphics page at display size.
+
+* Two-pass: ``get_dest_page_image`` crops and resizes the panels to the full
+  2120x3200 dest page, which is then shrunk again to fit the display.
+* Fused: ``get_display_page_image`` lays the page out at display size, so the
+  source panels are resampled only once.
+* Full vs reduced decode: the fused build including the JPEG decode, either at
+  full size or at the reduced scale from ``get_srce_min_decode_scale``.
+
+All build the benchmark test image into a 1920x1080 display.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from barks_build_comic_images.build_comic_images import ComicBookImageBuilder
+from barks_fantagraphics.comics_consts import DEST_TARGET_HEIGHT, DEST_TARGET_WIDTH, PageType
+from barks_fantagraphics.page_classes import CleanPage, RequiredDimensions
+from barks_fantagraphics.panel_geometry import BoundingBox
+from comic_utils.pil_image_utils import load_pil_image_from_bytes
+from PIL import Image, ImageOps
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+TEST_COMIC_PAGE_FILE = Path(__file__).parent / "comic-book-load-test-image.jpg"
+
+MAX_WIDTH = 1920
+MAX_HEIGHT = 1080
+
+
+@pytest.fixture
+def builder(tmp_path: Path) -> ComicBookImageBuilder:
+    empty_page_file = tmp_path / "empty_page.png"
+    Image.new("RGB", (DEST_TARGET_WIDTH, DEST_TARGET_HEIGHT), (250, 246, 235)).save(empty_page_file)
+    builder = ComicBookImageBuilder(MagicMock(), empty_page_file, allow_reduced_decode=True)
+    builder.set_required_dim(RequiredDimensions(page_num_y_bottom=90))
+    return builder
+
+
+@pytest.fixture
+def srce_image() -> Image.Image:
+    with Image.open(TEST_COMIC_PAGE_FILE) as image:
+        return image.convert("RGB")
+
+
+def _make_pages(srce_image: Image.Image) -> tuple[CleanPage, CleanPage]:
+    srce_page = CleanPage("srce.jpg", PageType.BODY, page_num=5)
+    srce_page.panels_bbox = BoundingBox(0, 0, srce_image.width - 1, srce_image.height - 1)
+    dest_page = CleanPage("dest.jpg", PageType.BODY, page_num=7)
+    dest_page.panels_bbox = BoundingBox(100, 157, 2019, 3021)
+    return srce_page, dest_page
+
+
+def test_two_pass_build_benchmark(
+    benchmark: BenchmarkFixture, builder: ComicBookImageBuilder, srce_image: Image.Image
+) -> None:
+    pages = _make_pages(srce_image)
+
+    def build() -> None:
+        dest_image = builder.get_dest_page_image(srce_image, *pages)
+        ImageOps.contain(dest_image, (MAX_WIDTH, MAX_HEIGHT), Image.Resampling.LANCZOS)
+
+    benchmark.pedantic(build, rounds=5, iterations=1, warmup_rounds=1)
+
+
+def test_fused_build_benchmark(
+    benchmark: BenchmarkFixture, builder: ComicBookImageBuilder, srce_image: Image.Image
+) -> None:
+    pages = _make_pages(srce_image)
+
+    def build() -> None:
+        builder.get_display_page_image(srce_image, *pages, MAX_WIDTH, MAX_HEIGHT)
+
+    benchmark.pedantic(build, rounds=5, iterations=1, warmup_rounds=1)
+
+
+@pytest.mark.parametrize("reduced", [False, True], ids=["full", "reduced"])
+def test_decode_and_build_benchmark(
+    benchmark: BenchmarkFixture,
+    builder: ComicBookImageBuilder,
+    srce_image: Image.Image,
+    reduced: bool,
+) -> None:
+    jpg_bytes = TEST_COMIC_PAGE_FILE.read_bytes()
+    pages = _make_pages(srce_image)
+    min_decode_scale = (
+        builder.get_srce_min_decode_scale(*pages, MAX_WIDTH, MAX_HEIGHT) if reduced else 1.0
+    )
+
+    def decode_and_build() -> None:
+        image = load_pil_image_from_bytes(jpg_bytes, ".jpg", min_decode_scale)
+        builder.get_display_page_image(image, *pages, MAX_WIDTH, MAX_HEIGHT)
+
+    benchmark.extra_info["min_decode_scale"] = min_decode_scale
+    benchmark.pedantic(decode_and_build, rounds=5, iterations=1, warmup_rounds=1)
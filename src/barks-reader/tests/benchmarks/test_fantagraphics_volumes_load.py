@@ -0,0 +1,82 @@
+# ruff: noqa: INP001
+
+"""Cold versus warm ``FantagraphicsVolumeArchives.load()``.
+
+* Cold: no manifest, so every volume zip and override zip is opened, its member
+  names sorted and validated, and the page maps derived.
+* Warm: a manifest from a previous load is up to date, so only the archives are
+  stat'ed and the page maps are read back from it.
+
+Both run against a fixture tree with one synthetic zip per Fantagraphics volume.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_fantagraphics.fanta_comics_info import NUM_VOLUMES
+from barks_reader.core.fantagraphics_volumes import FantagraphicsVolumeArchives
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+PAGES_PER_VOLUME = 250
+OVERRIDES_PER_VOLUME = 10
+
+
+@pytest.fixture(scope="module")
+def volumes_tree(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    root = tmp_path_factory.mktemp("fanta")
+    archive_root = root / "archive"
+    override_root = root / "override"
+    archive_root.mkdir()
+    override_root.mkdir()
+
+    for vol in range(1, NUM_VOLUMES + 1):
+        with zipfile.ZipFile(archive_root / f"{vol:02d} - Volume {vol}.cbz", "w") as zf:
+            for page in range(1, PAGES_PER_VOLUME + 1):
+                zf.writestr(f"images/page{page:03d}.jpg", b"")
+        with zipfile.ZipFile(override_root / f"{vol:02d}-overrides.cbz", "w") as zf:
+            for page in range(1, OVERRIDES_PER_VOLUME + 1):
+                zf.writestr(f"{page * 10:03d}.png", b"")
+
+    return archive_root, override_root
+
+
+def _make_archives(volumes_tree: tuple[Path, Path], manifest: Path) -> FantagraphicsVolumeArchives:
+    archive_root, override_root = volumes_tree
+    return FantagraphicsVolumeArchives(
+        archive_root, override_root, list(range(1, NUM_VOLUMES + 1)), manifest_path=manifest
+    )
+
+
+def test_load_cold_benchmark(
+    benchmark: BenchmarkFixture, volumes_tree: tuple[Path, Path], tmp_path: Path
+) -> None:
+    manifest = tmp_path / "manifest.json"
+
+    def load_cold() -> None:
+        manifest.unlink(missing_ok=True)
+        _make_archives(volumes_tree, manifest).load()
+
+    benchmark.extra_info["volumes"] = NUM_VOLUMES
+    benchmark.pedantic(load_cold, rounds=5, iterations=1)
+
+
+def test_load_warm_benchmark(
+    benchmark: BenchmarkFixture, volumes_tree: tuple[Path, Path], tmp_path: Path
+) -> None:
+    manifest = tmp_path / "manifest.json"
+    _make_archives(volumes_tree, manifest).load()
+
+    def load_warm() -> None:
+        archives = _make_archives(volumes_tree, manifest)
+        archives.load()
+        assert archives.num_volumes_scanned == 0
+
+    benchmark.extra_info["volumes"] = NUM_VOLUMES
+    benchmark.pedantic(load_warm, rounds=5, iterations=1)
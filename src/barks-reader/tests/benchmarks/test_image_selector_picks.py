@@ -0,0 +1,179 @@
+# ruff: noqa: INP001
+
+"""Cost of 1,000 random title-image picks with adaptive fit modes.
+
+* Full decode: each pick decodes the whole image to learn its size (how
+  ``get_image_size`` used to work).
+* Header read: each pick reads the image header of a filesystem panel.
+* Index: each pick looks the size up in the panels zip's dimensions index.
+
+The panels are 60 noisy 1200x900 JPEGs spread over 20 titles.
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import zipfile
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from barks_fantagraphics.barks_titles import Titles
+from barks_reader.core import image_selector as is_module
+from barks_reader.core.image_selector import ImageSelector
+from barks_reader.core.panel_dimensions_index import (
+    get_panel_dimensions_index_file,
+    load_panel_dimensions_index,
+    write_panel_dimensions_index,
+)
+from barks_reader.core.reader_file_paths import FileTypes
+from comic_utils.pil_image_utils import load_pil_image_for_reading
+from PIL import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from barks_reader.core.panel_dimensions_index import PanelDimensions, PanelDimensionsIndex
+    from comic_utils.comic_consts import PanelPath
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_PICKS = 1000
+NUM_TITLES = 20
+IMAGES_PER_TITLE = 3
+IMAGE_SIZE = (1200, 900)
+
+_TITLES = list(Titles)[:NUM_TITLES]
+
+
+class SplashResolver:
+    """Serves each title's splash images, and their sizes from an optional index."""
+
+    def __init__(
+        self,
+        title_files: dict[str, list[PanelPath]],
+        dimensions_index: PanelDimensionsIndex | None = None,
+    ) -> None:
+        self._title_files = title_files
+        self._dimensions_index = dimensions_index
+
+    def resolve(
+        self, title_str: str, category: FileTypes, prefer_edited: bool
+    ) -> list[tuple[PanelPath, bool]]:
+        if category != FileTypes.SPLASH or prefer_edited:
+            return []
+        return [(f, False) for f in self._title_files.get(title_str, [])]
+
+    def get_panel_dimensions(self, image_file: PanelPath) -> PanelDimensions | None:
+        if self._dimensions_index is None:
+            return None
+        return self._dimensions_index.get(image_file)
+
+    def get_nontitle_files(self) -> list[PanelPath]:
+        return []
+
+    @staticmethod
+    def get_file_ext() -> str:
+        return ".jpg"
+
+
+def _title_str(title: Titles) -> str:
+    return f"Title {title.value}"
+
+
+@pytest.fixture(scope="module")
+def panels_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    panels_dir = tmp_path_factory.mktemp("Barks Panels")
+    image = Image.effect_noise(IMAGE_SIZE, 64).convert("RGB")
+    for title in _TITLES:
+        (panels_dir / _title_str(title)).mkdir()
+        for i in range(IMAGES_PER_TITLE):
+            image.save(panels_dir / _title_str(title) / f"{i:03d}.jpg", quality=90)
+    return panels_dir
+
+
+@pytest.fixture(scope="module")
+def panels_zip(panels_dir: Path) -> Generator[zipfile.ZipFile]:
+    zip_file = panels_dir.parent / "Barks Panels.zip"
+    with zipfile.ZipFile(zip_file, "w") as archive:
+        for image_file in sorted(panels_dir.rglob("*.jpg")):
+            archive.write(image_file, image_file.relative_to(panels_dir).as_posix())
+
+    def read_image_size(zf: zipfile.ZipFile, info: zipfile.ZipInfo) -> tuple[int, int]:
+        with Image.open(io.BytesIO(zf.read(info))) as image:
+            return image.size
+
+    with zipfile.ZipFile(zip_file) as archive:
+        write_panel_dimensions_index(
+            get_panel_dimensions_index_file(zip_file), archive, read_image_size
+        )
+        yield archive
+
+
+def _make_selector(resolver: SplashResolver, tmp_path: Path) -> ImageSelector:
+    reader_settings = MagicMock()
+    reader_settings.sys_file_paths.get_reader_icon_files_dir.return_value = tmp_path
+    reader_settings.get_app_settings_path.return_value = tmp_path / "barks-reader.ini"
+    with patch.object(ImageSelector, "_get_censored_images", return_value=[]):
+        return ImageSelector(resolver, reader_settings)  # ty: ignore[invalid-argument-type]
+
+
+def _make_title_list() -> list[MagicMock]:
+    title_list = []
+    for title in _TITLES:
+        title_info = MagicMock()
+        title_info.comic_book_info.title = title
+        title_info.comic_book_info.get_title_str.return_value = _title_str(title)
+        title_list.append(title_info)
+    return title_list
+
+
+@pytest.mark.parametrize("size_source", ["full_decode", "header_read", "index"])
+def test_random_title_image_picks_benchmark(
+    benchmark: BenchmarkFixture,
+    panels_dir: Path,
+    panels_zip: zipfile.ZipFile,
+    tmp_path: Path,
+    size_source: str,
+) -> None:
+    title_files: dict[str, list[PanelPath]]
+    if size_source == "index":
+        root = zipfile.Path(panels_zip)
+        title_files = {
+            _title_str(t): [root / _title_str(t) / f"{i:03d}.jpg" for i in range(IMAGES_PER_TITLE)]
+            for t in _TITLES
+        }
+        dimensions_index = load_panel_dimensions_index(
+            panels_zip, get_panel_dimensions_index_file(panels_dir.parent / "Barks Panels.zip")
+        )
+        assert len(dimensions_index) == NUM_TITLES * IMAGES_PER_TITLE
+        resolver = SplashResolver(title_files, dimensions_index)
+    else:
+        title_files = {
+            _title_str(t): [*sorted((panels_dir / _title_str(t)).iterdir())] for t in _TITLES
+        }
+        resolver = SplashResolver(title_files)
+
+    selector = _make_selector(resolver, tmp_path)
+    title_list = _make_title_list()
+
+    def pick_images() -> None:
+        random.seed(1)
+        for _ in range(NUM_PICKS):
+            selector.get_random_image(
+                title_list,  # ty: ignore[invalid-argument-type]
+                use_adaptive_fit_mode=True,
+                file_types={FileTypes.SPLASH},
+            )
+
+    if size_source == "full_decode":
+        with patch.object(
+            is_module,
+            is_module.get_image_size.__name__,
+            side_effect=lambda f: load_pil_image_for_reading(f).size,
+        ):
+            # Slow enough that one round is plenty.
+            benchmark.pedantic(pick_images, rounds=1, iterations=1)
+    else:
+        benchmark.pedantic(pick_images, rounds=3, iterations=1)
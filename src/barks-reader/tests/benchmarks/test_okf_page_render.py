@@ -0,0 +1,86 @@
+# ruff: noqa: INP001
+
+"""Cost of showing every page of a synthetic 2,000 page OKF bundle.
+
+* Cold: a new ``PageCache`` reads and renders each page with markdown-it (what
+  ``OKFViewer._show`` did for every page shown).
+* Warm: every page is already in the cache, so showing it is a ``stat`` and a
+  lookup.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from okf_reader.core.page_cache import PageCache
+from okf_reader.core.render import render_page
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_DIRS = 40
+NUM_PAGES_PER_DIR = 50
+
+
+def _page_text(dir_num: int, page_num: int) -> str:
+    next_page = f"page-{(page_num + 1) % NUM_PAGES_PER_DIR:02}.md"
+    return f"""---
+title: Page {dir_num}-{page_num}
+type: concept
+---
+# Page {dir_num}-{page_num}
+
+Uncle Scrooge counts his **money** in the [money bin]({next_page}) while
+Donald and the nephews look on.[^1] Gyro's `invention` is *not* helping.
+
+## Appearances
+
+- [Lost in the Andes!](/concept/dir-00/page-00.md) — the square eggs
+- [Back to the Klondike](../dir-01/page-01.md) — Glittering Goldie
+- A plain item with no link
+
+| Title | Year | Pages |
+|-------|------|-------|
+| Lost in the Andes! | 1949 | 32 |
+| Back to the Klondike | 1953 | 28 |
+| The Golden Helmet | 1952 | 32 |
+
+> A blockquote about the story.
+
+[^1]: From the story notes, `notes/{dir_num}.md`.
+"""
+
+
+def _make_bundle(root: Path) -> list[Path]:
+    pages = []
+    for dir_num in range(NUM_DIRS):
+        directory = root / "concept" / f"dir-{dir_num:02}"
+        directory.mkdir(parents=True)
+        for page_num in range(NUM_PAGES_PER_DIR):
+            page = directory / f"page-{page_num:02}.md"
+            page.write_text(_page_text(dir_num, page_num), encoding="utf-8")
+            pages.append(page)
+    return pages
+
+
+@pytest.mark.parametrize("cache", ["cold", "warm"])
+def test_okf_page_render_benchmark(benchmark: BenchmarkFixture, tmp_path: Path, cache: str) -> None:
+    pages = _make_bundle(tmp_path)
+    warm_cache = PageCache(render_page, max_pages=len(pages))
+    for page in pages:
+        warm_cache.render(page)
+
+    def show_pages() -> None:
+        if cache == "cold":
+            cold_cache = PageCache(render_page, max_pages=len(pages))
+            for page in pages:
+                cold_cache.render(page)
+        else:
+            for page in pages:
+                assert warm_cache.get(page) is not None
+
+    benchmark.extra_info["pages"] = len(pages)
+    benchmark.pedantic(show_pages, rounds=3, iterations=1, warmup_rounds=1)
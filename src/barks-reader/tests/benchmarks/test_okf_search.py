@@ -0,0 +1,81 @@
+# ruff: noqa: INP001
+
+"""Query latency of OKF bundle search over a synthetic 2,000 page bundle.
+
+* Title index: ``BundleSearcher``'s in-memory title/heading index (no body text).
+* Full text: a ``FullTextIndex`` over titles, headings and body text, answering
+  a word query and a quoted phrase query.
+* Unchanged update: a new ``FullTextIndex`` brought up to date from its saved
+  index file, which ``stat``s every page but reads none of them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from okf_reader.core.search import FullTextIndex, build_search_index, search_index
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_DIRS = 40
+NUM_PAGES_PER_DIR = 50
+
+WORDS = (
+    *("scrooge", "donald", "nephews", "money", "bin", "klondike", "andes", "square"),
+    *("eggs", "gyro", "invention", "beagle", "boys", "magica", "golden", "helmet"),
+    *("treasure", "duckburg", "glittering", "goldie"),
+)
+
+
+def _page_text(dir_num: int, page_num: int) -> str:
+    page_words = [WORDS[(dir_num * 7 + page_num * 3 + i) % len(WORDS)] for i in range(120)]
+    return f"""---
+title: Page {dir_num}-{page_num}
+type: concept
+---
+# Page {dir_num}-{page_num}
+
+## {WORDS[page_num % len(WORDS)].title()} Story
+
+{" ".join(page_words)}
+"""
+
+
+def _make_bundle(root: Path) -> Path:
+    for dir_num in range(NUM_DIRS):
+        directory = root / "concept" / f"dir-{dir_num:02}"
+        directory.mkdir(parents=True)
+        for page_num in range(NUM_PAGES_PER_DIR):
+            page = directory / f"page-{page_num:02}.md"
+            page.write_text(_page_text(dir_num, page_num), encoding="utf-8")
+    return root
+
+
+@pytest.mark.parametrize(
+    "search", ["title_index", "full_text_words", "full_text_phrase", "unchanged_update"]
+)
+def test_okf_search_benchmark(benchmark: BenchmarkFixture, tmp_path: Path, search: str) -> None:
+    bundle = _make_bundle(tmp_path / "bundle")
+    index_path = tmp_path / "search-index.json"
+    title_index = build_search_index(bundle)
+    full_text_index = FullTextIndex(bundle, index_path)
+    full_text_index.update()
+
+    def run_search() -> None:
+        if search == "title_index":
+            search_index(title_index, "klondike story")
+        elif search == "full_text_words":
+            assert full_text_index.search("golden treasure")
+        elif search == "full_text_phrase":
+            assert full_text_index.search('"square eggs"')
+        else:
+            index = FullTextIndex(bundle, index_path)
+            index.update()
+            assert index.num_pages_indexed == 0
+
+    benchmark.extra_info["pages"] = NUM_DIRS * NUM_PAGES_PER_DIR
+    benchmark.pedantic(run_search, rounds=10, iterations=1, warmup_rounds=1)
@@ -0,0 +1,82 @@
+# ruff: noqa: INP001
+
+"""Time to first page of a synthetic 10,000 page OKF bundle.
+
+What must happen before the first page can show with its tree node selected:
+
+* Eager: walk the whole bundle into a tree (``load_bundle_tree``), then read
+  and render the page.
+* Lazy: list only the bundle's top level and the page's ancestor directories
+  (what ``OKFViewer`` does), then read and render the page.
+* Cached: as lazy, but the directories were listed before (the wiki reopened,
+  or the tree cache's worker listed them ahead), so each is a few ``stat``s.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from okf_reader.core.page_cache import PageCache
+from okf_reader.core.render import load_bundle_tree, render_page
+from okf_reader.core.tree_cache import BundleTreeCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_TOPICS = 20
+NUM_SUBTOPICS = 10
+NUM_PAGES_PER_DIR = 50
+PAGE_BODY = "Uncle Scrooge counts his **money** in the money bin.\n\n" * 30
+
+
+def _index_text(title: str, hrefs: list[str]) -> str:
+    return f"# {title}\n\n" + "".join(f"- [{href}]({href})\n" for href in hrefs)
+
+
+def _make_bundle(root: Path) -> Path:
+    """Write the bundle; return the page shown first, deep in the middle of it."""
+    (root / "index.md").write_text(_index_text("Bundle", ["concept/index.md"]))
+    concept = root / "concept"
+    concept.mkdir()
+    topics = [f"topic-{t:02}" for t in range(NUM_TOPICS)]
+    (concept / "index.md").write_text(_index_text("Concepts", [f"{t}/index.md" for t in topics]))
+    for topic in topics:
+        subtopics = [f"sub-{s:02}" for s in range(NUM_SUBTOPICS)]
+        (concept / topic).mkdir()
+        (concept / topic / "index.md").write_text(
+            _index_text(topic, [f"{s}/index.md" for s in subtopics])
+        )
+        for subtopic in subtopics:
+            directory = concept / topic / subtopic
+            directory.mkdir()
+            pages = [f"page-{p:02}.md" for p in range(NUM_PAGES_PER_DIR)]
+            (directory / "index.md").write_text(_index_text(subtopic, pages[::-1]))
+            for page in pages:
+                (directory / page).write_text(
+                    f"---\ntitle: {topic} {subtopic} {page}\n---\n# {page}\n\n{PAGE_BODY}"
+                )
+    return concept / topics[NUM_TOPICS // 2] / f"sub-{NUM_SUBTOPICS // 2:02}" / "page-25.md"
+
+
+@pytest.mark.parametrize("tree", ["eager", "lazy", "cached"])
+def test_okf_tree_load_benchmark(benchmark: BenchmarkFixture, tmp_path: Path, tree: str) -> None:
+    first_page = _make_bundle(tmp_path)
+    ancestors = [d for d in reversed(first_page.parents) if d.is_relative_to(tmp_path)]
+    warm_cache = BundleTreeCache(tmp_path)
+    for directory in ancestors:
+        warm_cache.list_children(directory)
+
+    def show_first_page() -> None:
+        if tree == "eager":
+            assert load_bundle_tree(tmp_path).children
+        else:
+            cache = warm_cache if tree == "cached" else BundleTreeCache(tmp_path)
+            for directory in ancestors:
+                assert cache.list_children(directory)
+        assert PageCache(render_page).render(first_page).blocks
+
+    benchmark.extra_info["pages"] = NUM_TOPICS * NUM_SUBTOPICS * NUM_PAGES_PER_DIR
+    benchmark.pedantic(show_first_page, rounds=3, iterations=1, warmup_rounds=1)
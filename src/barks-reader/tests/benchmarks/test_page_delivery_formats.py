@@ -0,0 +1,123 @@
+# ruff: noqa: INP001
+
+"""Per-page cost of the two page delivery formats from ``ArchivePageImageSource``.
+
+* PNG path: the worker encodes an uncompressed PNG, then the UI thread decodes
+  it again (``CoreImage``; measured here with the equivalent PIL decode).
+* Raw path: the worker produces a contiguous pixel buffer that the UI thread
+  uploads with ``blit_buffer`` and never decodes.
+
+Both are run over the same synthetic CBZ built from the benchmark test image.
+Peak Python-traced memory for one pass is recorded in ``extra_info``.
+"""
+
+from __future__ import annotations
+
+import io
+import tracemalloc
+import zipfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_fantagraphics.comics_consts import PageType
+from barks_fantagraphics.page_classes import CleanPage
+from barks_reader.core.archive_page_image_source import ArchivePageImageSource
+from barks_reader.core.comic_book_page_info import PageInfo
+from PIL import Image as PilImage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Generator
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+TEST_COMIC_PAGE_FILE = Path(__file__).parent / "comic-book-load-test-image.jpg"
+
+NUM_PAGES = 8
+MAX_WIDTH = 1920
+MAX_HEIGHT = 1080
+
+
+def _make_page_info(filename: str, index: int) -> PageInfo:
+    page = CleanPage(filename, PageType.BODY)
+    return PageInfo(
+        page_index=index,
+        display_page_num=str(index + 1),
+        page_type=PageType.BODY,
+        srce_page=page,
+        dest_page=page,
+    )
+
+
+@pytest.fixture
+def synthetic_cbz(tmp_path: Path) -> tuple[Path, list[PageInfo]]:
+    """Build a prebuilt-style CBZ holding ``NUM_PAGES`` copies of the test page."""
+    jpg_bytes = io.BytesIO()
+    PilImage.open(TEST_COMIC_PAGE_FILE).save(jpg_bytes, format="JPEG", quality=95)
+
+    cbz_path = tmp_path / "Benchmark Title.cbz"
+    page_infos = []
+    with zipfile.ZipFile(cbz_path, "w") as zf:
+        for i in range(NUM_PAGES):
+            filename = f"page_{i:03d}.jpg"
+            zf.writestr(f"images/{filename}", jpg_bytes.getvalue())
+            page_infos.append(_make_page_info(filename, i))
+
+    return cbz_path, page_infos
+
+
+@pytest.fixture
+def image_source(
+    synthetic_cbz: tuple[Path, list[PageInfo]],
+) -> Generator[ArchivePageImageSource]:
+    cbz_path, _ = synthetic_cbz
+    source = ArchivePageImageSource(
+        archive_path=cbz_path,
+        fanta_volume_archive=None,
+        comic_book_image_builder=None,
+        empty_page_image=b"",
+        use_fantagraphics_overrides=False,
+        max_width=MAX_WIDTH,
+        max_height=MAX_HEIGHT,
+    )
+    source.open()
+    yield source
+    source.close()
+
+
+def _png_path(source: ArchivePageImageSource, page_info: PageInfo) -> None:
+    stream, _ext = source.load_page_image(page_info)
+    PilImage.open(stream).load()  # The UI-thread decode the raw path avoids.
+
+
+def _raw_path(source: ArchivePageImageSource, page_info: PageInfo) -> None:
+    source.load_page_pixels(page_info)
+
+
+def _traced_peak_mib(run_pass: Callable[[], None]) -> float:
+    tracemalloc.start()
+    try:
+        run_pass()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / (1024 * 1024)
+
+
+@pytest.mark.parametrize("deliver", [_png_path, _raw_path], ids=["png", "raw"])
+def test_page_delivery_benchmark(
+    benchmark: BenchmarkFixture,
+    image_source: ArchivePageImageSource,
+    synthetic_cbz: tuple[Path, list[PageInfo]],
+    deliver: Callable[[ArchivePageImageSource, PageInfo], None],
+) -> None:
+    _, page_infos = synthetic_cbz
+
+    def run_pass() -> None:
+        for page_info in page_infos:
+            deliver(image_source, page_info)
+
+    benchmark.extra_info["pages_per_round"] = NUM_PAGES
+    benchmark.extra_info["peak_traced_mib"] = round(_traced_peak_mib(run_pass), 1)
+
+    benchmark.pedantic(run_pass, rounds=5, iterations=1)
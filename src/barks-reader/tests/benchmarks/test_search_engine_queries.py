@@ -0,0 +1,132 @@
+# ruff: noqa: INP001
+
+"""Per-query cost of 500 mixed word and entity searches on the Whoosh index.
+
+* Fresh searcher: each query opens a new searcher on the index, and with it a
+  reader per segment, then closes it again (how ``SearchEngine`` used to work).
+* Pooled: each query leases a long-lived searcher from the engine's
+  ``SearcherPool``.
+
+The index holds 3,000 speech bubbles spread over 100 titles and 3 segments.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import contextmanager
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+from barks_fantagraphics.whoosh_punct_tokenizer import WordWithPunctTokenizer
+from barks_fantagraphics.whoosh_search_engine import MY_STOP_WORDS, SearchEngine
+from whoosh.analysis import LowercaseFilter, StopFilter
+from whoosh.fields import ID, KEYWORD, TEXT, Schema
+from whoosh.index import create_in
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+    from whoosh.index import Index
+    from whoosh.searching import Searcher
+
+NUM_QUERIES = 500
+NUM_TITLES = 100
+BUBBLES_PER_TITLE = 30
+NUM_SEGMENTS = 3
+
+_WORDS = [f"word{i}" for i in range(400)]
+_PEOPLE = [f"Person {i}" for i in range(50)]
+
+
+def _make_schema() -> Schema:
+    punct_analyzer = (
+        WordWithPunctTokenizer() | LowercaseFilter() | StopFilter(stoplist=MY_STOP_WORDS)
+    )
+    return Schema(
+        title=ID(stored=True),
+        fanta_vol=ID(stored=True),
+        fanta_page=ID(stored=True),
+        comic_page=ID(stored=True),
+        content_id=ID(stored=True),
+        panel_num=ID(stored=True),
+        unstemmed=TEXT(stored=False, lang="en", analyzer=punct_analyzer),
+        content_raw=TEXT(stored=True, lang="en"),
+        entities_person=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_location=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_org=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_work=KEYWORD(stored=True, commas=True, scorable=True),
+        entities_misc=KEYWORD(stored=True, commas=True, scorable=True),
+    )
+
+
+@pytest.fixture(scope="module")
+def index_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    index_dir = tmp_path_factory.mktemp("search-index")
+    index = create_in(str(index_dir), _make_schema())
+    rng = random.Random(1)
+
+    titles_per_segment = NUM_TITLES // NUM_SEGMENTS
+    for segment in range(NUM_SEGMENTS):
+        writer = index.writer()
+        for title_num in range(segment * titles_per_segment, (segment + 1) * titles_per_segment):
+            for bubble in range(BUBBLES_PER_TITLE):
+                text = " ".join(rng.choices(_WORDS, k=12))
+                writer.add_document(
+                    title=f"Title {title_num:03d}",
+                    fanta_vol=str(1 + title_num % 28),
+                    fanta_page=f"{1 + bubble // 6:03d}",
+                    comic_page=str(1 + bubble // 6),
+                    content_id=str(bubble),
+                    panel_num=str(1 + bubble % 6),
+                    unstemmed=text,
+                    content_raw=text.upper(),
+                    entities_person=",".join(rng.sample(_PEOPLE, 2)),
+                    entities_location="",
+                    entities_org="",
+                    entities_work="",
+                    entities_misc="",
+                )
+        writer.commit()
+
+    return index_dir
+
+
+class FreshSearcherPerQuery:
+    """Stands in for the engine's ``SearcherPool``, opening a new searcher every time."""
+
+    def __init__(self, index: Index) -> None:
+        self._index = index
+
+    @contextmanager
+    def lease(self) -> Iterator[Searcher]:
+        with self._index.searcher() as searcher:
+            yield searcher
+
+
+@pytest.mark.parametrize("searchers", ["fresh", "pooled"])
+def test_mixed_queries_benchmark(
+    benchmark: BenchmarkFixture, index_dir: Path, searchers: str
+) -> None:
+    engine = SearchEngine(index_dir)
+    rng = random.Random(2)
+    queries = [
+        ("words", rng.choice(_WORDS)) if i % 2 == 0 else ("person", rng.choice(_PEOPLE))
+        for i in range(NUM_QUERIES)
+    ]
+
+    def run_queries() -> None:
+        for kind, query in queries:
+            if kind == "words":
+                engine.find_words(query)
+            else:
+                engine.find_entities(kind, query)
+
+    benchmark.extra_info["queries"] = NUM_QUERIES
+    if searchers == "fresh":
+        with patch.object(engine, "_searchers", FreshSearcherPerQuery(engine._index)):  # noqa: SLF001
+            benchmark.pedantic(run_queries, rounds=3, iterations=1, warmup_rounds=1)
+    else:
+        benchmark.pedantic(run_queries, rounds=3, iterations=1, warmup_rounds=1)
@@ -0,0 +1,65 @@
+# ruff: noqa: INP001
+
+"""Wall-clock time to build the speech search index for a synthetic 8-volume corpus.
+
+* 1 worker: the documents are generated and written in this process, through
+  one whoosh writer (how ``SearchEngineCreator`` used to work).
+* 4 workers: each volume's documents are generated in a pool of worker
+  processes, each started with the corpus once, then written through one
+  whoosh writer in this process.
+
+Each volume has 6 titles of 12 pages, with 8 speech bubbles per page for each
+OCR type. Entities are tagged by a dictionary tagger that looks for every
+curated person name in every bubble, standing in for the real tagger's cost.
+"""
+
+from __future__ import annotations
+
+import shutil
+from typing import TYPE_CHECKING, Any, cast
+from unittest.mock import patch
+
+import pytest
+from barks_fantagraphics import whoosh_search_engine
+from barks_fantagraphics.speech_groupers import OcrTypes
+from barks_fantagraphics.testing.fake_speech import (
+    SyntheticComicsDatabase,
+    SyntheticSpeechGroups,
+    tag_curated_persons,
+)
+from barks_fantagraphics.whoosh_search_engine import SearchEngine, SearchEngineCreator
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_VOLUMES = 8
+TITLES_PER_VOLUME = 6
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_index_build_benchmark(
+    benchmark: BenchmarkFixture, tmp_path: Path, max_workers: int
+) -> None:
+    speech_groups = SyntheticSpeechGroups(
+        titles_per_volume=TITLES_PER_VOLUME, pages_per_title=12, bubbles_per_page=8
+    )
+    comics_database = SyntheticComicsDatabase(titles_per_volume=TITLES_PER_VOLUME)
+    index_dir = tmp_path / "index"
+
+    def build_index() -> None:
+        shutil.rmtree(index_dir, ignore_errors=True)
+        with patch.object(whoosh_search_engine, "SpeechGroups", return_value=speech_groups):
+            creator = SearchEngineCreator(cast("Any", comics_database), index_dir, OcrTypes.EASYOCR)
+            creator.index_volumes(
+                list(range(1, NUM_VOLUMES + 1)),
+                entity_tagger=tag_curated_persons,
+                max_workers=max_workers,
+            )
+
+    benchmark.pedantic(build_index, rounds=2, iterations=1)
+
+    num_documents = len(list(SearchEngine(index_dir).iter_all_stored_fields()))
+    assert num_documents == NUM_VOLUMES * TITLES_PER_VOLUME * 12 * 8
+    benchmark.extra_info["documents"] = num_documents
@@ -0,0 +1,76 @@
+# ruff: noqa: INP001
+
+"""Cost of reading a 30 page title's grouped OCR speech, 25 groups per page.
+
+* JSON: ``get_speech_page_groups(title)`` parses each page's OCR prelim groups
+  JSON, for both OCR engines.
+* Cache: ``get_speech_page_groups(title, with_json=False)`` checks the JSON
+  files haven't changed, then reads the title's speech groups cache.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
+
+import pytest
+from barks_fantagraphics.barks_titles import Titles
+from barks_fantagraphics.ocr_file_paths import get_ocr_prelim_groups_json_filename
+from barks_fantagraphics.speech_groupers import OcrTypes, SpeechGroups
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_PAGES = 30
+NUM_GROUPS_PER_PAGE = 25
+TITLE = Titles.LUCK_OF_THE_NORTH
+
+
+def _make_page_json(rng: random.Random) -> dict:
+    groups = {}
+    for group_id in range(NUM_GROUPS_PER_PAGE):
+        words = [
+            "".join(rng.choices(string.ascii_uppercase, k=rng.randint(2, 9))) for _ in range(12)
+        ]
+        x, y = rng.randint(0, 2000), rng.randint(0, 3000)
+        groups[str(group_id)] = {
+            "ai_text": " ".join(words[:6]) + "-\n" + " ".join(words[6:]) + "!",
+            "panel_num": rng.randint(1, 8),
+            "type": rng.choice(["speech", "thought", "caption"]),
+            "notes": "",
+            "text_box": [[x, y], [x + 300, y], [x + 300, y + 120], [x, y + 120]],
+        }
+    return {"groups": groups}
+
+
+@pytest.mark.parametrize("source", ["json", "cache"])
+def test_speech_groups_read_benchmark(
+    benchmark: BenchmarkFixture, tmp_path: Path, source: str
+) -> None:
+    rng = random.Random(1)
+    srce_dest_map = {f"{200 + i}": f"{i + 1}" for i in range(NUM_PAGES)}
+    for srce_page in srce_dest_map:
+        for ocr_index in OcrTypes:
+            json_file = tmp_path / get_ocr_prelim_groups_json_filename(srce_page, ocr_index)
+            json_file.write_text(json.dumps(_make_page_json(rng), indent=4))
+
+    db = MagicMock()
+    db.get_fanta_volume_int_for.return_value = 9
+    db.get_fantagraphics_restored_ocr_prelim_volume_dir.return_value = tmp_path
+    speech_groups = SpeechGroups(db)
+    with_json = source == "json"
+
+    def read_speech() -> None:
+        speech_groups.get_speech_page_groups(TITLE, with_json=with_json)
+
+    with patch.object(SpeechGroups, "_get_srce_page_to_dest_page_map", return_value=srce_dest_map):
+        # Builds the cache.
+        speech_groups.get_speech_page_groups(TITLE, with_json=False)
+
+        benchmark.extra_info["pages"] = NUM_PAGES * len(OcrTypes)
+        benchmark.pedantic(read_speech, rounds=10, iterations=1, warmup_rounds=1)
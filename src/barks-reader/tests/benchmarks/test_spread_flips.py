@@ -0,0 +1,133 @@
+# ruff: noqa: INP001
+
+"""Cost of flipping through every double-page spread of a loaded comic.
+
+* On demand: each flip composites the spread from its two cached pages and
+  flattens it again, on the UI thread.
+* Assembled: the loader's workers composited every spread as its pages loaded,
+  so each flip is a page cache lookup.
+
+Pages are the benchmark test image shrunk to fit a 1920x1080 window.
+"""
+
+from __future__ import annotations
+
+import io
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from barks_fantagraphics.comics_consts import PageType
+from barks_reader.core.comic_book_loader import ComicBookLoader
+from barks_reader.core.comic_book_page_info import PageInfo, build_display_units
+from barks_reader.core.image_pipeline import resize_contain, to_page_image
+from barks_reader.core.testing import FakeScheduler, RecordingCursor
+from PIL import Image
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+    from barks_reader.core.page_image_source import PageImage
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+TEST_COMIC_PAGE_FILE = Path(__file__).parent / "comic-book-load-test-image.jpg"
+
+NUM_PAGES = 21
+MAX_WIDTH = 1920
+MAX_HEIGHT = 1080
+
+
+class DisplayPageSource:
+    """Serves the same display-size page for every page index."""
+
+    def __init__(self) -> None:
+        with Image.open(TEST_COMIC_PAGE_FILE) as image:
+            self._page_image = to_page_image(resize_contain(image, MAX_WIDTH, MAX_HEIGHT))
+
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:  # noqa: ARG002
+        return self._page_image
+
+    @staticmethod
+    def load_page_image(page_info: PageInfo) -> tuple[io.BytesIO, str]:  # noqa: ARG004
+        """Return fake PNG bytes (unused by the loader)."""
+        return io.BytesIO(b"fake_png_data"), ".png"
+
+    @staticmethod
+    def get_image_info_str(page_info: PageInfo) -> str:  # noqa: ARG004
+        return "benchmark page"
+
+
+def _make_page_map() -> OrderedDict[str, PageInfo]:
+    page_map: OrderedDict[str, PageInfo] = OrderedDict()
+    for i in range(NUM_PAGES):
+        page = MagicMock(page_filename=f"page_{i:03d}.jpg", page_type=PageType.BODY)
+        page_map[str(i + 1)] = PageInfo(
+            page_index=i,
+            display_page_num=str(i + 1),
+            page_type=PageType.BODY,
+            srce_page=page,
+            dest_page=page,
+            is_solo=i == 0,
+        )
+    return page_map
+
+
+@pytest.fixture
+def all_loaded() -> threading.Event:
+    return threading.Event()
+
+
+@pytest.fixture
+def loader(tmp_path: Path, all_loaded: threading.Event) -> Generator[ComicBookLoader]:
+    empty_page = tmp_path / "empty_page.png"
+    empty_page.write_bytes(b"")
+    reader_settings = MagicMock()
+    reader_settings.sys_file_paths.get_empty_page_file.return_value = str(empty_page)
+
+    loader = ComicBookLoader(
+        reader_settings=reader_settings,
+        on_first_image_loaded=MagicMock(),
+        on_all_images_loaded=all_loaded.set,
+        on_load_error=MagicMock(),
+        max_window_width=MAX_WIDTH,
+        max_window_height=MAX_HEIGHT,
+        scheduler=FakeScheduler(),
+        cursor=RecordingCursor(),
+    )
+    yield loader
+    loader.close_comic()
+
+
+@pytest.mark.parametrize("assemble_spreads", [False, True], ids=["on_demand", "assembled"])
+def test_spread_flips_benchmark(
+    benchmark: BenchmarkFixture,
+    loader: ComicBookLoader,
+    all_loaded: threading.Event,
+    assemble_spreads: bool,
+) -> None:
+    page_map = _make_page_map()
+    loader.set_comic(
+        DisplayPageSource(),
+        list(page_map),
+        page_map,
+        archive_desc="spread flips",
+        assemble_spreads=assemble_spreads,
+    )
+    # Reported once every page, and every spread being assembled, is done.
+    assert all_loaded.wait(10.0)
+
+    spreads = [
+        (unit.left_page_index, unit.right_page_index)
+        for unit in build_display_units(page_map)[0]
+        if unit.right_page_index is not None
+    ]
+
+    def flip_through_spreads() -> None:
+        for left_index, right_index in spreads:
+            loader.get_double_page_image_ready_for_reading(left_index, right_index)
+
+    benchmark.extra_info["spreads"] = len(spreads)
+    benchmark.pedantic(flip_through_spreads, rounds=5, iterations=1)
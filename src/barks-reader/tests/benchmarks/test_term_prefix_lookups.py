@@ -0,0 +1,93 @@
+# ruff: noqa: INP001
+
+"""Cost of 2,000 word-completion prefix lookups on a 30,000 term vocabulary.
+
+* JSON per call: each lookup re-reads the alphabetically split term file, then
+  scans the prefix's group (how ``SearchEngine`` served the terms).
+* Alpha split: the split terms are loaded once, and each lookup scans the
+  group of the prefix's first two letters (how the search screen completed
+  words).
+* Prefix index: each lookup bisects the ``TermVocabulary`` prefix index.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_fantagraphics.term_vocabulary import TermVocabulary
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_LOOKUPS = 2000
+NUM_TERMS = 30_000
+CAPITALIZED_FRACTION = 0.1
+
+
+def _make_terms() -> list[str]:
+    rng = random.Random(1)
+    terms = {
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 10))) for _ in range(NUM_TERMS)
+    }
+    return [t.capitalize() if rng.random() < CAPITALIZED_FRACTION else t for t in sorted(terms)]
+
+
+def _split_terms(terms: list[str]) -> dict[str, dict[str, list[str]]]:
+    alpha_split: dict[str, dict[str, list[str]]] = {}
+    for term in terms:
+        key = term.lower()
+        alpha_split.setdefault(key[0], {}).setdefault(key[:2], []).append(term)
+    return alpha_split
+
+
+def _match_in_group(alpha_split: dict[str, dict[str, list[str]]], prefix: str) -> list[str]:
+    group = alpha_split.get(prefix[0], {}).get(prefix[:2], [])
+    return sorted(t for t in group if t.lower().startswith(prefix))
+
+
+@pytest.mark.parametrize("lookup", ["json_per_call", "alpha_split", "prefix_index"])
+def test_prefix_lookups_benchmark(benchmark: BenchmarkFixture, tmp_path: Path, lookup: str) -> None:
+    terms = _make_terms()
+    alpha_split_file = tmp_path / "cleaned-alpha-split-unstemmed-terms.json"
+    alpha_split_file.write_text(json.dumps(_split_terms(terms)))
+
+    rng = random.Random(2)
+    prefixes = [rng.choice(terms).lower()[: rng.randint(2, 4)] for _ in range(NUM_LOOKUPS)]
+
+    match_prefix: Callable[[str], list[str]]
+    if lookup == "json_per_call":
+
+        def match_prefix(prefix: str) -> list[str]:
+            return _match_in_group(json.loads(alpha_split_file.read_text()), prefix)
+
+    elif lookup == "alpha_split":
+        alpha_split = json.loads(alpha_split_file.read_text())
+
+        def match_prefix(prefix: str) -> list[str]:
+            return _match_in_group(alpha_split, prefix)
+
+    else:
+        vocabulary = TermVocabulary(terms)
+
+        def match_prefix(prefix: str) -> list[str]:
+            return sorted(vocabulary.with_prefix(prefix))
+
+    assert match_prefix("ab") == sorted(t for t in terms if t.lower().startswith("ab"))
+
+    def run_lookups() -> None:
+        for prefix in prefixes:
+            match_prefix(prefix)
+
+    benchmark.extra_info["lookups"] = NUM_LOOKUPS
+    if lookup == "json_per_call":
+        # Slow enough that one round is plenty.
+        benchmark.pedantic(run_lookups, rounds=1, iterations=1)
+    else:
+        benchmark.pedantic(run_lookups, rounds=3, iterations=1, warmup_rounds=1)
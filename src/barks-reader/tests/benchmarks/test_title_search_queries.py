@@ -0,0 +1,101 @@
+# ruff: noqa: INP001
+
+"""Cost of 500 title searches, half substrings and half misspelled titles.
+
+* Scan: each substring search checks every title string (how
+  ``get_titles_containing`` used to work), and each misspelling scores every
+  title by trigram overlap and edit distance.
+* Index: both go through ``BarksTitleSearch``'s trigram index, which only
+  looks at titles sharing trigrams with the query.
+"""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_fantagraphics.comic_book_info import BARKS_TITLE_INFO
+from barks_fantagraphics.comic_issues import Issues
+from barks_fantagraphics.title_search import BarksTitleSearch
+from barks_fantagraphics.trigram_index import (
+    MAX_EDIT_DISTANCE,
+    MIN_FUZZY_SCORE,
+    fold_text,
+    get_bounded_edit_distance,
+    get_trigrams,
+)
+
+if TYPE_CHECKING:
+    from barks_fantagraphics.barks_titles import Titles
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+NUM_QUERIES = 500
+
+_TITLE_INFOS = [info for info in BARKS_TITLE_INFO if info.issue_name != Issues.EXTRAS]
+
+
+def _misspell(rng: random.Random, text: str) -> str:
+    i = rng.randrange(1, len(text) - 1)
+    if rng.random() < 0.5:  # noqa: PLR2004
+        return text[:i] + text[i + 1 :]
+    return text[: i - 1] + text[i] + text[i - 1] + text[i + 1 :]
+
+
+def _make_queries() -> list[tuple[str, str]]:
+    rng = random.Random(1)
+    queries = []
+    for i in range(NUM_QUERIES):
+        title_str = rng.choice(_TITLE_INFOS).get_title_str()
+        if i % 2 == 0:
+            start = rng.randrange(max(1, len(title_str) - 5))
+            queries.append(("containing", title_str[start : start + 5].lower()))
+        else:
+            queries.append(("fuzzy", _misspell(rng, title_str)))
+    return queries
+
+
+def _scan_containing(word: str) -> list[Titles]:
+    word = word.lower()
+    return [info.title for info in _TITLE_INFOS if word in info.get_title_str().lower()]
+
+
+def _scan_fuzzy(query: str) -> list[Titles]:
+    folded_query = fold_text(query)
+    query_trigrams = get_trigrams(folded_query)
+    scores = []
+    for info in _TITLE_INFOS:
+        folded = fold_text(info.get_title_str())
+        trigrams = get_trigrams(folded)
+        num_shared = len(query_trigrams & trigrams)
+        score = (
+            num_shared / len(query_trigrams)
+            + num_shared / (len(query_trigrams) + len(trigrams) - num_shared)
+        ) / 2
+        distance = get_bounded_edit_distance(folded_query, folded, MAX_EDIT_DISTANCE)
+        if distance <= MAX_EDIT_DISTANCE:
+            score = max(score, 1.0 - distance / (len(folded_query) + 1))
+        if score >= MIN_FUZZY_SCORE:
+            scores.append((score, info.title))
+    return [title for _, title in sorted(scores, reverse=True)[:10]]
+
+
+@pytest.mark.parametrize("lookup", ["scan", "index"])
+def test_title_search_benchmark(benchmark: BenchmarkFixture, lookup: str) -> None:
+    queries = _make_queries()
+    title_search = BarksTitleSearch()
+
+    if lookup == "scan":
+        searches = {"containing": _scan_containing, "fuzzy": _scan_fuzzy}
+    else:
+        searches = {
+            "containing": title_search.get_titles_containing,
+            "fuzzy": title_search.get_titles_matching_fuzzy,
+        }
+
+    def run_queries() -> None:
+        for kind, query in queries:
+            searches[kind](query)
+
+    benchmark.extra_info["queries"] = NUM_QUERIES
+    benchmark.pedantic(run_queries, rounds=3, iterations=1, warmup_rounds=1)
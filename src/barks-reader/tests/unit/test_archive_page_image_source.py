@@ -9,6 +9,8 @@ from __future__ import annotations
 import io
 import zipfile
 from pathlib import Path
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock, patch
 
 import pytest
 from barks_fantagraphics.comics_consts import PageType
@@ -16,8 +18,12 @@ from barks_fantagraphics.page_classes import CleanPage
 from barks_reader.core.archive_page_image_source import ArchivePageImageSource
 from barks_reader.core.comic_book_page_info import PageInfo
 from barks_reader.core.fantagraphics_volumes import FantagraphicsArchive
+from barks_reader.core.rendered_page_cache import RenderedPageCache
 from PIL import Image
 
+if TYPE_CHECKING:
+    from barks_reader.core.page_image_source import PageImage
+
 
 def _make_png_bytes(size: tuple[int, int], color: tuple[int, int, int] = (40, 80, 120)) -> bytes:
     buf = io.BytesIO()
@@ -77,6 +83,59 @@ class TestArchivePageImageSourcePrebuilt:
         # 1000x500 contained within 200x200 -> 200x100 (aspect preserved).
         assert decoded.size == (200, 100)
 
+    def test_load_page_pixels_returns_resized_buffer(self, prebuilt_cbz: Path) -> None:
+        source = ArchivePageImageSource(
+            archive_path=prebuilt_cbz,
+            fanta_volume_archive=None,
+            comic_book_image_builder=None,
+            empty_page_image=b"",
+            use_fantagraphics_overrides=False,
+            max_width=200,
+            max_height=200,
+        )
+        source.open()
+        try:
+            page_image = source.load_page_pixels(_make_page_info("p01.png"))
+        finally:
+            source.close()
+
+        # Same contain-resize as the PNG path, delivered as tightly packed RGB.
+        assert page_image.size == (200, 100)
+        assert page_image.colorfmt == "rgb"
+        assert page_image.nbytes == 200 * 100 * 3
+        assert page_image.pixels[:3] == bytes((40, 80, 120))
+
+    def test_load_page_pixels_uses_rendered_page_cache(
+        self, prebuilt_cbz: Path, tmp_path: Path
+    ) -> None:
+        cache = RenderedPageCache(tmp_path / "cache", max_bytes=10_000_000)
+
+        def load(max_size: int) -> PageImage:
+            source = ArchivePageImageSource(
+                archive_path=prebuilt_cbz,
+                fanta_volume_archive=None,
+                comic_book_image_builder=None,
+                empty_page_image=b"",
+                use_fantagraphics_overrides=False,
+                max_width=max_size,
+                max_height=max_size,
+                rendered_page_cache=cache,
+            )
+            source.open()
+            try:
+                return source.load_page_pixels(_make_page_info("p01.png"))
+            finally:
+                source.close()
+
+        first = load(200)
+        with patch.object(ArchivePageImageSource, "_build_page_image", side_effect=AssertionError):
+            # A re-read is served from the cache without building the page.
+            assert load(200) == first
+        # A different window size is a different entry.
+        assert load(100).size == (100, 50)
+        assert cache.num_hits == 1
+        assert cache.num_misses == 2  # noqa: PLR2004
+
     def test_close_releases_archive(self, prebuilt_cbz: Path) -> None:
         source = ArchivePageImageSource(
             archive_path=prebuilt_cbz,
@@ -234,3 +293,35 @@ class TestFantagraphicsSourceResolution:
 
         assert "__empty_page__" in info
         assert "from override" in info
+
+
+class TestFantagraphicsReducedDecode:
+    def test_builder_decode_scale_reduces_archive_jpeg(self, tmp_path: Path) -> None:
+        jpg_bytes = io.BytesIO()
+        Image.new("RGB", (800, 1200), (40, 80, 120)).save(jpg_bytes, format="JPEG")
+        archive_path = tmp_path / "vol1.zip"
+        _write_cbz(archive_path, {"arch/101.jpg": jpg_bytes.getvalue()})
+
+        builder = MagicMock()
+        builder.get_srce_min_decode_scale.return_value = 0.25
+        builder.get_display_page_image.side_effect = lambda image, *_args: image
+        page_info = _make_page_info("101.jpg")
+        source = ArchivePageImageSource(
+            archive_path=archive_path,
+            fanta_volume_archive=_make_fanta_archive(archive={"101": "arch/101.jpg"}),
+            comic_book_image_builder=builder,
+            empty_page_image=b"",
+            use_fantagraphics_overrides=False,
+            max_width=300,
+            max_height=200,
+        )
+        source.open()
+        try:
+            page_image = source.load_page_pixels(page_info)
+        finally:
+            source.close()
+
+        builder.get_srce_min_decode_scale.assert_called_once_with(
+            page_info.srce_page, page_info.dest_page, 300, 200
+        )
+        assert page_image.size == (200, 300)
@@ -18,17 +18,21 @@ from barks_reader.core.comic_book_loader_platform_settings import (
     get_prefetch_tuning,
 )
 from barks_reader.core.fantagraphics_volumes import FantagraphicsVolumeArchives
+from barks_reader.core.page_image_source import PageImage
 from barks_reader.core.testing import FakeScheduler, RecordingCursor
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Generator
     from pathlib import Path
 
     from barks_reader.core.comic_book_page_info import PageInfo
 
 
+_FAKE_PAGE_IMAGE = PageImage(pixels=bytes(2 * 2 * 3), size=(2, 2), colorfmt="rgb")
+
+
 class FakePageImageSource:
-    """Test double that returns canned bytes with no I/O."""
+    """Test double that returns canned pixels with no I/O."""
 
     def __init__(self, *, delay: float = 0.0, fail: bool = False) -> None:
         self._delay = delay
@@ -43,14 +47,19 @@ class FakePageImageSource:
     def close(self) -> None:
         self.closed = True
 
-    def load_page_image(self, page_info: PageInfo) -> tuple[io.BytesIO, str]:  # noqa: ARG002
-        """Return fake PNG bytes."""
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:  # noqa: ARG002
+        """Return a fake pixel buffer."""
         if self._delay:
             time.sleep(self._delay)
         if self._fail:
             msg = "Simulated load failure"
             raise FileNotFoundError(msg)
         self.load_count += 1
+        return _FAKE_PAGE_IMAGE
+
+    @staticmethod
+    def load_page_image(page_info: PageInfo) -> tuple[io.BytesIO, str]:  # noqa: ARG004
+        """Return fake PNG bytes (unused by the loader)."""
         return io.BytesIO(b"fake_png_data"), ".png"
 
     @staticmethod
@@ -114,6 +123,7 @@ def mock_tuning() -> Generator[None]:
         tuning.get_initial_dynamic_window.return_value = 2
         tuning.get_new_dynamic_window.return_value = (50.0, 2)
         tuning.get_traced_peak_mib.return_value = 12.5
+        tuning.page_cache_budget_bytes = 1024 * 1024
         mock_get.return_value = tuning
         yield
 
@@ -234,9 +244,9 @@ def test_set_comic_and_load_success(
 
     assert source.load_count == 2  # noqa: PLR2004
     assert source.opened
-    assert len(loader._images) == 2  # noqa: PLR2004
-    assert loader._images[0] is not None
-    assert loader._images[1] is not None
+    assert len(loader._page_cache) == 2  # noqa: PLR2004
+    assert loader._page_cache.get(0) is not None
+    assert loader._page_cache.get(1) is not None
 
 
 def test_cursor_restored_at_first_page_ready(
@@ -251,10 +261,10 @@ def test_cursor_restored_at_first_page_ready(
     class GatedPageImageSource(FakePageImageSource):
         """Blocks every page after the first until the test releases them."""
 
-        def load_page_image(self, page_info: PageInfo) -> tuple[io.BytesIO, str]:
+        def load_page_pixels(self, page_info: PageInfo) -> PageImage:
             if page_info.page_index > 0:
                 release_last_page.wait(timeout=2.0)
-            return super().load_page_image(page_info)
+            return super().load_page_pixels(page_info)
 
     loader.set_comic(GatedPageImageSource(), load_order, page_map, archive_desc="gated.cbz")
 
@@ -290,12 +300,17 @@ class OrderRecordingSource:
     def close(self) -> None:
         pass
 
-    def load_page_image(self, page_info: PageInfo) -> tuple[io.BytesIO, str]:
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:
         idx = page_info.page_index
         if idx == self._block_index:
             self._started.set()
             self._release.wait(timeout=2.0)
         self.load_order.append(idx)
+        return _FAKE_PAGE_IMAGE
+
+    @staticmethod
+    def load_page_image(page_info: PageInfo) -> tuple[io.BytesIO, str]:  # noqa: ARG004
+        """Return fake PNG bytes (unused by the loader)."""
         return io.BytesIO(b"fake_png_data"), ".png"
 
     @staticmethod
@@ -415,6 +430,31 @@ def test_close_comic_calls_source_close(
     assert source.closed
 
 
+def test_set_comic_takes_over_preloaded_pages(
+    loader: ComicBookLoader,
+    page_map_and_order: tuple[OrderedDict[str, Any], list[str]],
+    mock_callbacks: dict[str, MagicMock],
+) -> None:
+    """Pages preloaded for a comic are not decoded again when it is opened."""
+    page_map, load_order = page_map_and_order
+    preload_source = FakePageImageSource()
+
+    loader.preload_comic("next", lambda: (preload_source, page_map, load_order[:1]))
+    assert _wait_for(lambda: preload_source.closed)
+
+    source = FakePageImageSource()
+    loader.set_comic(source, load_order, page_map, archive_desc="next.cbz", preload_id="next")
+    if loader._thread:
+        loader._thread.join(timeout=2.0)
+
+    assert preload_source.load_count == 1
+    assert source.load_count == 1  # Only the page that was not preloaded.
+    mock_callbacks["on_first_image_loaded"].assert_called_once()
+    mock_callbacks["on_all_images_loaded"].assert_called_once()
+    assert loader._page_cache.get(0) is not None
+    assert loader._page_cache.get(1) is not None
+
+
 def test_stop_cancels_inflight_loads(
     loader: ComicBookLoader,
     page_map_and_order: tuple[OrderedDict[str, Any], list[str]],
@@ -582,27 +622,234 @@ def test_get_prebuilt_comic_path_raises_when_file_missing(
         loader._get_prebuilt_comic_path(fanta_info)
 
 
+def _stub_loaded_pages(loader: ComicBookLoader, pages: list[PageImage]) -> None:
+    """Stub the loader's page cache directly, as if *pages* had been loaded."""
+    loader._image_loaded_events = [threading.Event() for _ in pages]
+    for page_index, page_image in enumerate(pages):
+        loader._store_page(page_index, page_image)
+
+
+def test_get_image_ready_for_reading_returns_cached_pixels(loader: ComicBookLoader) -> None:
+    """A loaded page is handed back as the exact buffer the worker produced."""
+    _stub_loaded_pages(loader, [_FAKE_PAGE_IMAGE])
+
+    assert loader.get_image_ready_for_reading(0) is _FAKE_PAGE_IMAGE
+
+
 def test_get_double_page_image_ready_for_reading_composes_two_pages(
     loader: ComicBookLoader,
 ) -> None:
-    """Compose two real PNG streams into a wider landscape PNG."""
-    from PIL import Image  # noqa: PLC0415
-
-    left_buf = io.BytesIO()
-    Image.new("RGB", (50, 80), (255, 0, 0)).save(left_buf, format="PNG")
-    right_buf = io.BytesIO()
-    Image.new("RGB", (50, 80), (0, 255, 0)).save(right_buf, format="PNG")
+    """Compose two raw page buffers into a wider landscape buffer."""
+    left = PageImage(pixels=bytes([255, 0, 0]) * (50 * 80), size=(50, 80), colorfmt="rgb")
+    right = PageImage(pixels=bytes([0, 255, 0]) * (50 * 80), size=(50, 80), colorfmt="rgb")
 
     # Stub the loader's image cache directly.
-    loader._images = [(left_buf, ".png"), (right_buf, ".png")]
+    _stub_loaded_pages(loader, [left, right])
 
-    stream, ext = loader.get_double_page_image_ready_for_reading(0, 1)
-
-    assert ext == "png"  # PNG_EXT_FOR_KIVY (no leading dot)
-    data = stream.read()
-    assert data.startswith(b"\x89PNG\r\n")
+    spread = loader.get_double_page_image_ready_for_reading(0, 1)
 
     # The composited image must be wider than either source.
-    out_image = Image.open(io.BytesIO(data))
-    assert out_image.width == 100  # noqa: PLR2004
-    assert out_image.height == 80  # noqa: PLR2004
+    assert spread.size == (100, 80)
+    assert spread.colorfmt == "rgb"
+    assert spread.nbytes == 100 * 80 * 3
+    # Left half red, right half green (first row, first and last pixels).
+    assert spread.pixels[:3] == bytes([255, 0, 0])
+    assert spread.pixels[99 * 3 : 100 * 3] == bytes([0, 255, 0])
+
+
+def _make_spread_page_map(count: int) -> tuple[OrderedDict[str, Any], list[str]]:
+    """Like `_make_indexed_page_map`, but page 0 is solo and the rest pair into spreads."""
+    page_map, load_order = _make_indexed_page_map(count)
+    for page in page_map.values():
+        page.is_solo = page.page_index == 0
+    return page_map, load_order
+
+
+class ColoredPageImageSource(FakePageImageSource):
+    """Returns a small page filled with a color derived from its page index."""
+
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:
+        color = bytes([page_info.page_index * 40 % 256, 0, 0])
+        return PageImage(pixels=color * (4 * 6), size=(4, 6), colorfmt="rgb")
+
+
+def test_spreads_are_assembled_as_pages_load(loader: ComicBookLoader) -> None:
+    """With spread assembly on, every left/right pair is composited by the workers."""
+    page_map, load_order = _make_spread_page_map(5)
+
+    loader.set_comic(
+        ColoredPageImageSource(),
+        load_order,
+        page_map,
+        archive_desc="spreads.cbz",
+        assemble_spreads=True,
+    )
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+
+    assert loader._page_cache.num_spreads == 2  # noqa: PLR2004
+    cached_spread = loader._page_cache.get_spread(1, 2)
+    assert cached_spread is not None
+    assert loader.get_double_page_image_ready_for_reading(1, 2) is cached_spread
+    assert cached_spread.size == (8, 6)
+    assert cached_spread.pixels[:3] == bytes([40, 0, 0])
+    assert cached_spread.pixels[7 * 3 : 8 * 3] == bytes([80, 0, 0])
+
+
+def test_spreads_are_not_assembled_by_default(loader: ComicBookLoader) -> None:
+    page_map, load_order = _make_spread_page_map(5)
+
+    loader.set_comic(ColoredPageImageSource(), load_order, page_map, archive_desc="spreads.cbz")
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+
+    assert loader._page_cache.num_spreads == 0
+    # Spreads are still composited on demand.
+    assert loader.get_double_page_image_ready_for_reading(1, 2).size == (8, 6)
+
+
+def test_stopping_spread_assembly_drops_the_cached_spreads(loader: ComicBookLoader) -> None:
+    page_map, load_order = _make_spread_page_map(5)
+    loader.set_comic(
+        ColoredPageImageSource(),
+        load_order,
+        page_map,
+        archive_desc="spreads.cbz",
+        assemble_spreads=True,
+    )
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+
+    loader.set_assemble_spreads(False)
+
+    assert loader._page_cache.num_spreads == 0
+    assert loader._get_spread_to_assemble(1) is None
+    loader.set_assemble_spreads(True)
+    assert loader._get_spread_to_assemble(1) == (1, 2)
+
+
+def test_spread_is_assembled_from_preloaded_pages(loader: ComicBookLoader) -> None:
+    """Pages taken over from the preloader also complete their spreads."""
+    page_map, load_order = _make_spread_page_map(3)
+    preloaded = {
+        index: ColoredPageImageSource().load_page_pixels(page_map[str(index)]) for index in (1, 2)
+    }
+    loader._preloader = MagicMock()
+    loader._preloader.take.return_value = preloaded
+
+    source = SizedPageImageSource()
+    loader.set_comic(
+        source,
+        load_order,
+        page_map,
+        archive_desc="spreads.cbz",
+        preload_id="next",
+        assemble_spreads=True,
+    )
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+
+    assert source.loaded_indices == [0]
+    assert loader._page_cache.get_spread(1, 2) is not None
+
+
+# ---------------------------------------------------------------------------
+# Byte-budgeted page cache: eviction and reload of evicted pages
+# ---------------------------------------------------------------------------
+
+_PAGE_BYTES = 100
+
+
+class SizedPageImageSource(FakePageImageSource):
+    """Returns a fixed-size buffer per page and records every page index loaded."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaded_indices: list[int] = []
+
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:
+        self.loaded_indices.append(page_info.page_index)
+        return PageImage(pixels=bytes(_PAGE_BYTES), size=(_PAGE_BYTES, 1), colorfmt="rgb")
+
+
+def _wait_for(condition: Callable[[], bool], timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def small_cache_tuning() -> Generator[None]:
+    """Tuning whose page cache holds only six pages' worth of bytes."""
+    with patch.object(loader_module, get_prefetch_tuning.__name__) as mock_get:
+        tuning = MagicMock()
+        tuning.get_initial_dynamic_window.return_value = 1
+        tuning.get_new_dynamic_window.return_value = (50.0, 1)
+        tuning.get_traced_peak_mib.return_value = 1.0
+        tuning.page_cache_budget_bytes = 6 * _PAGE_BYTES
+        mock_get.return_value = tuning
+        yield
+
+
+def test_page_cache_evicts_pages_beyond_budget(
+    loader: ComicBookLoader,
+    small_cache_tuning: None,  # noqa: ARG001
+    mock_callbacks: dict[str, MagicMock],
+) -> None:
+    """A comic bigger than the byte budget keeps only a budget's worth of pages."""
+    page_map, load_order = _make_indexed_page_map(10)
+    source = SizedPageImageSource()
+
+    loader.set_comic(source, load_order, page_map, archive_desc="big.cbz")
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+
+    mock_callbacks["on_all_images_loaded"].assert_called_once()
+    assert loader._page_cache.total_bytes <= 6 * _PAGE_BYTES
+    # Pages 0-3 (around the reading position) are pinned; older pages outside that
+    # window were evicted as later pages arrived.
+    assert loader.wait_load_event(0, 0)
+    assert not loader.wait_load_event(5, 0)
+    assert loader.wait_load_event(9, 0)  # most recently loaded
+
+
+def test_evicted_page_is_reloaded_when_navigated_back_to(
+    loader: ComicBookLoader,
+    small_cache_tuning: None,  # noqa: ARG001
+) -> None:
+    """Navigating to an evicted page after the load has finished reloads it."""
+    page_map, load_order = _make_indexed_page_map(10)
+    source = SizedPageImageSource()
+
+    loader.set_comic(source, load_order, page_map, archive_desc="big.cbz")
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+    assert not loader.wait_load_event(5, 0)
+
+    loader.set_current_page(5)
+    loader.prioritize_page(5)
+
+    assert loader.wait_load_event(5, 2.0)
+    assert source.loaded_indices.count(5) == 2  # noqa: PLR2004
+    assert loader.get_image_ready_for_reading(5).nbytes == _PAGE_BYTES
+    assert _wait_for(lambda: not loader._loader_active)
+
+
+def test_set_current_page_requeues_evicted_neighbors(
+    loader: ComicBookLoader,
+    small_cache_tuning: None,  # noqa: ARG001
+) -> None:
+    """Moving the reading position reloads evicted pages in its pinned window."""
+    page_map, load_order = _make_indexed_page_map(10)
+    source = SizedPageImageSource()
+
+    loader.set_comic(source, load_order, page_map, archive_desc="big.cbz")
+    assert loader._thread is not None
+    loader._thread.join(timeout=2.0)
+
+    loader.set_current_page(5)
+
+    assert _wait_for(lambda: all(loader.wait_load_event(i, 0) for i in range(4, 7)))
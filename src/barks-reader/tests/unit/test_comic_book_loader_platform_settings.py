@@ -176,6 +176,23 @@ class TestGetPrefetchTuning:
         assert tuning.memory_low_water_mib == expected_low
         assert tuning.memory_high_water_mib == expected_high
 
+    def test_low_end_profile_gets_smallest_page_cache_budget(self) -> None:
+        budgets = {}
+        for tier, profile in [
+            ("low", _profile(low=True)),
+            ("mid", _profile(mid=True)),
+            ("high", _profile(high=True)),
+        ]:
+            platform_settings_module._PREFETCH_TUNING = None  # noqa: SLF001
+            with patch.object(
+                platform_settings_module, "_get_system_profile", return_value=profile
+            ):
+                tuning = get_prefetch_tuning(worker_count=4, num_pages=10)
+            budgets[tier] = tuning.page_cache_budget_mib
+            assert tuning.page_cache_budget_bytes == int(budgets[tier] * 1024 * 1024)
+
+        assert budgets["low"] < budgets["mid"] < budgets["high"]
+
     def test_caches_result_across_calls(self) -> None:
         with patch.object(
             platform_settings_module, "_get_system_profile", return_value=_profile(high=True)
@@ -219,7 +219,8 @@ class TestComicBookReader:
 
     def test_show_page_renders_immediately_when_loaded(self, reader: ComicBookReader) -> None:
         self._stub_current_page(reader, 3)
-        reader._all_loaded = True  # ready fast-path
+        reader._all_loaded = True
+        reader._comic_book_loader.wait_load_event.return_value = True
 
         with patch.object(reader, "_render_page") as mock_render:
             reader._show_page(None, None)
@@ -227,6 +228,36 @@ class TestComicBookReader:
         mock_render.assert_called_once_with(3, None)
         reader._comic_book_loader.cursor.set_busy.assert_not_called()
 
+    def test_show_page_pins_page_before_checking_readiness(self, reader: ComicBookReader) -> None:
+        """The loader learns the reading position before the page is checked/drawn."""
+        self._stub_current_page(reader, 3)
+        loader = reader._comic_book_loader
+        loader.wait_load_event.return_value = True
+
+        with patch.object(reader, "_render_page"):
+            reader._show_page(None, None)
+
+        loader.set_current_page.assert_called_once_with(3)
+        call_names = [c[0] for c in loader.method_calls]
+        assert call_names.index("set_current_page") < call_names.index("wait_load_event")
+
+    def test_show_page_reprioritizes_evicted_page_after_full_load(
+        self, reader: ComicBookReader
+    ) -> None:
+        """A page evicted after the full load is awaited again, not assumed ready."""
+        self._stub_current_page(reader, 3)
+        reader._all_loaded = True
+        reader._comic_book_loader.wait_load_event.return_value = False  # evicted
+
+        with (
+            patch.object(reader, "_render_page") as mock_render,
+            patch.object(barks_reader.ui.comic_book_reader.Clock, "schedule_interval"),
+        ):
+            reader._show_page(None, None)
+
+        mock_render.assert_not_called()
+        reader._comic_book_loader.prioritize_page.assert_called_once_with(3)
+
     def test_show_page_keeps_current_page_and_polls_when_not_loaded(
         self, reader: ComicBookReader
     ) -> None:
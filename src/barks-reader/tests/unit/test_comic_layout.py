@@ -16,6 +16,7 @@ from barks_reader.core.comic_book_page_info import (
     ComicLayout,
     ComicLayoutBuilder,
     PageInfo,
+    build_display_units,
     slice_comic_layout,
     slice_page_map,
 )
@@ -130,6 +131,42 @@ class TestDisplayUnits:
         assert layout.display_units == [DisplayUnit(0, 1), DisplayUnit(2, None)]
 
 
+class TestBuildDisplayUnits:
+    @staticmethod
+    def _page_map(solo_flags: list[bool]) -> OrderedDict[str, PageInfo]:
+        return OrderedDict(
+            (str(i + 1), _page(i, str(i + 1), is_solo=is_solo))
+            for i, is_solo in enumerate(solo_flags)
+        )
+
+    def test_empty_page_map_has_no_units(self) -> None:
+        assert build_display_units(OrderedDict()) == ([], {})
+
+    @pytest.mark.parametrize(
+        ("solo_flags", "expected_units"),
+        [
+            # A solo cover shifts the body pages so they pair from page 1 on.
+            ([True, False, False, False, False], [(0, None), (1, 2), (3, 4)]),
+            # A solo page in the middle restarts pairing after it.
+            ([False, False, False, True, False, False], [(0, 1), (2, None), (3, None), (4, 5)]),
+            # Consecutive solo pages never pair with each other.
+            ([True, True, True], [(0, None), (1, None), (2, None)]),
+            ([False], [(0, None)]),
+        ],
+    )
+    def test_pairing(
+        self, solo_flags: list[bool], expected_units: list[tuple[int, int | None]]
+    ) -> None:
+        units, unit_idx_for_index = build_display_units(self._page_map(solo_flags))
+
+        assert units == [DisplayUnit(left, right) for left, right in expected_units]
+        for unit_idx, unit in enumerate(units):
+            assert unit_idx_for_index[unit.left_page_index] == unit_idx
+            if unit.right_page_index is not None:
+                assert unit_idx_for_index[unit.right_page_index] == unit_idx
+        assert sorted(unit_idx_for_index) == list(range(len(solo_flags)))
+
+
 class TestResolveLastRead:
     def test_single_page_mode_returns_current(self) -> None:
         page_index = 4
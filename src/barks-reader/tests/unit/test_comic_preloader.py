@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import io
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+from barks_reader.core.comic_preloader import ComicPreloader
+from barks_reader.core.page_image_source import PageImage
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from barks_reader.core.comic_book_page_info import PageInfo
+
+_FAKE_PAGE_IMAGE = PageImage(pixels=bytes(2 * 2 * 3), size=(2, 2), colorfmt="rgb")
+
+
+class RecordingSource:
+    """Records loaded page indices; ``page_loaded`` is set after every load."""
+
+    def __init__(self) -> None:
+        self.loaded: list[int] = []
+        self.opened = False
+        self.closed = threading.Event()
+        self.page_loaded = threading.Event()
+
+    def open(self) -> None:
+        self.opened = True
+
+    def close(self) -> None:
+        self.closed.set()
+
+    def load_page_pixels(self, page_info: PageInfo) -> PageImage:
+        self.loaded.append(page_info.page_index)
+        self.page_loaded.set()
+        return _FAKE_PAGE_IMAGE
+
+    @staticmethod
+    def load_page_image(page_info: PageInfo) -> tuple[io.BytesIO, str]:  # noqa: ARG004
+        """Return fake PNG bytes (unused by the loader)."""
+        return io.BytesIO(b"fake_png_data"), ".png"
+
+    @staticmethod
+    def get_image_info_str(page_info: PageInfo) -> str:  # noqa: ARG004
+        return "fake_image"
+
+
+def _make_page_map(count: int) -> OrderedDict[str, Any]:
+    page_map: OrderedDict[str, Any] = OrderedDict()
+    for i in range(count):
+        page = MagicMock()
+        page.page_index = i
+        page_map[str(i)] = page
+    return page_map
+
+
+def _builder(
+    source: RecordingSource, page_map: OrderedDict[str, Any]
+) -> Callable[[], tuple[RecordingSource, OrderedDict[str, Any], list[str]]]:
+    return lambda: (source, page_map, list(reversed(page_map)))
+
+
+def test_take_hands_over_the_first_pages_in_load_order() -> None:
+    source = RecordingSource()
+    page_map = _make_page_map(6)
+    preloader = ComicPreloader(is_loader_busy=lambda: False, num_pages=3)
+
+    preloader.preload("next", _builder(source, page_map))
+    assert source.closed.wait(2.0)
+
+    pages = preloader.take("next", page_map)
+
+    assert source.opened
+    assert source.loaded == [5, 4, 3]
+    assert pages == {5: _FAKE_PAGE_IMAGE, 4: _FAKE_PAGE_IMAGE, 3: _FAKE_PAGE_IMAGE}
+    assert preloader.preload_id == ""
+
+
+def test_take_returns_nothing_for_another_comic() -> None:
+    source = RecordingSource()
+    page_map = _make_page_map(2)
+    preloader = ComicPreloader(is_loader_busy=lambda: False)
+
+    preloader.preload("next", _builder(source, page_map))
+    assert source.closed.wait(2.0)
+
+    assert preloader.take("other", page_map) == {}
+    assert preloader.take("next", page_map) == {}  # The preload was dropped.
+
+
+def test_take_returns_nothing_for_a_different_layout() -> None:
+    source = RecordingSource()
+    preloader = ComicPreloader(is_loader_busy=lambda: False)
+
+    preloader.preload("next", _builder(source, _make_page_map(3)))
+    assert source.closed.wait(2.0)
+
+    assert preloader.take("next", _make_page_map(4)) == {}
+
+
+def test_preload_waits_while_loader_is_busy() -> None:
+    source = RecordingSource()
+    page_map = _make_page_map(4)
+    busy = threading.Event()
+    busy.set()
+    preloader = ComicPreloader(is_loader_busy=busy.is_set)
+
+    preloader.preload("next", _builder(source, page_map))
+
+    assert not source.page_loaded.wait(0.3)
+    busy.clear()
+    assert source.closed.wait(2.0)
+    assert len(preloader.take("next", page_map)) == len(page_map)
+
+
+def test_cancel_stops_preload_and_closes_source() -> None:
+    source = RecordingSource()
+    page_map = _make_page_map(4)
+    busy = threading.Event()
+    built = threading.Event()
+    preloader = ComicPreloader(is_loader_busy=busy.is_set)
+
+    def build() -> tuple[RecordingSource, OrderedDict[str, Any], list[str]]:
+        busy.set()  # The current comic needs the loader again mid-preload.
+        built.set()
+        return source, page_map, list(page_map)
+
+    preloader.preload("next", build)
+    assert built.wait(2.0)
+    preloader.cancel()
+
+    assert source.closed.wait(2.0)
+    assert source.loaded == []
+    assert preloader.take("next", page_map) == {}
+
+
+def test_failing_build_is_not_an_error() -> None:
+    preloader = ComicPreloader(is_loader_busy=lambda: False)
+    done = threading.Event()
+
+    def build() -> tuple[RecordingSource, OrderedDict[str, Any], list[str]]:
+        done.set()
+        msg = "Volume not available"
+        raise FileNotFoundError(msg)
+
+    preloader.preload("next", build)
+
+    assert done.wait(2.0)
+    assert preloader.take("next", _make_page_map(1)) == {}
+
+
+def test_cancel_does_not_wait_for_a_page_being_decoded() -> None:
+    """A decode can't be interrupted: cancel returns at once and its page is dropped."""
+    decoding = threading.Event()
+    finish_decode = threading.Event()
+
+    class BlockingSource(RecordingSource):
+        def load_page_pixels(self, page_info: PageInfo) -> PageImage:
+            decoding.set()
+            finish_decode.wait(2.0)
+            return super().load_page_pixels(page_info)
+
+    source = BlockingSource()
+    page_map = _make_page_map(3)
+    preloader = ComicPreloader(is_loader_busy=lambda: False)
+
+    preloader.preload("next", _builder(source, page_map))
+    assert decoding.wait(2.0)
+    start = time.monotonic()
+    preloader.cancel()
+    assert time.monotonic() - start < 0.5  # noqa: PLR2004
+
+    finish_decode.set()
+    assert source.closed.wait(2.0)
+    assert source.loaded == [2]  # Stopped after the page in flight.
+    assert preloader.take("next", page_map) == {}
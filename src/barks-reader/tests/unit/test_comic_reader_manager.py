@@ -278,6 +278,33 @@ class TestComicReaderManager:
         mock_dependencies["user_error_handler"].handle_error.assert_not_called()
         mock_screen.close_comic_book_reader.assert_not_called()
 
+    def test_preload_barks_prepares_comic_only_when_preload_runs(
+        self, manager: ComicReaderManager, mock_dependencies: dict[str, MagicMock]
+    ) -> None:
+        _mock_screen, mock_reader = _attach_reader_screen(manager)
+        mock_fanta_info = MagicMock(spec=FantaComicBookInfo)
+        mock_fanta_info.comic_book_info = MagicMock()
+        mock_comic = MagicMock()
+        get_comic = MagicMock(return_value=mock_comic)
+        mock_layout = _single_body_page_layout()
+        mock_dependencies["layout_builder"].build.return_value = mock_layout
+
+        manager.preload_barks_comic_book(mock_fanta_info, get_comic, "1", use_overrides_active=True)
+
+        mock_reader.preload_comic.assert_called_once()
+        fanta_info, use_overrides, page_to_first_goto, prepare_comic = (
+            mock_reader.preload_comic.call_args.args
+        )
+        assert (fanta_info, use_overrides, page_to_first_goto) == (mock_fanta_info, True, "1")
+        get_comic.assert_not_called()
+        mock_dependencies["last_read_page_tracker"].begin.assert_not_called()
+
+        with patch.object(barks_reader.core.reader_setup, "ComicBookImageBuilder"):
+            layout, _image_builder = prepare_comic()
+
+        assert layout is mock_layout
+        mock_dependencies["layout_builder"].build.assert_called_once_with(mock_comic)
+
     def test_comic_closed_delegates_to_tracker(
         self, manager: ComicReaderManager, mock_dependencies: dict[str, MagicMock]
     ) -> None:
@@ -101,6 +101,16 @@ class TestEntityIndexScreen:
             EntityType.PERSON, "Donald Duck"
         )
 
+    def test_find_background_titles_searches_entities(
+        self, person_index_screen: EntityIndexScreen
+    ) -> None:
+        person_index_screen._search.find_entities.return_value = {"Title A": MagicMock()}
+
+        assert person_index_screen._find_background_titles("Donald Duck") == ["Title A"]
+        person_index_screen._search.find_entities.assert_called_with(
+            EntityType.PERSON, "Donald Duck"
+        )
+
     def test_entity_type_stored(self, person_index_screen: EntityIndexScreen) -> None:
         assert person_index_screen._entity_type == EntityType.PERSON
 
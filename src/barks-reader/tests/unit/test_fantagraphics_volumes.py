@@ -1,5 +1,6 @@
 # ruff: noqa: SLF001, PLR2004
 
+import json
 import zipfile
 from pathlib import Path
 
@@ -7,6 +8,7 @@ import pytest
 from barks_fantagraphics.barks_titles import ENUM_TO_STR_TITLE, Titles
 from barks_fantagraphics.fanta_comics_info import NUM_VOLUMES
 from barks_reader.core.fantagraphics_volumes import (
+    VOLUMES_MANIFEST_VERSION,
     DuplicateArchiveFilesError,
     FantagraphicsArchive,
     FantagraphicsVolumeArchives,
@@ -564,3 +566,113 @@ class TestLoadEndToEnd:
 
         with pytest.raises(PageExtError, match="expecting extension to be in"):
             archives.load()
+
+
+class TestVolumesManifest:
+    @staticmethod
+    def _make_tree(tmp_path: Path) -> tuple[Path, Path]:
+        archive_root = tmp_path / "archive"
+        override_root = tmp_path / "override"
+        archive_root.mkdir()
+        override_root.mkdir()
+        for vol in range(1, NUM_VOLUMES + 1):
+            _make_volume_zip(
+                archive_root / f"{vol:02d}-vol.cbz",
+                image_names=["page001.png", "page002.png", "page003.png"],
+            )
+        _make_override_zip(override_root / "01-override.cbz", image_names=["002.png", "009.png"])
+        return archive_root, override_root
+
+    @staticmethod
+    def _load(
+        archive_root: Path, override_root: Path, manifest: Path
+    ) -> FantagraphicsVolumeArchives:
+        archives = FantagraphicsVolumeArchives(
+            archive_root=archive_root,
+            override_root=override_root,
+            volume_list=list(range(1, NUM_VOLUMES + 1)),
+            manifest_path=manifest,
+        )
+        archives.load()
+        return archives
+
+    def test_warm_load_matches_cold_load_without_scanning(self, tmp_path: Path) -> None:
+        archive_root, override_root = self._make_tree(tmp_path)
+        manifest = tmp_path / "manifest.json"
+
+        cold = self._load(archive_root, override_root, manifest)
+        assert cold.num_volumes_scanned == NUM_VOLUMES
+        assert manifest.is_file()
+
+        warm = self._load(archive_root, override_root, manifest)
+        assert warm.num_volumes_scanned == 0
+
+        for vol in range(1, NUM_VOLUMES + 1):
+            assert warm.get_fantagraphics_archive(vol) == cold.get_fantagraphics_archive(vol)
+        vol1 = warm.get_fantagraphics_archive(1)
+        assert vol1.override_images_page_map == {"002": Path("002.png")}
+        assert vol1.extra_images_page_map == {"009": Path("009.png")}
+
+    def test_only_changed_volumes_are_rescanned(self, tmp_path: Path) -> None:
+        archive_root, override_root = self._make_tree(tmp_path)
+        manifest = tmp_path / "manifest.json"
+        self._load(archive_root, override_root, manifest)
+
+        _make_volume_zip(archive_root / "02-vol.cbz", image_names=["page001.png", "page002.png"])
+        _make_override_zip(override_root / "01-override.cbz", image_names=["003.png"])
+
+        archives = self._load(archive_root, override_root, manifest)
+
+        assert archives.num_volumes_scanned == 2
+        assert archives.get_fantagraphics_archive(2).last_page == 2
+        assert archives.get_fantagraphics_archive(1).override_images_page_map == {
+            "003": Path("003.png")
+        }
+
+    def test_corrupt_manifest_falls_back_to_scanning(self, tmp_path: Path) -> None:
+        archive_root, override_root = self._make_tree(tmp_path)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text("{not json")
+
+        archives = self._load(archive_root, override_root, manifest)
+
+        assert archives.num_volumes_scanned == NUM_VOLUMES
+        assert self._load(archive_root, override_root, manifest).num_volumes_scanned == 0
+
+    @pytest.mark.parametrize(
+        "manifest_text",
+        [
+            "[]",
+            json.dumps({"version": VOLUMES_MANIFEST_VERSION}),
+            json.dumps({"version": VOLUMES_MANIFEST_VERSION, "volumes": [1, 2]}),
+        ],
+    )
+    def test_malformed_manifest_falls_back_to_scanning(
+        self, tmp_path: Path, manifest_text: str
+    ) -> None:
+        archive_root, override_root = self._make_tree(tmp_path)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(manifest_text)
+
+        archives = self._load(archive_root, override_root, manifest)
+
+        assert archives.num_volumes_scanned == NUM_VOLUMES
+        assert self._load(archive_root, override_root, manifest).num_volumes_scanned == 0
+
+    def test_malformed_entries_are_rescanned(self, tmp_path: Path) -> None:
+        archive_root, override_root = self._make_tree(tmp_path)
+        manifest = tmp_path / "manifest.json"
+        cold = self._load(archive_root, override_root, manifest)
+
+        saved = json.loads(manifest.read_text())
+        del saved["volumes"]["1"]["signature"]
+        saved["volumes"]["2"]["archive_images_page_map"] = ["page001.png"]
+        saved["volumes"]["3"] = "not an entry"
+        manifest.write_text(json.dumps(saved))
+
+        archives = self._load(archive_root, override_root, manifest)
+
+        assert archives.num_volumes_scanned == 3
+        for vol in (1, 2, 3):
+            assert archives.get_fantagraphics_archive(vol) == cold.get_fantagraphics_archive(vol)
+        assert self._load(archive_root, override_root, manifest).num_volumes_scanned == 0
@@ -7,6 +7,8 @@ files on disk, so composition across stages is actually covered.
 from __future__ import annotations
 
 import io
+import sys
+import types
 import zipfile
 from typing import TYPE_CHECKING
 from unittest.mock import patch
@@ -17,10 +19,13 @@ from barks_reader.core.image_pipeline import (
     convert_mode,
     decode_pil,
     encode_png_stream,
+    from_page_image,
     load_pil,
     read_raw_bytes,
     resize_contain,
+    to_page_image,
 )
+from comic_utils.pil_image_utils import get_decode_reduction
 from PIL import Image
 
 if TYPE_CHECKING:
@@ -91,6 +96,41 @@ class TestDecodePil:
         with pytest.raises(Exception):  # noqa: B017, PT011
             decode_pil(b"not an image")
 
+    @pytest.mark.parametrize(
+        ("min_decode_scale", "expected_size", "expected_reduction"),
+        [
+            (1.0, (400, 200), (1.0, 1.0)),
+            (0.5, (200, 100), (2.0, 2.0)),
+            (0.3, (200, 100), (2.0, 2.0)),
+            (0.1, (50, 25), (8.0, 8.0)),
+        ],
+    )
+    @pytest.mark.parametrize("ext", [".jpg", None])
+    def test_decode_jpg_reduced(
+        self,
+        ext: str | None,
+        min_decode_scale: float,
+        expected_size: tuple[int, int],
+        expected_reduction: tuple[float, float],
+    ) -> None:
+        pil = decode_pil(_make_jpg_bytes((400, 200)), ext=ext, min_decode_scale=min_decode_scale)
+
+        assert pil.size == expected_size
+        assert get_decode_reduction(pil) == expected_reduction
+
+    def test_decode_jpg_reduction_is_not_the_size_ratio(self) -> None:
+        """A reduced JPEG decode rounds its sides up: 36x20 at 1/8 is 5x3, not 4.5x2.5."""
+        pil = decode_pil(_make_jpg_bytes((36, 20)), ext=".jpg", min_decode_scale=0.1)
+
+        assert pil.size == (5, 3)
+        assert get_decode_reduction(pil) == (8.0, 8.0)
+
+    def test_decode_png_ignores_reduced_scale(self) -> None:
+        pil = decode_pil(_make_png_bytes((400, 200)), ext=".png", min_decode_scale=0.1)
+
+        assert pil.size == (400, 200)
+        assert get_decode_reduction(pil) == (1.0, 1.0)
+
 
 class TestLoadPil:
     def test_load_pil_from_filesystem_path(self, tmp_path: Path) -> None:
@@ -114,6 +154,17 @@ class TestLoadPil:
 
         assert pil.size == (16, 8)
 
+    def test_load_pil_from_zip_reduced(self, tmp_path: Path) -> None:
+        zip_path = tmp_path / "archive.zip"
+        _write_zip(zip_path, {"images/p1.jpg": _make_jpg_bytes((400, 200))})
+
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            pil = load_pil(
+                zipfile.Path(zf, at="images/p1.jpg"), use_ext_hint=True, min_decode_scale=0.25
+            )
+
+        assert pil.size == (100, 50)
+
     def test_load_pil_encrypted_zip_delegates_to_allow_listed_loader(self, tmp_path: Path) -> None:
         """Encrypted reads must go through comic_utils' allow-listed loader.
 
@@ -134,9 +185,26 @@ class TestLoadPil:
             zip_member = zipfile.Path(zf, at="p.png")
             result = load_pil(zip_member, encrypted_zip=True, use_ext_hint=True)
 
-        mock_loader.assert_called_once_with(zip_member, encrypted=True)
+        mock_loader.assert_called_once_with(zip_member, encrypted=True, min_decode_scale=1.0)
         assert result is sentinel
 
+    def test_load_pil_encrypted_zip_reduces_decrypted_bytes(self, tmp_path: Path) -> None:
+        """Decrypted override JPEGs get the same reduced decode as archive pages."""
+        zip_path = tmp_path / "enc.zip"
+        _write_zip(zip_path, {"p.jpg": b"cipher"})
+        panel_bytes_module = types.SimpleNamespace(
+            get_decrypted_bytes=lambda _data: _make_jpg_bytes((400, 200))
+        )
+
+        with (
+            zipfile.ZipFile(zip_path, "r") as zf,
+            patch.dict(sys.modules, {"comic_utils.get_panel_bytes": panel_bytes_module}),
+        ):
+            pil = load_pil(zipfile.Path(zf, at="p.jpg"), encrypted_zip=True, min_decode_scale=0.5)
+
+        assert pil.size == (200, 100)
+        assert get_decode_reduction(pil) == (2.0, 2.0)
+
 
 class TestTransformStages:
     def test_convert_mode_to_rgba(self) -> None:
@@ -165,6 +233,30 @@ class TestTransformStages:
         assert decoded.size == (10, 5)
 
 
+class TestPageImageBuffers:
+    def test_opaque_image_flattens_to_rgb(self) -> None:
+        page_image = to_page_image(Image.new("L", (4, 3), 7))
+
+        assert page_image.colorfmt == "rgb"
+        assert page_image.size == (4, 3)
+        assert page_image.pixels == bytes([7, 7, 7]) * 12
+
+    def test_transparent_image_keeps_alpha(self) -> None:
+        page_image = to_page_image(Image.new("RGBA", (2, 2), (1, 2, 3, 128)))
+
+        assert page_image.colorfmt == "rgba"
+        assert page_image.pixels == bytes([1, 2, 3, 128]) * 4
+
+    def test_round_trip_through_pil(self) -> None:
+        original = Image.new("RGB", (5, 6), (10, 20, 30))
+
+        restored = from_page_image(to_page_image(original))
+
+        assert restored.mode == "RGB"
+        assert restored.size == (5, 6)
+        assert restored.tobytes() == original.tobytes()
+
+
 class TestEndToEndPipeline:
     """Integration test: ZIP archive → ready-to-display PNG bytes."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import random
+import zipfile
 from collections import defaultdict
 from pathlib import Path
 from random import randrange
@@ -13,6 +14,7 @@ import pytest
 from barks_fantagraphics.barks_titles import Titles
 from barks_reader.core import image_selector as is_module
 from barks_reader.core.image_selector import FIT_MODE_CONTAIN, FIT_MODE_COVER, ImageSelector
+from barks_reader.core.panel_dimensions_index import PanelDimensions
 from barks_reader.core.reader_file_paths import EMERGENCY_INSET_FILE, FileTypes
 from barks_reader.core.reader_settings import ReaderSettings
 from barks_reader.core.reader_utils import get_all_files_in_dir
@@ -37,6 +39,7 @@ class FakeResolver:
         self.file_ext: str = ".png"
         self.search_files: list[PanelPath] = [Path("search1.png")]
         self.edited_version: tuple[PanelPath, bool] = (Path("edited.png"), True)
+        self.panel_dimensions: dict[PanelPath, PanelDimensions] = {}
 
     def resolve(
         self, title_str: str, category: FileTypes, prefer_edited: bool
@@ -65,6 +68,9 @@ class FakeResolver:
     def get_comic_search_files(self, _title_str: str, _prefer_edited: bool) -> list[PanelPath]:
         return self.search_files
 
+    def get_panel_dimensions(self, image_file: PanelPath) -> PanelDimensions | None:
+        return self.panel_dimensions.get(image_file)
+
 
 @pytest.fixture
 def mock_settings() -> MagicMock:
@@ -424,6 +430,44 @@ class TestImageSelector:
         image_selector._never_crop_images = frozenset({"012-3.png"})
         assert not image_selector._is_never_crop(Path("/comics/x-012-3.png"))
 
+    def test_never_crop_matches_longer_suffixes(self, image_selector: ImageSelector) -> None:
+        image_selector._never_crop_images = frozenset({"Splash/Lost in the Andes/012-3.png"})
+
+        assert image_selector._is_never_crop(Path("/comics/Splash/Lost in the Andes/012-3.png"))
+        assert image_selector._is_never_crop(Path("Splash/Lost in the Andes/012-3.png"))
+        assert not image_selector._is_never_crop(Path("/comics/Insets/Lost in the Andes/012-3.png"))
+
+    def test_adaptive_fit_mode_uses_indexed_dimensions(
+        self, image_selector: ImageSelector, fake_resolver: FakeResolver
+    ) -> None:
+        """Indexed dimensions are used without reading the image."""
+        image_file = Path("splash.png")
+        fake_resolver.panel_dimensions[image_file] = PanelDimensions(1000, 800)
+
+        with patch.object(is_module, is_module.get_image_size.__name__) as mock_get_image_size:
+            assert image_selector._get_adaptive_fit_mode(image_file) == FIT_MODE_COVER
+            fake_resolver.panel_dimensions[image_file] = PanelDimensions(650, 1000)
+            assert image_selector._get_adaptive_fit_mode(image_file) == FIT_MODE_CONTAIN
+
+        mock_get_image_size.assert_not_called()
+
+    def test_adaptive_fit_mode_unindexed_zip_member_uses_contain(
+        self, image_selector: ImageSelector, tmp_path: Path
+    ) -> None:
+        """A zip member missing from the index is never read (that would mean decrypting it)."""
+        zip_file = tmp_path / "panels.zip"
+        with zipfile.ZipFile(zip_file, "w") as archive:
+            archive.writestr("Splash/splash.jpg", b"encrypted")
+
+        with (
+            zipfile.ZipFile(zip_file) as archive,
+            patch.object(is_module, is_module.get_image_size.__name__) as mock_get_image_size,
+        ):
+            image_file = zipfile.Path(archive, "Splash/splash.jpg")
+            assert image_selector._get_adaptive_fit_mode(image_file) == FIT_MODE_CONTAIN
+
+        mock_get_image_size.assert_not_called()
+
     def test_load_never_crop_images_parses_file(
         self,
         image_selector: ImageSelector,
@@ -51,6 +51,7 @@ def mock_components() -> MainScreenComponents:
     return MainScreenComponents(
         random_title_images=MagicMock(),
         json_settings_manager=MagicMock(),
+        reading_history_store=MagicMock(),
         special_fanta_overrides=MagicMock(),
         comic_reader_manager=MagicMock(),
         window_helper=MagicMock(),
@@ -196,6 +197,10 @@ class TestMainScreen:
         scheduled_callback(0)
         main_screen._nav.enter_bottom_focus_if_index_visible.assert_called_once_with(keyboard)
 
+    def test_app_closing_flushes_reading_history(self, main_screen: MainScreen) -> None:
+        main_screen.app_closing()
+        main_screen._reading_history_store.close.assert_called_once()
+
     def test_on_action_bar_collapse(self, main_screen: MainScreen) -> None:
         main_screen.on_action_bar_collapse()
         main_screen._tree_view_manager.deselect_and_close_open_nodes.assert_called_once()
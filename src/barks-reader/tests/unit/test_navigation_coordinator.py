@@ -8,9 +8,19 @@ from unittest.mock import MagicMock, patch
 import barks_reader.ui.navigation_coordinator
 import pytest
 from barks_fantagraphics.barks_titles import ENUM_TO_STR_TITLE, Titles
+from barks_fantagraphics.fanta_comics_info import ALL_FANTA_COMIC_BOOK_INFO
 from barks_reader.core.image_selector import ImageInfo
 from barks_reader.core.navigation.view_states import ViewStates
 from barks_reader.ui.navigation_coordinator import NavigationCoordinator, TitleTarget
+from barks_reader.ui.tree_view_nodes import TitleTreeViewNode
+
+
+def _make_title_node(title: Titles) -> MagicMock:
+    node = MagicMock(spec=TitleTreeViewNode)
+    node.fanta_info = ALL_FANTA_COMIC_BOOK_INFO[title]
+    node.get_title.return_value = title
+    node.parent_node = MagicMock()
+    return node
 
 
 @pytest.fixture
@@ -238,6 +248,77 @@ class TestNavigationCoordinator:
         mock_deps["on_active_changed"].assert_called_once()
         mock_deps["comic_reader_manager"].read_barks_comic_book.assert_called_once()
 
+    def test_read_comic_preloads_next_title_in_series(
+        self, nav_coord: NavigationCoordinator, mock_deps: dict[str, MagicMock]
+    ) -> None:
+        """After opening a comic, the next comic in the same series is preloaded."""
+        mock_fanta_info = MagicMock()
+        mock_fanta_info.comic_book_info.title = Titles.DONALD_DUCK_AND_THE_MUMMYS_RING
+        nav_coord._current_fanta_info = mock_fanta_info
+        mock_deps["bottom_title_view_screen"].goto_page_active = False
+        mock_deps["reader_settings"].use_prebuilt_archives = False
+        overrides = mock_deps["special_fanta_overrides"]
+        overrides.is_title_where_overrides_are_optional.return_value = False
+        manager = mock_deps["comic_reader_manager"]
+        manager.get_last_read_page.return_value = MagicMock(display_page_num="12")
+
+        assert nav_coord.read_comic() is True
+
+        manager.preload_barks_comic_book.assert_called_once()
+        # Skips the intervening short story: the next Donald Duck Adventures title.
+        fanta_info, get_comic, page_to_first_goto, use_overrides = (
+            manager.preload_barks_comic_book.call_args.args
+        )
+        assert fanta_info.comic_book_info.title == Titles.TOO_MANY_PETS
+        assert page_to_first_goto == "12"
+        assert use_overrides is True
+        # The comic itself is only built when the preload runs.
+        get_comic_book = mock_deps["comics_database"].get_comic_book
+        get_comic_book.reset_mock()
+        get_comic()
+        get_comic_book.assert_called_once()
+        assert get_comic_book.call_args.args[0] == ENUM_TO_STR_TITLE[Titles.TOO_MANY_PETS]
+
+    def test_read_comic_preloads_next_comic_in_the_selected_title_list(
+        self, nav_coord: NavigationCoordinator, mock_deps: dict[str, MagicMock]
+    ) -> None:
+        """A title read from a tree list preloads the next comic in that list."""
+        title_nodes = [
+            _make_title_node(title)
+            for title in (
+                Titles.DONALD_DUCK_AND_THE_MUMMYS_RING,
+                Titles.IF_THE_HAT_FITS,
+                Titles.ADVENTURE_DOWN_UNDER,
+            )
+        ]
+        parent = MagicMock()
+        parent.nodes = title_nodes
+        title_nodes[0].parent_node = parent
+        mock_deps["tree_view_screen"].get_selected_node.return_value = title_nodes[0]
+        nav_coord._current_fanta_info = title_nodes[0].fanta_info
+        mock_deps["bottom_title_view_screen"].goto_page_active = False
+        mock_deps["comic_reader_manager"].get_last_read_page.return_value = None
+
+        assert nav_coord.read_comic() is True
+
+        # Skips the one-pager, which is read in its collection, not as a comic.
+        manager = mock_deps["comic_reader_manager"]
+        fanta_info = manager.preload_barks_comic_book.call_args.args[0]
+        assert fanta_info.comic_book_info.title == Titles.ADVENTURE_DOWN_UNDER
+
+    def test_read_comic_last_in_the_selected_title_list_preloads_nothing(
+        self, nav_coord: NavigationCoordinator, mock_deps: dict[str, MagicMock]
+    ) -> None:
+        title_node = _make_title_node(Titles.DONALD_DUCK_AND_THE_MUMMYS_RING)
+        title_node.parent_node.nodes = [title_node]
+        mock_deps["tree_view_screen"].get_selected_node.return_value = title_node
+        nav_coord._current_fanta_info = title_node.fanta_info
+        mock_deps["bottom_title_view_screen"].goto_page_active = False
+
+        assert nav_coord.read_comic() is True
+
+        mock_deps["comic_reader_manager"].preload_barks_comic_book.assert_not_called()
+
     def test_read_comic_one_pager_opens_collection_at_its_page(
         self, nav_coord: NavigationCoordinator, mock_deps: dict[str, MagicMock]
     ) -> None:
@@ -334,6 +415,7 @@ class TestNavigationCoordinator:
 
         assert result is False
         mock_deps["comic_reader_manager"].read_barks_comic_book.assert_not_called()
+        mock_deps["comic_reader_manager"].preload_barks_comic_book.assert_not_called()
 
     def test_on_comic_closed_restores_view_state(
         self, nav_coord: NavigationCoordinator, mock_deps: dict[str, MagicMock]
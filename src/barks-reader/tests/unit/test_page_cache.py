@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from barks_reader.core.page_cache import PageCache
+from barks_reader.core.page_image_source import PageImage
+
+
+def _page(nbytes: int = 10) -> PageImage:
+    return PageImage(pixels=bytes(nbytes), size=(nbytes, 1), colorfmt="rgb")
+
+
+class TestPageCache:
+    def test_put_and_get(self) -> None:
+        cache = PageCache(max_bytes=100)
+        page = _page()
+
+        cache.put(0, page)
+
+        assert cache.get(0) is page
+        assert cache.get(1) is None
+        assert 0 in cache
+        assert len(cache) == 1
+        assert cache.total_bytes == 10  # noqa: PLR2004
+
+    def test_replacing_a_page_does_not_double_count(self) -> None:
+        cache = PageCache(max_bytes=100)
+
+        cache.put(0, _page(10))
+        cache.put(0, _page(30))
+
+        assert cache.total_bytes == 30  # noqa: PLR2004
+
+    def test_evicts_least_recently_used_outside_pinned_window(self) -> None:
+        evicted: list[int] = []
+        cache = PageCache(max_bytes=30, on_evict=evicted.append, keep_radius=0)
+        cache.set_focus(100)  # Nothing near the pages below is pinned.
+
+        cache.put(0, _page())
+        cache.put(1, _page())
+        cache.put(2, _page())
+        cache.get(0)  # Page 0 is now more recent than page 1.
+        cache.put(3, _page())
+
+        assert evicted == [1]
+        assert 1 not in cache
+        assert cache.total_bytes == 30  # noqa: PLR2004
+        assert cache.num_evictions == 1
+
+    def test_pages_near_focus_are_never_evicted(self) -> None:
+        evicted: list[int] = []
+        cache = PageCache(max_bytes=20, on_evict=evicted.append, keep_radius=1)
+        cache.set_focus(5)
+
+        for page_index in (4, 5, 6, 7):
+            cache.put(page_index, _page())
+
+        # 4, 5 and 6 are pinned; only 7 (just inserted) would be left, and it is kept.
+        assert evicted == []
+        assert cache.total_bytes == 40  # noqa: PLR2004
+
+        cache.set_focus(20)
+        cache.put(20, _page())
+
+        # Over-budget pages are reclaimed once the focus moves away from them.
+        assert evicted == [4, 5, 6]
+        assert cache.total_bytes == 20  # noqa: PLR2004
+
+    def test_evicted_near_focus_reports_pages_to_reload(self) -> None:
+        cache = PageCache(max_bytes=10, keep_radius=1)
+        cache.set_focus(100)
+        cache.put(0, _page())
+        cache.put(1, _page())  # Evicts 0.
+        cache.put(2, _page())  # Evicts 1.
+
+        cache.set_focus(1)
+
+        assert cache.evicted_near_focus() == [0, 1]
+
+        cache.put(1, _page())
+        assert cache.evicted_near_focus() == [0]
+
+    def test_clear_drops_everything_without_callbacks(self) -> None:
+        evicted: list[int] = []
+        cache = PageCache(max_bytes=100, on_evict=evicted.append)
+        cache.put(0, _page())
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
+        assert evicted == []
+
+    def test_spreads_share_the_budget_but_are_not_reported_as_evicted(self) -> None:
+        evicted: list[int] = []
+        cache = PageCache(max_bytes=40, on_evict=evicted.append, keep_radius=0)
+        cache.set_focus(100)
+        spread = _page(20)
+
+        cache.put(0, _page())
+        cache.put(1, _page())
+        cache.put_spread(0, 1, spread)
+
+        assert cache.get_spread(0, 1) is spread
+        assert cache.get_spread(1, 2) is None
+        assert cache.num_spreads == 1
+        assert cache.page_sizes() == [10, 10]
+        assert cache.total_bytes == 40  # noqa: PLR2004
+
+        cache.get(0)
+        cache.get(1)  # The spread is now the least recently used entry.
+        cache.put(2, _page())
+
+        assert cache.get_spread(0, 1) is None
+        assert evicted == []
+        assert cache.evicted_near_focus() == []
+
+    def test_drop_spreads_keeps_the_pages(self) -> None:
+        cache = PageCache(max_bytes=100)
+        cache.put(0, _page())
+        cache.put(1, _page())
+        cache.put_spread(0, 1, _page(20))
+
+        cache.drop_spreads()
+
+        assert cache.num_spreads == 0
+        assert cache.page_sizes() == [10, 10]
+        assert cache.total_bytes == 20  # noqa: PLR2004
+
+    def test_spread_is_pinned_with_its_left_page(self) -> None:
+        cache = PageCache(max_bytes=20, keep_radius=0)
+        cache.set_focus(4)
+
+        cache.put_spread(4, 5, _page(20))
+        cache.put(8, _page())
+
+        assert cache.get_spread(4, 5) is not None
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from typing import TYPE_CHECKING
+
+import pytest
+from barks_reader.core.panel_dimensions_index import (
+    PANEL_DIMENSIONS_INDEX_VERSION,
+    PanelDimensions,
+    PanelDimensionsIndex,
+    get_panel_dimensions_index_file,
+    load_panel_dimensions_index,
+    write_panel_dimensions_index,
+)
+from PIL import Image
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_IMAGE_SIZES = {
+    "Splash/Title One.png": (300, 200),
+    "Insets/Title Two.jpg": (120, 160),
+}
+
+
+def _image_bytes(size: tuple[int, int], image_format: str) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, (200, 100, 50)).save(buffer, format=image_format)
+    return buffer.getvalue()
+
+
+def _read_image_size(archive: zipfile.ZipFile, info: zipfile.ZipInfo) -> tuple[int, int]:
+    with Image.open(io.BytesIO(archive.read(info))) as image:
+        return image.size
+
+
+@pytest.fixture
+def panels_zip_file(tmp_path: Path) -> Path:
+    zip_file = tmp_path / "Barks Panels.zip"
+    with zipfile.ZipFile(zip_file, "w") as archive:
+        archive.writestr("Splash/", "")
+        archive.writestr("Splash/notes.txt", "not an image")
+        for name, size in _IMAGE_SIZES.items():
+            archive.writestr(name, _image_bytes(size, "PNG" if name.endswith(".png") else "JPEG"))
+    return zip_file
+
+
+@pytest.fixture
+def index_file(panels_zip_file: Path) -> Path:
+    index_file = get_panel_dimensions_index_file(panels_zip_file)
+    with zipfile.ZipFile(panels_zip_file) as archive:
+        write_panel_dimensions_index(index_file, archive, _read_image_size)
+    return index_file
+
+
+def _load(panels_zip_file: Path, index_file: Path) -> PanelDimensionsIndex:
+    with zipfile.ZipFile(panels_zip_file) as archive:
+        return load_panel_dimensions_index(archive, index_file)
+
+
+def test_index_file_is_stored_alongside_the_zip(tmp_path: Path) -> None:
+    index_file = get_panel_dimensions_index_file(tmp_path / "Barks Panels.zip")
+    assert index_file == tmp_path / "Barks Panels.dims.json"
+
+
+def test_write_indexes_only_images(index_file: Path) -> None:
+    index = json.loads(index_file.read_text(encoding="utf-8"))
+
+    assert index["version"] == PANEL_DIMENSIONS_INDEX_VERSION
+    assert set(index["members"]) == set(_IMAGE_SIZES)
+
+
+def test_load_round_trip(panels_zip_file: Path, index_file: Path) -> None:
+    index = _load(panels_zip_file, index_file)
+
+    assert len(index) == len(_IMAGE_SIZES)
+    with zipfile.ZipFile(panels_zip_file) as archive:
+        root = zipfile.Path(archive)
+        for name, (width, height) in _IMAGE_SIZES.items():
+            assert index.get(root / name) == PanelDimensions(width, height)
+        assert index.get(root / "Splash/Missing.png") is None
+
+
+def test_filesystem_paths_are_not_indexed(
+    panels_zip_file: Path, index_file: Path, tmp_path: Path
+) -> None:
+    index = _load(panels_zip_file, index_file)
+    assert index.get(tmp_path / "Splash" / "Title One.png") is None
+
+
+def test_entries_with_a_changed_crc_are_dropped(panels_zip_file: Path, index_file: Path) -> None:
+    rebuilt_zip_file = panels_zip_file.with_name("rebuilt.zip")
+    with zipfile.ZipFile(rebuilt_zip_file, "w") as archive:
+        archive.writestr("Splash/Title One.png", _image_bytes((10, 10), "PNG"))
+        archive.writestr("Insets/Title Two.jpg", _image_bytes((120, 160), "JPEG"))
+
+    index = _load(rebuilt_zip_file, index_file)
+
+    with zipfile.ZipFile(rebuilt_zip_file) as archive:
+        root = zipfile.Path(archive)
+        assert index.get(root / "Splash/Title One.png") is None
+        assert index.get(root / "Insets/Title Two.jpg") == PanelDimensions(120, 160)
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        "not json",
+        json.dumps({"version": PANEL_DIMENSIONS_INDEX_VERSION + 1, "members": {}}),
+        json.dumps({"version": PANEL_DIMENSIONS_INDEX_VERSION, "members": []}),
+        json.dumps({"version": PANEL_DIMENSIONS_INDEX_VERSION, "members": {"a.png": [1, 2]}}),
+    ],
+    ids=["not_json", "outdated", "members_not_a_dict", "short_entry"],
+)
+def test_bad_index_gives_an_empty_index(
+    panels_zip_file: Path, index_file: Path, contents: str
+) -> None:
+    index_file.write_text(contents, encoding="utf-8")
+    assert len(_load(panels_zip_file, index_file)) == 0
+
+
+def test_missing_index_gives_an_empty_index(panels_zip_file: Path, tmp_path: Path) -> None:
+    assert len(_load(panels_zip_file, tmp_path / "missing.dims.json")) == 0
+
+
+def test_aspect_ratio() -> None:
+    assert PanelDimensions(300, 200).aspect_ratio == 1.5  # noqa: PLR2004
+    assert PanelDimensions(300, 0).aspect_ratio is None
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from barks_reader.core.page_image_source import PageImage
+from barks_reader.core.panel_image_cache import PanelImageCache
+
+
+def _image(width: int = 5) -> PageImage:
+    return PageImage(pixels=bytes(width * 4), size=(width, 1), colorfmt="rgba")
+
+
+class TestPanelImageCache:
+    def test_put_and_get(self) -> None:
+        cache = PanelImageCache(max_bytes=100)
+        image = _image()
+
+        cache.put("a.png", image)
+
+        assert cache.get("a.png") is image
+        assert cache.get("b.png") is None
+        assert "a.png" in cache
+        assert len(cache) == 1
+        assert cache.total_bytes == 20  # noqa: PLR2004
+
+    def test_replacing_an_image_does_not_double_count(self) -> None:
+        cache = PanelImageCache(max_bytes=100)
+
+        cache.put("a.png", _image(5))
+        cache.put("a.png", _image(10))
+
+        assert cache.total_bytes == 40  # noqa: PLR2004
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = PanelImageCache(max_bytes=60)
+
+        cache.put("a.png", _image())
+        cache.put("b.png", _image())
+        cache.put("c.png", _image())
+        cache.get("a.png")  # a is now more recent than b.
+        cache.put("d.png", _image())
+
+        assert "b.png" not in cache
+        assert len(cache) == 3  # noqa: PLR2004
+        assert cache.total_bytes == 60  # noqa: PLR2004
+
+    def test_image_larger_than_budget_is_not_cached(self) -> None:
+        cache = PanelImageCache(max_bytes=60)
+        cache.put("a.png", _image())
+
+        cache.put("big.png", _image(100))
+
+        assert "big.png" not in cache
+        assert "a.png" in cache
+
+    def test_clear(self) -> None:
+        cache = PanelImageCache(max_bytes=100)
+        cache.put("a.png", _image())
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.total_bytes == 0
@@ -1,31 +1,55 @@
-# ruff: noqa: SLF001, ARG005
+# ruff: noqa: SLF001
 
 from __future__ import annotations
 
-import threading
-from contextlib import contextmanager
+from concurrent.futures import Executor, Future
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from barks_reader.core import panel_image_loader as loader_module
+from barks_reader.core.page_image_source import PageImage
+from barks_reader.core.panel_image_cache import PanelImageCache
 from barks_reader.core.panel_image_loader import PanelImageLoader, load_panel_pil
 from barks_reader.core.testing import FakeScheduler
 from PIL import Image
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable
 
 
-@contextmanager
-def _synchronous_worker_thread() -> Iterator[MagicMock]:
-    """Patch the loader's Thread so the worker runs synchronously on start()."""
-    with patch.object(loader_module, threading.Thread.__name__) as mock_thread_cls:
-        mock_thread_cls.side_effect = lambda target, args, daemon: MagicMock(
-            start=lambda: target(*args)
-        )
-        yield mock_thread_cls
+class DeferredExecutor(Executor):
+    """Queues submitted work until the test runs it with :meth:`run_next`."""
+
+    def __init__(self) -> None:
+        self.submitted: list[tuple[Callable[..., Any], tuple[Any, ...]]] = []
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ANN401
+        assert not kwargs
+        self.submitted.append((fn, args))
+        return Future()
+
+    def run_next(self) -> None:
+        fn, args = self.submitted.pop(0)
+        fn(*args)
+
+
+class InlineExecutor(DeferredExecutor):
+    """Runs submitted work synchronously."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ANN401
+        future = super().submit(fn, *args, **kwargs)
+        self.run_next()
+        return future
+
+
+def _rgba_image(size: tuple[int, int] = (4, 3)) -> Image.Image:
+    return Image.new("RGBA", size, (10, 20, 30, 255))
+
+
+def _page_image(pil: Image.Image) -> PageImage:
+    return PageImage(pixels=pil.tobytes(), size=pil.size, colorfmt="rgba")
 
 
 @pytest.fixture
@@ -39,8 +63,20 @@ def fake_scheduler() -> FakeScheduler:
 
 
 @pytest.fixture
-def loader(fake_scheduler: FakeScheduler) -> PanelImageLoader:
-    return PanelImageLoader(fake_scheduler)
+def cache() -> PanelImageCache:
+    return PanelImageCache(max_bytes=1024 * 1024)
+
+
+@pytest.fixture
+def executor() -> DeferredExecutor:
+    return InlineExecutor()
+
+
+@pytest.fixture
+def loader(
+    fake_scheduler: FakeScheduler, executor: DeferredExecutor, cache: PanelImageCache
+) -> PanelImageLoader:
+    return PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
 
 
 class TestLoadPanelPil:
@@ -72,7 +108,7 @@ class TestPanelImageLoader:
         loader.cancel()
         assert loader._generation == 1
 
-    def test_load_pil_success_invokes_callback_with_rgba_image(
+    def test_load_pixels_success_invokes_callback_with_rgba_buffer(
         self,
         loader: PanelImageLoader,
         mock_callback: MagicMock,
@@ -80,38 +116,37 @@ class TestPanelImageLoader:
     ) -> None:
         mock_path = MagicMock(spec=Path)
         raw_pil = MagicMock(spec=Image.Image)
-        converted = MagicMock(spec=Image.Image)
-        raw_pil.convert.return_value = converted
+        converted = _rgba_image()
 
         with (
-            _synchronous_worker_thread(),
             patch.object(loader_module, "load_pil", return_value=raw_pil) as mock_load_pil,
             patch.object(loader_module, "convert_mode", return_value=converted) as mock_convert,
         ):
-            loader.load_pil(mock_path, mock_callback)
+            loader.load_pixels(mock_path, mock_callback)
 
             mock_load_pil.assert_called_once_with(mock_path, encrypted_zip=True)
             mock_convert.assert_called_once_with(raw_pil, "RGBA")
-            mock_callback.assert_called_once_with(converted, None)
+            mock_callback.assert_called_once_with(_page_image(converted), None)
             assert fake_scheduler.scheduled_once_count == 1
 
-    def test_load_pil_error_path(
+    def test_load_pixels_error_path(
         self,
         loader: PanelImageLoader,
         mock_callback: MagicMock,
         fake_scheduler: FakeScheduler,
+        cache: PanelImageCache,
     ) -> None:
         mock_path = MagicMock(spec=Path)
         error = OSError("Read failed")
 
         with (
-            _synchronous_worker_thread(),
             patch.object(loader_module, "load_pil", side_effect=error),
         ):
-            loader.load_pil(mock_path, mock_callback)
+            loader.load_pixels(mock_path, mock_callback)
 
             mock_callback.assert_called_once_with(None, error)
             assert fake_scheduler.scheduled_once_count == 1
+            assert len(cache) == 0
 
     def test_worker_cancel_before_decode_skips_callback(
         self,
@@ -126,13 +161,12 @@ class TestPanelImageLoader:
             return MagicMock(spec=Image.Image)
 
         with (
-            _synchronous_worker_thread(),
             patch.object(loader_module, "load_pil", side_effect=cancel_during_load),
             patch.object(loader_module, "convert_mode") as mock_convert,
         ):
-            loader.load_pil(mock_path, mock_callback)
+            loader.load_pixels(mock_path, mock_callback)
 
-            # Cancel happened right after load_pil; convert_mode should not run.
+            # Cancel happened right after the decode; convert_mode should not run.
             mock_convert.assert_not_called()
             assert fake_scheduler.scheduled_once_count == 0
 
@@ -141,87 +175,91 @@ class TestPanelImageLoader:
         loader: PanelImageLoader,
         mock_callback: MagicMock,
         fake_scheduler: FakeScheduler,
+        cache: PanelImageCache,
     ) -> None:
         mock_path = MagicMock(spec=Path)
         raw_pil = MagicMock(spec=Image.Image)
 
-        def cancel_during_convert(*_a: object, **_k: object) -> MagicMock:
+        def cancel_during_convert(*_a: object, **_k: object) -> Image.Image:
             loader.cancel()
-            return MagicMock(spec=Image.Image)
+            return _rgba_image()
 
         with (
-            _synchronous_worker_thread(),
             patch.object(loader_module, "load_pil", return_value=raw_pil),
             patch.object(loader_module, "convert_mode", side_effect=cancel_during_convert),
         ):
-            loader.load_pil(mock_path, mock_callback)
+            loader.load_pixels(mock_path, mock_callback)
 
             assert fake_scheduler.scheduled_once_count == 0
+            # The decode still finished, so it is kept for the next time round.
+            assert str(mock_path) in cache
 
-    def test_new_load_does_not_join_previous_thread(
-        self, loader: PanelImageLoader, mock_callback: MagicMock
+    def test_new_load_does_not_wait_for_previous_decode(
+        self, fake_scheduler: FakeScheduler, cache: PanelImageCache
     ) -> None:
         """A new load must never block the UI thread waiting on the previous decode."""
-        mock_path = MagicMock(spec=Path)
+        executor = DeferredExecutor()
+        loader = PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
 
-        with patch.object(loader_module, threading.Thread.__name__) as mock_thread_cls:
-            first_thread = MagicMock()
-            mock_thread_cls.return_value = first_thread
+        loader.load_pixels(MagicMock(spec=Path), MagicMock())
+        loader.load_pixels(MagicMock(spec=Path), MagicMock())
 
-            loader.load_pil(mock_path, mock_callback)
-            loader.load_pil(mock_path, mock_callback)
-
-            first_thread.join.assert_not_called()
+        assert len(executor.submitted) == 2  # noqa: PLR2004
 
     def test_stale_worker_result_dropped(
-        self, loader: PanelImageLoader, fake_scheduler: FakeScheduler
+        self, fake_scheduler: FakeScheduler, cache: PanelImageCache
     ) -> None:
         """A worker superseded by a newer load must not deliver its result."""
-        mock_path = MagicMock(spec=Path)
-        workers: list[tuple[Any, tuple[Any, ...]]] = []
+        executor = DeferredExecutor()
+        loader = PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
 
         with (
-            patch.object(loader_module, threading.Thread.__name__) as mock_thread_cls,
             patch.object(loader_module, "load_pil", return_value=MagicMock(spec=Image.Image)),
-            patch.object(loader_module, "convert_mode", return_value=MagicMock(spec=Image.Image)),
+            patch.object(loader_module, "convert_mode", side_effect=lambda *_: _rgba_image()),
         ):
-            mock_thread_cls.side_effect = lambda target, args, daemon: MagicMock(
-                start=lambda: workers.append((target, args))
-            )
             callback_a = MagicMock()
             callback_b = MagicMock()
-            loader.load_pil(mock_path, callback_a)
-            loader.load_pil(mock_path, callback_b)
+            loader.load_pixels(MagicMock(spec=Path), callback_a)
+            loader.load_pixels(MagicMock(spec=Path), callback_b)
 
             # Run the superseded worker A after B was requested.
-            target_a, args_a = workers[0]
-            target_a(*args_a)
+            executor.run_next()
             callback_a.assert_not_called()
             assert fake_scheduler.scheduled_once_count == 0
 
-            target_b, args_b = workers[1]
-            target_b(*args_b)
+            executor.run_next()
             callback_b.assert_called_once()
 
+    def test_queued_stale_worker_skips_decode(
+        self, fake_scheduler: FakeScheduler, cache: PanelImageCache
+    ) -> None:
+        """A load superseded before a worker picks it up is never decoded."""
+        executor = DeferredExecutor()
+        loader = PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
+
+        with patch.object(loader_module, "load_pil") as mock_load_pil:
+            loader.load_pixels(MagicMock(spec=Path), MagicMock())
+            loader.cancel()
+            executor.run_next()
+
+            mock_load_pil.assert_not_called()
+
     def test_cancel_drops_in_flight_result(
-        self, loader: PanelImageLoader, mock_callback: MagicMock, fake_scheduler: FakeScheduler
+        self, fake_scheduler: FakeScheduler, cache: PanelImageCache, mock_callback: MagicMock
     ) -> None:
-        mock_path = MagicMock(spec=Path)
-        workers: list[tuple[Any, tuple[Any, ...]]] = []
+        executor = DeferredExecutor()
+        loader = PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
 
-        with (
-            patch.object(loader_module, threading.Thread.__name__) as mock_thread_cls,
-            patch.object(loader_module, "load_pil", return_value=MagicMock(spec=Image.Image)),
-            patch.object(loader_module, "convert_mode", return_value=MagicMock(spec=Image.Image)),
-        ):
-            mock_thread_cls.side_effect = lambda target, args, daemon: MagicMock(
-                start=lambda: workers.append((target, args))
-            )
-            loader.load_pil(mock_path, mock_callback)
+        def cancel_during_load(*_a: object, **_k: object) -> MagicMock:
             loader.cancel()
+            return MagicMock(spec=Image.Image)
 
-            target, args = workers[0]
-            target(*args)
+        with (
+            patch.object(loader_module, "load_pil", side_effect=cancel_during_load),
+            patch.object(loader_module, "convert_mode", side_effect=lambda *_: _rgba_image()),
+        ):
+            loader.load_pixels(MagicMock(spec=Path), mock_callback)
+            executor.run_next()
 
             mock_callback.assert_not_called()
             assert fake_scheduler.scheduled_once_count == 0
@@ -230,11 +268,87 @@ class TestPanelImageLoader:
         self, loader: PanelImageLoader, mock_callback: MagicMock
     ) -> None:
         """A delivery scheduled just before a newer load bumped the generation is dropped."""
-        pil = MagicMock(spec=Image.Image)
+        image = _page_image(_rgba_image())
         loader._generation = 2
 
-        loader._deliver(1, mock_callback, pil, None)
+        loader._deliver(1, mock_callback, image, None)
         mock_callback.assert_not_called()
 
-        loader._deliver(2, mock_callback, pil, None)
-        mock_callback.assert_called_once_with(pil, None)
+        loader._deliver(2, mock_callback, image, None)
+        mock_callback.assert_called_once_with(image, None)
+
+
+class TestPanelImageCaching:
+    def test_repeat_load_is_served_from_cache(
+        self, loader: PanelImageLoader, fake_scheduler: FakeScheduler
+    ) -> None:
+        mock_path = MagicMock(spec=Path)
+        converted = _rgba_image()
+        callback = MagicMock()
+
+        with (
+            patch.object(loader_module, "load_pil", return_value=_rgba_image()) as mock_load_pil,
+            patch.object(loader_module, "convert_mode", return_value=converted),
+        ):
+            loader.load_pixels(mock_path, MagicMock())
+            loader.load_pixels(mock_path, callback)
+
+        mock_load_pil.assert_called_once()
+        callback.assert_called_once_with(_page_image(converted), None)
+        # A cache hit is still delivered through the scheduler.
+        assert fake_scheduler.scheduled_once_count == 2  # noqa: PLR2004
+
+    def test_cache_holds_the_rgba_buffer(
+        self, loader: PanelImageLoader, cache: PanelImageCache
+    ) -> None:
+        """A cache hit hands over the buffer flattened on the worker, with nothing to convert."""
+        mock_path = MagicMock(spec=Path)
+        callback = MagicMock()
+
+        with patch.object(loader_module, "load_pil", return_value=Image.new("RGB", (40, 30))):
+            loader.load_pixels(mock_path, MagicMock())
+        loader.load_pixels(mock_path, callback)
+
+        cached = cache.get(str(mock_path))
+        assert cached is not None
+        assert cached.size == (40, 30)
+        assert cached.colorfmt == "rgba"
+        assert cached.nbytes == 40 * 30 * 4
+        callback.assert_called_once_with(cached, None)
+
+    def test_cached_image_is_shared_between_loaders(
+        self, fake_scheduler: FakeScheduler, executor: DeferredExecutor, cache: PanelImageCache
+    ) -> None:
+        mock_path = MagicMock(spec=Path)
+        loader_a = PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
+        loader_b = PanelImageLoader(fake_scheduler, executor=executor, cache=cache)
+        callback = MagicMock()
+
+        with patch.object(loader_module, "load_pil", return_value=_rgba_image()) as mock_load_pil:
+            loader_a.load_pixels(mock_path, MagicMock())
+            loader_b.load_pixels(mock_path, callback)
+
+        mock_load_pil.assert_called_once()
+        callback.assert_called_once()
+
+    def test_cancel_drops_scheduled_cache_hit(
+        self, loader: PanelImageLoader, cache: PanelImageCache
+    ) -> None:
+        mock_path = MagicMock(spec=Path)
+        cache.put(str(mock_path), _page_image(_rgba_image()))
+        callback = MagicMock()
+        scheduled: list[Callable[[], None]] = []
+
+        with patch.object(FakeScheduler, "schedule_once", side_effect=scheduled.append):
+            loader.load_pixels(mock_path, callback)
+        loader.cancel()
+        scheduled[0]()
+
+        callback.assert_not_called()
+
+    def test_default_loaders_share_one_pool_and_cache(self, fake_scheduler: FakeScheduler) -> None:
+        loader_a = PanelImageLoader(fake_scheduler)
+        loader_b = PanelImageLoader(fake_scheduler)
+
+        assert loader_a._executor is loader_b._executor
+        assert loader_a._cache is loader_b._cache
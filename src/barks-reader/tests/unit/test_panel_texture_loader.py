@@ -4,11 +4,11 @@ from __future__ import annotations
 from unittest.mock import MagicMock, patch
 
 import pytest
+from barks_reader.core.page_image_source import PageImage
 from barks_reader.core.panel_image_loader import PanelImageLoader
 from barks_reader.ui import panel_texture_loader as loader_module
 from barks_reader.ui.panel_texture_loader import PanelTextureLoader
 from kivy.core.image import Texture
-from PIL import Image
 
 
 @pytest.fixture
@@ -51,9 +51,7 @@ class TestLoadTexture:
         mock_callback: MagicMock,
     ) -> None:
         mock_path = MagicMock()
-        mock_pil = MagicMock(spec=Image.Image)
-        mock_pil.size = (100, 100)
-        mock_pil.tobytes.return_value = b"pixels"
+        image = PageImage(pixels=b"pixels", size=(100, 100), colorfmt="rgba")
 
         with patch.object(loader_module, "Texture") as mock_texture_cls:
             mock_texture = MagicMock(spec=Texture)
@@ -61,16 +59,16 @@ class TestLoadTexture:
 
             loader.load_texture(mock_path, mock_callback)
 
-            # Verify the pil loader was delegated to with an internal wrapping callback.
-            mock_pil_loader.load_pil.assert_called_once()
-            args, _ = mock_pil_loader.load_pil.call_args
+            # Verify the image loader was delegated to with an internal wrapping callback.
+            mock_pil_loader.load_pixels.assert_called_once()
+            args, _ = mock_pil_loader.load_pixels.call_args
             assert args[0] is mock_path
-            pil_callback = args[1]
+            image_callback = args[1]
 
-            # Simulate successful PIL load arriving on the UI thread.
-            pil_callback(mock_pil, None)
+            # Simulate a successful load arriving on the UI thread.
+            image_callback(image, None)
 
-            mock_texture_cls.create.assert_called_once_with(size=(100, 100))
+            mock_texture_cls.create.assert_called_once_with(size=(100, 100), colorfmt="rgba")
             mock_texture.blit_buffer.assert_called_once_with(
                 b"pixels", colorfmt="rgba", bufferfmt="ubyte"
             )
@@ -88,25 +86,23 @@ class TestLoadTexture:
 
         loader.load_texture(mock_path, mock_callback)
 
-        args, _ = mock_pil_loader.load_pil.call_args
-        pil_callback = args[1]
+        args, _ = mock_pil_loader.load_pixels.call_args
+        image_callback = args[1]
 
-        pil_callback(None, error)
+        image_callback(None, error)
 
         mock_callback.assert_called_once_with(None, error)
 
-    def test_pil_to_texture_is_static(self) -> None:
-        mock_pil = MagicMock(spec=Image.Image)
-        mock_pil.size = (50, 50)
-        mock_pil.tobytes.return_value = b"data"
+    def test_image_to_texture_is_static(self) -> None:
+        image = PageImage(pixels=b"data", size=(50, 50), colorfmt="rgba")
 
         with patch.object(loader_module, "Texture") as mock_texture_cls:
             mock_tex = MagicMock()
             mock_texture_cls.create.return_value = mock_tex
 
-            result = PanelTextureLoader._pil_to_texture(mock_pil)
+            result = PanelTextureLoader._image_to_texture(image)
 
-            mock_texture_cls.create.assert_called_once_with(size=(50, 50))
+            mock_texture_cls.create.assert_called_once_with(size=(50, 50), colorfmt="rgba")
             mock_tex.blit_buffer.assert_called_once_with(
                 b"data", colorfmt="rgba", bufferfmt="ubyte"
             )
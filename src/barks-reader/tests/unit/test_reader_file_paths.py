@@ -8,6 +8,11 @@ from unittest.mock import patch
 
 import pytest
 from barks_fantagraphics.barks_titles import Titles
+from barks_reader.core.panel_dimensions_index import (
+    PanelDimensions,
+    get_panel_dimensions_index_file,
+    write_panel_dimensions_index,
+)
 from barks_reader.core.reader_file_paths import (
     EDITED_SUBDIR,
     BarksPanelsExtType,
@@ -78,6 +83,30 @@ class TestReaderFilePaths:
         assert reader_file_paths._barks_panels_zip is not None
         assert reader_file_paths._panels_ext_type == BarksPanelsExtType.JPG
 
+    def test_zip_source_loads_panel_dimensions_index(
+        self, reader_file_paths: ReaderFilePaths, panels_zip: Path
+    ) -> None:
+        with zipfile.ZipFile(panels_zip, "a") as zf:
+            zf.writestr("Covers/Title.jpg", b"jpeg bytes")
+        with zipfile.ZipFile(panels_zip) as zf:
+            write_panel_dimensions_index(
+                get_panel_dimensions_index_file(panels_zip), zf, lambda _zf, _info: (300, 200)
+            )
+
+        with patch("os.path.expandvars", return_value=str(panels_zip)):
+            reader_file_paths.set_barks_panels_source(panels_zip, BarksPanelsExtType.JPG)
+
+        cover_file = reader_file_paths._panel_dirs[PanelDirNames.COVERS] / "Title.jpg"
+        assert reader_file_paths.get_panel_dimensions(cover_file) == PanelDimensions(300, 200)
+
+    def test_dir_source_has_no_panel_dimensions(
+        self, reader_file_paths: ReaderFilePaths, panels_dir: Path
+    ) -> None:
+        with patch("os.path.expandvars", return_value=str(panels_dir)):
+            reader_file_paths.set_barks_panels_source(panels_dir, BarksPanelsExtType.MOSTLY_PNG)
+
+        assert reader_file_paths.get_panel_dimensions(panels_dir / "Covers" / "Title.png") is None
+
     def test_set_barks_panels_source_missing_dir(
         self, reader_file_paths: ReaderFilePaths, tmp_path: Path
     ) -> None:
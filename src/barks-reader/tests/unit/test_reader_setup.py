@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock, patch
 
+from barks_build_comic_images.build_comic_images import RGB_DISPLAY_PROFILE
 from barks_reader.core import reader_setup
 from barks_reader.core.reader_setup import (
     bootstrap_reader_environment,
@@ -70,7 +71,13 @@ class TestPrepareComicForReading:
             )
 
             layout_builder.build.assert_called_once_with(comic)
-            builder_cls.assert_called_once_with(comic, "/empty.png", get_inset_decrypted_bytes=None)
+            builder_cls.assert_called_once_with(
+                comic,
+                "/empty.png",
+                page_image_source=RGB_DISPLAY_PROFILE.page_image_source,
+                get_inset_decrypted_bytes=None,
+                allow_reduced_decode=True,
+            )
             instance.set_required_dim.assert_called_once_with(required_dim)
 
         assert result_layout is layout
@@ -3,11 +3,16 @@
 
 from __future__ import annotations
 
+import json
+import subprocess
+import sys
+import time
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
 import pytest
 from barks_fantagraphics.comics_consts import PageType
+from barks_reader.core import reading_history
 from barks_reader.core.reading_history import (
     ReadEvent,
     ReadingHistoryStore,
@@ -26,6 +31,55 @@ if TYPE_CHECKING:
     from pathlib import Path
 
 _TODAY = date(2026, 7, 17)
+_NO_TIMER_FLUSH_SECS = 3600.0  # a writer that only flushes when told to
+_WAIT_SECS = 10.0
+# Lines the crashing writer builds before it dies: each lands mid-flush, most
+# of them mid-compaction, since a compaction writes a line per event.
+_CRASH_AFTER_NUM_LINES = (600, 1900, 3700)
+_CRASH_EXIT_CODE = 9  # the crashing writer's os._exit code
+
+# Adds, pages through and then closes events, flushing after each change and
+# printing the id of each event once it is all flushed. It dies without any
+# cleanup (no buffer flushed, no file closed) as it builds its
+# ``crash_after_num_lines``th journal line. With a few updates per event the
+# journal is compacted every few events.
+_CRASHING_WRITER_CODE = """\
+import os
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from barks_reader.core import reading_history as rh
+
+store_path, crash_after_num_lines = Path(sys.argv[1]), int(sys.argv[2])
+to_journal_line = rh._to_journal_line
+num_lines = 0
+
+def _crashing_to_journal_line(record):
+    global num_lines
+    num_lines += 1
+    if num_lines == crash_after_num_lines:
+        os._exit(9)
+    return to_journal_line(record)
+
+rh._to_journal_line = _crashing_to_journal_line
+rh._COMPACT_MIN_RECORDS = 8
+store = rh.ReadingHistoryStore(store_path, flush_interval_secs=3600.0)
+i = len(store.get_events())
+while True:
+    event = rh.ReadEvent(f"{i:08}", "Vacation Time", datetime(2026, 7, 17, 9, 0))
+    store.add_event(event)
+    store.flush()
+    for page in range(3):
+        event.last_display_page = str(page)
+        store.update_event(event)
+        store.flush()
+    event.closed_at = datetime(2026, 7, 17, 9, 30)
+    store.update_event(event)
+    store.flush()
+    print(event.event_id, flush=True)
+    i += 1
+"""
 
 
 def _make_event(
@@ -58,25 +112,27 @@ class TestReadEventJson:
 
 class TestReadingHistoryStore:
     def test_missing_file_starts_empty(self, tmp_path: Path) -> None:
-        store = ReadingHistoryStore(tmp_path / "history.json")
+        store = ReadingHistoryStore(tmp_path / "history.jsonl")
         assert store.get_events() == []
 
     def test_corrupt_file_starts_empty(self, tmp_path: Path) -> None:
-        store_path = tmp_path / "history.json"
+        store_path = tmp_path / "history.jsonl"
         store_path.write_text("not json at all", encoding="utf-8")
         store = ReadingHistoryStore(store_path)
         assert store.get_events() == []
 
     def test_add_event_persists_across_reload(self, tmp_path: Path) -> None:
-        store_path = tmp_path / "history.json"
+        store_path = tmp_path / "history.jsonl"
         event = _make_event()
-        ReadingHistoryStore(store_path).add_event(event)
+        store = ReadingHistoryStore(store_path)
+        store.add_event(event)
+        store.close()
 
         reloaded = ReadingHistoryStore(store_path)
         assert reloaded.get_events() == [event]
 
     def test_update_event_replaces_by_id(self, tmp_path: Path) -> None:
-        store_path = tmp_path / "history.json"
+        store_path = tmp_path / "history.jsonl"
         store = ReadingHistoryStore(store_path)
         event = _make_event()
         store.add_event(event)
@@ -84,17 +140,18 @@ class TestReadingHistoryStore:
         event.closed_at = datetime(2026, 7, 17, 15, 0)
         event.last_display_page = "5"
         store.update_event(event)
+        store.close()
 
         reloaded = ReadingHistoryStore(store_path)
         assert reloaded.get_events() == [event]
 
     def test_update_unknown_event_is_noop(self, tmp_path: Path) -> None:
-        store = ReadingHistoryStore(tmp_path / "history.json")
+        store = ReadingHistoryStore(tmp_path / "history.jsonl")
         store.update_event(_make_event(event_id="unknown"))
         assert store.get_events() == []
 
     def test_delete_event(self, tmp_path: Path) -> None:
-        store = ReadingHistoryStore(tmp_path / "history.json")
+        store = ReadingHistoryStore(tmp_path / "history.jsonl")
         keep = _make_event(event_id="keep")
         store.add_event(_make_event(event_id="gone"))
         store.add_event(keep)
@@ -103,7 +160,7 @@ class TestReadingHistoryStore:
         assert store.get_events() == [keep]
 
     def test_delete_events_for_title(self, tmp_path: Path) -> None:
-        store = ReadingHistoryStore(tmp_path / "history.json")
+        store = ReadingHistoryStore(tmp_path / "history.jsonl")
         keep = _make_event(title_str="Vacation Time", event_id="keep")
         store.add_event(_make_event(title_str="Trick or Treat", event_id="a"))
         store.add_event(keep)
@@ -113,15 +170,152 @@ class TestReadingHistoryStore:
         assert store.get_events() == [keep]
 
     def test_clear(self, tmp_path: Path) -> None:
-        store_path = tmp_path / "history.json"
+        store_path = tmp_path / "history.jsonl"
         store = ReadingHistoryStore(store_path)
         store.add_event(_make_event())
         store.clear()
+        store.close()
 
         assert store.get_events() == []
         assert ReadingHistoryStore(store_path).get_events() == []
 
 
+class TestJournal:
+    def test_changes_are_written_on_flush(self, tmp_path: Path) -> None:
+        """A change is in memory at once but only reaches the disk when flushed."""
+        store_path = tmp_path / "history.jsonl"
+        store = ReadingHistoryStore(store_path, flush_interval_secs=_NO_TIMER_FLUSH_SECS)
+        event = _make_event()
+
+        store.add_event(event)
+        assert store.get_events() == [event]
+        assert not store_path.exists()
+
+        store.flush()
+        assert ReadingHistoryStore(store_path).get_events() == [event]
+        store.close()
+
+    def test_changes_are_flushed_on_a_timer(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "history.jsonl"
+        store = ReadingHistoryStore(store_path, flush_interval_secs=0.01)
+        event = _make_event()
+
+        store.add_event(event)
+
+        deadline = time.monotonic() + _WAIT_SECS
+        while ReadingHistoryStore(store_path).get_events() != [event]:
+            assert time.monotonic() < deadline, "the writer never flushed"
+            time.sleep(0.01)
+        store.close()
+
+    def test_changes_after_close_are_written_at_once(self, tmp_path: Path) -> None:
+        """A session closed after the app's shutdown flush is still recorded."""
+        store_path = tmp_path / "history.jsonl"
+        store = ReadingHistoryStore(store_path)
+        store.close()
+
+        event = _make_event()
+        store.add_event(event)
+
+        assert ReadingHistoryStore(store_path).get_events() == [event]
+
+    def test_torn_record_is_skipped_and_repaired(self, tmp_path: Path) -> None:
+        """A record cut short by a crash mid-append is dropped; later records append cleanly."""
+        store_path = tmp_path / "history.jsonl"
+        store = ReadingHistoryStore(store_path)
+        first = _make_event(event_id="first")
+        store.add_event(first)
+        store.close()
+        with store_path.open("a", encoding="utf-8") as file:
+            file.write('{"op":"put","event":{"id":"to')
+
+        store = ReadingHistoryStore(store_path)
+        assert store.get_events() == [first]
+        second = _make_event(event_id="second")
+        store.add_event(second)
+        store.close()
+
+        assert ReadingHistoryStore(store_path).get_events() == [first, second]
+
+    def test_journal_is_compacted(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Many updates of a few events don't grow the journal without bound."""
+        monkeypatch.setattr(reading_history, "_COMPACT_MIN_RECORDS", 8)
+        store_path = tmp_path / "history.jsonl"
+        store = ReadingHistoryStore(store_path, flush_interval_secs=_NO_TIMER_FLUSH_SECS)
+        events = [_make_event(event_id=str(i)) for i in range(3)]
+        for event in events:
+            store.add_event(event)
+        for page in range(100):
+            for event in events:
+                event.last_display_page = str(page)
+                store.update_event(event)
+            store.flush()
+        store.close()
+
+        assert len(store_path.read_text(encoding="utf-8").splitlines()) <= 8 + len(events)
+        assert ReadingHistoryStore(store_path).get_events() == events
+
+
+class TestLegacyMigration:
+    @staticmethod
+    def _write_legacy_store(store_path: Path, events: list[ReadEvent]) -> Path:
+        legacy_path = store_path.with_suffix(".json")
+        legacy_data = {"version": 1, "events": [e.to_json() for e in events]}
+        legacy_path.write_text(json.dumps(legacy_data, indent=4), encoding="utf-8")
+        return legacy_path
+
+    def test_json_history_is_migrated_once(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "history.jsonl"
+        events = [_make_event(event_id="a"), _make_event(title_str="Vacation Time", event_id="b")]
+        legacy_path = self._write_legacy_store(store_path, events)
+
+        assert ReadingHistoryStore(store_path).get_events() == events
+
+        assert not legacy_path.exists()
+        assert legacy_path.with_name("history.json.migrated").exists()
+        self._write_legacy_store(store_path, [])  # a stray old file is ignored from now on
+        assert ReadingHistoryStore(store_path).get_events() == events
+
+    def test_corrupt_json_history_starts_empty(self, tmp_path: Path) -> None:
+        store_path = tmp_path / "history.jsonl"
+        legacy_path = store_path.with_suffix(".json")
+        legacy_path.write_text("not json at all", encoding="utf-8")
+
+        assert ReadingHistoryStore(store_path).get_events() == []
+        assert legacy_path.exists()
+
+
+class TestCrashSafety:
+    def test_writer_killed_mid_flush_loses_no_flushed_event(self, tmp_path: Path) -> None:
+        """After each crash the journal loads every flushed event, and takes new ones."""
+        store_path = tmp_path / "history.jsonl"
+        for num_crashes, crash_after_num_lines in enumerate(_CRASH_AFTER_NUM_LINES, 1):
+            writer = subprocess.run(  # noqa: S603
+                [
+                    sys.executable,
+                    "-c",
+                    _CRASHING_WRITER_CODE,
+                    str(store_path),
+                    str(crash_after_num_lines),
+                ],
+                capture_output=True,
+                text=True,
+                check=False,
+            )
+            assert writer.returncode == _CRASH_EXIT_CODE, writer.stderr
+            flushed_ids = writer.stdout.split()
+            assert flushed_ids
+
+            events = ReadingHistoryStore(store_path).get_events()
+
+            assert [p.name for p in tmp_path.iterdir()] == [store_path.name]
+            event_ids = [e.event_id for e in events]
+            assert event_ids == [f"{i:08}" for i in range(len(events))]
+            assert set(flushed_ids) <= set(event_ids)
+            # At most the event being written when each writer died is left open.
+            assert sum(e.closed_at is None for e in events) <= num_crashes
+
+
 class _FixedClock:
     def __init__(self, *times: datetime) -> None:
         self._times = list(times)
@@ -134,7 +328,7 @@ class TestReadingHistoryTracker:
     def _make_tracker(
         self, tmp_path: Path, clock: _FixedClock, *, enabled: bool = True
     ) -> tuple[ReadingHistoryTracker, ReadingHistoryStore]:
-        store = ReadingHistoryStore(tmp_path / "history.json")
+        store = ReadingHistoryStore(tmp_path / "history.jsonl")
         tracker = ReadingHistoryTracker(store, is_enabled=lambda: enabled, now=clock)
         return tracker, store
 
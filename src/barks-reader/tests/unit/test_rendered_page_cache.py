@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import os
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from barks_reader.core.page_image_source import PageImage
+from barks_reader.core.rendered_page_cache import RenderedPageCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _page(width: int = 10, fill: int = 0) -> PageImage:
+    return PageImage(pixels=bytes([fill]) * (width * 3), size=(width, 1), colorfmt="rgb")
+
+
+def _entry_files(cache_dir: Path) -> list[Path]:
+    return sorted(cache_dir.glob("*/*.page"))
+
+
+class TestRenderedPageCache:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        cache = RenderedPageCache(tmp_path, max_bytes=10_000)
+        page = PageImage(pixels=bytes(range(2 * 3 * 4)), size=(3, 2), colorfmt="rgba")
+        key = cache.make_key("book.cbz", "images/p01.jpg", 1234)
+
+        assert cache.get(key) is None
+
+        cache.put(key, page)
+
+        assert cache.get(key) == page
+        assert cache.num_hits == 1
+        assert cache.num_misses == 1
+
+    def test_entries_persist_across_instances(self, tmp_path: Path) -> None:
+        key = RenderedPageCache.make_key("a")
+        RenderedPageCache(tmp_path, max_bytes=10_000).put(key, _page(fill=7))
+
+        assert RenderedPageCache(tmp_path, max_bytes=10_000).get(key) == _page(fill=7)
+
+    def test_key_depends_on_every_part(self) -> None:
+        key = RenderedPageCache.make_key("book.cbz", "p01.jpg", 1, (800, 600))
+
+        assert key == RenderedPageCache.make_key("book.cbz", "p01.jpg", 1, (800, 600))
+        assert key != RenderedPageCache.make_key("book.cbz", "p01.jpg", 2, (800, 600))
+        assert key != RenderedPageCache.make_key("book.cbz", "p01.jpg", 1, (800, 601))
+
+    def test_corrupt_entry_is_a_miss_and_is_removed(self, tmp_path: Path) -> None:
+        cache = RenderedPageCache(tmp_path, max_bytes=10_000)
+        key = cache.make_key("a")
+        cache.put(key, _page())
+        (entry_path,) = _entry_files(tmp_path)
+        entry_path.write_bytes(entry_path.read_bytes()[:-1])
+
+        assert cache.get(key) is None
+        assert not entry_path.exists()
+
+    def test_evicts_least_recently_used_entries_over_cap(self, tmp_path: Path) -> None:
+        entry_size = len(_page().pixels) + 13  # Pixels plus the entry header.
+        # Room for three and a half entries; evicting trims to 90% of that.
+        cache = RenderedPageCache(tmp_path, max_bytes=int(3.5 * entry_size))
+        keys = [cache.make_key(i) for i in range(4)]
+
+        for mtime, key in enumerate(keys[:3]):
+            cache.put(key, _page())
+            (entry_path,) = [p for p in _entry_files(tmp_path) if p.stem == key]
+            os.utime(entry_path, (mtime, mtime))
+        assert cache.get(keys[0]) is not None  # A hit makes entry 0 the most recent.
+
+        cache.put(keys[3], _page())
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.get(keys[3]) is not None
+
+    def test_re_put_replaces_the_entry_size(self, tmp_path: Path) -> None:
+        entry_size = len(_page().pixels) + 13  # Pixels plus the entry header.
+        cache = RenderedPageCache(tmp_path, max_bytes=int(3.5 * entry_size))
+        key_a, key_b = cache.make_key("a"), cache.make_key("b")
+        cache.put(key_a, _page())
+        cache.put(key_b, _page())
+
+        # Two entries stay well under the cap however often one is rewritten.
+        with patch.object(
+            RenderedPageCache, "_evict_lru", autospec=True, return_value=2 * entry_size
+        ) as evict:
+            for fill in range(4):
+                cache.put(key_a, _page(fill=fill))
+
+        evict.assert_not_called()
+        assert cache.get(key_a) == _page(fill=3)
+        assert cache.get(key_b) == _page()
+
+    def test_concurrent_writers_leave_a_complete_entry(self, tmp_path: Path) -> None:
+        cache = RenderedPageCache(tmp_path, max_bytes=10_000_000)
+        other = RenderedPageCache(tmp_path, max_bytes=10_000_000)
+        key = cache.make_key("shared")
+        pages = [_page(width=1000, fill=i) for i in range(8)]
+
+        threads = [
+            threading.Thread(target=(cache if i % 2 else other).put, args=(key, page))
+            for i, page in enumerate(pages)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert cache.get(key) in pages
+        assert [p.name for p in tmp_path.glob("*/*")] == [key + ".page"]
+
+    def test_clear_removes_all_entries(self, tmp_path: Path) -> None:
+        cache = RenderedPageCache(tmp_path, max_bytes=10_000)
+        cache.put(cache.make_key("a"), _page())
+        cache.put(cache.make_key("b"), _page())
+
+        cache.clear()
+
+        assert _entry_files(tmp_path) == []
@@ -6,15 +6,16 @@ from types import SimpleNamespace
 from typing import ClassVar, cast
 from unittest.mock import MagicMock, patch
 
+from barks_fantagraphics.term_vocabulary import TermVocabulary
 from barks_reader.ui import search_screen
 from barks_reader.ui.search_screen import SearchScreen, _SearchResultButton
 
 
-def _make_screen(word_terms: dict) -> SearchScreen:
+def _make_screen(word_terms: list[str]) -> SearchScreen:
     """Create a SearchScreen with just enough state for prefix-matching tests."""
     with patch.object(SearchScreen, "__init__", lambda _self, *_a, **_kw: None):
         screen = SearchScreen.__new__(SearchScreen)
-        screen._word_terms = word_terms
+        screen._word_vocabulary = TermVocabulary(word_terms)
         return screen
 
 
@@ -59,13 +60,16 @@ class TestMarkResultSelected:
 
 
 class TestGetWordsMatchingPrefix:
-    TERMS: ClassVar[dict] = {
-        "d": {
-            "do": ["don", "Don Gaspar", "Don Quixote", "done", "Donna Duck"],
-            "da": ["dance", "Daniel Boone"],
-        },
-        "q": {"qu": ["quixote"]},
-    }
+    TERMS: ClassVar[list[str]] = [
+        "dance",
+        "Daniel Boone",
+        "don",
+        "Don Gaspar",
+        "Don Quixote",
+        "done",
+        "Donna Duck",
+        "quixote",
+    ]
 
     def _match(self, text: str) -> list[str]:
         screen = _make_screen(self.TERMS)
@@ -98,6 +102,9 @@ class TestGetWordsMatchingPrefix:
     def test_different_letter_group(self) -> None:
         assert self._match("qu") == ["quixote"]
 
+    def test_prefix_is_case_insensitive(self) -> None:
+        assert self._match("DANI") == ["Daniel Boone"]
+
 
 class TestSearchInputEnter:
     """Enter in a search input focuses the first title-result row (any mode)."""
@@ -224,3 +231,66 @@ class TestAdoptNavFocus:
         assert screen._nav_active is True
         assert screen._nav_on_exit_request is exit_cb
         assert screen._nav_focus_area == "results"
+
+
+class TestWordSearchPages:
+    """A word search shows its first page of hits at once, then all of them together."""
+
+    @staticmethod
+    def _word_search_screen(pages: list[dict]) -> SearchScreen:
+        screen = _make_bare_screen()
+        screen._search = MagicMock()
+        screen._search.iter_word_search_titles.return_value = iter(pages)
+        screen._word_search_pages = None
+        screen._word_search_pages_event = None
+        return screen
+
+    @staticmethod
+    def _select_word(screen: SearchScreen) -> MagicMock:
+        ids = SimpleNamespace(word_chips_layout=SimpleNamespace(children=[]))
+        with (
+            patch.object(SearchScreen, "ids", ids),
+            patch.object(SearchScreen, "_update_background_from_results"),
+            patch.object(search_screen.Clock, "schedule_interval") as schedule_interval,
+        ):
+            screen._on_word_chip_selected("duck")
+        return schedule_interval
+
+    def test_later_pages_are_shown_once_all_are_pulled(self) -> None:
+        found = {"Title A": MagicMock()}
+        screen = self._word_search_screen([found, found])
+
+        with patch.object(SearchScreen, "_show_word_results") as show:
+            schedule_interval = self._select_word(screen)
+            show.assert_called_once_with(found)
+
+            pull_page = schedule_interval.call_args.args[0]
+            assert pull_page(0) is True
+            show.assert_called_once()
+
+            assert pull_page(0) is False
+            assert show.call_count == 2  # noqa: PLR2004
+            schedule_interval.return_value.cancel.assert_called_once()
+            assert screen._word_search_pages is None
+
+    def test_a_single_page_of_hits_is_shown_once(self) -> None:
+        found = {"Title A": MagicMock()}
+        screen = self._word_search_screen([found])
+
+        with patch.object(SearchScreen, "_show_word_results") as show:
+            schedule_interval = self._select_word(screen)
+            pull_page = schedule_interval.call_args.args[0]
+            assert pull_page(0) is False
+
+        assert show.call_count == 2  # noqa: PLR2004
+
+    def test_a_new_word_stops_pulling_the_old_word_pages(self) -> None:
+        found = {"Title A": MagicMock()}
+        screen = self._word_search_screen([found, found])
+
+        with patch.object(SearchScreen, "_show_word_results"):
+            schedule_interval = self._select_word(screen)
+            screen._search.iter_word_search_titles.return_value = iter([found, found])
+            self._select_word(screen)
+
+        schedule_interval.return_value.cancel.assert_called_once()
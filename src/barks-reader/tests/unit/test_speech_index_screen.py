@@ -123,11 +123,26 @@ class TestSpeechIndexScreen:
             mock_populate_grid.assert_called_with("A")
 
     def test_find_words(self, speech_index_screen: SpeechIndexScreen) -> None:
-        speech_index_screen._find_words("test")
-        speech_index_screen._search.find_words.assert_called_with("test")
+        found = {"Title": MagicMock()}
+        search = speech_index_screen._search
+        search.iter_word_search_titles.return_value = iter([found, found])
 
-        speech_index_screen._find_words("1942")
-        speech_index_screen._search.find_words.assert_called_with("1942")
+        assert speech_index_screen._find_words("test") is found
+        search.iter_word_search_titles.assert_called_with("test")
+
+        search.iter_word_search_titles.return_value = iter([])
+        assert speech_index_screen._find_words("1942") == {}
+        search.iter_word_search_titles.assert_called_with("1942")
+
+    def test_find_background_titles_uses_only_the_first_page(
+        self, speech_index_screen: SpeechIndexScreen
+    ) -> None:
+        pages = MagicMock()
+        pages.__next__.return_value = {"Title A": MagicMock(), "Title B": MagicMock()}
+        speech_index_screen._search.iter_word_search_titles.return_value = pages
+
+        assert speech_index_screen._find_background_titles("test") == ["Title A", "Title B"]
+        pages.__next__.assert_called_once()
 
     def test_next_background_image(self, speech_index_screen: SpeechIndexScreen) -> None:
         # Setup state
@@ -138,9 +153,9 @@ class TestSpeechIndexScreen:
         # Populate item index
         speech_index_screen._item_index["A"] = [IndexItem("term", "term")]
 
-        # Mock find_words
+        # Mock the background title search
         with patch.object(  # noqa: SIM117
-            speech_index_screen, "_find_words", return_value={"Title": MagicMock()}
+            speech_index_screen, "_find_background_titles", return_value=["Title"]
         ):
             # Mock the title-string -> Titles enum -> FantaComicBookInfo lookup chain.
             with (
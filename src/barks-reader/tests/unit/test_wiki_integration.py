@@ -8,7 +8,8 @@ a wiki page path, and the table decoration from our own is_barks_title.
 from __future__ import annotations
 
 import zipfile
-from typing import TYPE_CHECKING
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock, patch
 
 from barks_fantagraphics.barks_titles import ENUM_TO_STR_TITLE, Titles
@@ -30,14 +31,17 @@ from barks_reader.core.wiki_integration import (
     title_can_have_wiki_page,
     tree_navigable_title,
     wiki_page_for_title,
+    wiki_search_index_path,
     wiki_session_path,
     wiki_theme_spec,
     wiki_top_bar_spec,
 )
+from okf_reader.core.backgrounds import CancelToken, PixelBuffer
 from okf_reader.core.theme import ViewerThemeSpec
 from PIL import Image
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
 
@@ -173,6 +177,17 @@ class TestWikiSessionPath:
         two = wiki_session_path(app_data, tmp_path / "bundle-b")
         assert one != two
 
+    def test_search_index_keyed_like_the_session(self, tmp_path: Path) -> None:
+        """Each bundle's saved search index sits beside, but apart from, its session file."""
+        app_data = tmp_path / "app"
+        bundle = tmp_path / "bundle-a"
+        index = wiki_search_index_path(app_data, bundle)
+        assert index.parent == app_data
+        assert index != wiki_session_path(app_data, bundle)
+        assert index.name.removeprefix("okf-reader-search-index-") == (
+            wiki_session_path(app_data, bundle).name.removeprefix("okf-reader-session-")
+        )
+
 
 class TestBarksTableRewriter:
     def test_non_barks_title_parenthesized(self) -> None:
@@ -212,16 +227,28 @@ class TestBarksTableRewriter:
         assert rewriter.wrap_widths(["Series", "Issue", "Date"]) == [None, None, None]
 
 
+class _InlineExecutor(Executor):
+    """Runs submitted work synchronously, into an already completed future."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ANN401
+        future: Future[Any] = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
 class TestBarksPanelsImageProvider:
     @staticmethod
-    def _make_provider(*, encrypted: bool) -> tuple[BarksPanelsImageProvider, MagicMock]:
+    def _make_provider(
+        *, encrypted: bool, executor: Executor | None = None
+    ) -> tuple[BarksPanelsImageProvider, MagicMock]:
         settings = MagicMock()
         settings.file_paths.barks_panels_are_encrypted = encrypted
         selector = MagicMock()
-        return BarksPanelsImageProvider(settings, selector), selector
+        provider = BarksPanelsImageProvider(settings, selector, executor or _InlineExecutor())
+        return provider, selector
 
     def test_zip_panel_decoded_via_allow_listed_loader(self, tmp_path: Path) -> None:
-        """A zip-member panel is decrypted through load_panel_pil and re-encoded to PNG.
+        """A zip-member panel is decrypted through load_panel_pil and decoded to pixels.
 
         The decrypt must go through panel_image_loader (the compiled decryptor's
         caller allow-list), with the encrypted flag taken from the file paths.
@@ -235,51 +262,80 @@ class TestBarksPanelsImageProvider:
         selector.get_random_image.return_value.filename = panel
 
         page = tmp_path / "okf" / "reference" / "x.md"
-        pil = Image.new("RGB", (1, 1))
+        pil = Image.new("RGB", (2, 1), (255, 0, 0))
         with patch.object(wiki_integration, "load_panel_pil", return_value=pil) as mock_load:
-            bg = provider.background_for({}, page)
+            bg = provider.load_background({}, page, CancelToken()).result()
 
         mock_load.assert_called_once_with(panel, encrypted_zip=True)
         assert bg is not None
-        assert bg.ext == ".png"
+        assert bg.ext == ".jpg"
         assert bg.path is None
-        assert bg.data is not None
-        assert bg.data.startswith(b"\x89PNG")
+        assert bg.data is None
+        assert bg.pixels == PixelBuffer(b"\xff\x00\x00" * 2, (2, 1), "rgb")
 
-    def test_filesystem_panel_passed_through_by_path(self, tmp_path: Path) -> None:
-        """A plain filesystem panel is handed to kivy by path, never decoded here."""
-        panel = tmp_path / "panel.jpg"
+    def test_filesystem_panel_decoded_on_the_worker(self, tmp_path: Path) -> None:
+        """A plain filesystem panel is decoded off the UI thread too, not loaded by kivy."""
+        panel = tmp_path / "panel.png"
+        Image.new("RGBA", (1, 1), (1, 2, 3, 4)).save(panel)
         provider, selector = self._make_provider(encrypted=False)
         selector.get_random_image.return_value.filename = panel
 
+        bg = provider.load_background(
+            {}, tmp_path / "okf" / "reference" / "x.md", CancelToken()
+        ).result()
+
+        assert bg is not None
+        assert bg.path is None
+        assert bg.ext == ".png"
+        assert bg.pixels == PixelBuffer(bytes([1, 2, 3, 4]), (1, 1), "rgba")
+
+    def test_panel_chosen_on_the_calling_thread(self, tmp_path: Path) -> None:
+        """Only the decode is deferred: the shared selector is never used on a worker."""
+        panel = tmp_path / "panel.png"
+        executor = MagicMock()
+        provider, selector = self._make_provider(encrypted=False, executor=executor)
+        selector.get_random_image.return_value.filename = panel
+
+        provider.load_background({}, tmp_path / "okf" / "reference" / "x.md", CancelToken())
+
+        selector.get_random_image.assert_called_once()
+        executor.submit.assert_called_once()
+        assert executor.submit.call_args.args[1] == panel
+
+    def test_cancelled_load_skips_the_decode(self, tmp_path: Path) -> None:
+        panel = tmp_path / "panel.png"
+        provider, selector = self._make_provider(encrypted=False)
+        selector.get_random_image.return_value.filename = panel
+        cancel = CancelToken()
+        cancel.cancel()
+
         with patch.object(wiki_integration, "load_panel_pil") as mock_load:
-            bg = provider.background_for({}, tmp_path / "okf" / "reference" / "x.md")
+            bg = provider.load_background({}, tmp_path / "okf" / "reference" / "x.md", cancel)
 
         mock_load.assert_not_called()
-        assert bg is not None
-        assert bg.path == panel
-        assert bg.ext == ".jpg"
-        assert bg.data is None
+        assert bg.result() is None
 
     def test_story_page_selects_title_specific_panel(self, tmp_path: Path) -> None:
         """A story page draws from that title's own panels."""
         panel = tmp_path / "panel.png"
+        Image.new("RGB", (1, 1)).save(panel)
         provider, selector = self._make_provider(encrypted=False)
         selector.get_random_image_for_title.return_value = panel
 
         page = tmp_path / "okf" / "concept" / "stories" / "donald-duck-adventures" / "x.md"
-        bg = provider.background_for({"title": "Lost in the Andes!"}, page)
+        bg = provider.load_background({"title": "Lost in the Andes!"}, page, CancelToken())
 
         selector.get_random_image_for_title.assert_called_once()
         selector.get_random_image.assert_not_called()
-        assert bg is not None
-        assert bg.path == panel
+        assert bg.result() is not None
 
     def test_no_panel_found_is_none(self, tmp_path: Path) -> None:
         provider, selector = self._make_provider(encrypted=True)
         selector.get_random_image.return_value.filename = None
 
-        assert provider.background_for({}, tmp_path / "okf" / "reference" / "x.md") is None
+        bg = provider.load_background({}, tmp_path / "okf" / "reference" / "x.md", CancelToken())
+
+        assert bg.result() is None
 
 
 class TestWikiTopBarSpec:
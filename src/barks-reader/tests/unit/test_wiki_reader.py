@@ -410,6 +410,35 @@ class TestWikiReaderScreenBuildViewer:
 
         assert viewer_cls.call_args.kwargs["on_exit"] == wiki_screen.close
 
+    def test_rebuild_closes_the_outgoing_viewer(self, wiki_screen: WikiReaderScreen) -> None:
+        old_viewer = MagicMock()
+        wiki_screen._viewer = old_viewer
+        with (
+            patch.object(wiki_reader, "OKFViewer"),
+            patch.object(wiki_reader, "wiki_top_bar_spec"),
+            patch.object(wiki_reader, "wiki_session_path"),
+            patch.object(wiki_reader, "BarksPanelsImageProvider"),
+            patch.object(wiki_reader, "BarksTableRewriter"),
+            patch.object(wiki_screen, "add_widget"),
+            patch.object(wiki_screen, "remove_widget"),
+        ):
+            wiki_screen._build_viewer(self.BUNDLE)
+
+        old_viewer.save_session.assert_called_once_with()
+        old_viewer.close.assert_called_once_with()
+
+    def test_app_closing_saves_and_closes_the_viewer(self, wiki_screen: WikiReaderScreen) -> None:
+        viewer = MagicMock()
+        wiki_screen._viewer = viewer
+
+        wiki_screen.app_closing()
+
+        viewer.save_session.assert_called_once_with()
+        viewer.close.assert_called_once_with()
+
+    def test_app_closing_before_first_open_is_noop(self, wiki_screen: WikiReaderScreen) -> None:
+        wiki_screen.app_closing()
+
 
 class TestWikiFullscreenViewerSize:
     """The pure fullscreen-strip math (comic aspect, width from height)."""
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import io
 import logging
+import math
 from typing import TYPE_CHECKING
 
 from PIL import Image, ImageOps
@@ -32,6 +33,9 @@ _EXTENSION_TO_PIL_FORMAT = {
     PNG_FILE_EXT: PNG_PIL_FORMAT,
 }
 
+# Image 'info' key recording the (x, y) factors a JPEG was shrunk by while decoding.
+DECODE_REDUCTION_INFO_KEY = "barks_decode_reduction"
+
 
 def load_pil_image_for_reading(file: Path) -> PilImage:
     current_log_level = logging.getLogger().level
@@ -44,7 +48,9 @@ def load_pil_image_for_reading(file: Path) -> PilImage:
         logging.getLogger().setLevel(current_log_level)
 
 
-def load_pil_image_from_zip(zip_path: zipfile.Path, encrypted: bool) -> PilImage:
+def load_pil_image_from_zip(
+    zip_path: zipfile.Path, encrypted: bool, min_decode_scale: float = 1.0
+) -> PilImage:
     from .decryption import DecryptionError  # noqa: PLC0415
     from .get_panel_bytes import get_decrypted_bytes  # noqa: PLC0415
 
@@ -58,22 +64,56 @@ def load_pil_image_from_zip(zip_path: zipfile.Path, encrypted: bool) -> PilImage
             if not file_data:
                 msg = f'Image decryption failed with empty bytes: "{zip_path}".'
                 raise DecryptionError(msg)
-        return load_pil_image_from_bytes(file_data, ext)
+        return load_pil_image_from_bytes(file_data, ext, min_decode_scale)
     finally:
         logging.getLogger().setLevel(current_log_level)
 
 
-def load_pil_image_from_bytes(file_bytes: bytes, ext: str) -> PilImage:
+def load_pil_image_from_bytes(
+    file_bytes: bytes, ext: str, min_decode_scale: float = 1.0
+) -> PilImage:
     current_log_level = logging.getLogger().level
     try:
         logging.getLogger().setLevel(logging.INFO)
         image = Image.open(io.BytesIO(file_bytes), "r", formats=[_get_pil_format_from_ext(ext)])
+        reduce_jpeg_decode(image, min_decode_scale)
         image.load()
         return image
     finally:
         logging.getLogger().setLevel(current_log_level)
 
 
+def reduce_jpeg_decode(image: PilImage, min_decode_scale: float) -> None:
+    """Let libjpeg decode an opened, not yet loaded, JPEG at 1/2, 1/4 or 1/8 scale.
+
+    The largest reduction that keeps at least ``min_decode_scale`` of each side is
+    used, and recorded per axis under ``DECODE_REDUCTION_INFO_KEY`` in
+    ``image.info``. Other formats, and scales of 1.0 or more, are decoded at full size.
+    """
+    if min_decode_scale >= 1.0 or image.format != JPEG_PIL_FORMAT:
+        return
+
+    full_width, full_height = image.size
+    draft = image.draft(
+        None,
+        (
+            max(1, math.ceil(image.width * min_decode_scale)),
+            max(1, math.ceil(image.height * min_decode_scale)),
+        ),
+    )
+    # The draft box is the full image in decoded pixels. libjpeg rounds a reduced
+    # side up, so the factors can't be recovered from the sizes: a 2090 wide page
+    # decoded at 1/8 is 262 wide, but its pixel 250 still starts at source pixel 2000.
+    if draft is not None and image.size != (full_width, full_height):
+        _, box = draft
+        image.info[DECODE_REDUCTION_INFO_KEY] = (full_width / box[2], full_height / box[3])
+
+
+def get_decode_reduction(image: PilImage) -> tuple[float, float]:
+    """Return the (x, y) factors *image* was shrunk by while decoding ((1, 1) for a full decode)."""
+    return image.info.get(DECODE_REDUCTION_INFO_KEY, (1.0, 1.0))
+
+
 def _get_pil_format_from_ext(ext: str) -> str:
     try:
         return _EXTENSION_TO_PIL_FORMAT[ext.lower()]
@@ -109,8 +149,9 @@ def get_pil_image_as_jpg_bytes(pil_image: PilImage) -> io.BytesIO:
 
 
 def get_image_size(image_file: Path) -> tuple[int, int]:
-    image = load_pil_image_for_reading(image_file)
-    return image.size
+    # The size is in the image header, so there is no need to decode the pixels.
+    with Image.open(str(image_file), "r") as image:
+        return image.size
 
 
 def copy_file_to_jpg(srce_file: Path, dest_file: Path) -> None:
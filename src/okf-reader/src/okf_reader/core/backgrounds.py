@@ -5,34 +5,55 @@ between "what image suits this page" and the UI. The provider owns selection —
 stateful choosers (e.g. the Barks Reader's ImageSelector with its recently-used
 tracking) cannot be reduced to a candidate list. okf_reader must stay independent
 of the Barks packages (import-linter contract), so the provider speaks only in
-frontmatter dicts and paths, and hands back either a plain image file or raw
+frontmatter dicts and paths, and hands back either a plain image file, raw
 image bytes (for sources the UI cannot open by filename, e.g. members of an
-encrypted archive).
+encrypted archive) or an already decoded pixel buffer.
+
+A provider whose images are slow to produce (decrypting, decoding) implements
+``AsyncImageProvider`` instead: it hands back a future, and does the slow part
+off the UI thread. ``BackgroundLoader`` keeps the viewer's background in step
+with the page on show, cancelling the request for a page already left.
 """
 
 from __future__ import annotations
 
+import logging
 import random
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Protocol
+from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
 
 IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".webp")
 
+_logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PixelBuffer:
+    """A decoded image: rows top to bottom with no padding, ready for a texture."""
+
+    pixels: bytes
+    size: tuple[int, int]
+    colorfmt: str  # "rgb" or "rgba" (Kivy colorfmt names)
+
 
 @dataclass(frozen=True)
 class PageBackground:
-    """One background image: a plain file on disk, or in-memory image bytes.
+    """One background image: a plain file on disk, in-memory image bytes, or pixels.
 
-    Exactly one of ``path``/``data`` is set. ``ext`` (e.g. ``".png"``) tells the
-    UI how to decode ``data``; it is informational for ``path``.
+    Exactly one of ``path``/``data``/``pixels`` is set. ``ext`` (e.g. ``".png"``)
+    tells the UI how to decode ``data``; it is informational otherwise.
     """
 
     ext: str
     path: Path | None = None
     data: bytes | None = None
+    pixels: PixelBuffer | None = None
 
 
 class ImageProvider(Protocol):
@@ -43,6 +64,117 @@ class ImageProvider(Protocol):
         ...
 
 
+class CancelToken:
+    """Set once the page a background was requested for is no longer wanted."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@runtime_checkable
+class AsyncImageProvider(Protocol):
+    """Source of the background image for a page, loaded off the UI thread."""
+
+    def load_background(
+        self, frontmatter: dict[str, Any], page_path: Path, cancel: CancelToken
+    ) -> Future[PageBackground | None]:
+        """Start loading the background for a page; the future resolves to it.
+
+        Called on the UI thread, so a stateful provider may choose the image
+        there; the decoding belongs on a worker. Once ``cancel`` is set the
+        result is unwanted, and the provider may resolve the future to None
+        without finishing the work.
+        """
+        ...
+
+
+class SyncImageProviderAdapter:
+    """Present a plain ``ImageProvider`` as an ``AsyncImageProvider``.
+
+    The background is chosen on the calling thread, as it always was, and handed
+    back as an already completed future.
+    """
+
+    def __init__(self, provider: ImageProvider) -> None:
+        self._provider = provider
+
+    def load_background(
+        self, frontmatter: dict[str, Any], page_path: Path, cancel: CancelToken
+    ) -> Future[PageBackground | None]:
+        future: Future[PageBackground | None] = Future()
+        try:
+            future.set_result(
+                None if cancel.cancelled else self._provider.background_for(frontmatter, page_path)
+            )
+        except Exception as err:  # noqa: BLE001 — delivered through the future, like a worker's
+            future.set_exception(err)
+        return future
+
+
+def as_async_image_provider(
+    provider: ImageProvider | AsyncImageProvider,
+) -> AsyncImageProvider:
+    """Return ``provider`` itself if it loads asynchronously, else an adapter over it."""
+    if isinstance(provider, AsyncImageProvider):
+        return provider
+    return SyncImageProviderAdapter(provider)
+
+
+class BackgroundLoader:
+    """Request backgrounds page by page, applying only the latest one.
+
+    Each request cancels the one before it, and a load that completes is handed
+    to ``apply`` through ``schedule`` (the UI thread's "run this next frame")
+    only if its request is still the latest. So however quickly pages are
+    changed, the background that ends up on show is the last page's. A failed
+    load leaves the current background in place.
+    """
+
+    def __init__(
+        self,
+        provider: AsyncImageProvider,
+        apply: Callable[[PageBackground | None], None],
+        schedule: Callable[[Callable[[], None]], None],
+    ) -> None:
+        self._provider = provider
+        self._apply = apply
+        self._schedule = schedule
+        self._cancel = CancelToken()
+
+    def request(self, frontmatter: dict[str, Any], page_path: Path) -> None:
+        """Cancel any pending background and start loading this page's."""
+        self._cancel.cancel()
+        cancel = self._cancel = CancelToken()
+        future = self._provider.load_background(frontmatter, page_path, cancel)
+        # Done callbacks run on whichever thread completes the future.
+        future.add_done_callback(lambda f: self._schedule(lambda: self._finish(f, cancel)))
+
+    def cancel(self) -> None:
+        """Drop the pending background, if any (e.g. when the viewer closes)."""
+        self._cancel.cancel()
+
+    def _finish(self, future: Future[PageBackground | None], cancel: CancelToken) -> None:
+        """On the UI thread: apply a completed load, unless it has been superseded.
+
+        A failed load is logged (superseded or not), and the current background kept.
+        """
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            _logger.error("Could not load the page background.", exc_info=error)
+            return
+        if not cancel.cancelled:
+            self._apply(future.result())
+
+
 class DirPerTitleImageProvider:
     """Images organized one subdirectory per title: ``<root>/<title>/*.png``.
 
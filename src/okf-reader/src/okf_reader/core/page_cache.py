@@ -0,0 +1,183 @@
+"""Kivy-free cache of rendered OKF pages, rendered off the UI thread.
+
+`render_page` re-tokenises a page with markdown-it on every call, so a page shown
+again (Back, a tree re-selection, a search hit) would otherwise be parsed from
+scratch each time. A `PageCache` keeps the rendered `Page`s of the most recently
+shown pages, each keyed by its file's modification time and size so an edited
+page is re-rendered, and renders misses on a worker. It also renders ahead the
+`neighbour_pages` of the page on show: those a reader most likely opens next.
+
+Cached pages are shared: consumers must treat a `Page` and its blocks as
+read-only.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .render import list_child_paths
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+    from .render import Page
+
+# Rendered pages are small (markup strings); this covers a long reading session.
+PAGE_CACHE_MAX_PAGES = 256
+# How many likely next pages are rendered ahead after each page is shown.
+PREFETCH_PAGES = 4
+
+type PageSignature = tuple[int, int]  # (mtime_ns, size)
+
+
+def unavailable_page_text(path: Path, err: OSError) -> str:
+    """Return the markdown shown in place of a page that cannot be read."""
+    return f"# Page unavailable\n\n`{path.name}`: {err.strerror or err}\n"
+
+
+class PageCache:
+    """An LRU of rendered pages, keyed by path and the file's modification time and size.
+
+    ``render`` turns a page's text into a `Page` (the viewer binds its table
+    rewriter and colors into it). Pages are read and rendered on ``executor``,
+    a single worker by default; a page that cannot be read renders as an error
+    page, which is not cached (tolerant consumption, SPEC §9). `load` and
+    `prefetch_neighbours` are meant to be called from one thread (the UI's).
+    Call `close` once the cache is done with, to let its own worker go.
+    """
+
+    def __init__(
+        self,
+        render: Callable[[str], Page],
+        max_pages: int = PAGE_CACHE_MAX_PAGES,
+        executor: Executor | None = None,
+    ) -> None:
+        self._render = render
+        self._max_pages = max_pages
+        # A viewer makes a cache per bundle it opens, so the cache shuts down the
+        # worker it made itself on `close`; an injected executor is the caller's.
+        self._owns_executor = executor is None
+        self._executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="okf-render")
+        )
+        self._lock = threading.Lock()
+        self._pages: OrderedDict[Path, tuple[PageSignature, Page]] = OrderedDict()
+        self._loading: dict[Path, Future[Page]] = {}
+        # Bumped by every load and prefetch: an older prefetch stops rendering
+        # ahead, so it never holds up the page the reader has asked for.
+        self._generation = 0
+
+    def get(self, path: Path) -> Page | None:
+        """Return the cached page for ``path`` if it is up to date, else None."""
+        signature = _get_signature(path)
+        if signature is None:
+            return None
+        with self._lock:
+            entry = self._pages.get(path)
+            if entry is None or entry[0] != signature:
+                return None
+            self._pages.move_to_end(path)
+            return entry[1]
+
+    def load(self, path: Path) -> Future[Page]:
+        """Return a future of the rendered page, rendering it on the worker if need be."""
+        page = self.get(path)
+        if page is not None:
+            future: Future[Page] = Future()
+            future.set_result(page)
+            return future
+
+        self._generation += 1
+        with self._lock:
+            loading = self._loading.get(path)
+        if loading is not None:
+            return loading
+
+        future = self._executor.submit(self.render, path)
+        with self._lock:
+            self._loading[path] = future
+        future.add_done_callback(lambda _f: self._loading_done(path))
+        return future
+
+    def prefetch_neighbours(self, page_path: Path) -> None:
+        """Render the pages likely to be opened after ``page_path`` ahead, on the worker."""
+        self._generation += 1
+        self._executor.submit(self._prefetch, page_path, self._generation)
+
+    def close(self) -> None:
+        """Drop the queued renders and let the worker thread exit, without waiting for it.
+
+        A prefetch under way stops after its current page. The cache must not be
+        loaded from after this.
+        """
+        self._generation += 1
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def render(self, path: Path) -> Page:
+        """Read and render ``path`` now, on the calling thread, caching the result."""
+        signature = _get_signature(path)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError as err:
+            return self._render(unavailable_page_text(path, err))
+        page = self._render(text)
+        if signature is not None:
+            with self._lock:
+                self._pages[path] = (signature, page)
+                self._pages.move_to_end(path)
+                while len(self._pages) > self._max_pages:
+                    self._pages.popitem(last=False)
+        return page
+
+    def _prefetch(self, page_path: Path, generation: int) -> None:
+        """Worker: render the neighbours of ``page_path`` until a newer request comes in."""
+        for path in neighbour_pages(page_path):
+            if self._generation != generation:
+                return
+            if self.get(path) is None:
+                self.render(path)
+
+    def _loading_done(self, path: Path) -> None:
+        with self._lock:
+            self._loading.pop(path, None)
+
+
+def _get_signature(path: Path) -> PageSignature | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def neighbour_pages(page_path: Path, max_pages: int = PREFETCH_PAGES) -> list[Path]:
+    """Return the pages a reader most likely opens after ``page_path``, most likely first.
+
+    A directory's ``index.md`` leads to the children it lists, in `list_children`'s
+    curated order (a child directory by its own ``index.md``). Any other page
+    leads to its next siblings in that order, then to those before it. Only
+    paths are needed, so no concept is read for its title.
+    """
+    directory = page_path.parent
+    pages = [
+        child / "index.md" if child.is_dir() else child
+        for child in list_child_paths(directory)
+        if not child.is_dir() or (child / "index.md").is_file()
+    ]
+    if page_path.name == "index.md":
+        return pages[:max_pages]
+    if page_path not in pages:
+        return []
+
+    i = pages.index(page_path)
+    following = pages[i + 1 : i + 1 + max_pages]
+    preceding = pages[max(i - (max_pages - len(following)), 0) : i]
+    return following + preceding[::-1]
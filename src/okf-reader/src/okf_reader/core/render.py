@@ -362,7 +362,7 @@ def _visible_text(markup: str) -> str:
     return text.replace("&amp;", "&").replace("&bl;", "[").replace("&br;", "]")
 
 
-def _visible_len(markup: str) -> int:
+def visible_len(markup: str) -> int:
     """Character count of what a Kivy-markup string displays."""
     return len(_visible_text(markup))
 
@@ -418,7 +418,7 @@ def _table_block(
         col_wrap.append(TABLE_COL_WRAP_WIDTH if override is None else override)
     wrapped: list[list[list[str]]] = [  # rows -> cells -> the cell's wrapped lines
         [
-            _wrap_markup(cell, col_wrap[c]) if _visible_len(cell) > col_wrap[c] else [cell]
+            _wrap_markup(cell, col_wrap[c]) if visible_len(cell) > col_wrap[c] else [cell]
             for c, cell in enumerate(row)
         ]
         for row in rows
@@ -427,7 +427,7 @@ def _table_block(
     for row in wrapped:
         for c, cell in enumerate(row):
             for cell_line in cell:
-                length = _visible_len(cell_line)
+                length = visible_len(cell_line)
                 if length > col_wrap[c]:
                     length = 0  # unbreakable word: overflows its own row only
                 if c == len(widths):
@@ -449,9 +449,9 @@ def _table_block(
             # A cell with fewer lines than the row contributes blank padding.
             segments = ((cell[i] if i < len(cell) else "") for cell in row)
             padded = (
-                " " * max(widths[c] - _visible_len(seg), 0) + seg
+                " " * max(widths[c] - visible_len(seg), 0) + seg
                 if numeric_cols[c]
-                else seg + " " * max(widths[c] - _visible_len(seg), 0)
+                else seg + " " * max(widths[c] - visible_len(seg), 0)
                 for c, seg in enumerate(segments)
             )
             row_lines.append("  ".join(padded).rstrip())
@@ -702,19 +702,32 @@ def list_children(directory: Path) -> list[BundleDir | ConceptNode]:
     in ``directory``, so a consumer can populate a tree lazily one level at a time.
     A ``directory`` that is not a directory yields an empty list (SPEC §9).
     """
-    children: list[BundleDir | ConceptNode] = []
+    return [
+        BundleDir(child, child.name, title=dir_title(child))
+        if child.is_dir()
+        else ConceptNode(child, concept_title(child))
+        for child in list_child_paths(directory)
+    ]
+
+
+def list_child_paths(directory: Path) -> list[Path]:
+    """Return the paths of `list_children`'s children, in its order, reading no concept.
+
+    Only the directory's ``index.md`` is read (for the curated order), so a
+    consumer that keeps its own per-concept data (e.g. a persistent search
+    index) can walk a bundle without re-reading unchanged pages.
+    """
+    children: list[Path] = []
     if directory.is_dir():
         for child in sorted(directory.iterdir()):
             if child.name.startswith("."):
                 continue  # skip hidden entries (e.g. .obsidian) — not OKF content
-            if child.is_dir():
-                children.append(BundleDir(child, child.name, title=dir_title(child)))
-            elif child.suffix == ".md" and child.name not in RESERVED_FILES:
-                children.append(ConceptNode(child, concept_title(child)))
+            if child.is_dir() or (child.suffix == ".md" and child.name not in RESERVED_FILES):
+                children.append(child)
         rank = _index_link_order(directory)
         # Stable sort over the name-ordered base: listed children first in listing
         # order, unlisted ones after, still alphabetical among themselves.
-        children.sort(key=lambda child: rank.get(child.path.name, len(rank)))
+        children.sort(key=lambda child: rank.get(child.name, len(rank)))
     return children
 
 
@@ -6,27 +6,37 @@ answers substring queries against it, so the UI only owns the search box and the
 results list. Pure and deterministic — same bundle + query in, same hits out —
 so it is unit-testable in isolation.
 
-Scope is deliberately tier 1: titles and headings, not body prose. It reuses the
-bundle walk (`render.load_bundle_tree`) and extracts headings with a cheap ATX
-line scan, and follows the tolerant-consumption spirit (SPEC §9) — an unreadable
-page is skipped, never fatal.
+`build_search_index` is deliberately tier 1: titles and headings, not body prose.
+It reuses the bundle walk (`render.load_bundle_tree`) and extracts headings with
+a cheap ATX line scan, and follows the tolerant-consumption spirit (SPEC §9) — an
+unreadable page is skipped, never fatal.
+
+`FullTextIndex` adds the body text: an inverted index with positional postings
+(so quoted phrases can be searched for), which can be saved to a file and is
+then updated incrementally — only pages whose modification time or size has
+changed are read again. Its hits keep the same score tiers, with body-only
+matches ranked below them; `FullTextSearcher` is its `SearchProvider`.
 """
 
 from __future__ import annotations
 
+import json
+import os
 import re
+import tempfile
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Protocol
+from pathlib import Path
+from typing import Any, Protocol
 
 from okf_reader.core.render import (
     BundleDir,
+    dir_title,
+    list_child_paths,
     load_bundle_tree,
     parse_frontmatter,
 )
 
-if TYPE_CHECKING:
-    from pathlib import Path
-
 BREADCRUMB_SEP = " › "  # noqa: RUF001 — display glyph, not a greater-than
 
 # An ATX heading line ("## Title", up to three leading spaces, optional trailing
@@ -40,6 +50,17 @@ _SCORE_EXACT_TITLE = 400
 _SCORE_PREFIX_TITLE = 300
 _SCORE_WORDS_IN_TITLE = 200
 _SCORE_WORDS_IN_HEADING = 100
+_SCORE_WORDS_IN_BODY = 50
+
+# Bump when the saved full-text index layout or its tokenizing changes.
+FULLTEXT_INDEX_VERSION = 1
+
+# Words are runs of letters/digits, lowercased; punctuation and markup separate them.
+_WORD = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]*)"')
+# Link targets and HTML comments are not text a reader sees, so are not indexed.
+_LINK_TARGET = re.compile(r"\]\([^)]*\)")
+_HTML_COMMENT = re.compile(r"<!--.*?-->", re.DOTALL)
 
 
 @dataclass(frozen=True)
@@ -49,7 +70,7 @@ class SearchHit:
     path: Path  # absolute .md page to open (feeds OKFViewer.show_page)
     title: str  # display title
     breadcrumb: str  # ancestor-dir chain joined by BREADCRUMB_SEP
-    matched_on: str  # "title" | "heading"
+    matched_on: str  # "title" | "heading" | "body"
     score: int  # higher = better
 
 
@@ -75,9 +96,9 @@ class SearchIndex:
 class SearchProvider(Protocol):
     """A pluggable search backend — the viewer's optional override seam.
 
-    okf_reader's built-in title/heading search (see `BundleSearcher`) needs no
-    app knowledge, so the viewer uses it by default. An embedding app may inject
-    its own (e.g. a full-text or unified backend) instead.
+    okf_reader's built-in full-text search (see `FullTextSearcher`) needs no app
+    knowledge, so the viewer uses it by default. An embedding app may inject its
+    own (e.g. one saving its index, or a unified backend) instead.
     """
 
     def search(self, query: str) -> list[SearchHit]:
@@ -256,3 +277,333 @@ class BundleSearcher:
         self.warm()
         assert self._index is not None
         return search_index(self._index, query, limit=self._limit)
+
+
+# --------------------------------------------------------------------------- full text
+
+
+type Postings = dict[str, dict[str, list[int]]]  # term -> page id -> word positions
+
+
+def tokenize(text: str) -> list[str]:
+    """Split ``text`` into the lowercased words the full-text index is made of."""
+    return _WORD.findall(text.lower())
+
+
+@dataclass(frozen=True)
+class _QueryParts:
+    """A query split for the full-text index: free words, and quoted phrases."""
+
+    words: list[str]
+    phrases: list[list[str]]  # each phrase's words, in order
+    terms: list[str]  # the words and phrases, as the score tiers match them
+    text: str  # the whole query, for the exact/prefix title tiers
+
+
+def _parse_query(query: str) -> _QueryParts:
+    q = query.strip().lower()
+    phrase_texts = [" ".join(p.split()) for p in _PHRASE.findall(q)]
+    phrase_texts = [p for p in phrase_texts if p]
+    words = _PHRASE.sub(" ", q).replace('"', " ").split()
+    return _QueryParts(
+        words=words,
+        phrases=[tokenize(p) for p in phrase_texts],
+        terms=[*words, *phrase_texts],
+        text=" ".join(q.replace('"', " ").split()) if '"' in q else q,
+    )
+
+
+class FullTextIndex:
+    """An inverted index over a bundle's page titles, headings and body text.
+
+    With an ``index_path``, `update` saves the index there, and a later index
+    reuses every page whose modification time and size are unchanged, reading
+    only new and changed pages. The curated order and breadcrumbs come from
+    walking the bundle's directories (their ``index.md`` files), not its pages.
+    """
+
+    def __init__(self, bundle: Path, index_path: Path | None = None) -> None:
+        self._bundle = bundle
+        self._index_path = index_path
+        self._pages: dict[str, dict[str, Any]] = {}  # bundle-relative path -> page record
+        self._postings: Postings = {}
+        # The postings' terms, sorted: the terms a word starts are a range of it.
+        self._terms: list[str] = []
+        self._next_id = 0
+        self._entries: dict[str, _Entry] = {}  # page id -> display and tier fields
+        self.num_pages_indexed = 0
+
+    def update(self) -> None:
+        """Index the bundle's pages, reading only those new or changed since the saved index."""
+        self._read_index()
+        walked = _walk_pages(self._bundle)
+
+        self.num_pages_indexed = 0
+        current: set[str] = set()
+        for page_path, _breadcrumb in walked:
+            rel = page_path.relative_to(self._bundle).as_posix()
+            current.add(rel)
+            signature = _get_signature(page_path)
+            record = self._pages.get(rel)
+            if record is not None and signature is not None and record["signature"] == signature:
+                continue
+            if record is not None:
+                self._remove_page(rel)
+            self._add_page(rel, page_path, signature)
+            self.num_pages_indexed += 1
+
+        removed = self._pages.keys() - current
+        for rel in removed:
+            self._remove_page(rel)
+
+        self._entries = {}
+        for order, (page_path, breadcrumb) in enumerate(walked):
+            record = self._pages[page_path.relative_to(self._bundle).as_posix()]
+            self._entries[record["id"]] = _Entry(
+                path=page_path,
+                title=record["title"],
+                breadcrumb=breadcrumb,
+                order=order,
+                title_lower=record["title"].lower(),
+                headings_lower=tuple(record["headings"]),
+            )
+
+        self._terms = sorted(self._postings)
+
+        if self.num_pages_indexed or removed:
+            self._write_index()
+
+    def search(self, query: str, *, limit: int = 50) -> list[SearchHit]:
+        """Return the pages matching ``query``, best first.
+
+        Like `search_index`, plus the body text: every word must appear in the
+        page (or start one: "egg" finds "eggs"), and every quoted phrase as
+        those whole words in a row. Titles and headings still match on any
+        substring ("uess" finds "Guess") and keep their tiers (exact title,
+        title prefix, words in title, words in headings); a match found only in
+        the body ranks below them. Ties break on the curated order.
+        """
+        parts = _parse_query(query)
+        if not parts.terms:
+            return []
+
+        # A query of only punctuation can't be looked up; the tiers still apply.
+        body_pages: set[str] | None = None
+        for word in parts.words:
+            for token in tokenize(word):
+                body_pages = _intersect(body_pages, self._pages_containing(token))
+        for phrase in parts.phrases:
+            body_pages = _intersect(body_pages, self._pages_with_phrase(phrase))
+
+        scored: list[tuple[int, int, SearchHit]] = []
+        for page_id, entry in self._entries.items():
+            result = _score_entry(entry, parts.terms, parts.text)
+            if result is None:
+                if body_pages is None or page_id not in body_pages:
+                    continue
+                result = _SCORE_WORDS_IN_BODY, "body"
+            score, matched_on = result
+            hit = SearchHit(entry.path, entry.title, entry.breadcrumb, matched_on, score)
+            scored.append((score, entry.order, hit))
+
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [hit for _score, _order, hit in scored[:limit]]
+
+    def _pages_containing(self, token: str) -> set[str]:
+        """Return the pages with a word that is, or starts with, ``token``."""
+        pages: set[str] = set()
+        for i in range(bisect_left(self._terms, token), len(self._terms)):
+            term = self._terms[i]
+            if not term.startswith(token):
+                break
+            pages.update(self._postings[term])
+        return pages
+
+    def _pages_with_phrase(self, words: list[str]) -> set[str]:
+        if not words:
+            return set()
+        postings = [self._postings.get(word, {}) for word in words]
+        pages = set(postings[0]).intersection(*postings[1:])
+        return {page_id for page_id in pages if _has_phrase([p[page_id] for p in postings])}
+
+    def _add_page(self, rel: str, page_path: Path, signature: list[int] | None) -> None:
+        try:
+            text = page_path.read_text(encoding="utf-8")
+        except OSError:
+            text = ""
+        fm, body = parse_frontmatter(text)
+        title = fm.get("title")
+        if not isinstance(title, str) or not title:
+            title = page_path.stem
+
+        page_id = str(self._next_id)
+        self._next_id += 1
+        # The body's word positions start after a gap, so no phrase spans the title and body.
+        title_words = tokenize(title)
+        body_words = tokenize(_HTML_COMMENT.sub(" ", _LINK_TARGET.sub("] ", body)))
+        positions: dict[str, list[int]] = {}
+        for position, word in enumerate(title_words):
+            positions.setdefault(word, []).append(position)
+        for position, word in enumerate(body_words, len(title_words) + 1):
+            positions.setdefault(word, []).append(position)
+        for word, word_positions in positions.items():
+            self._postings.setdefault(word, {})[page_id] = word_positions
+
+        self._pages[rel] = {
+            "id": page_id,
+            # An unreadable page is indexed again next time.
+            "signature": signature,
+            "title": title,
+            "headings": [h.lower() for h in _extract_headings(text)],
+            "terms": list(positions),
+        }
+
+    def _remove_page(self, rel: str) -> None:
+        record = self._pages.pop(rel)
+        for term in record["terms"]:
+            term_pages = self._postings[term]
+            del term_pages[record["id"]]
+            if not term_pages:
+                del self._postings[term]
+
+    def _read_index(self) -> None:
+        self._pages, self._postings, self._next_id = {}, {}, 0
+        if self._index_path is None:
+            return
+        try:
+            with self._index_path.open("r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return  # missing or corrupt: rebuilt from the pages (SPEC §9 spirit)
+        if not _is_saved_index(index):
+            return  # outdated or malformed: rebuilt too
+        self._pages, self._postings, self._next_id = (
+            index["pages"],
+            index["postings"],
+            index["next_id"],
+        )
+
+    def _write_index(self) -> None:
+        """Save the index — best effort: without it the next index reads every page."""
+        if self._index_path is None:
+            return
+        index = {
+            "version": FULLTEXT_INDEX_VERSION,
+            "next_id": self._next_id,
+            "pages": self._pages,
+            "postings": self._postings,
+        }
+        try:
+            self._index_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_name = tempfile.mkstemp(
+                prefix=self._index_path.name, dir=self._index_path.parent
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(index, f, separators=(",", ":"))
+                Path(temp_name).replace(self._index_path)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+
+
+def _is_saved_index(index: object) -> bool:
+    """Whether ``index`` is a saved index of this version, shaped as `_write_index` writes it."""
+    if not isinstance(index, dict) or index.get("version") != FULLTEXT_INDEX_VERSION:
+        return False
+    pages, postings = index.get("pages"), index.get("postings")
+    return (
+        type(index.get("next_id")) is int
+        and isinstance(pages, dict)
+        and all(_is_page_record(record) for record in pages.values())
+        and isinstance(postings, dict)
+        and all(isinstance(term_pages, dict) for term_pages in postings.values())
+    )
+
+
+def _is_page_record(record: object) -> bool:
+    return (
+        isinstance(record, dict)
+        and isinstance(record.get("id"), str)
+        and (record.get("signature") is None or isinstance(record.get("signature"), list))
+        and isinstance(record.get("title"), str)
+        and isinstance(record.get("headings"), list)
+        and isinstance(record.get("terms"), list)
+    )
+
+
+def _has_phrase(word_positions: list[list[int]]) -> bool:
+    """Return whether the words at ``word_positions`` (one list per word) occur in a row."""
+    later = [set(positions) for positions in word_positions[1:]]
+    return any(
+        all(start + i in positions for i, positions in enumerate(later, 1))
+        for start in word_positions[0]
+    )
+
+
+def _intersect(pages: set[str] | None, more_pages: set[str]) -> set[str]:
+    return more_pages if pages is None else pages & more_pages
+
+
+def _get_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _walk_pages(bundle: Path) -> list[tuple[Path, str]]:
+    """Return the bundle's concept pages and their breadcrumbs, in curated walk order."""
+    pages: list[tuple[Path, str]] = []
+
+    def walk(directory: Path, crumbs: tuple[str, ...]) -> None:
+        for child in list_child_paths(directory):
+            if child.is_dir():
+                walk(child, (*crumbs, dir_title(child)))
+            else:
+                pages.append((child, BREADCRUMB_SEP.join(crumbs)))
+
+    walk(bundle, ())
+    return pages
+
+
+class FullTextSearcher:
+    """A `SearchProvider` over a bundle's `FullTextIndex`, built on first use.
+
+    Like `BundleSearcher`, but searching body text too. Given an ``index_path``
+    the index is saved there, so a later searcher only reads the pages that have
+    changed since.
+    """
+
+    def __init__(self, bundle: Path, index_path: Path | None = None, *, limit: int = 50) -> None:
+        self._bundle = bundle
+        self._index_path = index_path
+        self._limit = limit
+        self._index: FullTextIndex | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether the index is already built (a search will not block on I/O)."""
+        return self._index is not None
+
+    def warm(self) -> None:
+        """Build (or bring up to date) and cache the index now, if not already done.
+
+        Bundle I/O; intended to be called from a worker thread so the first
+        `search` returns without a UI-blocking build. Idempotent.
+        """
+        if self._index is None:
+            index = FullTextIndex(self._bundle, self._index_path)
+            index.update()
+            self._index = index
+
+    def search(self, query: str) -> list[SearchHit]:
+        """Return the bundle pages matching ``query`` (building the index once)."""
+        if not query.strip():
+            return []
+        self.warm()
+        assert self._index is not None
+        return self._index.search(query, limit=self._limit)
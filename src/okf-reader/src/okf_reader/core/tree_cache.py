@@ -0,0 +1,203 @@
+"""Kivy-free cache of bundle directory listings, warmed off the UI thread.
+
+The viewer's tree is lazy — a directory is listed (`list_children`) only when it
+is expanded, or when a page inside it is shown and the tree is synced to it —
+but a listing is not cheap: it parses the directory's ``index.md`` for the
+curated order and reads the frontmatter of every concept for its title. A
+`BundleTreeCache` keeps each directory's listing, keyed by the directory's
+modification time and its ``index.md``'s, and each title keyed by its file's
+modification time and size, so a directory listed before is listed again with
+a few ``stat``s. `BundleTreeCache.warm_around` lists the directories around a
+page on a worker: its ancestors (which the tree sync opens) first, then the
+subdirectories beside it and beside its directory (which the reader most likely
+expands next).
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from .render import (
+    BundleDir,
+    ConceptNode,
+    concept_title,
+    dir_title,
+    has_children,
+    list_child_paths,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+    from pathlib import Path
+
+# How many directories up from a page `warm_around` lists the subdirectories
+# of: the page's own and its directory's siblings.
+WARM_LEVELS = 2
+
+type FileSignature = tuple[int, int]  # (mtime_ns, size)
+# (directory mtime_ns, its index.md's signature): a child added, removed or
+# renamed changes the first, a re-curated listing the second.
+type DirSignature = tuple[int, FileSignature | None]
+
+
+class BundleTreeCache:
+    """Directory listings and titles of the bundle at ``bundle``, reused while unchanged.
+
+    Listings are read on the calling thread when not cached, and ahead of need
+    on ``executor`` (a single worker by default) by `warm_around`. Entries are
+    small and bounded by the bundle's size, so nothing is evicted. Call `close`
+    once the cache is done with, to let its own worker go.
+    """
+
+    def __init__(self, bundle: Path, executor: Executor | None = None) -> None:
+        self.bundle = bundle
+        # Warming is ahead-of-need work for the one bundle a viewer shows, so the
+        # cache shuts down the worker it made itself on `close` rather than leave
+        # it idling after the viewer moves on; an injected executor is the caller's.
+        self._owns_executor = executor is None
+        self._executor = (
+            executor
+            if executor is not None
+            else ThreadPoolExecutor(max_workers=1, thread_name_prefix="okf-tree")
+        )
+        self._lock = threading.Lock()
+        self._listings: dict[Path, tuple[DirSignature, list[tuple[Path, bool]]]] = {}
+        self._has_children: dict[Path, tuple[int, bool]] = {}
+        self._titles: dict[Path, tuple[FileSignature | None, str]] = {}
+        # Bumped by every warm: an older warm stops, so the worker is always
+        # busy with the directories around the page now showing.
+        self._generation = 0
+
+    def list_children(self, directory: Path) -> list[BundleDir | ConceptNode]:
+        """Return `render.list_children` of ``directory``, from the cache where still valid."""
+        return [
+            BundleDir(path, path.name, title=self._title(path / "index.md", path, dir_title))
+            if is_dir
+            else ConceptNode(path, self._title(path, path, concept_title))
+            for path, is_dir in self._list(directory)
+        ]
+
+    def has_children(self, directory: Path) -> bool:
+        """Return `render.has_children` of ``directory``, from the cache where still valid."""
+        mtime = _get_mtime(directory)
+        if mtime is None:
+            return False
+        with self._lock:
+            entry = self._has_children.get(directory)
+        if entry is not None and entry[0] == mtime:
+            return entry[1]
+        result = has_children(directory)
+        with self._lock:
+            self._has_children[directory] = (mtime, result)
+        return result
+
+    def is_listed(self, directory: Path) -> bool:
+        """Whether ``directory``'s listing is cached and still valid."""
+        signature = _get_dir_signature(directory)
+        with self._lock:
+            entry = self._listings.get(directory)
+        return signature is not None and entry is not None and entry[0] == signature
+
+    def warm_around(self, page_path: Path) -> Future[None]:
+        """List the directories around ``page_path`` ahead of need, on the worker.
+
+        The returned future is done once the page's ancestor directories — those
+        a tree sync to it opens — are listed: at once if they already are. The
+        worker then goes on to the subdirectories of the nearest `WARM_LEVELS`
+        ancestors, nearest first, unless a newer warm has come in meanwhile.
+        """
+        self._generation += 1
+        ancestors = self._ancestors(page_path)
+        listed: Future[None] = Future()
+        if all(self.is_listed(directory) for directory in ancestors):
+            listed.set_result(None)
+        self._executor.submit(self._warm, ancestors, listed, self._generation)
+        return listed
+
+    def close(self) -> None:
+        """Drop the queued warms and let the worker thread exit, without waiting for it.
+
+        A warm under way finishes listing the ancestors it promised, then stops.
+        Listings are still read on the calling thread, but `warm_around` must
+        not be called after this.
+        """
+        self._generation += 1
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _warm(self, ancestors: list[Path], listed: Future[None], generation: int) -> None:
+        """Worker: list ``ancestors``, then the subdirectories of the nearest until a newer warm."""
+        try:
+            for ancestor in ancestors:
+                self.list_children(ancestor)
+        finally:
+            if not listed.done():
+                listed.set_result(None)
+        for directory in ancestors[: -WARM_LEVELS - 1 : -1]:
+            for path, is_dir in self._list(directory):
+                if self._generation != generation:
+                    return
+                if is_dir:
+                    self.has_children(path)
+                    self.list_children(path)
+
+    def _ancestors(self, page_path: Path) -> list[Path]:
+        """Return the directories from the bundle root down to ``page_path``'s, if inside it."""
+        try:
+            rel = page_path.parent.relative_to(self.bundle)
+        except ValueError:
+            return []
+        directories = [self.bundle]
+        for part in rel.parts:
+            directories.append(directories[-1] / part)
+        return directories
+
+    def _list(self, directory: Path) -> list[tuple[Path, bool]]:
+        """Return ``directory``'s children in listing order, each with whether it is a directory."""
+        signature = _get_dir_signature(directory)
+        with self._lock:
+            entry = self._listings.get(directory)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        children = [(path, path.is_dir()) for path in list_child_paths(directory)]
+        if signature is not None:
+            with self._lock:
+                self._listings[directory] = (signature, children)
+        return children
+
+    def _title(self, source: Path, path: Path, read_title: Callable[[Path], str]) -> str:
+        """Return ``read_title(path)``, re-read only when ``source`` (the file it reads) changed."""
+        signature = _get_signature(source)
+        with self._lock:
+            entry = self._titles.get(path)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        title = read_title(path)
+        with self._lock:
+            self._titles[path] = (signature, title)
+        return title
+
+
+def _get_signature(path: Path) -> FileSignature | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_mtime(directory: Path) -> int | None:
+    try:
+        return directory.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _get_dir_signature(directory: Path) -> DirSignature | None:
+    mtime = _get_mtime(directory)
+    if mtime is None:
+        return None
+    return mtime, _get_signature(directory / "index.md")
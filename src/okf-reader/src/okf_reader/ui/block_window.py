@@ -0,0 +1,213 @@
+"""Kivy-free windowing for the OKF viewer's virtualized page body.
+
+Laying a long page out whole costs a Kivy Label per block and per table row,
+most of them far off screen. The viewer instead keeps live widgets for only the
+items near the scroll position — in the spirit of Kivy's RecycleView, but for
+items whose heights are only known once their text has been measured:
+
+* `ItemExtents` holds each item's height (an estimate until the item is first
+  built and measured) and the offsets running down from them.
+* `BlockWindow` builds the items coming within an overscan margin of the
+  viewport, releases (for recycling) those leaving it, and says where the
+  viewport must move so the text under it stays put when a measurement
+  corrects an estimate above it.
+* `TextSizeCache` keeps measured text sizes, so a block shown before at the
+  same width is never measured again.
+
+Lives in ``okf_reader.ui`` beside the viewer but imports no Kivy, so everything
+here is unit-testable without a window. Offsets are pixels down from the top of
+the list.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+from okf_reader.core.render import visible_len
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Sequence
+
+# Measured text sizes kept: every block of a few long pages, at a width or two.
+TEXT_SIZE_CACHE_MAX_ENTRIES = 8192
+# Only for estimating text not yet measured: a proportional glyph's average
+# advance, and a line's pitch, as multiples of the font size (the pitch also of
+# the line height). A close estimate keeps the scroll bar from jumping as the
+# reader scrolls into unmeasured text.
+AVERAGE_CHAR_WIDTH = 0.5
+LINE_PITCH = 1.15
+
+type TextSize = tuple[float, float]  # (width, height)
+
+
+def estimate_text_height(markup: str, font_size: float, width: float, line_height: float) -> float:
+    """Estimate the height of Kivy markup wrapped at ``width``, before it is measured."""
+    chars_per_line = max(int(width / (font_size * AVERAGE_CHAR_WIDTH)), 1)
+    num_lines = sum(
+        max(math.ceil(visible_len(line) / chars_per_line), 1) for line in markup.split("\n")
+    )
+    return num_lines * font_size * line_height * LINE_PITCH
+
+
+def reveal_offset(
+    top: float, bottom: float, view_top: float, view_height: float, padding: float
+) -> float:
+    """Return the viewport top showing ``top``..``bottom`` with the least scrolling.
+
+    Like Kivy's ``ScrollView.scroll_to``: unchanged if the span (padded) is
+    already in view, otherwise just far enough to bring it in.
+    """
+    if top - padding < view_top:
+        return max(top - padding, 0)
+    if bottom + padding > view_top + view_height:
+        return bottom + padding - view_height
+    return view_top
+
+
+class ItemExtents:
+    """The heights of a list's items and their offsets from the top of the list.
+
+    Heights start as the caller's estimates; `set_height` records a measured
+    one. Offsets are brought up to date lazily, from the first changed item on.
+    """
+
+    def __init__(self, heights: Sequence[float]) -> None:
+        self._heights = list(heights)
+        self._tops = [0.0] * len(self._heights)
+        self._num_valid_tops = 0  # _tops[:n] are up to date
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._heights)
+
+    def height(self, i: int) -> float:
+        """Return item ``i``'s height."""
+        return self._heights[i]
+
+    def set_height(self, i: int, height: float) -> None:
+        """Record item ``i``'s (measured) height, moving every item below it."""
+        if height != self._heights[i]:
+            self._heights[i] = height
+            self._num_valid_tops = min(self._num_valid_tops, i + 1)
+
+    def top(self, i: int) -> float:
+        """Return item ``i``'s offset from the top of the list."""
+        self._update_tops(i + 1)
+        return self._tops[i]
+
+    def bottom(self, i: int) -> float:
+        """Return the offset just below item ``i``."""
+        return self.top(i) + self._heights[i]
+
+    @property
+    def total_height(self) -> float:
+        """The height of the whole list."""
+        return self.bottom(len(self) - 1) if self._heights else 0.0
+
+    def index_at(self, offset: float) -> int:
+        """Return the item at ``offset`` — the first or last item beyond the list's ends."""
+        self._update_tops(len(self))
+        return min(max(bisect_right(self._tops, offset) - 1, 0), len(self) - 1)
+
+    def _update_tops(self, num_tops: int) -> None:
+        i = self._num_valid_tops
+        if i >= num_tops:
+            return
+        top = self._tops[i - 1] + self._heights[i - 1] if i else 0.0
+        for j in range(i, num_tops):
+            self._tops[j] = top
+            top += self._heights[j]
+        self._num_valid_tops = num_tops
+
+
+class BlockWindow[W]:
+    """Live widgets for only the items of a list near its viewport.
+
+    ``build(i)`` makes item ``i``'s widget and returns it with the item's
+    measured height; ``release(i, widget)`` takes the widget back once the item
+    is no longer near the viewport, for the caller to recycle. Items within
+    ``overscan`` of the viewport are kept live, so a short scroll finds them
+    ready.
+    """
+
+    def __init__(
+        self,
+        extents: ItemExtents,
+        build: Callable[[int], tuple[W, float]],
+        release: Callable[[int, W], None],
+        *,
+        overscan: float,
+    ) -> None:
+        self.extents = extents
+        self._build = build
+        self._release = release
+        self._overscan = overscan
+        self.live: dict[int, W] = {}
+
+    def update(self, view_top: float, view_height: float) -> float:
+        """Make live just the items near the viewport; return the viewport's corrected top.
+
+        Building an item measures it, which may correct its estimated height and
+        so move every item below. The returned top is ``view_top`` moved along
+        with the item at the top of the viewport, so the text there stays put.
+        """
+        extents = self.extents
+        if not len(extents):
+            return view_top
+        anchor = extents.index_at(view_top)
+        anchor_offset = view_top - extents.top(anchor)
+
+        def window_bottom() -> float:
+            return extents.top(anchor) + anchor_offset + view_height + self._overscan
+
+        first = extents.index_at(view_top - self._overscan)
+        # Release first, so the items built next can recycle the widgets.
+        leaving = [i for i in self.live if i < first or extents.top(i) >= window_bottom()]
+        for i in leaving:
+            self._release(i, self.live.pop(i))
+
+        i = first
+        while i < len(extents) and extents.top(i) < window_bottom():
+            if i not in self.live:
+                widget, height = self._build(i)
+                self.live[i] = widget
+                extents.set_height(i, height)
+            i += 1
+        for j in [j for j in self.live if j >= i]:
+            self._release(j, self.live.pop(j))
+
+        return extents.top(anchor) + anchor_offset
+
+    def release_all(self) -> None:
+        """Release every live item's widget."""
+        while self.live:
+            i, widget = self.live.popitem()
+            self._release(i, widget)
+
+
+class TextSizeCache:
+    """An LRU of measured text sizes, keyed by whatever the caller's measurement depends on.
+
+    The viewer keys a block's size by its kind, markup, font size and wrap width.
+    """
+
+    def __init__(self, max_entries: int = TEXT_SIZE_CACHE_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._sizes: OrderedDict[Hashable, TextSize] = OrderedDict()
+
+    def get(self, key: Hashable) -> TextSize | None:
+        """Return the size measured for ``key``, or None if it has not been (or was dropped)."""
+        size = self._sizes.get(key)
+        if size is not None:
+            self._sizes.move_to_end(key)
+        return size
+
+    def put(self, key: Hashable, size: TextSize) -> None:
+        """Remember the size measured for ``key``."""
+        self._sizes[key] = size
+        self._sizes.move_to_end(key)
+        while len(self._sizes) > self._max_entries:
+            self._sizes.popitem(last=False)
@@ -11,16 +11,19 @@ scripts/read_okf.py.
 from __future__ import annotations
 
 import io
+import math
 import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from kivy.animation import Animation
 from kivy.app import App
 from kivy.clock import Clock
 from kivy.core.image import Image as CoreImage
 from kivy.effects.scroll import ScrollEffect
 from kivy.graphics import Color, Rectangle, RoundedRectangle
+from kivy.graphics.texture import Texture  # ty: ignore[unresolved-import]
 from kivy.metrics import dp, sp
 from kivy.uix.actionbar import ActionButton, ActionToggleButton
 from kivy.uix.anchorlayout import AnchorLayout
@@ -37,22 +40,31 @@ from kivy.uix.togglebutton import ToggleButton
 from kivy.uix.treeview import TreeView, TreeViewLabel
 from kivy.uix.widget import Widget
 
+from okf_reader.core.backgrounds import BackgroundLoader, as_async_image_provider
+from okf_reader.core.page_cache import PageCache
 from okf_reader.core.render import (
     LINK_COLOR,
     Block,
     BundleDir,
     TableBlock,
     TableRewriter,
-    has_children,
-    list_children,
     render_page,
     resolve_link,
+    visible_len,
 )
-from okf_reader.core.search import BundleSearcher
+from okf_reader.core.search import FullTextSearcher
 from okf_reader.core.session import load_session_state, save_session_state
 from okf_reader.core.theme import ViewerThemeSpec
 from okf_reader.core.top_bar import TopBarSpec
-
+from okf_reader.core.tree_cache import BundleTreeCache
+
+from .block_window import (
+    BlockWindow,
+    ItemExtents,
+    TextSizeCache,
+    estimate_text_height,
+    reveal_offset,
+)
 from .focus_ring import (
     SIDEBAR_RING_GROUP,
     clear_focus_ring,
@@ -85,9 +97,16 @@ from .keynav import (
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Collection
+    from concurrent.futures import Future
 
     from okf_reader.core.actions import PageAction, PageActionProvider
-    from okf_reader.core.backgrounds import ImageProvider
+    from okf_reader.core.backgrounds import (
+        AsyncImageProvider,
+        ImageProvider,
+        PageBackground,
+        PixelBuffer,
+    )
+    from okf_reader.core.render import Page
     from okf_reader.core.search import SearchHit, SearchProvider
 
 BODY_LINE_HEIGHT = 1.25
@@ -95,8 +114,16 @@ BODY_LINE_HEIGHT = 1.25
 # only lines up in a monospace face. RobotoMono ships with Kivy (regular only —
 # another reason table headers are colored, not bold).
 TABLE_FONT_NAME = "RobotoMono-Regular"
-# Space between a table's last row and its horizontal scrollbar (see _table_widget).
+# Scroll bars are widened from Kivy's 2dp default (see _scroll_view).
+SCROLL_BAR_WIDTH = 12  # dp
+# Space between a table's last row and its horizontal scrollbar (see _add_table).
 TABLE_BAR_GAP = dp(4)
+# The page body only has widgets for the blocks (and table rows) within this
+# distance of its viewport; the rest are placed but not built (see BlockWindow).
+BODY_OVERSCAN = 400  # dp
+# How many times one body update may move the viewport to follow the text under
+# it, as new measurements correct the estimated heights above it.
+_BODY_WINDOW_MAX_PASSES = 3
 BODY_PADDING = (16, 8, 24, 16)  # left, top, right, bottom
 BODY_BLOCK_SPACING = 12
 POPUP_PADDING = 12
@@ -114,6 +141,9 @@ TREE_INDENT_LEVEL = 12  # dp — extra indent per tree depth
 # Multiplied into the background image (Kivy Image.color) so white text stays
 # readable over it — the same darkening mechanism the Barks Reader's kv files use.
 WINDOW_BG_TINT = (0.30, 0.30, 0.30, 1)
+# The outgoing background stays on show while the next one loads, then fades out
+# over the newcomer for this long.
+BG_CROSS_FADE_SECS = 0.4
 # Translucent black drawn over the background image behind the whole sidebar
 # column (the search field and the tree), giving the tree text and the
 # search-field seam a legibility floor over a vivid background panel. Near-black,
@@ -297,6 +327,14 @@ def _bar_separator(color: tuple[float, float, float, float], width_dp: float = 1
     return separator
 
 
+def _pixels_texture(buffer: PixelBuffer) -> Texture:
+    """Upload a decoded pixel buffer (rows top to bottom) into a new texture."""
+    texture = Texture.create(size=buffer.size, colorfmt=buffer.colorfmt)
+    texture.blit_buffer(buffer.pixels, colorfmt=buffer.colorfmt, bufferfmt="ubyte")
+    texture.flip_vertical()
+    return texture
+
+
 def _scroll_view(**kwargs) -> ScrollView:  # noqa: ANN003
     """Build a ScrollView with the Barks Reader's scroll behavior (tree_view_screen.kv).
 
@@ -312,7 +350,7 @@ def _scroll_view(**kwargs) -> ScrollView:  # noqa: ANN003
         scroll_type=["bars", "content"],
         bar_color=(0.7, 0.7, 1.0, 1),
         bar_inactive_color=(0.7, 0.7, 0.7, 0.9),
-        bar_width=dp(12),
+        bar_width=dp(SCROLL_BAR_WIDTH),
         **kwargs,
     )
 
@@ -343,11 +381,79 @@ class _HistoryEntry:
     scroll_y: float = 1.0
 
 
+@dataclass(frozen=True)
+class _BodyItem:
+    """One page block's place in the body column.
+
+    Blocks group into banded sections: each heading starts a new section holding
+    it and everything up to the next heading (see BLOCK_BG_COLOR). From the top,
+    an item is ``gap`` (the body's top padding, or the space between sections),
+    then its part of the section band — the block inset by ``band_above`` and
+    ``band_below`` — then, under the last item, the body's bottom padding.
+    """
+
+    block: Block | TableBlock
+    starts_section: bool
+    ends_section: bool
+    gap: float
+    band_above: float
+    band_below: float
+    trailing: float
+
+    @property
+    def chrome_height(self) -> float:
+        """The item's height apart from its block's."""
+        return self.gap + self.band_above + self.band_below + self.trailing
+
+
+def _layout_items(blocks: list[Block | TableBlock]) -> list[_BodyItem]:
+    """Place a page's blocks in banded sections (see `_BodyItem`)."""
+    starts = [i == 0 or (isinstance(blk, Block) and blk.heading) for i, blk in enumerate(blocks)]
+    last = len(blocks) - 1
+    return [
+        _BodyItem(
+            block=blk,
+            starts_section=starts[i],
+            ends_section=i == last or starts[i + 1],
+            gap=BODY_PADDING[1] if i == 0 else BODY_BLOCK_SPACING if starts[i] else 0,
+            band_above=SECTION_PADDING[1] if starts[i] else SECTION_BLOCK_SPACING,
+            band_below=SECTION_PADDING[1] if i == last or starts[i + 1] else 0,
+            trailing=BODY_PADDING[3] if i == last else 0,
+        )
+        for i, blk in enumerate(blocks)
+    ]
+
+
+@dataclass(frozen=True)
+class _PageLink:
+    """One link on the page, in document order: where it is, built or not."""
+
+    item: int  # the body item (block) holding it
+    row: int | None  # its table row, for a link in a table
+    ref: str
+    occurrence: int  # which of its label's refs it is
+
+
+class _BodyItemWidget(RelativeLayout):
+    """A live body item: its slice of the section band and its block's widgets.
+
+    Recycled from page to page and block to block (see `OKFViewer._build_body_item`).
+    """
+
+    def __init__(self, **kwargs) -> None:  # noqa: ANN003
+        super().__init__(size_hint=(None, None), **kwargs)
+        with self.canvas.before:  # ty: ignore[unresolved-attribute]
+            self.band_color = Color(rgba=BLOCK_BG_COLOR)
+            self.band = RoundedRectangle()
+        self.labels: list[tuple[str, Label]] = []  # (label pool, label) of the block's text
+        self.table_rows: BlockWindow[Label] | None = None  # a table's live rows
+
+
 class OKFViewer(RelativeLayout):
     def __init__(
         self,
         bundle: Path,
-        image_provider: ImageProvider | None = None,
+        image_provider: ImageProvider | AsyncImageProvider | None = None,
         table_rewriter: TableRewriter | None = None,
         start_page: Path | None = None,
         action_provider: PageActionProvider | None = None,
@@ -366,22 +472,45 @@ class OKFViewer(RelativeLayout):
         self.history: list[_HistoryEntry] = []
         self._anchors: dict[str, str] = {}  # "fn:<label>" -> the definition block's markup
         self._syncing_tree = False  # True while _sync_tree_to selects programmatically
-        self._image_provider = image_provider
-        self._table_rewriter = table_rewriter
+        # Backgrounds load off the UI thread (a plain ImageProvider is adapted),
+        # and only the latest page's is ever applied, on the next frame.
+        self._background_loader = (
+            BackgroundLoader(
+                as_async_image_provider(image_provider),
+                self._apply_background,
+                lambda apply: Clock.schedule_once(lambda _dt: apply(), 0),
+            )
+            if image_provider is not None
+            else None
+        )
+        # Rendered pages are cached and misses rendered off the UI thread (see
+        # _show); _page_request tells a late render for a page since left apart.
+        self._page_cache = PageCache(
+            lambda text: render_page(
+                text,
+                table_rewriter=table_rewriter,
+                heading_color=self._theme.heading_hex,
+                link_color=self._theme.link_hex,
+            )
+        )
+        self._page_request = 0
+        # Directory listings for the lazy tree, reused while a directory is
+        # unchanged, and listed ahead around each page shown (see _show).
+        self._tree_cache = BundleTreeCache(bundle)
         self._action_provider = action_provider
         self._state_path = state_path
-        # Title/heading search over the bundle. The built-in searcher needs no app
+        # Full-text search over the bundle. The built-in searcher needs no app
         # knowledge (unlike the image/table/action providers) and builds its index
         # lazily on the first query, so defaulting it here costs nothing up front;
-        # an embedding app may inject a different backend (e.g. full-text).
-        self._searcher: SearchProvider = search_provider or BundleSearcher(bundle)
+        # an embedding app may inject one that saves its index, or another backend.
+        self._searcher: SearchProvider = search_provider or FullTextSearcher(bundle)
         # Building the index walks the whole bundle, so it is warmed off the UI
         # thread on the field's first focus (see _on_search_focus); until it is
         # ready a query shows a "Searching…" note rather than freezing the field.
         # _search_failed is set if the off-thread index build raised: search is
         # "ready" (the field stops waiting) but disabled, showing an error note
         # instead of hanging on "Searching…". It guards every search() call, since
-        # a failed BundleSearcher would re-raise the build on the UI thread if
+        # a failed FullTextSearcher would re-raise the build on the UI thread if
         # queried again.
         self._search_ready = self._search_failed = False
         self._search_warming = False
@@ -390,7 +519,7 @@ class OKFViewer(RelativeLayout):
         # at the root, since the reader is the whole app.
         self._on_exit = on_exit
         self._page_action: PageAction | None = None
-        self._band_colors: list[Color] = []  # the current page's section-band Colors
+        self._init_body_window()
         self._init_link_hover()
         self._init_keyboard_nav()
 
@@ -399,6 +528,9 @@ class OKFViewer(RelativeLayout):
         # panels above.
         self.bg_image = Image(fit_mode="cover", color=WINDOW_BG_TINT, size_hint=(1, 1))
         self.add_widget(self.bg_image)
+        # The outgoing background, fading out over bg_image (see _apply_background).
+        self._bg_fade = Image(fit_mode="cover", color=WINDOW_BG_TINT, size_hint=(1, 1), opacity=0)
+        self.add_widget(self._bg_fade)
         root = BoxLayout(orientation="vertical", size_hint=(1, 1))
         self.add_widget(root)
         root.add_widget(self._build_top_bar(top_bar if top_bar is not None else TopBarSpec()))
@@ -424,13 +556,7 @@ class OKFViewer(RelativeLayout):
         content.add_widget(self._build_left_column())
 
         self.body_scroll = _scroll_view(size_hint=(1 - TREE_PANEL_WIDTH, 1), do_scroll_x=False)
-        self.body = BoxLayout(
-            orientation="vertical",
-            size_hint=(None, None),
-            spacing=BODY_BLOCK_SPACING,
-            padding=BODY_PADDING,
-        )
-        self.body.bind(minimum_height=self.body.setter("height"))
+        self.body = RelativeLayout(size_hint=(None, None), height=0)
         self._add_reading_pane_scrim()
         # The scroll child is a full-width anchor that centers the body column,
         # whose width is capped at BODY_MAX_WIDTH so the measure stays readable
@@ -441,13 +567,16 @@ class OKFViewer(RelativeLayout):
         self.body_scroll.bind(
             width=lambda _inst, w: setattr(self.body, "width", min(w, dp(BODY_MAX_WIDTH)))
         )
+        self.body.bind(width=lambda *_args: self._relayout_body())
+        self.body_scroll.bind(scroll_y=self._update_body_window, height=self._update_body_window)
         self.body_scroll.add_widget(body_anchor)
         content.add_widget(self.body_scroll)
 
         # Lazy: load only the bundle's top level (all tiers) now; each directory's
-        # children are read on first expansion (see _on_dir_open). This keeps startup
-        # cheap even though the full bundle is ~900 files across ~200 dirs.
-        self._add_tree_nodes(list_children(bundle), None)
+        # children are read on first expansion (see _on_dir_open), or ahead on the
+        # tree cache's worker around each page shown. This keeps startup cheap
+        # however many files and directories the bundle has.
+        self._add_tree_nodes(self._tree_cache.list_children(bundle), None)
 
         # Startup, before any page is shown: empty frontmatter matches no title, so
         # the provider's fallback pool supplies a random story image.
@@ -713,7 +842,7 @@ class OKFViewer(RelativeLayout):
                 )
                 # Disclosure triangle only when there is something to open (cheap
                 # existence scan); the real children still load lazily on expand.
-                tv.is_leaf = not has_children(node.path)
+                tv.is_leaf = not self._tree_cache.has_children(node.path)
                 tv.bundle_path = node.path
                 tv.loaded = False
                 tv.bind(is_open=self._on_dir_open)
@@ -735,7 +864,7 @@ class OKFViewer(RelativeLayout):
             return
         if not dir_node.loaded:
             dir_node.loaded = True
-            self._add_tree_nodes(list_children(dir_node.bundle_path), dir_node)
+            self._add_tree_nodes(self._tree_cache.list_children(dir_node.bundle_path), dir_node)
         self._close_other_branches(dir_node)
 
     def _close_other_branches(self, opened) -> None:  # noqa: ANN001
@@ -1073,6 +1202,16 @@ class OKFViewer(RelativeLayout):
             self._state_path, self.bundle, self.history[-1].path, self.body_scroll.scroll_y
         )
 
+    def close(self) -> None:
+        """Let the page and tree caches' worker threads go, once this viewer is done with.
+
+        Renders and tree syncs still in flight are dropped. The hosting app
+        decides when — the standalone app calls this on stop, after `save_session`.
+        """
+        self._page_request += 1
+        self._page_cache.close()
+        self._tree_cache.close()
+
     def on_touch_down(self, touch) -> bool:  # noqa: ANN001
         """Route the mouse's back button (button 4) to Back, wherever it lands."""
         if self._focus_region is FocusRegion.TOP_BAR:
@@ -1098,7 +1237,7 @@ class OKFViewer(RelativeLayout):
         in results mode.
         """
         self._focus_region = FocusRegion.PAGE
-        self._page_links: list[tuple[Label, str, int]] = []  # (label, ref, occurrence-in-label)
+        self._page_links: list[_PageLink] = []
         self._focused_link: int | None = None
         self._sidebar_index: int | None = None
         self._results_scroll: ScrollView | None = None
@@ -1298,14 +1437,25 @@ class OKFViewer(RelativeLayout):
 
         Viewport-relative: y grows downward from the viewport's top edge, so a
         label spanning the top of the view has top ~0 (see `hybrid_link_step`).
-        Occurrences within one label share its geometry.
+        Occurrences within one label share its geometry. Worked out from the
+        page's placed items, so links not yet built have geometry too.
         """
-        viewport_top = self.body_scroll.to_window(self.body_scroll.x, self.body_scroll.top)[1]
-        geometry = []
-        for lbl, _ref, _occurrence in self._page_links:
-            label_top = viewport_top - lbl.to_window(lbl.x, lbl.top)[1]
-            geometry.append((label_top, label_top + lbl.height))
-        return geometry
+        view_top = self._body_view_top()
+        return [
+            (top - view_top, bottom - view_top)
+            for top, bottom in map(self._link_extent, self._page_links)
+        ]
+
+    def _link_extent(self, link: _PageLink) -> tuple[float, float]:
+        """Return a link's label's (top, bottom), as offsets down from the top of the body."""
+        assert self._body_window is not None
+        top = self._block_top(link.item)
+        if link.row is None:
+            item = self._body_items[link.item]
+            height = self._body_window.extents.height(link.item) - item.chrome_height
+            return top, top + height
+        rows = self._table_rows[link.item]
+        return top + rows.top(link.row), top + rows.bottom(link.row)
 
     def _prune_offscreen_link_focus(self) -> None:
         """Drop link focus once its label has scrolled fully out of the viewport.
@@ -1316,10 +1466,9 @@ class OKFViewer(RelativeLayout):
         """
         if self._focused_link is None:
             return
-        lbl, _ref, _occurrence = self._page_links[self._focused_link]
-        viewport_top = self.body_scroll.to_window(self.body_scroll.x, self.body_scroll.top)[1]
-        label_top = viewport_top - lbl.to_window(lbl.x, lbl.top)[1]
-        if label_top + lbl.height <= 0 or label_top >= self.body_scroll.height:
+        top, bottom = self._link_extent(self._page_links[self._focused_link])
+        view_top = self._body_view_top()
+        if bottom <= view_top or top >= view_top + self.body_scroll.height:
             self._clear_link_focus()
 
     def _scroll_page_by(self, delta_px: float) -> None:
@@ -1327,46 +1476,56 @@ class OKFViewer(RelativeLayout):
             self.body_scroll.scroll_y, self.body_scroll.height, self.body.height, delta_px
         )
 
-    def _build_page_links(self) -> list[tuple[Label, str, int]]:
-        """Collect the page's links in document order: (label, ref, occurrence-in-label)."""
-        return [
-            (lbl, ref, i)
-            for lbl in self._link_labels
-            for i, ref in enumerate(enumerate_refs(lbl.text))
-        ]
+    def _build_page_links(self) -> list[_PageLink]:
+        """Collect the page's links in document order, from its blocks (built or not)."""
+        links = []
+        for i, item in enumerate(self._body_items):
+            blk = item.block
+            if isinstance(blk, TableBlock):
+                links.extend(
+                    _PageLink(i, r, ref, occurrence)
+                    for r, row in enumerate(blk.rows)
+                    for occurrence, ref in enumerate(enumerate_refs(row))
+                )
+            else:
+                links.extend(
+                    _PageLink(i, None, ref, occurrence)
+                    for occurrence, ref in enumerate(enumerate_refs(blk.markup))
+                )
+        return links
 
     def _set_link_focus(self, idx: int | None) -> None:
         """Move the gold link highlight to ``idx``, scrolling its label into view."""
-        self._restore_focused_link_markup()
+        previous = self._focused_link
         self._focused_link = idx
+        if previous is not None:
+            self._refresh_link_label(self._page_links[previous])
         if idx is None:
             return
-        lbl, _ref, occurrence = self._page_links[idx]
-        lbl._orig_markup = lbl.text  # noqa: SLF001
-        lbl.text = highlight_ref_occurrence(lbl.text, occurrence, LINK_COLOR, LINK_FOCUS_COLOR)
+        link = self._page_links[idx]
         if self.body.height > self.body_scroll.height:
-            self.body_scroll.scroll_to(lbl, padding=dp(24))
+            top, bottom = self._link_extent(link)
+            view_top = self._body_view_top()
+            self._scroll_body_to(
+                reveal_offset(top, bottom, view_top, self.body_scroll.height, dp(24))
+            )
+            self._update_body_window()  # builds the label, highlighted, if it was not
+        self._refresh_link_label(link)
 
-    def _restore_focused_link_markup(self) -> None:
-        """Put the focused link's label text back to its unhighlighted markup."""
-        if self._focused_link is None:
-            return
-        lbl, _ref, _occurrence = self._page_links[self._focused_link]
-        orig = getattr(lbl, "_orig_markup", None)
-        if orig is not None:
-            lbl.text = orig
-            lbl._orig_markup = None  # noqa: SLF001
+    def _refresh_link_label(self, link: _PageLink) -> None:
+        """Re-mark a link's label, if built, for whether its link is focused."""
+        lbl = self._link_labels.get((link.item, link.row))
+        if lbl is not None:
+            lbl.text = self._label_markup(link.item, link.row)
 
     def _clear_link_focus(self) -> None:
-        self._restore_focused_link_markup()
-        self._focused_link = None
+        self._set_link_focus(None)
 
     def _follow_focused_link(self) -> bool:
         """Activate the focused link exactly as a tap would; False with no focus."""
-        if self._focused_link is None:
+        if self._focused_link is None or self._page_path is None:
             return False
-        lbl, ref, _occurrence = self._page_links[self._focused_link]
-        self._on_ref(lbl, ref)
+        self._follow_ref(self._page_path, self._page_links[self._focused_link].ref)
         return True
 
     def _handle_sidebar_key(self, key: int) -> bool:
@@ -1557,27 +1716,67 @@ class OKFViewer(RelativeLayout):
             clear_focus_ring(self._left_body, group=SIDEBAR_RING_GROUP)
             self._clear_result_focus()
             if self.history:
-                self._sync_tree_to(self.history[-1].path)
+                self._sync_tree_when_listed(self.history[-1].path)
 
     def _update_background(self, frontmatter: dict[str, Any], path: Path) -> None:
-        """Set the page panel's background to an image suiting the page, if any.
+        """Start loading the page panel's background: an image suiting the page, if any.
 
-        The provider owns selection and repeat-avoidance; this method only
-        renders its answer — a plain file by filename, or in-memory bytes
-        (e.g. a decrypted archive member) decoded to a texture.
+        The provider owns selection and repeat-avoidance, and an asynchronous one
+        decodes off the UI thread; the current background stays until the new
+        one is ready (see _apply_background).
         """
-        if self._image_provider is None:
+        if self._background_loader is None:
             return
-        bg = self._image_provider.background_for(frontmatter, path)
+        self._background_loader.request(frontmatter, path)
+
+    def _apply_background(self, bg: PageBackground | None) -> None:
+        """Render the provider's answer, cross-fading from the outgoing background.
+
+        A plain file is loaded by filename, in-memory bytes (e.g. a decrypted
+        archive member) are decoded to a texture, and a decoded pixel buffer is
+        uploaded as one.
+        """
+        Animation.cancel_all(self._bg_fade)
+        self._bg_fade.texture = self.bg_image.texture
+        if self._bg_fade.texture is not None:
+            self._bg_fade.opacity = 1
+            Animation(opacity=0, duration=BG_CROSS_FADE_SECS).start(self._bg_fade)
+
         if bg is None:
             self.bg_image.source = ""
             self.bg_image.texture = None
         elif bg.path is not None:
             self.bg_image.source = str(bg.path)
         else:
-            assert bg.data is not None
             self.bg_image.source = ""  # or kivy would reload the old file over the texture
-            self.bg_image.texture = CoreImage(io.BytesIO(bg.data), ext=bg.ext.lstrip(".")).texture
+            if bg.pixels is not None:
+                self.bg_image.texture = _pixels_texture(bg.pixels)
+            else:
+                assert bg.data is not None
+                self.bg_image.texture = CoreImage(
+                    io.BytesIO(bg.data), ext=bg.ext.lstrip(".")
+                ).texture
+
+    def _sync_tree_when_listed(self, path: Path) -> None:
+        """Sync the tree to ``path`` once its ancestor directories are listed.
+
+        Listing a directory not seen before reads every concept in it, so rather
+        than hold up the page on the UI thread, the tree cache lists them on its
+        worker (while the page renders on the page cache's) and the tree follows
+        on the next frame — unless another page was asked for meanwhile. Already
+        listed directories sync at once.
+        """
+        listed = self._tree_cache.warm_around(path)
+        if listed.done():
+            self._sync_tree_to(path)
+            return
+        request = self._page_request
+        listed.add_done_callback(
+            lambda _future: Clock.schedule_once(
+                lambda _dt: self._sync_tree_to(path) if request == self._page_request else None,
+                0,
+            )
+        )
 
     def _sync_tree_to(self, path: Path) -> None:
         """Select and reveal the tree node for ``path``, expanding ancestors as needed.
@@ -1602,7 +1801,7 @@ class OKFViewer(RelativeLayout):
                 return  # not represented in the tree (e.g. hidden dir) — nothing to sync
             if not dir_node.loaded:  # populate before opening, as a manual expand would
                 dir_node.loaded = True
-                self._add_tree_nodes(list_children(dir_node.bundle_path), dir_node)
+                self._add_tree_nodes(self._tree_cache.list_children(dir_node.bundle_path), dir_node)
             if not dir_node.is_open:
                 self.tree.toggle_node(dir_node)
             children = dir_node.nodes
@@ -1716,52 +1915,56 @@ class OKFViewer(RelativeLayout):
         # so clicking it leaves — a unified back stack. Standalone (no on_exit) keeps
         # it disabled at the root.
         self.back_btn.disabled = len(self.history) <= 1 and self._on_exit is None
-        self._sync_tree_to(path)
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError as err:
-            # Tolerant consumption (SPEC §9): a page deleted or made unreadable
-            # after the tree was populated (e.g. the wiki being regenerated)
-            # degrades to an error page instead of crashing the event handler.
-            text = f"# Page unavailable\n\n`{path.name}`: {err.strerror or err}\n"
-        page = render_page(
-            text,
-            table_rewriter=self._table_rewriter,
-            heading_color=self._theme.heading_hex,
-            link_color=self._theme.link_hex,
+        self._page_request += 1
+        self._sync_tree_when_listed(path)
+        # A cached page shows at once. Otherwise it is read and rendered on the
+        # page cache's worker, and the outgoing page stays up until it arrives
+        # (or is dropped, if another page was asked for meanwhile). A page
+        # deleted or made unreadable after the tree was populated (e.g. the wiki
+        # being regenerated) renders as an error page (SPEC §9).
+        page = self._page_cache.get(path)
+        if page is not None:
+            self._show_page(path, page, scroll_y)
+            return
+        request = self._page_request
+        self._page_cache.load(path).add_done_callback(
+            lambda future: Clock.schedule_once(
+                lambda _dt: self._on_page_rendered(future, request, path, scroll_y), 0
+            )
         )
+
+    def _on_page_rendered(
+        self, future: Future[Page], request: int, path: Path, scroll_y: float
+    ) -> None:
+        """Show a page rendered on the worker, unless another page was asked for since."""
+        if request == self._page_request:
+            self._show_page(path, future.result(), scroll_y)
+
+    def _show_page(self, path: Path, page: Page, scroll_y: float) -> None:
+        """Lay out a rendered page, then render the pages likely to come next ahead."""
         self._update_background(page.frontmatter, path)
         self._set_page_action(
             self._action_provider.action_for(page.frontmatter, path)
             if self._action_provider is not None
             else None
         )
-        self.body.clear_widgets()
-        self._band_colors.clear()  # their sections were just discarded
-        self._link_labels.clear()  # ditto their link labels
-        self._focused_link = None  # its label was just discarded — nothing to restore
-        self._anchors = {}
-        # Blocks group into banded sections: each heading starts a new section
-        # box holding it and everything up to the next heading (see BLOCK_BG_COLOR).
-        section: BoxLayout | None = None
-        for blk in page.blocks:
-            if isinstance(blk, TableBlock):
-                if section is None:
-                    section = self._new_section()
-                section.add_widget(self._table_widget(blk, path))
-                continue
-            lbl = self._body_label(blk, path)
-            if blk.anchor:
-                self._anchors[blk.anchor] = blk.markup
-            if section is None or blk.heading:
-                section = self._new_section()
-            section.add_widget(self._hanging_row(lbl, blk) if blk.indent else lbl)
+        self._release_body()
+        self._focused_link = None  # its label was just released — nothing to restore
+        self._page_path = path
+        # Footnote definitions, whether or not their blocks are ever built.
+        self._anchors = {
+            blk.anchor: blk.markup
+            for blk in page.blocks
+            if isinstance(blk, Block) and blk.anchor is not None
+        }
+        self._body_items = _layout_items(page.blocks)
         self._page_links = self._build_page_links()
+        self._relayout_body(keep_place=False)
         # Fresh pages open at the top; Back passes the offset the page was left at.
         self.body_scroll.scroll_y = scroll_y
         if scroll_y != 1:
-            # The labels take their texture sizes over the next frame, shifting the
-            # normalized offset; re-assert it once the layout has settled.
+            # The blocks measured on the way correct the estimated page height,
+            # shifting the normalized offset; re-assert it once they have settled.
             Clock.schedule_once(lambda _dt: setattr(self.body_scroll, "scroll_y", scroll_y), 0)
         # Keep the results list's highlight on the page now showing, however reached.
         self._active_result_path = path
@@ -1769,74 +1972,272 @@ class OKFViewer(RelativeLayout):
         # A click-navigation swaps the page under a stationary mouse; re-evaluate
         # the cursor once the new labels' textures have settled.
         Clock.schedule_once(lambda _dt: self._refresh_cursor(), 0)
+        self._page_cache.prefetch_neighbours(path)
 
-    def _new_section(self) -> BoxLayout:
-        """Append and return a fresh banded section box for the next run of blocks."""
-        box = BoxLayout(
-            orientation="vertical",
-            size_hint_y=None,
-            spacing=SECTION_BLOCK_SPACING,
-            padding=SECTION_PADDING,
+    def _init_body_window(self) -> None:
+        """Initialize the virtualized page body's state (see `_update_body_window`).
+
+        Every block of the page is placed (``_body_items``), but only those near
+        the viewport have widgets, recycled through the item and label pools.
+        Measured text sizes are cached across pages, and a table's row heights
+        are known without building its rows.
+        """
+        self._page_path: Path | None = None
+        self._body_items: list[_BodyItem] = []
+        self._body_window: BlockWindow[_BodyItemWidget] | None = None
+        self._table_rows: dict[int, ItemExtents] = {}  # body item -> its table's rows
+        self._text_sizes = TextSizeCache()
+        self._item_pool: list[_BodyItemWidget] = []
+        self._label_pools: dict[str, list[Label]] = {"body": [], "table": []}
+        self._updating_body_window = False
+
+    def _release_body(self) -> None:
+        """Release the shown page's live items, for the next page's to recycle."""
+        if self._body_window is not None:
+            self._body_window.release_all()
+            self._body_window = None
+
+    def _relayout_body(self, *, keep_place: bool = True) -> None:
+        """Place the page's items for the body's current width, then build those in view.
+
+        Heights measured at this width before come from the text-size cache, the
+        rest are estimated (see `estimate_text_height`). With ``keep_place`` (a
+        resize), the text at the top of the viewport stays there.
+        """
+        if not self._body_items:
+            return
+        place = None
+        if keep_place and self._body_window is not None:
+            extents = self._body_window.extents
+            view_top = self._body_view_top()
+            anchor = extents.index_at(view_top)
+            place = anchor, (view_top - extents.top(anchor)) / max(extents.height(anchor), 1)
+        self._release_body()
+
+        width = self._body_text_width()
+        self._table_rows = {
+            i: self._table_row_extents(item.block)
+            for i, item in enumerate(self._body_items)
+            if isinstance(item.block, TableBlock)
+        }
+        extents = ItemExtents(
+            [
+                item.chrome_height + self._estimate_block_height(i, item.block, width)
+                for i, item in enumerate(self._body_items)
+            ]
+        )
+        self._body_window = BlockWindow(
+            extents,
+            self._build_body_item,
+            self._release_body_item,
+            overscan=dp(BODY_OVERSCAN),
         )
-        box.bind(minimum_height=box.setter("height"))
-        self._band_colors.append(_add_text_backing(box, self._band_alpha()))
-        self.body.add_widget(box)
-        return box
+        if place is None:
+            self.body_scroll.scroll_y = 1
+            self.body.height = extents.total_height
+        else:
+            anchor, fraction = place
+            view_top = extents.top(anchor) + fraction * extents.height(anchor)
+            self._set_body_view(view_top, extents.total_height, at_bottom=False)
+        self._update_body_window()
 
-    def _body_label(self, blk: Block, path: Path) -> Label:
-        """Build one body block's self-sizing, ref-navigable Label."""
-        lbl = Label(
-            text=blk.markup,
-            markup=True,
-            font_size=blk.font_size,
-            line_height=BODY_LINE_HEIGHT,
-            halign="left",
-            valign="top",
-            size_hint_y=None,
+    def _update_body_window(self, *_args: object) -> None:
+        """Build the body items near the viewport and release the rest (see `BlockWindow`).
+
+        Measuring a newly built item can correct the page height estimated
+        above the viewport; the viewport then moves with the text at its top,
+        so what is being read stays put — or stays at the bottom, after End.
+        """
+        window = self._body_window
+        if window is None or self._updating_body_window:
+            return
+        self._updating_body_window = True
+        try:
+            at_bottom = (
+                self.body_scroll.scroll_y <= 0 and self.body.height > self.body_scroll.height
+            )
+            view_top = self._body_view_top()
+            for _ in range(_BODY_WINDOW_MAX_PASSES):
+                new_top = window.update(view_top, self.body_scroll.height)
+                height = window.extents.total_height
+                if new_top == view_top and height == self.body.height:
+                    break
+                self._set_body_view(new_top, height, at_bottom=at_bottom)
+                view_top = self._body_view_top()
+            for i, widget in window.live.items():
+                widget.y = self.body.height - window.extents.bottom(i)
+                if widget.table_rows is not None:
+                    rows_top = self._block_top(i)
+                    widget.table_rows.update(view_top - rows_top, self.body_scroll.height)
+        finally:
+            self._updating_body_window = False
+
+    def _body_view_top(self) -> float:
+        """Return the viewport's top, as an offset down from the top of the body."""
+        scrollable = self.body.height - self.body_scroll.height
+        return (1 - self.body_scroll.scroll_y) * max(scrollable, 0)
+
+    def _set_body_view(self, view_top: float, height: float, *, at_bottom: bool) -> None:
+        """Resize the body to ``height`` and scroll its ``view_top`` to the viewport's top."""
+        scrollable = height - self.body_scroll.height
+        if scrollable <= 0:
+            scroll_y = 1.0
+        elif at_bottom:
+            scroll_y = 0.0
+        else:
+            scroll_y = 1 - min(max(view_top / scrollable, 0), 1)
+        # Scroll first: the resize then re-syncs the scroll effect to the new offset.
+        self.body_scroll.scroll_y = scroll_y
+        self.body.height = height
+
+    def _scroll_body_to(self, view_top: float) -> None:
+        self._set_body_view(view_top, self.body.height, at_bottom=False)
+
+    def _body_text_width(self) -> float:
+        """Return the width a body block's text wraps at (inside its section band)."""
+        return max(self.body.width - BODY_PADDING[0] - BODY_PADDING[2] - 2 * SECTION_PADDING[0], 1)
+
+    def _block_top(self, i: int) -> float:
+        """Return where item ``i``'s block starts, as an offset down from the top of the body."""
+        assert self._body_window is not None
+        item = self._body_items[i]
+        return self._body_window.extents.top(i) + item.gap + item.band_above
+
+    def _estimate_block_height(self, i: int, blk: Block | TableBlock, width: float) -> float:
+        """Return a block's height if measured at ``width`` before, else an estimate."""
+        if isinstance(blk, TableBlock):
+            return self._table_height(i, blk, width)  # exact, from the font's cell size
+        if blk.indent:
+            width = self._hanging_text_width(blk, width)
+        size = self._text_sizes.get(("text", blk.markup, blk.font_size, width))
+        if size is not None:
+            return size[1]
+        return estimate_text_height(blk.markup, blk.font_size, width, BODY_LINE_HEIGHT)
+
+    def _build_body_item(self, i: int) -> tuple[_BodyItemWidget, float]:
+        """Build item ``i``'s widgets (recycling released ones); return them and its height."""
+        item = self._body_items[i]
+        widget = self._item_pool.pop() if self._item_pool else _BodyItemWidget()
+        x = BODY_PADDING[0] + SECTION_PADDING[0]
+        y = item.trailing + item.band_below
+        width = self._body_text_width()
+        blk = item.block
+        if isinstance(blk, TableBlock):
+            content_height = self._add_table(widget, i, blk, x, y, width)
+        elif blk.indent:
+            content_height = self._add_hanging_row(widget, i, blk, x, y, width)
+        else:
+            lbl = self._take_body_label(widget, i, blk.markup, blk.font_size, width)
+            lbl.pos = (x, y)
+            content_height = lbl.height
+        height = item.chrome_height + content_height
+
+        widget.size = (self.body.width, height)
+        widget.band_color.a = self._band_alpha()
+        radius = dp(BLOCK_BG_RADIUS)
+        top_radius = radius if item.starts_section else 0
+        bottom_radius = radius if item.ends_section else 0
+        widget.band.radius = [top_radius, top_radius, bottom_radius, bottom_radius]
+        widget.band.pos = (BODY_PADDING[0], item.trailing)
+        widget.band.size = (
+            self.body.width - BODY_PADDING[0] - BODY_PADDING[2],
+            height - item.gap - item.trailing,
         )
-        lbl.bind(width=lambda inst, w: inst.setter("text_size")(inst, (w, None)))
-        lbl.bind(texture_size=lambda inst, ts: inst.setter("height")(inst, ts[1]))
-        lbl._page_path = path  # noqa: SLF001
+        self.body.add_widget(widget)
+        return widget, height
+
+    def _release_body_item(self, i: int, widget: _BodyItemWidget) -> None:
+        """Take a body item's widgets back into the pools."""
+        if widget.table_rows is not None:
+            widget.table_rows.release_all()
+            widget.table_rows = None
+        self._link_labels.pop((i, None), None)
+        for pool, lbl in widget.labels:
+            self._label_pools[pool].append(lbl)
+        widget.labels.clear()
+        widget.clear_widgets()
+        self.body.remove_widget(widget)
+        self._item_pool.append(widget)
+
+    def _take_label(self, pool: str) -> Label:
+        """Return a released label from ``pool``, or a new one, ready for new text."""
+        if self._label_pools[pool]:
+            return self._label_pools[pool].pop()
+        if pool == "table":
+            # Tables come from the core space-padded to aligned columns (see TableBlock).
+            lbl = Label(
+                markup=True,
+                font_name=TABLE_FONT_NAME,
+                halign="left",
+                valign="top",
+                size_hint=(None, None),
+            )
+        else:
+            lbl = Label(
+                markup=True,
+                line_height=BODY_LINE_HEIGHT,
+                valign="top",
+                size_hint=(None, None),
+            )
         lbl.bind(on_ref_press=self._on_ref)
-        if "[ref=" in blk.markup:
-            self._link_labels.append(lbl)
         return lbl
 
-    @staticmethod
-    def _hanging_row(lbl: Label, blk: Block) -> BoxLayout:
-        """Wrap a list-item/blockquote label in a hanging-indent row.
-
-        The marker glyph sits right-aligned in its own fixed column, so ``lbl``'s
-        wrapped lines align under the item's text instead of returning to the
-        margin (see LIST_MARKER_WIDTH). A continuation paragraph or blockquote
-        carries an empty marker and just gets the alignment. The row and marker
-        track the text label's height, which the layout resolves after this
-        returns — hence the bind rather than a one-off read.
-        """
-        row = BoxLayout(size_hint_y=None, spacing=dp(LIST_MARKER_GAP))
-        if blk.indent > 1:
-            step = dp((blk.indent - 1) * LIST_INDENT_STEP)
-            row.add_widget(Widget(size_hint=(None, None), width=step, height=1))
-        marker = Label(
-            text=blk.marker,
-            markup=True,
-            font_size=blk.font_size,
-            line_height=BODY_LINE_HEIGHT,
-            halign="right",
-            valign="top",
-            size_hint=(None, None),
-            width=dp(LIST_MARKER_WIDTH),
-        )
-        marker.bind(size=lambda inst, size: inst.setter("text_size")(inst, size))
-        row.add_widget(marker)
-        row.add_widget(lbl)
+    def _take_body_label(
+        self, widget: _BodyItemWidget, i: int, markup: str, font_size: int, width: float
+    ) -> Label:
+        """Add a body text label to ``widget``, sized to its text wrapped at ``width``.
 
-        def sync_height(_lbl, height: float) -> None:  # noqa: ANN001
-            row.height = height
-            marker.height = height
+        The text is measured once per markup, size and width (the text-size
+        cache) — after that the label's height is known before Kivy renders it.
+        """
+        lbl = self._take_label("body")
+        lbl.text = self._label_markup(i, None)
+        lbl.font_size = font_size
+        lbl.halign = "left"
+        lbl.text_size = (width, None)
+        key = ("text", markup, font_size, width)
+        size = self._text_sizes.get(key)
+        if size is None:
+            lbl.texture_update()
+            size = (width, lbl.texture_size[1])
+            self._text_sizes.put(key, size)
+        lbl.size = (width, size[1])
+        if "[ref=" in markup:
+            self._link_labels[i, None] = lbl
+        widget.labels.append(("body", lbl))
+        widget.add_widget(lbl)
+        return lbl
 
-        lbl.bind(height=sync_height)
-        return row
+    @staticmethod
+    def _hanging_text_width(blk: Block, width: float) -> float:
+        """Return the width a list item's text wraps at, right of its marker column."""
+        indent = dp((blk.indent - 1) * LIST_INDENT_STEP)
+        return max(width - indent - dp(LIST_MARKER_WIDTH) - dp(LIST_MARKER_GAP), 1)
+
+    def _add_hanging_row(
+        self, widget: _BodyItemWidget, i: int, blk: Block, x: float, y: float, width: float
+    ) -> float:
+        """Lay a list-item/blockquote block out with a hanging indent; return its height.
+
+        The marker glyph sits right-aligned in its own fixed column, so the
+        text's wrapped lines align under the item's text instead of returning to
+        the margin (see LIST_MARKER_WIDTH). A continuation paragraph or
+        blockquote carries an empty marker and just gets the alignment. Deeper
+        nesting shifts the whole row right one step per level.
+        """
+        indent = dp((blk.indent - 1) * LIST_INDENT_STEP)
+        text_width = self._hanging_text_width(blk, width)
+        lbl = self._take_body_label(widget, i, blk.markup, blk.font_size, text_width)
+        lbl.pos = (x + width - text_width, y)
+        marker = self._take_label("body")
+        marker.text = blk.marker
+        marker.font_size = blk.font_size
+        marker.halign = "right"
+        marker.text_size = marker.size = (dp(LIST_MARKER_WIDTH), lbl.height)
+        marker.pos = (x + indent, y)
+        widget.labels.append(("body", marker))
+        widget.add_widget(marker)
+        return lbl.height
 
     def _band_alpha(self) -> float:
         """Return the section-band alpha the Contrast toggle currently calls for."""
@@ -1858,85 +2259,139 @@ class OKFViewer(RelativeLayout):
         vivid background panel. Its Color is kept so the Contrast toggle can dial
         it up alongside the bands (see _apply_band_alpha).
         """
+        # The body is a RelativeLayout: its canvas draws in its own coordinates.
         with self.body.canvas.before:
             self._pane_scrim_color = Color(rgba=(*READING_PANE_SCRIM[:3], self._pane_scrim_alpha()))
-            rect = Rectangle(pos=self.body.pos, size=self.body.size)
-        self.body.bind(
-            pos=lambda _inst, pos: setattr(rect, "pos", pos),
-            size=lambda _inst, size: setattr(rect, "size", size),
-        )
+            rect = Rectangle(pos=(0, 0), size=self.body.size)
+        self.body.bind(size=lambda _inst, size: setattr(rect, "size", size))
 
     def _apply_band_alpha(self) -> None:
         """Retune the current page's section bands and the reading-pane scrim to the toggle."""
         alpha = self._band_alpha()
-        for color in self._band_colors:
-            color.a = alpha
+        if self._body_window is not None:
+            for widget in self._body_window.live.values():
+                widget.band_color.a = alpha
         self._pane_scrim_color.a = self._pane_scrim_alpha()
 
-    def _table_widget(self, blk: TableBlock, path: Path) -> ScrollView:
-        """Build the widget for a table: monospace rows, tightly stacked, one per Label.
+    def _table_cell_size(self, font_size: int) -> tuple[float, float]:
+        """Return one character cell of the table font at ``font_size``: (advance, line height).
+
+        Measured once per size; the font is monospace, so every row's size
+        follows from it without building the row.
+        """
+        key = ("table", font_size)
+        size = self._text_sizes.get(key)
+        if size is None:
+            sample = "0" * 10
+            lbl = Label(text=sample, font_name=TABLE_FONT_NAME, font_size=font_size)
+            lbl.texture_update()
+            size = (lbl.texture_size[0] / len(sample), lbl.texture_size[1])
+            self._text_sizes.put(key, size)
+        return size
+
+    def _table_row_extents(self, blk: TableBlock) -> ItemExtents:
+        """Return the heights of a table's rows (a row may span several lines)."""
+        _advance, line_height = self._table_cell_size(blk.font_size)
+        return ItemExtents([(row.count("\n") + 1) * line_height for row in blk.rows])
+
+    def _table_width(self, blk: TableBlock) -> float:
+        """Return the width of a table's widest line, plus a cell so it never wraps."""
+        advance, _line_height = self._table_cell_size(blk.font_size)
+        num_chars = max(
+            (visible_len(line) for row in blk.rows for line in row.split("\n")), default=0
+        )
+        return math.ceil((num_chars + 1) * advance)
+
+    def _table_height(self, i: int, blk: TableBlock, width: float) -> float:
+        """Return a table's height: its rows, plus room for the scrollbar if it is too wide.
+
+        Kivy draws the horizontal bar inside the ScrollView's bounds, so when the
+        table overflows, room is reserved below the rows — otherwise the bar
+        covers the last row. (The bar is only drawn when the table overflows, so
+        fitting tables get no dead strip.)
+        """
+        height = self._table_rows[i].total_height
+        if self._table_width(blk) > width:
+            height += dp(SCROLL_BAR_WIDTH) + TABLE_BAR_GAP
+        return height
+
+    def _add_table(
+        self, widget: _BodyItemWidget, i: int, blk: TableBlock, x: float, y: float, width: float
+    ) -> float:
+        """Add a table to ``widget``: monospace rows, tightly stacked; return its height.
 
         One Label per row (not one for the whole table) keeps each texture small —
         a several-hundred-row table in a single Label would exceed the GPU texture
-        size limit. Each label takes its natural (texture) size so the columns'
-        space padding is preserved, and the stack sits in its own horizontal
-        ScrollView so a wide table scrolls instead of clipping. Cells can carry
-        links (the core's ``_inline`` renders them like any other), so rows join
-        the same ref-press and hover machinery as body labels.
+        size limit — and only the rows near the viewport are built, the table
+        having its own `BlockWindow` over them. The rows sit in their own
+        horizontal ScrollView, so a wide table scrolls instead of clipping. Cells
+        can carry links (the core's ``_inline`` renders them like any other), so
+        rows join the same ref-press and hover machinery as body labels.
         """
-        stack = BoxLayout(orientation="vertical", size_hint=(None, None))
-        stack.bind(
-            minimum_height=stack.setter("height"),
-            minimum_width=stack.setter("width"),
-        )
-        for row in blk.rows:
-            lbl = Label(
-                text=row,
-                markup=True,
-                font_name=TABLE_FONT_NAME,
-                font_size=blk.font_size,
-                size_hint=(None, None),
-            )
-            lbl.bind(texture_size=lbl.setter("size"))
-            lbl._page_path = path  # noqa: SLF001
-            lbl.bind(on_ref_press=self._on_ref)
-            if "[ref=" in row:
-                self._link_labels.append(lbl)
+        rows = self._table_rows[i]
+        height = self._table_height(i, blk, width)
+        stack = RelativeLayout(size_hint=(None, None))
+        stack.size = (self._table_width(blk), rows.total_height)
+        scroller = _scroll_view(size_hint=(None, None), do_scroll_y=False)
+        scroller.size = (width, height)
+        scroller.pos = (x, y)
+        scroller.add_widget(stack)
+        widget.add_widget(scroller)
+
+        def build_row(r: int) -> tuple[Label, float]:
+            lbl = self._take_label("table")
+            lbl.text = self._label_markup(i, r)
+            lbl.font_size = blk.font_size
+            lbl.text_size = lbl.size = (stack.width, rows.height(r))
+            lbl.pos = (0, stack.height - rows.bottom(r))
+            if "[ref=" in blk.rows[r]:
+                self._link_labels[i, r] = lbl
             stack.add_widget(lbl)
-        scroller = _scroll_view(size_hint=(1, None), do_scroll_y=False, height=0)
-
-        def fit_height(*_args: object) -> None:
-            # Kivy draws the horizontal bar inside the ScrollView's bounds, so when
-            # the table overflows, reserve room below the rows — otherwise the bar
-            # covers the last row. (The bar is only drawn when the table overflows,
-            # so fitting tables get no dead strip.)
-            overflows = stack.width > scroller.width
-            scroller.height = stack.height + (
-                scroller.bar_width + TABLE_BAR_GAP if overflows else 0
-            )
+            return lbl, rows.height(r)
+
+        def release_row(r: int, lbl: Label) -> None:
+            self._link_labels.pop((i, r), None)
+            stack.remove_widget(lbl)
+            self._label_pools["table"].append(lbl)
+
+        widget.table_rows = BlockWindow(rows, build_row, release_row, overscan=dp(BODY_OVERSCAN))
+        return height
+
+    def _label_markup(self, i: int, row: int | None) -> str:
+        """Return the markup for item ``i``'s label (or table row), the focused link gold."""
+        blk = self._body_items[i].block
+        markup = blk.rows[row] if isinstance(blk, TableBlock) and row is not None else blk.markup
+        if self._focused_link is not None:
+            link = self._page_links[self._focused_link]
+            if (link.item, link.row) == (i, row):
+                return highlight_ref_occurrence(
+                    markup, link.occurrence, LINK_COLOR, LINK_FOCUS_COLOR
+                )
+        return markup
 
-        stack.bind(height=fit_height, width=fit_height)
-        scroller.bind(width=fit_height)
-        scroller.add_widget(stack)
-        return scroller
+    def _on_ref(self, _label: Label, ref: str) -> None:
+        if self._page_path is not None:
+            self._follow_ref(self._page_path, ref)
 
-    def _on_ref(self, label, ref: str) -> None:  # noqa: ANN001
+    def _follow_ref(self, page_path: Path, ref: str) -> None:
+        """Follow a link on ``page_path``: a footnote marker pops up its definition."""
         if ref.startswith("fn:"):
             markup = self._anchors.get(ref)  # tapped [id] → its definition, in a popup
             if markup is not None:
-                self._show_footnote_popup(markup, label._page_path)  # noqa: SLF001
+                self._show_footnote_popup(markup, page_path)
             return
-        target = resolve_link(label._page_path, ref, self.bundle)  # noqa: SLF001
+        target = resolve_link(page_path, ref, self.bundle)
         if target:
             self._show(target, push=True)
 
     def _init_link_hover(self) -> None:
         """Set up link hover: the hand cursor whenever the mouse is over a page link.
 
-        ``_link_labels`` holds the current page's link-bearing labels — the hit-test
-        candidates (see ``_ref_under``); ``_show`` rebuilds it with the page.
+        ``_link_labels`` holds the current page's built link-bearing labels, by
+        (body item, table row) — the hit-test candidates (see ``_ref_under``);
+        items add and remove theirs as they are built and released.
         """
-        self._link_labels: list[Label] = []
+        self._link_labels: dict[tuple[int, int | None], Label] = {}
         self._popup_link_label: Label | None = None  # an open footnote popup's label
         self._hand_cursor = False
         from kivy.core.window import Window  # noqa: PLC0415 — needs the realized window
@@ -1958,7 +2413,7 @@ class OKFViewer(RelativeLayout):
         # the scroll view's own to_widget would apply the scroll transform.
         if not self.body_scroll.collide_point(*self.body_scroll.parent.to_widget(*pos)):
             return False
-        return any(_ref_under(lbl, *pos) is not None for lbl in self._link_labels)
+        return any(_ref_under(lbl, *pos) is not None for lbl in self._link_labels.values())
 
     def _set_hand_cursor(self, over: bool) -> None:
         """Flip the system cursor between hand and arrow, only on a state change.
@@ -2023,7 +2478,7 @@ class OKFApp(App):
     def __init__(
         self,
         bundle: Path,
-        image_provider: ImageProvider | None = None,
+        image_provider: ImageProvider | AsyncImageProvider | None = None,
         table_rewriter: TableRewriter | None = None,
         start_page: Path | None = None,
         action_provider: PageActionProvider | None = None,
@@ -2077,9 +2532,10 @@ class OKFApp(App):
             print("warning: custom titlebar not allowed on this system")  # noqa: T201
 
     def on_stop(self) -> None:
-        """Remember the page (and scroll) being read, for the next launch."""
+        """Remember the page (and scroll) being read, for the next launch, and close the viewer."""
         if self._viewer is not None:
             self._viewer.save_session()
+            self._viewer.close()
 
     def _on_keyboard(self, _window, key, _scancode, _codepoint, modifiers) -> bool:  # noqa: ANN001
         """Ctrl+F focuses search; Alt+Left navigates back; the viewer owns the rest.
@@ -2126,7 +2582,7 @@ class OKFApp(App):
 
 def run(
     bundle: Path,
-    image_provider: ImageProvider | None = None,
+    image_provider: ImageProvider | AsyncImageProvider | None = None,
     table_rewriter: TableRewriter | None = None,
     start_page: Path | None = None,
     action_provider: PageActionProvider | None = None,
@@ -2,12 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import queue
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+import pytest
 from okf_reader.core import backgrounds as bg
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable
 
 
 def _make_favourites(tmp_path: Path) -> Path:
@@ -116,3 +122,202 @@ class TestChooseImage:
         """With only one candidate, repeating it beats showing nothing."""
         a = tmp_path / "a.png"
         assert bg.choose_image([a], last=a) == a
+
+
+def _background(name: str) -> bg.PageBackground:
+    return bg.PageBackground(ext=".png", path=Path(name))
+
+
+class _PendingProvider:
+    """An AsyncImageProvider whose loads complete only when the test says so."""
+
+    def __init__(self) -> None:
+        self.loads: dict[str, tuple[Future[bg.PageBackground | None], bg.CancelToken]] = {}
+
+    def load_background(
+        self,
+        frontmatter: dict[str, Any],  # noqa: ARG002
+        page_path: Path,
+        cancel: bg.CancelToken,
+    ) -> Future[bg.PageBackground | None]:
+        future: Future[bg.PageBackground | None] = Future()
+        self.loads[page_path.name] = (future, cancel)
+        return future
+
+    def complete(self, page: str) -> None:
+        self.loads[page][0].set_result(_background(f"{page}.png"))
+
+
+class _UiQueue:
+    """Stands in for Clock.schedule_once: callables run when the test drains it."""
+
+    def __init__(self) -> None:
+        self._pending: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
+
+    def schedule(self, fn: Callable[[], None]) -> None:
+        self._pending.put(fn)
+
+    def drain(self) -> None:
+        while not self._pending.empty():
+            self._pending.get()()
+
+
+class TestBackgroundLoader:
+    @staticmethod
+    def _make_loader(
+        provider: bg.AsyncImageProvider,
+    ) -> tuple[bg.BackgroundLoader, _UiQueue, list[bg.PageBackground | None]]:
+        ui = _UiQueue()
+        applied: list[bg.PageBackground | None] = []
+        return bg.BackgroundLoader(provider, applied.append, ui.schedule), ui, applied
+
+    def test_completed_load_is_applied_on_the_ui_queue(self) -> None:
+        """A load is applied only when the UI thread runs it, not when it completes."""
+        provider = _PendingProvider()
+        loader, ui, applied = self._make_loader(provider)
+
+        loader.request({}, Path("a.md"))
+        provider.complete("a.md")
+        assert applied == []
+
+        ui.drain()
+        assert applied == [_background("a.md.png")]
+
+    def test_new_request_cancels_the_previous_one(self) -> None:
+        """The provider is told a superseded load is unwanted."""
+        provider = _PendingProvider()
+        loader, _ui, _applied = self._make_loader(provider)
+
+        loader.request({}, Path("a.md"))
+        loader.request({}, Path("b.md"))
+
+        assert provider.loads["a.md"][1].cancelled
+        assert not provider.loads["b.md"][1].cancelled
+
+    def test_late_load_for_a_left_page_is_not_applied(self) -> None:
+        """A slow load finishing after the next page's never replaces its background."""
+        provider = _PendingProvider()
+        loader, ui, applied = self._make_loader(provider)
+
+        loader.request({}, Path("a.md"))
+        loader.request({}, Path("b.md"))
+        provider.complete("b.md")
+        provider.complete("a.md")
+        ui.drain()
+
+        assert applied == [_background("b.md.png")]
+
+    def test_load_already_queued_for_a_left_page_is_not_applied(self) -> None:
+        """A load completed but still waiting for the UI thread is dropped too."""
+        provider = _PendingProvider()
+        loader, ui, applied = self._make_loader(provider)
+
+        loader.request({}, Path("a.md"))
+        provider.complete("a.md")
+        loader.request({}, Path("b.md"))
+        ui.drain()
+        assert applied == []
+
+        provider.complete("b.md")
+        ui.drain()
+        assert applied == [_background("b.md.png")]
+
+    def test_quick_navigation_ends_on_the_last_page_background(self) -> None:
+        """Loads completing in any order on workers only ever apply the last page's."""
+
+        class SlowProvider:
+            def __init__(self, executor: ThreadPoolExecutor) -> None:
+                self._executor = executor
+                self._rng = random.Random(1)
+
+            def load_background(
+                self,
+                frontmatter: dict[str, Any],  # noqa: ARG002
+                page_path: Path,
+                cancel: bg.CancelToken,  # noqa: ARG002
+            ) -> Future[bg.PageBackground | None]:
+                # Ignores cancel, finishing every load, so only the loader's check
+                # keeps the stale ones off the screen.
+                return self._executor.submit(self._load, page_path, self._rng.uniform(0, 0.01))
+
+            @staticmethod
+            def _load(page_path: Path, delay: float) -> bg.PageBackground:
+                time.sleep(delay)
+                return _background(page_path.name)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            loader, ui, applied = self._make_loader(SlowProvider(executor))
+            for page in range(50):
+                loader.request({}, Path(f"{page}.md"))
+
+        ui.drain()
+        assert applied == [_background("49.md")]
+
+    def test_failed_load_is_logged_and_keeps_the_current_background(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        provider = _PendingProvider()
+        loader, ui, applied = self._make_loader(provider)
+
+        loader.request({}, Path("a.md"))
+        provider.loads["a.md"][0].set_exception(OSError("unreadable panel"))
+        ui.drain()
+
+        assert applied == []
+        [record] = caplog.records
+        assert record.levelname == "ERROR"
+        assert isinstance(record.exc_info, tuple)
+        assert str(record.exc_info[1]) == "unreadable panel"
+
+    def test_cancel_drops_the_pending_load(self) -> None:
+        provider = _PendingProvider()
+        loader, ui, applied = self._make_loader(provider)
+
+        loader.request({}, Path("a.md"))
+        loader.cancel()
+        provider.complete("a.md")
+        ui.drain()
+
+        assert provider.loads["a.md"][1].cancelled
+        assert applied == []
+
+
+class TestSyncImageProviderAdapter:
+    def test_wraps_a_plain_provider_in_a_completed_future(self, tmp_path: Path) -> None:
+        """Existing ImageProviders keep working through the async loader."""
+        provider = bg.as_async_image_provider(
+            bg.DirPerTitleImageProvider(_make_favourites(tmp_path))
+        )
+        assert isinstance(provider, bg.SyncImageProviderAdapter)
+
+        future = provider.load_background(
+            {"title": "Lost in the Andes!"}, tmp_path / "p.md", bg.CancelToken()
+        )
+
+        assert future.done()
+        background = future.result()
+        assert background is not None
+        assert background.path is not None
+        assert background.path.name == "square-eggs.png"
+
+    def test_cancelled_request_does_not_ask_the_provider(self, tmp_path: Path) -> None:
+        provider = bg.SyncImageProviderAdapter(bg.DirPerTitleImageProvider(tmp_path / "nowhere"))
+        cancel = bg.CancelToken()
+        cancel.cancel()
+
+        assert provider.load_background({}, tmp_path / "p.md", cancel).result() is None
+
+    def test_provider_error_is_delivered_through_the_future(self, tmp_path: Path) -> None:
+        class BrokenProvider:
+            def background_for(self, frontmatter: dict, page_path: Path) -> None:  # noqa: ARG002
+                raise OSError(page_path.name)
+
+        provider = bg.SyncImageProviderAdapter(BrokenProvider())
+        future = provider.load_background({}, tmp_path / "p.md", bg.CancelToken())
+
+        with pytest.raises(OSError, match=r"p\.md"):
+            future.result()
+
+    def test_async_provider_is_used_as_is(self) -> None:
+        provider = _PendingProvider()
+        assert bg.as_async_image_provider(provider) is provider
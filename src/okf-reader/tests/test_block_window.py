@@ -0,0 +1,192 @@
+"""Tests for the kivy-free page-body windowing (okf_reader.ui.block_window).
+
+These pin the item offsets, which items are live for a scroll position (the
+headless stand-in for the viewer's widget count), widget recycling, and the
+viewport correction when a measurement replaces an estimate above it.
+"""
+
+from __future__ import annotations
+
+from okf_reader.ui.block_window import (
+    BlockWindow,
+    ItemExtents,
+    TextSizeCache,
+    estimate_text_height,
+    reveal_offset,
+)
+
+NUM_ITEMS = 2000
+ESTIMATED_HEIGHT = 50.0
+VIEW_HEIGHT = 600.0
+OVERSCAN = 400.0
+
+
+class _Widget:
+    def __init__(self, serial: int) -> None:
+        self.serial = serial
+        self.item: int | None = None
+
+
+class _Builder:
+    """Builds stand-in widgets, recycling released ones, and measures items at ``heights``."""
+
+    def __init__(self, heights: dict[int, float] | None = None) -> None:
+        self.heights = heights or {}
+        self.pool: list[_Widget] = []
+        self.num_created = 0
+        self.built: list[int] = []
+
+    def build(self, i: int) -> tuple[_Widget, float]:
+        if self.pool:
+            widget = self.pool.pop()
+        else:
+            widget = _Widget(self.num_created)
+            self.num_created += 1
+        widget.item = i
+        self.built.append(i)
+        return widget, self.heights.get(i, ESTIMATED_HEIGHT)
+
+    def release(self, i: int, widget: _Widget) -> None:
+        assert widget.item == i
+        widget.item = None
+        self.pool.append(widget)
+
+
+def _make_window(builder: _Builder, num_items: int = NUM_ITEMS) -> BlockWindow[_Widget]:
+    extents = ItemExtents([ESTIMATED_HEIGHT] * num_items)
+    return BlockWindow(extents, builder.build, builder.release, overscan=OVERSCAN)
+
+
+class TestItemExtents:
+    def test_offsets_run_down_the_heights(self) -> None:
+        extents = ItemExtents([10, 20, 30])
+        assert [extents.top(i) for i in range(3)] == [0, 10, 30]
+        assert [extents.bottom(i) for i in range(3)] == [10, 30, 60]
+        assert extents.total_height == extents.bottom(2)
+
+    def test_measured_height_moves_the_items_below(self) -> None:
+        extents = ItemExtents([10, 20, 30])
+        assert [extents.top(i) for i in range(3)] == [0, 10, 30]
+
+        extents.set_height(1, 5)
+
+        assert [extents.top(i) for i in range(3)] == [0, 10, 15]
+        assert extents.total_height == extents.bottom(2)
+
+    def test_index_at_offset(self) -> None:
+        """Each offset maps to the item spanning it; offsets off either end to the end items."""
+        extents = ItemExtents([10, 20, 30])
+        offsets = (-5, 0, 9, 10, 29, 30, 59, 100)
+        assert [extents.index_at(y) for y in offsets] == [0, 0, 0, 1, 1, 2, 2, 2]
+
+    def test_empty(self) -> None:
+        assert ItemExtents([]).total_height == 0
+
+
+class TestBlockWindow:
+    def test_only_items_near_the_viewport_are_live(self) -> None:
+        """However long the page, the live widgets only cover the viewport and overscan."""
+        builder = _Builder()
+        window = _make_window(builder)
+        max_live = int((VIEW_HEIGHT + 2 * OVERSCAN) / ESTIMATED_HEIGHT) + 1
+
+        window.update(0, VIEW_HEIGHT)
+        assert sorted(window.live) == list(range(int((VIEW_HEIGHT + OVERSCAN) / ESTIMATED_HEIGHT)))
+
+        for view_top in range(0, int(NUM_ITEMS * ESTIMATED_HEIGHT), 1234):
+            window.update(view_top, VIEW_HEIGHT)
+            assert 0 < len(window.live) <= max_live
+            assert all(
+                window.extents.bottom(i) > view_top - OVERSCAN
+                and window.extents.top(i) < view_top + VIEW_HEIGHT + OVERSCAN
+                for i in window.live
+            )
+
+    def test_released_widgets_are_recycled(self) -> None:
+        """Scrolling the whole page creates no more widgets than are live at once."""
+        builder = _Builder()
+        window = _make_window(builder)
+        max_live = 0
+        for view_top in range(0, int(NUM_ITEMS * ESTIMATED_HEIGHT), 100):
+            window.update(view_top, VIEW_HEIGHT)
+            max_live = max(max_live, len(window.live))
+
+        assert len(builder.built) >= NUM_ITEMS
+        assert builder.num_created == max_live
+
+    def test_live_items_are_not_rebuilt(self) -> None:
+        """A small scroll only builds the item coming into the window."""
+        builder = _Builder()
+        window = _make_window(builder)
+        window.update(0, VIEW_HEIGHT)
+        num_built = len(builder.built)
+
+        window.update(10, VIEW_HEIGHT)
+
+        assert builder.built[num_built:] == [max(window.live)]
+
+    def test_viewport_follows_a_measurement_above_it(self) -> None:
+        """An item above the viewport measured taller moves the viewport along with the text."""
+        top_item, taller_item, growth = 100, 95, 300
+        builder = _Builder({taller_item: ESTIMATED_HEIGHT + growth})
+        window = _make_window(builder)
+        view_top = top_item * ESTIMATED_HEIGHT + 20  # the taller item is in the overscan
+
+        new_top = window.update(view_top, VIEW_HEIGHT)
+
+        assert taller_item in window.live
+        assert new_top == view_top + growth
+        assert window.extents.index_at(new_top) == top_item
+
+    def test_measurement_below_leaves_the_viewport(self) -> None:
+        builder = _Builder({5: ESTIMATED_HEIGHT + 300})
+        window = _make_window(builder)
+        assert window.update(0, VIEW_HEIGHT) == 0
+        assert window.extents.total_height == NUM_ITEMS * ESTIMATED_HEIGHT + 300
+
+    def test_release_all(self) -> None:
+        builder = _Builder()
+        window = _make_window(builder)
+        window.update(0, VIEW_HEIGHT)
+
+        window.release_all()
+
+        assert window.live == {}
+        assert len(builder.pool) == builder.num_created
+
+    def test_empty_list(self) -> None:
+        window = _make_window(_Builder(), num_items=0)
+        assert window.update(OVERSCAN, VIEW_HEIGHT) == OVERSCAN
+        assert window.live == {}
+
+
+class TestTextSizeCache:
+    def test_least_recently_used_size_is_dropped(self) -> None:
+        cache = TextSizeCache(max_entries=2)
+        cache.put("a", (1, 10))
+        cache.put("b", (1, 20))
+        assert cache.get("a") == (1, 10)  # now b is the least recently used
+
+        cache.put("c", (1, 30))
+
+        assert cache.get("b") is None
+        assert cache.get("a") == (1, 10)
+        assert cache.get("c") == (1, 30)
+
+
+class TestEstimates:
+    def test_estimate_grows_with_text_and_ignores_markup(self) -> None:
+        short = estimate_text_height("word", 16, 600, 1.25)
+        long = estimate_text_height("word " * 200, 16, 600, 1.25)
+        assert long > short
+        assert estimate_text_height("[b][color=ffffff]word[/color][/b]", 16, 600, 1.25) == short
+        assert estimate_text_height("one\ntwo", 16, 600, 1.25) == 2 * short
+
+    def test_reveal_offset_scrolls_only_as_far_as_needed(self) -> None:
+        """A span in view stays put; one above or below is brought just inside, padded."""
+        view_top, view_height, padding = 100, 200, 10
+        assert reveal_offset(120, 140, view_top, view_height, padding) == view_top
+        assert reveal_offset(50, 70, view_top, view_height, padding) == 50 - padding
+        assert reveal_offset(350, 370, view_top, view_height, padding) == (
+            370 + padding - view_height
+        )
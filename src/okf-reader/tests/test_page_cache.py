@@ -0,0 +1,216 @@
+"""Unit tests for the rendered-page cache (``okf_reader.core.page_cache``).
+
+These pin when a cached page is reused (same file modification time and size),
+the LRU bound, error-page tolerance, and which pages are rendered ahead.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Any
+
+from okf_reader.core import page_cache as pc
+from okf_reader.core.render import Block, render_page
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+    from okf_reader.core.render import Page
+
+
+class _DeferredExecutor(Executor):
+    """Queues submitted work until the test runs it with :meth:`run_all`."""
+
+    def __init__(self) -> None:
+        self.submitted: list[tuple[Future[Any], Callable[..., Any], tuple[Any, ...]]] = []
+        self.shut_down = False
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ANN401
+        assert not kwargs
+        future: Future[Any] = Future()
+        self.submitted.append((future, fn, args))
+        return future
+
+    def run_all(self) -> None:
+        while self.submitted:
+            future, fn, args = self.submitted.pop(0)
+            future.set_result(fn(*args))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: ARG002
+        self.shut_down = True
+
+
+class _CountingRender:
+    def __init__(self) -> None:
+        self.texts: list[str] = []
+
+    def __call__(self, text: str) -> Page:
+        self.texts.append(text)
+        return render_page(text)
+
+
+def _make_bundle(tmp_path: Path) -> Path:
+    """Build concept/{index,a,b,c,d}.md plus concept/sub/index.md; index.md lists c, sub, a."""
+    concept = tmp_path / "concept"
+    (concept / "sub").mkdir(parents=True)
+    (concept / "index.md").write_text(
+        "# Concepts\n\n- [C](c.md)\n- [Sub](sub/index.md)\n- [A](a.md)\n"
+    )
+    for name in "abcd":
+        (concept / f"{name}.md").write_text(f"---\ntitle: {name.upper()}\n---\n# {name.upper()}\n")
+    (concept / "sub" / "index.md").write_text("# Sub\n")
+    return concept
+
+
+class TestPageCache:
+    def test_rendered_page_is_reused(self, tmp_path: Path) -> None:
+        """A page shown again comes from the cache, without re-reading or re-rendering."""
+        page_path = _make_bundle(tmp_path) / "a.md"
+        render = _CountingRender()
+        cache = pc.PageCache(render)
+
+        page = cache.render(page_path)
+
+        assert cache.get(page_path) is page
+        assert cache.load(page_path).result() is page
+        assert len(render.texts) == 1
+        assert page.frontmatter == {"title": "A"}
+
+    def test_edited_page_is_rendered_again(self, tmp_path: Path) -> None:
+        page_path = _make_bundle(tmp_path) / "a.md"
+        cache = pc.PageCache(_CountingRender())
+        cache.render(page_path)
+
+        page_path.write_text("---\ntitle: Edited\n---\n# Edited\n")
+        os.utime(page_path, ns=(0, 1_000_000_000))
+
+        assert cache.get(page_path) is None
+        assert cache.render(page_path).frontmatter == {"title": "Edited"}
+
+    def test_least_recently_used_page_is_dropped(self, tmp_path: Path) -> None:
+        concept = _make_bundle(tmp_path)
+        cache = pc.PageCache(_CountingRender(), max_pages=2)
+        cache.render(concept / "a.md")
+        cache.render(concept / "b.md")
+        cache.get(concept / "a.md")  # now b is the least recently used
+
+        cache.render(concept / "c.md")
+
+        assert cache.get(concept / "a.md") is not None
+        assert cache.get(concept / "b.md") is None
+        assert cache.get(concept / "c.md") is not None
+
+    def test_unreadable_page_renders_an_error_page_uncached(self, tmp_path: Path) -> None:
+        """A page deleted after the tree was populated degrades to an error page."""
+        missing = tmp_path / "gone.md"
+        cache = pc.PageCache(_CountingRender())
+
+        page = cache.load(missing).result()
+
+        heading, message = page.blocks[:2]
+        assert isinstance(heading, Block)
+        assert isinstance(message, Block)
+        assert "Page unavailable" in heading.markup
+        assert "gone.md" in message.markup
+        assert cache.get(missing) is None
+
+    def test_misses_are_rendered_on_the_executor_once(self, tmp_path: Path) -> None:
+        """A page asked for again while it renders shares the one render."""
+        page_path = _make_bundle(tmp_path) / "a.md"
+        executor = _DeferredExecutor()
+        render = _CountingRender()
+        cache = pc.PageCache(render, executor=executor)
+
+        first = cache.load(page_path)
+        second = cache.load(page_path)
+        assert first is second
+        assert not first.done()
+        assert render.texts == []
+
+        executor.run_all()
+        assert first.result() is cache.get(page_path)
+        assert len(render.texts) == 1
+
+    def test_prefetch_renders_the_neighbours_ahead(self, tmp_path: Path) -> None:
+        concept = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        cache = pc.PageCache(_CountingRender(), executor=executor)
+
+        cache.prefetch_neighbours(concept / "index.md")
+        executor.run_all()
+
+        for name in ("c.md", "sub/index.md", "a.md", "b.md"):
+            assert cache.get(concept / name) is not None
+
+    def test_newer_request_stops_an_older_prefetch(self, tmp_path: Path) -> None:
+        """Rendering ahead never holds up the page the reader has asked for."""
+        concept = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        render = _CountingRender()
+        cache = pc.PageCache(render, executor=executor)
+
+        cache.prefetch_neighbours(concept / "index.md")
+        cache.load(concept / "d.md")
+        executor.run_all()
+
+        assert len(render.texts) == 1
+        assert cache.get(concept / "d.md") is not None
+
+    def test_close_lets_its_own_worker_go(self, tmp_path: Path) -> None:
+        concept = _make_bundle(tmp_path)
+        cache = pc.PageCache(_CountingRender())
+        cache.load(concept / "a.md").result()
+        workers = [t for t in threading.enumerate() if t.name.startswith("okf-render")]
+
+        cache.close()
+
+        assert workers
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+
+    def test_close_stops_a_prefetch_but_leaves_an_injected_executor(self, tmp_path: Path) -> None:
+        concept = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        render = _CountingRender()
+        cache = pc.PageCache(render, executor=executor)
+
+        cache.prefetch_neighbours(concept / "index.md")
+        cache.close()
+        executor.run_all()
+
+        assert render.texts == []
+        assert not executor.shut_down
+
+
+class TestNeighbourPages:
+    def test_index_leads_to_its_children_in_curated_order(self, tmp_path: Path) -> None:
+        """Listed children first, in listing order, then the rest by name."""
+        concept = _make_bundle(tmp_path)
+        assert pc.neighbour_pages(concept / "index.md", max_pages=5) == [
+            concept / "c.md",
+            concept / "sub" / "index.md",
+            concept / "a.md",
+            concept / "b.md",
+            concept / "d.md",
+        ]
+
+    def test_concept_leads_to_following_then_preceding_siblings(self, tmp_path: Path) -> None:
+        concept = _make_bundle(tmp_path)
+        assert pc.neighbour_pages(concept / "a.md", max_pages=4) == [
+            concept / "b.md",
+            concept / "d.md",
+            concept / "sub" / "index.md",
+            concept / "c.md",
+        ]
+        assert pc.neighbour_pages(concept / "c.md", max_pages=2) == [
+            concept / "sub" / "index.md",
+            concept / "a.md",
+        ]
+
+    def test_page_outside_the_listing_has_no_neighbours(self, tmp_path: Path) -> None:
+        concept = _make_bundle(tmp_path)
+        assert pc.neighbour_pages(concept / "log.md") == []
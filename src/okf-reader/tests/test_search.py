@@ -2,15 +2,20 @@
 
 These pin the index build (curated order, breadcrumbs, heading extraction,
 tolerance) and the query ranking (exact > prefix > words-in-title > heading,
-AND semantics, empty query, limit).
+AND semantics, empty query, limit), then the full-text index: body and phrase
+matching, and which pages an incremental update reads again.
 """
 
 from __future__ import annotations
 
+import json
+import os
 from typing import TYPE_CHECKING
 
 from okf_reader.core.search import (
     BundleSearcher,
+    FullTextIndex,
+    FullTextSearcher,
     build_search_index,
     search_index,
 )
@@ -176,3 +181,171 @@ class TestBundleSearcher:
         searcher = BundleSearcher(_make_bundle(tmp_path))
         searcher.search("guess")
         assert searcher.is_ready is True
+
+
+NUM_BODY_BUNDLE_PAGES = 2
+
+
+def _make_body_bundle(tmp_path: Path) -> Path:
+    """Add body prose to the small bundle: the square eggs only appear in guess's body."""
+    bundle = _make_bundle(tmp_path)
+    (bundle / "stories" / "guess.md").write_text(
+        _page(
+            "You Can't Guess!",
+            "# You Can't Guess!\n\n## The Bomb\n\nThe nephews find square eggs "
+            "in the [Andes](../andes.md).\n<!-- square eggs are a secret -->\n",
+        ),
+        encoding="utf-8",
+    )
+    (bundle / "stories" / "dither.md").write_text(
+        _page("Ten-Dollar Dither", "# Ten-Dollar Dither\n\nThe eggs are round and square.\n"),
+        encoding="utf-8",
+    )
+    return bundle
+
+
+def _touch(path: Path, text: str) -> None:
+    """Rewrite ``path`` with a modification time no earlier write in a test can share."""
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+
+
+class TestFullTextIndex:
+    def test_body_words_are_searched(self, tmp_path: Path) -> None:
+        """A word only in a page's body finds it, ranked below the title/heading tiers."""
+        index = FullTextIndex(_make_body_bundle(tmp_path))
+        index.update()
+        hits = index.search("eggs")
+        assert [h.title for h in hits] == ["Ten-Dollar Dither", "You Can't Guess!"]
+        assert {h.matched_on for h in hits} == {"body"}
+
+    def test_title_and_heading_tiers_still_rank_first(self, tmp_path: Path) -> None:
+        """The tiered scoring is kept; a body match only ranks below it."""
+        bundle = _make_body_bundle(tmp_path)
+        (bundle / "stories" / "dither.md").write_text(
+            _page("Ten-Dollar Dither", "# Ten-Dollar Dither\n\nThe bomb in the bin.\n"), "utf-8"
+        )
+        index = FullTextIndex(bundle)
+        index.update()
+        hits = index.search("bomb")
+        assert [(h.title, h.matched_on) for h in hits] == [
+            ("You Can't Guess!", "heading"),
+            ("Ten-Dollar Dither", "body"),
+        ]
+
+    def test_phrase_needs_the_words_in_a_row(self, tmp_path: Path) -> None:
+        """A quoted phrase matches consecutive words, not the words anywhere."""
+        index = FullTextIndex(_make_body_bundle(tmp_path))
+        index.update()
+        assert [h.title for h in index.search('"square eggs"')] == ["You Can't Guess!"]
+        assert [h.title for h in index.search('"eggs are" round')] == ["Ten-Dollar Dither"]
+        assert index.search('"eggs square"') == []
+
+    def test_link_targets_and_comments_are_not_indexed(self, tmp_path: Path) -> None:
+        """Only text a reader sees is searched: link text is, its target and comments are not."""
+        index = FullTextIndex(_make_body_bundle(tmp_path))
+        index.update()
+        assert [h.title for h in index.search("andes")] == ["You Can't Guess!"]
+        assert index.search("secret") == []
+        assert index.search("md") == []
+
+    def test_every_word_must_match(self, tmp_path: Path) -> None:
+        index = FullTextIndex(_make_body_bundle(tmp_path))
+        index.update()
+        assert [h.title for h in index.search("nephews egg")] == ["You Can't Guess!"]
+        assert index.search("nephews round") == []
+
+    def test_word_matches_the_start_of_a_word(self, tmp_path: Path) -> None:
+        index = FullTextIndex(_make_body_bundle(tmp_path))
+        index.update()
+        assert [h.title for h in index.search("nephew")] == ["You Can't Guess!"]
+        assert index.search("ephews") == []
+
+    def test_title_and_headings_match_mid_word(self, tmp_path: Path) -> None:
+        """As in `search_index`, a title or heading matches any substring, the body does not."""
+        index = FullTextIndex(_make_body_bundle(tmp_path))
+        index.update()
+        assert [(h.title, h.matched_on) for h in index.search("uess")] == [
+            ("You Can't Guess!", "title")
+        ]
+        assert [(h.title, h.matched_on) for h in index.search("omb")] == [
+            ("You Can't Guess!", "heading")
+        ]
+        assert index.search("uess round") == []
+
+    def test_saved_index_reads_only_changed_pages(self, tmp_path: Path) -> None:
+        """A new index over a saved one reads only the pages changed since it was saved."""
+        bundle = _make_body_bundle(tmp_path)
+        index_path = tmp_path / "index" / "search.json"
+        first = FullTextIndex(bundle, index_path)
+        first.update()
+        assert first.num_pages_indexed == NUM_BODY_BUNDLE_PAGES
+
+        unchanged = FullTextIndex(bundle, index_path)
+        unchanged.update()
+        assert unchanged.num_pages_indexed == 0
+        assert [h.title for h in unchanged.search('"square eggs"')] == ["You Can't Guess!"]
+
+        _touch(bundle / "stories" / "guess.md", _page("You Can't Guess!", "Round eggs only.\n"))
+        changed = FullTextIndex(bundle, index_path)
+        changed.update()
+        assert changed.num_pages_indexed == 1
+        assert changed.search('"square eggs"') == []
+        assert [h.title for h in changed.search("only")] == ["You Can't Guess!"]
+
+    def test_deleted_and_added_pages(self, tmp_path: Path) -> None:
+        bundle = _make_body_bundle(tmp_path)
+        index_path = tmp_path / "search.json"
+        FullTextIndex(bundle, index_path).update()
+
+        (bundle / "stories" / "dither.md").unlink()
+        (bundle / "stories" / "new.md").write_text(_page("New", "More round eggs.\n"), "utf-8")
+        index = FullTextIndex(bundle, index_path)
+        index.update()
+
+        assert index.num_pages_indexed == 1
+        assert [h.title for h in index.search("round")] == ["New"]
+
+    def test_corrupt_saved_index_is_rebuilt(self, tmp_path: Path) -> None:
+        """An unreadable index file is ignored and replaced (SPEC §9 tolerance)."""
+        bundle = _make_body_bundle(tmp_path)
+        index_path = tmp_path / "search.json"
+        index_path.write_text("{not json", encoding="utf-8")
+
+        index = FullTextIndex(bundle, index_path)
+        index.update()
+
+        assert index.num_pages_indexed == NUM_BODY_BUNDLE_PAGES
+        assert [h.title for h in index.search("nephews")] == ["You Can't Guess!"]
+        reread = FullTextIndex(bundle, index_path)
+        reread.update()
+        assert reread.num_pages_indexed == 0
+
+    def test_malformed_saved_index_is_rebuilt(self, tmp_path: Path) -> None:
+        """A saved index missing a key, or with a bad page record, is rebuilt, not raised on."""
+        bundle = _make_body_bundle(tmp_path)
+        index_path = tmp_path / "search.json"
+        FullTextIndex(bundle, index_path).update()
+        saved = json.loads(index_path.read_text(encoding="utf-8"))
+
+        for malformed in (
+            {k: v for k, v in saved.items() if k != "postings"},
+            {**saved, "next_id": "3"},
+            {**saved, "pages": {**saved["pages"], "stories/guess.md": {"id": "0"}}},
+        ):
+            index_path.write_text(json.dumps(malformed), encoding="utf-8")
+            index = FullTextIndex(bundle, index_path)
+            index.update()
+            assert index.num_pages_indexed == NUM_BODY_BUNDLE_PAGES
+            assert [h.title for h in index.search("nephews")] == ["You Can't Guess!"]
+
+
+class TestFullTextSearcher:
+    def test_warm_then_search(self, tmp_path: Path) -> None:
+        searcher = FullTextSearcher(_make_body_bundle(tmp_path), tmp_path / "search.json")
+        assert searcher.search(" ") == []
+        assert searcher.is_ready is False
+        searcher.warm()
+        assert searcher.is_ready is True
+        assert [h.title for h in searcher.search("nephews")] == ["You Can't Guess!"]
+        assert (tmp_path / "search.json").is_file()
@@ -0,0 +1,206 @@
+"""Unit tests for the directory-listing cache (``okf_reader.core.tree_cache``).
+
+These pin that a cached listing matches `render.list_children`, when it is
+reused (directory and ``index.md`` unchanged) or read again, that an edited
+title is picked up, and which directories `warm_around` lists ahead.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import Executor, Future
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from okf_reader.core import render
+from okf_reader.core import tree_cache as tc
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+
+class _DeferredExecutor(Executor):
+    """Queues submitted work until the test runs it with :meth:`run_all`."""
+
+    def __init__(self) -> None:
+        self.submitted: list[tuple[Future[Any], Callable[..., Any], tuple[Any, ...]]] = []
+        self.shut_down = False
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:  # noqa: ANN401
+        assert not kwargs
+        future: Future[Any] = Future()
+        self.submitted.append((future, fn, args))
+        return future
+
+    def run_all(self) -> None:
+        while self.submitted:
+            future, fn, args = self.submitted.pop(0)
+            future.set_result(fn(*args))
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:  # noqa: ARG002
+        self.shut_down = True
+
+
+@pytest.fixture
+def listed_dirs(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    """Record each directory the cache really lists (reads ``index.md`` and concepts for)."""
+    listed: list[Path] = []
+
+    def list_child_paths(directory: Path) -> list[Path]:
+        listed.append(directory)
+        return render.list_child_paths(directory)
+
+    monkeypatch.setattr(tc, "list_child_paths", list_child_paths)
+    return listed
+
+
+def _make_bundle(tmp_path: Path) -> Path:
+    """Build bundle/concept/{index,a,b}.md, concept/sub/{index,c}.md and concept/sub/deep/d.md."""
+    concept = tmp_path / "concept"
+    (concept / "sub" / "deep").mkdir(parents=True)
+    (tmp_path / "index.md").write_text("# Bundle\n")
+    (concept / "index.md").write_text("# Concepts\n\n- [B](b.md)\n- [Sub](sub/index.md)\n")
+    for path in (concept / "a.md", concept / "b.md", concept / "sub" / "c.md"):
+        path.write_text(f"---\ntitle: {path.stem.upper()}\n---\n# {path.stem.upper()}\n")
+    (concept / "sub" / "index.md").write_text("# The Sub\n")
+    (concept / "sub" / "deep" / "d.md").write_text("# D\n")
+    return tmp_path
+
+
+def _touch(path: Path, seconds: int) -> None:
+    """Set ``path``'s modification time, so a change shows whatever the clock's resolution."""
+    os.utime(path, ns=(0, seconds * 1_000_000_000))
+
+
+class TestBundleTreeCache:
+    def test_listing_matches_render(self, tmp_path: Path) -> None:
+        bundle = _make_bundle(tmp_path)
+        cache = tc.BundleTreeCache(bundle, executor=_DeferredExecutor())
+
+        for directory in (bundle, bundle / "concept", bundle / "concept" / "sub"):
+            assert cache.list_children(directory) == render.list_children(directory)
+            assert cache.has_children(directory) == render.has_children(directory)
+        assert cache.list_children(tmp_path / "missing") == []
+        assert not cache.has_children(tmp_path / "missing")
+
+    def test_unchanged_directory_is_not_listed_again(
+        self, tmp_path: Path, listed_dirs: list[Path]
+    ) -> None:
+        concept = _make_bundle(tmp_path) / "concept"
+        cache = tc.BundleTreeCache(tmp_path, executor=_DeferredExecutor())
+
+        first = cache.list_children(concept)
+        assert cache.is_listed(concept)
+
+        assert cache.list_children(concept) == first
+        assert listed_dirs == [concept]
+
+    def test_added_page_or_recurated_index_lists_again(
+        self, tmp_path: Path, listed_dirs: list[Path]
+    ) -> None:
+        """The listing is keyed by the directory's and its index.md's modification times."""
+        concept = _make_bundle(tmp_path) / "concept"
+        cache = tc.BundleTreeCache(tmp_path, executor=_DeferredExecutor())
+        cache.list_children(concept)
+
+        (concept / "e.md").write_text("# E\n")
+        _touch(concept, 1)
+        assert [c.path.name for c in cache.list_children(concept)][-1] == "e.md"
+
+        (concept / "index.md").write_text("# Concepts\n\n- [E](e.md)\n")
+        _touch(concept / "index.md", 2)
+        assert cache.list_children(concept)[0].path.name == "e.md"
+
+        assert listed_dirs == [concept] * 3
+
+    def test_edited_title_is_read_again(self, tmp_path: Path, listed_dirs: list[Path]) -> None:
+        """A title edited in place (no directory change) still shows the new title."""
+        concept = _make_bundle(tmp_path) / "concept"
+        cache = tc.BundleTreeCache(tmp_path, executor=_DeferredExecutor())
+        cache.list_children(concept)
+
+        (concept / "a.md").write_text("---\ntitle: Renamed A\n---\n# A\n")
+        _touch(concept / "a.md", 1)
+        (concept / "sub" / "index.md").write_text("# Renamed Sub\n")
+        _touch(concept / "sub" / "index.md", 1)
+
+        titles = {child.path.name: child.title for child in cache.list_children(concept)}
+        assert titles["a.md"] == "Renamed A"
+        assert titles["sub"] == "Renamed Sub"
+        assert listed_dirs == [concept]
+
+
+class TestWarmAround:
+    def test_ancestors_then_nearby_subdirectories_are_listed(self, tmp_path: Path) -> None:
+        bundle = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        cache = tc.BundleTreeCache(bundle, executor=executor)
+        page = bundle / "concept" / "sub" / "c.md"
+
+        listed = cache.warm_around(page)
+        assert not listed.done()
+        executor.run_all()
+
+        assert listed.done()
+        for directory in (bundle, bundle / "concept", bundle / "concept" / "sub"):
+            assert cache.is_listed(directory)
+        assert cache.is_listed(bundle / "concept" / "sub" / "deep")
+
+    def test_listed_ancestors_are_ready_at_once(self, tmp_path: Path) -> None:
+        bundle = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        cache = tc.BundleTreeCache(bundle, executor=executor)
+        page = bundle / "concept" / "a.md"
+        cache.warm_around(page)
+        executor.run_all()
+
+        assert cache.warm_around(page).done()
+
+    def test_newer_warm_stops_an_older_one(self, tmp_path: Path, listed_dirs: list[Path]) -> None:
+        """An older warm lists only the ancestors it was asked for, not what is near them."""
+        bundle = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        cache = tc.BundleTreeCache(bundle, executor=executor)
+
+        cache.warm_around(bundle / "concept" / "sub" / "c.md")
+        cache.warm_around(bundle / "index.md")
+        executor.run_all()
+
+        assert bundle / "concept" / "sub" / "deep" not in listed_dirs
+
+    def test_close_lets_its_own_worker_go(self, tmp_path: Path) -> None:
+        bundle = _make_bundle(tmp_path)
+        cache = tc.BundleTreeCache(bundle)
+        cache.warm_around(bundle / "concept" / "a.md").result()
+        workers = [t for t in threading.enumerate() if t.name.startswith("okf-tree")]
+
+        cache.close()
+
+        assert workers
+        for worker in workers:
+            worker.join(timeout=5)
+            assert not worker.is_alive()
+
+    def test_close_stops_a_warm_but_leaves_an_injected_executor(
+        self, tmp_path: Path, listed_dirs: list[Path]
+    ) -> None:
+        """A warm under way still lists the ancestors it promised, but nothing near them."""
+        bundle = _make_bundle(tmp_path)
+        executor = _DeferredExecutor()
+        cache = tc.BundleTreeCache(bundle, executor=executor)
+
+        listed = cache.warm_around(bundle / "concept" / "sub" / "c.md")
+        cache.close()
+        executor.run_all()
+
+        assert listed.done()
+        assert bundle / "concept" / "sub" / "deep" not in listed_dirs
+        assert not executor.shut_down
+
+    def test_page_outside_the_bundle_has_nothing_to_warm(self, tmp_path: Path) -> None:
+        bundle = _make_bundle(tmp_path / "bundle")
+        cache = tc.BundleTreeCache(bundle, executor=_DeferredExecutor())
+
+        assert cache.warm_around(tmp_path / "elsewhere.md").done()